@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎮📊 게임 경제 데이터베이스 벤치마크
+사용자 규모별 초기 데이터 생성 시간, 주요 조회 지연 시간, 일일 정산 시간과
+배치 시뮬레이션 처리량을 측정합니다.
+
+사용법:
+    python game_economy_benchmark.py                  # 10k, 100k, 1M 사용자
+    python game_economy_benchmark.py --sizes 10000    # 특정 규모만
+    python game_economy_benchmark.py --batch-days 7   # 7일 배치 시뮬레이션 처리량 포함
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sorisay_game_economy_system import GameEconomySimulator
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def measure(cursor, sql, params_list):
+    """쿼리를 여러 번 실행하여 지연 시간(ms) 목록 반환"""
+    timings = []
+    for params in params_list:
+        started = time.perf_counter()
+        cursor.execute(sql, params).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def run_size(total_users, samples, workdir, batch_days=0):
+    """한 규모에 대한 생성 시간과 조회 지연 측정"""
+    db_path = os.path.join(workdir, f"economy_{total_users}.db")
+    simulator = GameEconomySimulator(db_path=db_path, initial_users=0)
+    engine = simulator.economy_engine
+    seed = engine.simulate_initial_economy(total_users=total_users)
+
+    cursor = engine.db.conn.cursor()
+    user_ids = [row[0] for row in cursor.execute(
+        'SELECT user_id FROM users ORDER BY rowid LIMIT ?', (samples * 20,))]
+    sample_ids = [(user_id,) for user_id in random.sample(user_ids, min(samples, len(user_ids)))]
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    day_ranges = [
+        ((today - timedelta(days=d)).isoformat(), (today - timedelta(days=d - 1)).isoformat())
+        for d in range(7)
+    ]
+
+    queries = {
+        "사용자 활동 조회": measure(
+            cursor,
+            'SELECT activity_type, earnings, quality_score FROM activity_log WHERE user_id = ?',
+            sample_ids),
+        "사용자 콘텐츠 조회": measure(
+            cursor,
+            'SELECT content_id, title FROM content_library WHERE user_id = ?',
+            sample_ids),
+        "일일 활성 사용자 집계": measure(
+            cursor,
+            'SELECT COUNT(DISTINCT user_id) FROM activity_log WHERE timestamp >= ? AND timestamp < ?',
+            day_ranges),
+    }
+
+    # 최근 7일 정산 (하루 단위 집합 정산)
+    settle_timings = []
+    for d in range(7, 0, -1):
+        started = time.perf_counter()
+        engine.calculate_daily_revenue_distribution(today.date() - timedelta(days=d), verbose=False)
+        settle_timings.append((time.perf_counter() - started) * 1000)
+    queries["일일 수익 정산"] = settle_timings
+
+    batch = simulator.run_batch_simulation(days=batch_days) if batch_days else None
+
+    engine.db.conn.close()
+    db_size = sum(os.path.getsize(os.path.join(workdir, f))
+                  for f in os.listdir(workdir) if f.startswith(f"economy_{total_users}.db"))
+    return seed, queries, db_size, batch
+
+
+def print_report(results):
+    print("\n" + "=" * 80)
+    print("📊 게임 경제 DB 벤치마크 결과")
+    print("=" * 80)
+    print(f"{'사용자':>10} {'활동':>12} {'생성(초)':>10} {'행/초':>12} {'DB(MB)':>8}")
+    for total_users, (seed, _, db_size, _) in results.items():
+        rows = seed['users'] + seed['activities']
+        print(f"{total_users:>10,} {seed['activities']:>12,} {seed['seconds']:>10.2f} "
+              f"{rows / seed['seconds']:>12,.0f} {db_size / 1024 / 1024:>8.1f}")
+
+    print("\n⏱️ 조회 지연 (ms, 중앙값 / p95)")
+    for total_users, (_, queries, _, _) in results.items():
+        summary = " | ".join(
+            f"{name}: {statistics.median(t):.3f} / {percentile(t, 0.95):.3f}"
+            for name, t in queries.items()
+        )
+        print(f"  {total_users:>10,}명 → {summary}")
+
+    batches = {n: r[3] for n, r in results.items() if r[3]}
+    if batches:
+        print("\n⚡ 배치 시뮬레이션 (일수 / 활동 / 초 / 활동/초 / 하루당 초)")
+        for total_users, batch in batches.items():
+            print(f"  {total_users:>10,}명 → {batch['days']}일 / {batch['total_activities']:,} / "
+                  f"{batch['seconds']:.2f} / {batch['activities_per_second']:,.0f} / "
+                  f"{batch['seconds'] / batch['days']:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 경제 DB 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="측정할 사용자 수")
+    parser.add_argument("--samples", type=int, default=200, help="조회당 측정 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--batch-days", type=int, default=0, help="배치 시뮬레이션 일수 (0이면 생략)")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    workdir = tempfile.mkdtemp(prefix="economy_bench_")
+    results = {}
+    try:
+        for total_users in args.sizes:
+            print(f"\n🚀 {total_users:,}명 규모 측정 중...")
+            results[total_users] = run_size(total_users, args.samples, workdir, args.batch_days)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
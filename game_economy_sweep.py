@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎮🎲 게임 경제 파라미터 스윕 (몬테카를로)
+economy_config 파라미터 조합(시나리오)마다 여러 번 배치 시뮬레이션을 실행하여
+결과를 신뢰구간과 함께 비교합니다.
+
+각 실행은 프로세스 풀의 작업자에서 자체 메모리 SQLite DB로 돌아가므로
+서로 공유하는 상태가 없고, 코어 수에 비례해 처리량이 늘어납니다.
+반복 번호가 같은 실행은 시나리오와 관계없이 같은 시드를 쓰므로
+(공통 난수) 시나리오 간 차이가 난수 차이에 묻히지 않습니다.
+(사용자 ID가 UUID라 집계 합산 순서가 달라져 마지막 자릿수 정도는 달라질 수 있음)
+
+사용법:
+    python game_economy_sweep.py --param user_distribution_rate=0.6,0.7,0.8
+    python game_economy_sweep.py --param max_daily_earnings=30,50 --param quality_bonus_multiplier=1.2,1.5 \\
+        --replications 16 --users 20000 --days 3 --workers 8
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sorisay_game_economy_system import GameEconomySimulator
+
+# 스윕할 수 있는 economy_config 파라미터
+SWEEP_PARAMETERS = ('user_distribution_rate', 'quality_bonus_multiplier', 'max_daily_earnings',
+                    'base_ad_revenue_per_user', 'level_up_threshold')
+# 정수로만 쓰이는 파라미터 (레벨 = 경험치 // 기준 + 1)
+INTEGER_PARAMETERS = ('level_up_threshold',)
+
+# 시나리오 비교에 쓰는 지표 {키: 표시 이름}
+METRICS = {
+    'avg_user_earning': '평균 개인 수익($/일)',
+    'avg_paid_share': '상한 적용 실지급($/일)',
+    'daily_revenue': '일일 광고 수익($)',
+    'capped_rate': '상한 도달 비율',
+    'activity_earnings': '활동 수익($/일)',
+}
+
+# 양측 95% t 분포 임계값 (자유도 1~30, 그 이상은 정규 근사 1.96)
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+
+
+def run_scenario(task):
+    """
+    시나리오 1회 실행 (작업자 프로세스에서 호출, 피클 가능한 최상위 함수)
+    Args:
+        task (dict): name, overrides, seed, users, days, activities_per_user
+    Returns:
+        dict: 시나리오 이름, 시드, 지표, CPU 시간
+    """
+    started = time.process_time()
+    # 엔진 내부(초기 데이터, 광고 시청 수)는 전역 random을 쓰므로 함께 고정
+    random.seed(task['seed'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator = GameEconomySimulator(":memory:", initial_users=0)
+        engine = simulator.economy_engine
+        engine.economy_config.update(task['overrides'])
+        engine.simulate_initial_economy(total_users=task['users'])
+        result = simulator.run_batch_simulation(
+            days=task['days'], activities_per_user=task['activities_per_user'], seed=task['seed'])
+
+    revenues = [day['revenue'] for day in result['daily']]
+    cap = engine.economy_config['max_daily_earnings']
+    # 마지막 정산일의 실제 분배 결과 (정산 임시 테이블, 상한 적용 후)
+    capped, settled, avg_paid = engine.db.conn.execute(
+        'SELECT COALESCE(SUM(share >= ? - 1e-9), 0), COUNT(*), COALESCE(AVG(share), 0) FROM settlement_weights',
+        (cap,)
+    ).fetchone()
+    engine.db.conn.close()
+
+    metrics = {
+        'avg_user_earning': statistics.fmean(r['average_earning'] for r in revenues),
+        'daily_revenue': statistics.fmean(r['total_revenue'] for r in revenues),
+        'avg_paid_share': avg_paid,
+        'capped_rate': capped / settled if settled else 0.0,
+        'activity_earnings': result['total_earnings'] / task['days'],
+    }
+    return {
+        'name': task['name'],
+        'seed': task['seed'],
+        'metrics': metrics,
+        'cpu_seconds': time.process_time() - started,
+    }
+
+
+def confidence_interval(values, critical=None):
+    """평균과 95% 신뢰구간 반폭 (표본 1개면 반폭 0)"""
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, 0.0
+    df = len(values) - 1
+    if critical is None:
+        critical = T_CRITICAL_95[df - 1] if df <= len(T_CRITICAL_95) else 1.96
+    return mean, critical * statistics.stdev(values) / len(values) ** 0.5
+
+
+def build_scenarios(grid):
+    """
+    파라미터 격자를 시나리오 목록으로 변환 (모든 조합)
+    Args:
+        grid (dict): {파라미터: [값, ...]}
+    Returns:
+        list: [(이름, {파라미터: 값}), ...] - 격자가 비어 있으면 기본 설정 하나
+    """
+    for name in grid:
+        if name not in SWEEP_PARAMETERS:
+            raise ValueError(f"스윕할 수 없는 파라미터: {name} (가능: {', '.join(SWEEP_PARAMETERS)})")
+    grid = dict(grid)
+    for name in INTEGER_PARAMETERS:
+        if name in grid:
+            if any(value != int(value) for value in grid[name]):
+                raise ValueError(f"정수 값만 가능한 파라미터: {name}={grid[name]}")
+            grid[name] = [int(value) for value in grid[name]]
+    if not grid:
+        return [('baseline', {})]
+    names = list(grid)
+    scenarios = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        overrides = dict(zip(names, values))
+        label = ", ".join(f"{name}={value:g}" for name, value in overrides.items())
+        scenarios.append((label, overrides))
+    return scenarios
+
+
+def run_sweep(scenarios, replications=8, users=5000, days=2, activities_per_user=3.0,
+              workers=None, base_seed=1000):
+    """
+    시나리오 × 반복 실행을 프로세스 풀에 분배하고 시나리오별로 집계
+    Args:
+        scenarios (list): build_scenarios 결과
+        replications (int): 시나리오당 반복 횟수
+        users (int): 실행당 가상 사용자 수
+        days (int): 실행당 시뮬레이션 일수
+        activities_per_user (float): 사용자당 하루 평균 활동 수
+        workers (int): 작업자 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        base_seed (int): 반복 번호 r의 시드는 base_seed + r
+    Returns:
+        dict: 시나리오별 지표 (평균, 신뢰구간 반폭, 표본)와 실행 시간 정보
+    """
+    tasks = [
+        {
+            'name': name,
+            'overrides': overrides,
+            'seed': base_seed + replication,
+            'users': users,
+            'days': days,
+            'activities_per_user': activities_per_user,
+        }
+        for replication in range(replications)
+        for name, overrides in scenarios
+    ]
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    if workers == 1:
+        runs = [run_scenario(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            runs = list(pool.map(run_scenario, tasks))
+    wall_seconds = time.perf_counter() - started
+
+    summary = {}
+    for name, overrides in scenarios:
+        scenario_runs = sorted((run for run in runs if run['name'] == name), key=lambda run: run['seed'])
+        summary[name] = {
+            'overrides': overrides,
+            'runs': len(scenario_runs),
+            'metrics': {
+                key: confidence_interval([run['metrics'][key] for run in scenario_runs])
+                for key in METRICS
+            },
+            'samples': {key: [run['metrics'][key] for run in scenario_runs] for key in METRICS},
+        }
+
+    cpu_seconds = sum(run['cpu_seconds'] for run in runs)
+    return {
+        'scenarios': summary,
+        'workers': workers,
+        'runs': len(runs),
+        'wall_seconds': wall_seconds,
+        'cpu_seconds': cpu_seconds,
+        # 작업자 수 대비 실제 병렬 효율 (1.0이면 선형 확장)
+        'parallel_efficiency': cpu_seconds / (wall_seconds * min(workers, len(runs))) if wall_seconds > 0 else 0.0,
+    }
+
+
+def print_report(report):
+    print("\n" + "=" * 100)
+    print("🎲 게임 경제 시나리오 비교 (평균 ± 95% 신뢰구간)")
+    print("=" * 100)
+    name_width = max(len(name) for name in report['scenarios']) + 2
+    header = f"{'시나리오':<{name_width}}" + "".join(f"{label:>24}" for label in METRICS.values())
+    print(header)
+    for name, scenario in report['scenarios'].items():
+        cells = []
+        for key in METRICS:
+            mean, half_width = scenario['metrics'][key]
+            precision = 3 if key == 'capped_rate' else 2
+            cells.append(f"{mean:,.{precision}f} ± {half_width:,.{precision}f}".rjust(24))
+        print(f"{name:<{name_width}}" + "".join(cells))
+
+    print(f"\n⏱️ 실행 {report['runs']}회 | 작업자 {report['workers']}개 | "
+          f"경과 {report['wall_seconds']:.1f}초 | CPU {report['cpu_seconds']:.1f}초 | "
+          f"병렬 효율 {report['parallel_efficiency'] * 100:.0f}%")
+
+
+def parse_param(text):
+    """'이름=값1,값2' 형식을 (이름, [값...])으로 변환"""
+    name, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"'이름=값1,값2' 형식이 아닙니다: {text}")
+    try:
+        return name.strip(), [float(value) for value in values.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"숫자가 아닌 값: {text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 경제 파라미터 스윕")
+    parser.add_argument("--param", type=parse_param, action="append", default=[],
+                        help="스윕할 파라미터 (예: user_distribution_rate=0.6,0.7,0.8)")
+    parser.add_argument("--replications", type=int, default=8, help="시나리오당 반복 횟수")
+    parser.add_argument("--users", type=int, default=5000, help="실행당 가상 사용자 수")
+    parser.add_argument("--days", type=int, default=2, help="실행당 시뮬레이션 일수")
+    parser.add_argument("--activities", type=float, default=3.0, help="사용자당 하루 평균 활동 수")
+    parser.add_argument("--workers", type=int, default=None, help="작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--seed", type=int, default=1000, help="기준 시드")
+    args = parser.parse_args()
+
+    try:
+        scenarios = build_scenarios(dict(args.param))
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"🚀 시나리오 {len(scenarios)}개 × 반복 {args.replications}회 실행 중...")
+    report = run_sweep(scenarios, args.replications, args.users, args.days,
+                       args.activities, args.workers, args.seed)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+연속 음성 수집 (Audio Capture)
+마이크(또는 오디오 파일) 스트림을 백그라운드 스레드에서 계속 열어 두고,
+에너지 기반 음성 구간 검출(Recognizer.listen)로 말한 구절을 잘라 크기가 제한된 큐에 넣습니다.
+
+    - 주변 소음 보정(adjust_for_ambient_noise)은 시작할 때 한 번, 이후에는
+      calibration_interval초마다 말이 없는 동안에만 다시 합니다.
+    - 인식기(Google 등)가 구절 N을 인식하는 동안 수집 스레드는 구절 N+1을 듣습니다.
+    - 큐가 가득 차면 가장 오래된 구절을 버립니다 (밀린 명령보다 최근 명령이 중요).
+    - mute(start, end)가 True이면 그 구절은 버립니다 (소리새가 자기 목소리를 명령으로 듣지 않도록).
+      구절이 끝났는지는 무음이 pause_threshold초 이어진 뒤에야 알 수 있으므로, 돌려받은 시점이 아니라
+      구절을 녹음한 구간 전체(start~end)를 넘겨 그동안 소리새가 말했는지 확인합니다.
+    - sr.AudioFile 소스는 파일 끝에서 수집을 마치므로 마이크 없이 실행/테스트할 수 있습니다.
+"""
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+try:
+    import speech_recognition as sr
+    WaitTimeoutError = sr.WaitTimeoutError
+except ImportError:
+    sr = None
+
+    class WaitTimeoutError(Exception):
+        """speech_recognition이 없을 때 쓰는 대기 시간 초과 예외"""
+
+
+class CapturedPhrase:
+    """수집된 구절 하나"""
+
+    __slots__ = ("audio", "captured_at")
+
+    def __init__(self, audio, captured_at: float):
+        self.audio = audio
+        self.captured_at = captured_at
+
+
+class AudioCapture:
+    """백그라운드 스레드로 음성 구절을 계속 수집하는 단계"""
+
+    def __init__(self, recognizer, source_factory: Callable[[], object], queue_size: int = 4,
+                 calibration_interval: float = 60.0, calibration_duration: float = 0.5,
+                 listen_timeout: float = 1.0, phrase_time_limit: Optional[float] = 3,
+                 mute: Optional[Callable[[float, float], bool]] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            recognizer: sr.Recognizer (listen/adjust_for_ambient_noise 사용)
+            source_factory (callable): 오디오 소스 생성 (sr.Microphone, sr.AudioFile 등)
+            queue_size (int): 인식 대기 구절 최대 수
+            calibration_interval (float): 주변 소음 재보정 간격(초)
+            calibration_duration (float): 보정에 쓰는 소리 길이(초)
+            listen_timeout (float): 말 시작을 기다리는 최대 시간(초) - 지나면 종료/재보정 여부 확인
+            phrase_time_limit (float): 구절 최대 길이(초)
+            mute (callable): 구절을 녹음한 구간 (시작, 끝)을 받아 True를 반환하면 그 구절은 버림
+        """
+        self.recognizer = recognizer
+        self.source_factory = source_factory
+        self.calibration_interval = calibration_interval
+        self.calibration_duration = calibration_duration
+        self.listen_timeout = listen_timeout
+        self.phrase_time_limit = phrase_time_limit
+        self.mute = mute
+        self.clock = clock
+        self.phrases: "queue.Queue[CapturedPhrase]" = queue.Queue(maxsize=queue_size)
+        self.stats = {"captured": 0, "dropped_full": 0, "dropped_muted": 0, "calibrations": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_calibrated: Optional[float] = None
+
+    def start(self):
+        """수집 스레드 시작"""
+        if self._thread is None:
+            self._stop.clear()
+            self._finished.clear()
+            self._thread = threading.Thread(target=self._capture_loop, name="audio-capture", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """수집 스레드 종료 (진행 중인 listen은 listen_timeout 안에 끝남)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def exhausted(self) -> bool:
+        """소스가 끝났고(파일 끝/중지) 남은 구절도 없음"""
+        return self._finished.is_set() and self.phrases.empty()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[CapturedPhrase]:
+        """다음 구절 (timeout 동안 없거나 소스가 끝났으면 None)"""
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            try:
+                return self.phrases.get(timeout=0.1)
+            except queue.Empty:
+                if self._finished.is_set() and self.phrases.empty():
+                    return None
+                if deadline is not None and self.clock() >= deadline:
+                    return None
+
+    def calibrate(self, source):
+        """주변 소음 보정"""
+        self.recognizer.adjust_for_ambient_noise(source, duration=self.calibration_duration)
+        self._last_calibrated = self.clock()
+        self.stats["calibrations"] += 1
+
+    def _capture_loop(self):
+        try:
+            with self.source_factory() as source:
+                self.calibrate(source)
+                while not self._stop.is_set():
+                    if self.clock() - self._last_calibrated >= self.calibration_interval:
+                        self.calibrate(source)
+                    try:
+                        audio = self.recognizer.listen(
+                            source, timeout=self.listen_timeout, phrase_time_limit=self.phrase_time_limit
+                        )
+                    except WaitTimeoutError:
+                        if self._source_exhausted(source):
+                            break
+                        continue
+
+                    if self._source_exhausted(source):
+                        # 파일 끝: 말소리 없이 남은 꼬리 구간은 버림
+                        if self._is_speech(audio):
+                            self._enqueue(audio)
+                        break
+                    self._enqueue(audio)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"⚠ 음성 수집 중단: {e}")
+        finally:
+            self._finished.set()
+
+    def _enqueue(self, audio):
+        captured_at = self.clock()
+        if self.mute is not None and self.mute(captured_at - self._duration(audio), captured_at):
+            self.stats["dropped_muted"] += 1
+            return
+        phrase = CapturedPhrase(audio, captured_at)
+        while True:
+            try:
+                self.phrases.put_nowait(phrase)
+                break
+            except queue.Full:
+                try:
+                    self.phrases.get_nowait()
+                    self.stats["dropped_full"] += 1
+                except queue.Empty:
+                    pass
+        self.stats["captured"] += 1
+
+    def _is_speech(self, audio) -> bool:
+        """
+        파일 끝에서 돌려받은 구간이 실제 구절인지 확인
+        (말이 없으면 listen은 앞부분 무음 non_speaking_duration초만 돌려줌)
+        """
+        return self._duration(audio) > getattr(self.recognizer, "non_speaking_duration", 0.5)
+
+    @staticmethod
+    def _duration(audio) -> float:
+        """구절 길이(초) - 알 수 없으면 0"""
+        frame_data = getattr(audio, "frame_data", b"")
+        rate = getattr(audio, "sample_rate", 0) * getattr(audio, "sample_width", 0)
+        return len(frame_data) / rate if frame_data and rate else 0.0
+
+    @staticmethod
+    def _source_exhausted(source) -> bool:
+        """오디오 파일 소스를 끝까지 읽었는지 (마이크는 항상 False)"""
+        reader = getattr(source, "audio_reader", None)
+        if reader is None:
+            return False
+        try:
+            return reader.tell() >= reader.getnframes()
+        except Exception:
+            return False
@@ -21,15 +21,15 @@ class AutoFeatureExpansion:
         needs = []
         
         # 실패한 요청들 분석
-        failed_patterns = learning_engine.knowledge_base.get("failed_responses", {})
+        failed_patterns = learning_engine.response_store.pattern_counts("failed")
         
-        for pattern, failures in failed_patterns.items():
-            if len(failures) >= 3:  # 자주 실패하는 패턴
+        for pattern, failure_count in failed_patterns.items():
+            if failure_count >= 3:  # 자주 실패하는 패턴
                 need = {
                     "pattern": pattern,
-                    "frequency": len(failures),
+                    "frequency": failure_count,
                     "suggested_feature": self.suggest_feature_for_pattern(pattern),
-                    "priority": "high" if len(failures) > 5 else "medium"
+                    "priority": "high" if failure_count > 5 else "medium"
                 }
                 needs.append(need)
         
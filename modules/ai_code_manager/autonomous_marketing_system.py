@@ -7,16 +7,27 @@
 
 import json
 import random
+import threading
 import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from itertools import islice
+from typing import Dict, List, Any, Optional
 import os
 
+from modules.ai_code_manager.streaming_aggregates import TopK
+
+# 캠페인 성과 지표 중 누적 집계하는 항목
+CAMPAIGN_TOTAL_KEYS = ("cost", "revenue", "conversions")
+
+# 공유 스케줄러에 등록하는 자율 마케팅 사이클 작업 이름
+MARKETING_CYCLE_JOB = "marketing.autonomous_cycle"
+
 class AutonomousMarketingSystem:
     """완전 자율 광고 판매 마케팅 시스템"""
     
-    def __init__(self):
-        self.marketing_data_file = "data/autonomous_marketing_data.json"
+    def __init__(self, marketing_data_file: str = "data/autonomous_marketing_data.json"):
+        self.marketing_data_file = marketing_data_file
         self.ad_campaigns = []
         self.sales_analytics = {}
         self.customer_feedback = []
@@ -44,6 +55,16 @@ class AutonomousMarketingSystem:
             "kakao_ads": {"reach": 4000000, "cpc": 350, "conversion_rate": 0.04}
         }
         
+        # 스트리밍 집계 (캠페인 런칭/성과 갱신 시 누적, 리포트는 집계만 읽음)
+        self.campaign_totals = {key: 0 for key in CAMPAIGN_TOTAL_KEYS}
+        self.status_counts = Counter()
+        self.platform_totals: Dict[str, Dict] = {}
+        self.top_campaigns = TopK(5)
+        # 여러 호출자(음성 명령, 대시보드)가 공유하므로 작업 단위로 잠금
+        self.lock = threading.RLock()
+        # 마지막 자율 마케팅 사이클 결과 (조회용)
+        self.last_cycle: Dict = {}
+        
         self.load_marketing_data()
         
     def load_marketing_data(self):
@@ -58,6 +79,56 @@ class AutonomousMarketingSystem:
                     self.marketing_budget = data.get('marketing_budget', 1000000)
         except Exception as e:
             print(f"마케팅 데이터 로드 실패: {e}")
+        self.rebuild_aggregates()
+    
+    def rebuild_aggregates(self):
+        """저장된 캠페인으로 집계 재구성 (로드 시 한 번)"""
+        self.campaign_totals = {key: 0 for key in CAMPAIGN_TOTAL_KEYS}
+        self.status_counts = Counter()
+        self.platform_totals = {}
+        self.top_campaigns = TopK(5)
+        for campaign in self.ad_campaigns:
+            self._count_campaign(campaign)
+            self._add_performance(campaign, {}, campaign.get("performance_metrics", {}))
+    
+    def _count_campaign(self, campaign: Dict):
+        """캠페인 수와 플랫폼별 캠페인 수 집계"""
+        self.status_counts[campaign.get("status")] += 1
+        for platform in campaign.get("platforms", []):
+            self._platform_entry(platform)["campaigns"] += 1
+    
+    def _platform_entry(self, platform: str) -> Dict:
+        entry = self.platform_totals.get(platform)
+        if entry is None:
+            entry = self.platform_totals[platform] = {"campaigns": 0, "cost": 0, "revenue": 0, "conversions": 0}
+        return entry
+    
+    def _add_performance(self, campaign: Dict, old_metrics: Dict, new_metrics: Dict):
+        """성과 지표 변화량을 전체/플랫폼별 누적값과 상위 캠페인에 반영"""
+        platforms = campaign.get("platforms", [])
+        # 플랫폼별 성과는 균등 분배로 계산 (간소화)
+        platform_share = 1 / len(platforms) if platforms else 0
+        for key in CAMPAIGN_TOTAL_KEYS:
+            delta = new_metrics.get(key, 0) - old_metrics.get(key, 0)
+            self.campaign_totals[key] += delta
+            for platform in platforms:
+                self._platform_entry(platform)[key] += delta * platform_share
+        
+        if old_metrics.get("last_updated"):
+            # 이미 집계된 캠페인의 성과를 다시 계산한 경우 (드묾) - 상위 목록만 다시 구성
+            self.top_campaigns = TopK(5)
+            for other in self.ad_campaigns:
+                self._add_top_campaign(other, other.get("performance_metrics", {}))
+        else:
+            self._add_top_campaign(campaign, new_metrics)
+    
+    def _add_top_campaign(self, campaign: Dict, metrics: Dict):
+        self.top_campaigns.add(metrics.get("roi", 0), {
+            "campaign_id": campaign["campaign_id"],
+            "campaign_name": campaign["campaign_name"],
+            "roi": metrics.get("roi", 0),
+            "revenue": metrics.get("revenue", 0)
+        })
             
     def save_marketing_data(self):
         """마케팅 데이터 저장"""
@@ -225,6 +296,7 @@ class AutonomousMarketingSystem:
         }
         
         self.ad_campaigns.append(campaign)
+        self._count_campaign(campaign)
         return campaign
 
     def simulate_campaign_performance(self, campaign: Dict) -> Dict:
@@ -255,6 +327,7 @@ class AutonomousMarketingSystem:
             total_revenue += actual_revenue
         
         # 캠페인 성과 업데이트
+        old_metrics = campaign.get("performance_metrics", {})
         campaign["performance_metrics"] = {
             "impressions": total_impressions,
             "clicks": total_clicks,
@@ -266,6 +339,7 @@ class AutonomousMarketingSystem:
             "conversion_rate": (total_conversions / total_clicks) if total_clicks > 0 else 0,
             "last_updated": datetime.now().isoformat()
         }
+        self._add_performance(campaign, old_metrics, campaign["performance_metrics"])
         
         return campaign["performance_metrics"]
 
@@ -407,30 +481,16 @@ class AutonomousMarketingSystem:
         return optimization_result
 
     def generate_sales_analytics_report(self) -> Dict:
-        """판매 분석 리포트 생성"""
+        """판매 분석 리포트 생성 (누적 집계 기반, 캠페인 이력 크기와 무관)"""
         total_campaigns = len(self.ad_campaigns)
-        active_campaigns = len([c for c in self.ad_campaigns if c["status"] == "활성"])
+        active_campaigns = self.status_counts["활성"]
         
-        total_cost = sum([c["performance_metrics"].get("cost", 0) for c in self.ad_campaigns])
-        total_revenue = sum([c["performance_metrics"].get("revenue", 0) for c in self.ad_campaigns])
-        total_conversions = sum([c["performance_metrics"].get("conversions", 0) for c in self.ad_campaigns])
+        total_cost = self.campaign_totals["cost"]
+        total_revenue = self.campaign_totals["revenue"]
+        total_conversions = self.campaign_totals["conversions"]
         
         overall_roi = (total_revenue / total_cost) if total_cost > 0 else 0
-        
-        # 플랫폼별 성과
-        platform_performance = {}
-        for campaign in self.ad_campaigns:
-            for platform in campaign.get("platforms", []):
-                if platform not in platform_performance:
-                    platform_performance[platform] = {
-                        "campaigns": 0, "cost": 0, "revenue": 0, "conversions": 0
-                    }
-                platform_performance[platform]["campaigns"] += 1
-                # 플랫폼별 성과는 균등 분배로 계산 (간소화)
-                platform_share = 1 / len(campaign.get("platforms", [1]))
-                platform_performance[platform]["cost"] += campaign["performance_metrics"].get("cost", 0) * platform_share
-                platform_performance[platform]["revenue"] += campaign["performance_metrics"].get("revenue", 0) * platform_share
-                platform_performance[platform]["conversions"] += campaign["performance_metrics"].get("conversions", 0) * platform_share
+        platform_performance = self.platform_totals
         
         analytics_report = {
             "report_id": f"RPT_{int(time.time())}",
@@ -454,21 +514,18 @@ class AutonomousMarketingSystem:
                     "roi": round(data["revenue"] / data["cost"], 2) if data["cost"] > 0 else 0
                 } for platform, data in platform_performance.items()
             },
-            "top_performing_campaigns": [
-                {
-                    "campaign_id": c["campaign_id"],
-                    "campaign_name": c["campaign_name"],
-                    "roi": c["performance_metrics"].get("roi", 0),
-                    "revenue": c["performance_metrics"].get("revenue", 0)
-                } 
-                for c in sorted(self.ad_campaigns, key=lambda x: x["performance_metrics"].get("roi", 0), reverse=True)[:5]
-            ]
+            "top_performing_campaigns": [dict(entry) for entry in self.top_campaigns.items()]
         }
         
         return analytics_report
 
     def run_autonomous_marketing_cycle(self) -> Dict:
         """완전 자율 마케팅 사이클 실행"""
+        with self.lock:
+            self.last_cycle = self._run_autonomous_marketing_cycle()
+            return self.last_cycle
+    
+    def _run_autonomous_marketing_cycle(self) -> Dict:
         cycle_results = {
             "cycle_id": f"CYCLE_{int(time.time())}",
             "start_time": datetime.now().isoformat(),
@@ -504,8 +561,9 @@ class AutonomousMarketingSystem:
             self.marketing_budget -= campaign_budget
         
         # 2. 기존 캠페인 최적화
-        active_campaigns = [c for c in self.ad_campaigns if c["status"] == "활성"]
-        for campaign in active_campaigns[-3:]:  # 최근 3개 캠페인 최적화
+        # 최근 활성 캠페인 3개만 뒤에서부터 찾음 (전체 목록을 훑지 않음)
+        recent_active = list(islice((c for c in reversed(self.ad_campaigns) if c["status"] == "활성"), 3))
+        for campaign in reversed(recent_active):  # 최근 3개 캠페인 최적화
             if random.random() > 0.3:  # 70% 확률로 최적화
                 optimization = self.ai_auto_optimization(campaign)
                 cycle_results["actions_performed"].append(f"캠페인 {campaign['campaign_id']} 자동 최적화")
@@ -517,7 +575,7 @@ class AutonomousMarketingSystem:
             cycle_results["actions_performed"].append("고객 피드백 분석 완료")
         
         # 4. 예산 관리
-        total_revenue = sum([c["performance_metrics"].get("revenue", 0) for c in self.ad_campaigns])
+        total_revenue = self.campaign_totals["revenue"]
         if total_revenue > 0:
             # 수익의 30%를 다음 마케팅 예산으로 재투자
             reinvestment = int(total_revenue * 0.3)
@@ -532,12 +590,28 @@ class AutonomousMarketingSystem:
         
         return cycle_results
 
+# 프로세스 전체에서 공유하는 마케팅 서비스
+_marketing_service: Optional[AutonomousMarketingSystem] = None
+_marketing_service_lock = threading.Lock()
+
+
+def get_marketing_service() -> AutonomousMarketingSystem:
+    """공유 마케팅 시스템 반환 (처음 호출 시 한 번만 로드하고 집계 구성)"""
+    global _marketing_service
+    if _marketing_service is None:
+        with _marketing_service_lock:
+            if _marketing_service is None:
+                _marketing_service = AutonomousMarketingSystem()
+    return _marketing_service
+
+
 def create_autonomous_marketing_response(command: str) -> str:
     """자율 마케팅 시스템 응답 생성"""
-    marketing_system = AutonomousMarketingSystem()
+    marketing_system = get_marketing_service()
     
     if "분석" in command or "리포트" in command:
-        analytics = marketing_system.generate_sales_analytics_report()
+        with marketing_system.lock:
+            analytics = marketing_system.generate_sales_analytics_report()
         
         response = "📊 자율 마케팅 분석 리포트\n\n"
         response += f"📈 총 캠페인: {analytics['summary']['total_campaigns']}개\n"
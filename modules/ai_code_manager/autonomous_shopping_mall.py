@@ -6,16 +6,111 @@ AI가 스스로 상품을 기획, 런칭, 판매, 구매를 모두 자동으로
 import json
 import os
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from typing import Callable, Dict, List, Any, Optional
 import time
 
+from modules.ai_code_manager.streaming_aggregates import TimeBucketCounter
+
+# 메모리에 유지하는 최근 주문 수 (전체 이력은 주문 로그 파일에만 보관)
+RECENT_ORDER_LIMIT = 1000
+
+
+class OrderLog:
+    """
+    추가 전용 주문 로그 (JSON Lines)
+    주문은 한 줄씩 이어 쓰기만 하므로 기록 비용이 주문 이력 크기와 무관합니다.
+    """
+
+    def __init__(self, path: str, recent_limit: int = RECENT_ORDER_LIMIT,
+                 on_order: Optional[Callable[[Dict], None]] = None):
+        self.path = path
+        self.count = 0
+        self.recent = deque(maxlen=recent_limit)
+        # 주문마다 호출 (로드 시 재생되는 주문 포함) - 스트리밍 집계 갱신용
+        self.on_order = on_order
+        self._file = None
+        self._load()
+
+    def _load(self):
+        """주문 수와 최근 주문 복원"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    order = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    print(f"⚠ 손상된 주문 로그 레코드 무시: {self.path}")
+                    continue
+                self.count += 1
+                self.recent.append(order)
+                if self.on_order:
+                    self.on_order(order)
+
+    def append(self, orders: List[Dict]):
+        """주문 묶음을 로그 끝에 기록"""
+        if not orders:
+            return
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write("".join(json.dumps(order, ensure_ascii=False) + "\n" for order in orders))
+        self._file.flush()
+        self.count += len(orders)
+        self.recent.extend(orders)
+        if self.on_order:
+            for order in orders:
+                self.on_order(order)
+
+    def iter_orders(self):
+        """전체 주문 이력 순회 (분석용, 파일에서 한 줄씩 읽음)"""
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# 공유 스케줄러에 등록하는 자율 운영 사이클 작업 이름 (멀티 에이전트, 대시보드 공용)
+MALL_CYCLE_JOB = "mall.autonomous_cycle"
+
+
 class AutonomousShoppingMall:
-    def __init__(self):
-        self.mall_data_file = "data/autonomous_mall_data.json"
+    def __init__(self, mall_data_file: str = "data/autonomous_mall_data.json",
+                 order_log_file: Optional[str] = None):
+        self.mall_data_file = mall_data_file
+        
+        # 스트리밍 집계 (이벤트마다 갱신, 분석 시 전체 이력을 다시 훑지 않음)
+        self.recent_orders = TimeBucketCounter(window_seconds=24 * 3600, bucket_seconds=60)
+        self.category_counts = Counter()
+        self.inventory_total = 0
+        
+        # 주문은 스냅샷과 분리된 추가 전용 로그에 기록
+        self.order_log = OrderLog(order_log_file or os.path.splitext(mall_data_file)[0] + "_orders.jsonl",
+                                  on_order=self._count_order)
         self.products = []
         self.customers = []
-        self.orders = []
         self.inventory = {}
         self.market_trends = {}
         self.ai_seller_agents = []
@@ -30,9 +125,22 @@ class AutonomousShoppingMall:
             "market_position": "성장중"
         }
         
+        # 스냅샷 이후 상태 변경 여부 (변경이 없으면 저장하지 않음)
+        self.dirty = False
+        self.snapshots_written = 0
+        # 마지막 자율 운영 사이클 결과 (조회용, 사이클을 다시 돌리지 않음)
+        self.last_cycle: Dict = {}
+        # 음성 명령, 대시보드, 멀티 에이전트가 같은 인스턴스를 공유하므로 작업 단위로 잠금
+        self.lock = threading.RLock()
+        
         self.load_mall_data()
         self.initialize_ai_agents()
     
+    @property
+    def orders(self) -> List[Dict]:
+        """최근 주문 목록 (전체 이력은 order_log.iter_orders())"""
+        return list(self.order_log.recent)
+    
     def load_mall_data(self):
         """쇼핑몰 데이터 로드"""
         if os.path.exists(self.mall_data_file):
@@ -41,26 +149,58 @@ class AutonomousShoppingMall:
                     data = json.load(f)
                     self.products = data.get("products", [])
                     self.customers = data.get("customers", [])
-                    self.orders = data.get("orders", [])
                     self.inventory = data.get("inventory", {})
                     self.mall_stats = data.get("mall_stats", self.mall_stats)
+                    legacy_orders = data.get("orders")
             except (json.JSONDecodeError, IOError, KeyError) as e:
                 print(f"⚠️ 쇼핑몰 데이터 로드 실패: {e}")
-                pass
+                return
+            
+            self.category_counts = Counter(p.get("category", "기타") for p in self.products)
+            self.inventory_total = sum(self.inventory.values())
+            
+            # 이전 형식: 스냅샷 안의 주문 목록을 주문 로그로 한 번만 옮김
+            if legacy_orders is not None:
+                if self.order_log.count == 0:
+                    self.order_log.append(legacy_orders)
+                self.dirty = True
+                self.save_mall_data()
+    
+    def _count_order(self, order: Dict):
+        """주문 시각을 최근 주문 집계에 반영"""
+        try:
+            timestamp = datetime.fromisoformat(order["order_date"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return
+        self.recent_orders.add(timestamp)
     
-    def save_mall_data(self):
-        """쇼핑몰 데이터 저장"""
-        os.makedirs(os.path.dirname(self.mall_data_file), exist_ok=True)
+    def mark_dirty(self):
+        """스냅샷에 저장할 상태가 바뀌었음을 표시"""
+        self.dirty = True
+    
+    def save_mall_data(self, force: bool = False):
+        """쇼핑몰 상태 스냅샷 저장 (주문 제외, 변경이 있을 때만)"""
+        if not (self.dirty or force):
+            return False
+        directory = os.path.dirname(self.mall_data_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         data = {
             "products": self.products,
             "customers": self.customers,
-            "orders": self.orders,
             "inventory": self.inventory,
             "mall_stats": self.mall_stats,
+            "order_count": self.order_log.count,
             "last_updated": datetime.now().isoformat()
         }
-        with open(self.mall_data_file, 'w', encoding='utf-8') as f:
+        # 임시 파일에 쓴 뒤 교체하여 저장 도중 중단되어도 이전 스냅샷 유지
+        tmp_path = self.mall_data_file + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.mall_data_file)
+        self.dirty = False
+        self.snapshots_written += 1
+        return True
     
     def initialize_ai_agents(self):
         """AI 에이전트들 초기화"""
@@ -245,9 +385,12 @@ class AutonomousShoppingMall:
         
         self.products.append(product)
         self.inventory[product["id"]] = product["stock"]
+        self.category_counts[product.get("category", "기타")] += 1
+        self.inventory_total += product["stock"]
         
         # 쇼핑몰 통계 업데이트
         self.mall_stats["active_products"] += 1
+        self.mark_dirty()
         
         result = {
             "success": True,
@@ -276,11 +419,13 @@ class AutonomousShoppingMall:
             if sales_count > 0:
                 # 재고 업데이트
                 self.inventory[product["id"]] -= sales_count
+                self.inventory_total -= sales_count
                 
                 # 주문 생성
+                new_orders = []
                 for i in range(sales_count):
                     order = {
-                        "order_id": f"ORD_{len(self.orders) + i + 1:06d}",
+                        "order_id": f"ORD_{self.order_log.count + i + 1:06d}",
                         "product_id": product["id"],
                         "product_name": product["name"],
                         "price": product["price"],
@@ -289,12 +434,14 @@ class AutonomousShoppingMall:
                         "order_date": datetime.now().isoformat(),
                         "status": "완료"
                     }
-                    self.orders.append(order)
+                    new_orders.append(order)
+                self.order_log.append(new_orders)
                 
                 # 매출 계산
                 revenue = sales_count * product["price"]
                 self.mall_stats["total_revenue"] += revenue
                 self.mall_stats["total_sales"] += sales_count
+                self.mark_dirty()
                 
                 sales_results.append({
                     "product": product["name"],
@@ -314,7 +461,8 @@ class AutonomousShoppingMall:
         needed_categories = ["전자제품", "생활용품", "패션", "도서", "스포츠용품"]
         
         for buyer_agent in self.ai_buyer_agents[:2]:  # 2명의 구매 에이전트
-            if buyer_agent["budget"] > 10000:
+            # 최소 구매가(5,000원)가 예산의 1/3 이내일 때만 구매 (공유 인스턴스라 예산이 계속 줄어듦)
+            if buyer_agent["budget"] // 3 >= 5000:
                 # 구매할 상품 선택
                 category = random.choice(needed_categories)
                 product_name = self.generate_purchase_product(category)
@@ -362,8 +510,8 @@ class AutonomousShoppingMall:
             "총_판매량": self.mall_stats["total_sales"],
             "활성_상품수": self.mall_stats["active_products"],
             "평균_상품가": int(self.mall_stats["total_revenue"] / max(self.mall_stats["total_sales"], 1)),
-            "재고_현황": sum(self.inventory.values()),
-            "최근_주문수": len([o for o in self.orders if o["order_date"] > (datetime.now() - timedelta(days=1)).isoformat()]),
+            "재고_현황": self.inventory_total,
+            "최근_주문수": self.recent_orders.total(),
             "인기_카테고리": self.get_popular_category(),
             "수익성_분석": self.calculate_profitability()
         }
@@ -371,16 +519,10 @@ class AutonomousShoppingMall:
         return analysis
     
     def get_popular_category(self) -> str:
-        """인기 카테고리 분석"""
-        if not self.products:
+        """인기 카테고리 분석 (상품 출시 때 갱신한 카테고리 집계 사용)"""
+        if not self.category_counts:
             return "데이터 없음"
-        
-        categories = {}
-        for product in self.products:
-            cat = product.get("category", "기타")
-            categories[cat] = categories.get(cat, 0) + 1
-        
-        return max(categories.keys(), key=categories.get) if categories else "기타"
+        return self.category_counts.most_common(1)[0][0]
     
     def calculate_profitability(self) -> str:
         """수익성 계산"""
@@ -395,6 +537,11 @@ class AutonomousShoppingMall:
     
     def run_autonomous_cycle(self) -> Dict:
         """자율 운영 사이클 실행"""
+        with self.lock:
+            self.last_cycle = self._run_autonomous_cycle()
+            return self.last_cycle
+    
+    def _run_autonomous_cycle(self) -> Dict:
         cycle_results = {
             "timestamp": datetime.now().isoformat(),
             "actions_performed": [],
@@ -426,15 +573,42 @@ class AutonomousShoppingMall:
                 cycle_results["actions_performed"].append("자동 구매 실행")
                 cycle_results["purchases_made"] = len(purchase_results)
         
-        # 4. 데이터 저장
+        # 4. 데이터 저장 (주문은 이미 로그에 기록됨, 나머지 상태는 바뀐 경우에만)
         self.save_mall_data()
         
         return cycle_results
+    
+    def close(self):
+        """남은 변경분 저장 후 주문 로그 닫기"""
+        with self.lock:
+            self.save_mall_data()
+            self.order_log.close()
+
+
+# 프로세스 전체에서 공유하는 쇼핑몰 서비스
+_mall_service: Optional[AutonomousShoppingMall] = None
+_mall_service_lock = threading.Lock()
+
+
+def get_mall_service() -> AutonomousShoppingMall:
+    """공유 쇼핑몰 인스턴스 반환 (처음 호출 시 한 번만 데이터 로드)"""
+    global _mall_service
+    if _mall_service is None:
+        with _mall_service_lock:
+            if _mall_service is None:
+                _mall_service = AutonomousShoppingMall()
+    return _mall_service
+
 
 # 소리새와 연동을 위한 인터페이스
 def create_autonomous_mall_response(command: str) -> str:
     """소리새용 자율 쇼핑몰 응답 생성"""
-    mall = AutonomousShoppingMall()
+    mall = get_mall_service()
+    with mall.lock:
+        return _mall_command_response(mall, command)
+
+
+def _mall_command_response(mall: AutonomousShoppingMall, command: str) -> str:
     cmd_lower = command.lower()
     
     if "쇼핑몰" in cmd_lower and ("시작" in cmd_lower or "운영" in cmd_lower):
@@ -473,6 +647,7 @@ def create_autonomous_mall_response(command: str) -> str:
         # 신규 상품 기획
         new_product = mall.ai_product_planning()
         launch_result = mall.launch_product(new_product)
+        mall.save_mall_data()
         
         response = f"""🚀 신규 상품 출시!
 
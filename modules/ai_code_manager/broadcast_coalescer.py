@@ -0,0 +1,120 @@
+"""
+브로드캐스트 묶음 전송 (Broadcast Coalescer)
+대시보드 이벤트를 바로 보내지 않고 모아 두었다가 주기(tick)마다 한 번에 전송합니다.
+
+    - 목록형 이벤트(명령 로그, 창의적 활동)는 순서대로 모아 보내고,
+      한 주기에 max_events개를 넘으면 오래된 것부터 버립니다.
+    - 상태형 이벤트(시스템 상태, 듣기 상태, 페르소나)는 주기 안에서 마지막 값만 보냅니다.
+    - 통계는 변경 표시만 해 두고 전송 시점에 한 번 계산하여,
+      마지막으로 보낸 값과 달라진 항목만(델타) 보냅니다.
+
+명령이 몰려도 전송 횟수는 주기당 최대 한 번이므로 클라이언트 수 × 명령 수만큼
+전체 통계가 퍼지지 않습니다. 요청 대비 실제 전송 수는 stats()로 확인할 수 있습니다.
+"""
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+# 주기마다 보내는 묶음 이벤트 이름
+BATCH_EVENT = "dashboard_batch"
+
+
+class BroadcastCoalescer:
+    """주기 단위 이벤트 묶음 + 통계 델타 전송"""
+
+    def __init__(self, emit: Callable[[str, Any], None], stats_provider: Callable[[], Dict],
+                 latest_only: Tuple[str, ...] = (), max_events: int = 50):
+        """
+        Args:
+            emit (callable): emit(이벤트 이름, 데이터) - 모든 클라이언트에 전송
+            stats_provider (callable): 현재 전체 통계를 반환
+            latest_only (tuple): 주기 안에서 마지막 값만 보내는 이벤트 이름
+            max_events (int): 한 주기에 보내는 목록형 이벤트 최대 수
+        """
+        self.emit = emit
+        self.stats_provider = stats_provider
+        self.latest_only = set(latest_only)
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._events: List[Tuple[str, Any]] = []
+        self._latest: Dict[str, Any] = {}
+        self._stats_dirty = False
+        # 마지막으로 보낸 통계 (델타 계산 기준)
+        self._sent_stats: Dict[str, Any] = {}
+        self.counters = {
+            "requested": 0,        # 묶지 않았다면 보냈을 메시지 수
+            "sent": 0,             # 실제 전송한 묶음 메시지 수
+            "events_dropped": 0,   # 주기당 한도를 넘어 버린 목록형 이벤트
+            "events_replaced": 0,  # 같은 주기의 새 값으로 대체된 상태형 이벤트
+            "stats_deltas": 0,     # 변경 항목이 있어 보낸 통계
+            "stats_unchanged": 0,  # 변경 표시됐지만 값이 같아 보내지 않은 통계
+        }
+
+    def queue(self, event: str, data: Any):
+        """다음 주기에 보낼 이벤트 추가"""
+        with self._lock:
+            self.counters["requested"] += 1
+            if event in self.latest_only:
+                if event in self._latest:
+                    self.counters["events_replaced"] += 1
+                self._latest[event] = data
+                return
+            self._events.append((event, data))
+            if len(self._events) > self.max_events:
+                self._events.pop(0)
+                self.counters["events_dropped"] += 1
+
+    def mark_stats_dirty(self):
+        """통계가 바뀌었음을 표시 (값은 전송 시점에 계산)"""
+        with self._lock:
+            self.counters["requested"] += 1
+            self._stats_dirty = True
+
+    def flush(self) -> bool:
+        """
+        모아 둔 이벤트와 통계 델타를 한 메시지로 전송 (주기마다 호출)
+        Returns:
+            bool: 메시지를 보냈는지 여부
+        """
+        with self._lock:
+            stats_dirty = self._stats_dirty
+            self._stats_dirty = False
+
+        # 통계를 먼저 계산: 실패하면 모아 둔 이벤트를 꺼내지 않고 다음 주기에 다시 시도
+        stats = None
+        if stats_dirty:
+            try:
+                stats = self.stats_provider()
+            except Exception:
+                with self._lock:
+                    self._stats_dirty = True
+                raise
+
+        with self._lock:
+            events = self._events + list(self._latest.items())
+            self._events = []
+            self._latest = {}
+
+        delta = {}
+        if stats is not None:
+            delta = {key: value for key, value in stats.items()
+                     if key not in self._sent_stats or self._sent_stats[key] != value}
+            self._sent_stats = stats
+            with self._lock:
+                self.counters["stats_deltas" if delta else "stats_unchanged"] += 1
+
+        if not events and not delta:
+            return False
+        payload = {"events": [{"event": event, "data": data} for event, data in events]}
+        if delta:
+            payload["stats"] = delta
+        self.emit(BATCH_EVENT, payload)
+        with self._lock:
+            self.counters["sent"] += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """전송 카운터 (suppressed = 요청 - 전송)"""
+        with self._lock:
+            counters = dict(self.counters)
+        counters["suppressed"] = counters["requested"] - counters["sent"]
+        return counters
@@ -0,0 +1,113 @@
+"""
+명령 디스패처 (Command Dispatcher)
+서브시스템별 키워드와 핸들러를 라우팅 테이블로 선언하고,
+모든 키워드를 하나의 자동자로 컴파일하여 발화를 한 번만 훑어 경로를 고릅니다.
+
+경로 선택 규칙:
+    1. 일치한 키워드 수가 많은 경로
+    2. 일치한 키워드 길이 합이 긴 경로 (더 구체적인 키워드)
+    3. 테이블에 먼저 등록된 경로
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules.plugins.keyword_router import KeywordAutomaton
+
+
+class Route:
+    """라우팅 테이블 항목"""
+
+    def __init__(self, name: str, keywords: List[str], handler: Callable[[str, str], Optional[str]], priority: int):
+        self.name = name
+        self.keywords = keywords
+        self.handler = handler
+        self.priority = priority
+        self.hits = 0
+        self.handled = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class CommandDispatcher:
+    """선언형 라우팅 테이블 기반 명령 디스패처"""
+
+    def __init__(self):
+        self.routes: List[Route] = []
+        self.automaton = KeywordAutomaton()
+        # 키워드 -> 해당 키워드를 가진 경로 (같은 키워드를 여러 경로가 공유할 수 있음)
+        self.keyword_routes: Dict[str, List[Route]] = {}
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def register(self, name: str, keywords: List[str], handler: Callable[[str, str], Optional[str]]):
+        """경로 추가 (handler는 (원문, 소문자 원문)을 받아 응답 또는 None 반환)"""
+        route = Route(name, keywords, handler, len(self.routes))
+        self.routes.append(route)
+        for keyword in keywords:
+            keyword = keyword.lower()
+            self.automaton.add(keyword, keyword)
+            self.keyword_routes.setdefault(keyword, []).append(route)
+        self.automaton.build()
+        return route
+
+    def resolve(self, text: str) -> Optional[Route]:
+        """발화에 가장 잘 맞는 경로 선택 (없으면 None)"""
+        scores: Dict[int, Tuple[Route, set]] = {}
+        for hit in self.automaton.find_all(text):
+            for route in self.keyword_routes[hit.keyword]:
+                scores.setdefault(route.priority, (route, set()))[1].add(hit.keyword)
+
+        best = None
+        best_rank = None
+        for route, keywords in scores.values():
+            rank = (-len(keywords), -sum(len(k) for k in keywords), route.priority)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = route, rank
+        return best
+
+    def dispatch(self, text: str) -> Optional[str]:
+        """선택된 경로의 핸들러 실행. 해당 경로가 없거나 핸들러가 처리하지 않으면 None"""
+        route = self.resolve(text)
+        if route is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        started = time.perf_counter()
+        try:
+            response = route.handler(text, text.lower())
+        except Exception:
+            with self._lock:
+                route.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                route.hits += 1
+                route.total_seconds += elapsed
+                route.max_seconds = max(route.max_seconds, elapsed)
+
+        if response is not None:
+            with self._lock:
+                route.handled += 1
+        return response
+
+    def get_stats(self) -> Dict:
+        """경로별 적중 횟수와 핸들러 지연 시간 (적중 많은 순)"""
+        with self._lock:
+            routes = [
+                {
+                    "route": route.name,
+                    "hits": route.hits,
+                    "handled": route.handled,
+                    "errors": route.errors,
+                    "avg_ms": round(route.total_seconds / route.hits * 1000, 3) if route.hits else 0.0,
+                    "max_ms": round(route.max_seconds * 1000, 3),
+                }
+                for route in self.routes
+            ]
+            misses = self.misses
+        routes.sort(key=lambda r: r["hits"], reverse=True)
+        return {"routes": routes, "misses": misses, "keywords": len(self.automaton)}
@@ -0,0 +1,143 @@
+"""
+인증 정보 색인 (Credential Index)
+보안 설정의 API 키와 액세스 토큰을 해시값 → (이름, 종류, 권한 집합) 표로 한 번만 만들어 두고
+요청마다 사전 조회 한 번으로 인증과 권한을 확인합니다.
+
+    - 원본 키는 색인에 남기지 않고 SHA-256 해시만 보관합니다.
+    - 조회한 해시는 hmac.compare_digest로 다시 비교합니다 (상수 시간 비교).
+    - 설정 파일의 수정 시각/크기/inode가 바뀌면(SecurityKeyManager 저장 등) 다음 조회 때 다시 만듭니다.
+      파일 확인은 check_interval초에 한 번만 합니다.
+    - 다시 읽다가 파일이 없거나 형식이 잘못되면 마지막으로 읽은 정상 설정과 색인을 유지합니다
+      (기본 설정으로 바뀌어 인증이 꺼지지 않도록).
+"""
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+
+class Credential(NamedTuple):
+    """색인된 인증 정보 하나"""
+    name: str
+    kind: str  # "api_key" 또는 "token"
+    permissions: FrozenSet[str]
+    digest: bytes
+
+    def allows(self, permission: Optional[str]) -> bool:
+        """permission 권한 보유 여부 (all 권한은 모두 허용, permission이 없으면 인증만 확인)"""
+        return permission is None or permission in self.permissions or "all" in self.permissions
+
+
+def credential_digest(credential: str) -> bytes:
+    return hashlib.sha256(credential.encode("utf-8")).digest()
+
+
+def build_credential_table(config: Dict) -> Dict[bytes, Credential]:
+    """보안 설정에서 해시 → 인증 정보 표 생성 (키와 토큰 값이 같으면 API 키 우선)"""
+    security = config.get("security", {})
+    permissions = security.get("permissions", {})
+    table = {}
+    for kind, section in (("token", "access_tokens"), ("api_key", "api_keys")):
+        for name, value in security.get(section, {}).items():
+            if not isinstance(value, str) or not value:
+                continue
+            digest = credential_digest(value)
+            table[digest] = Credential(name, kind, frozenset(permissions.get(name, [])), digest)
+    return table
+
+
+class CredentialIndex:
+    """설정 파일 변경 시 자동으로 다시 만드는 인증 정보 색인"""
+
+    def __init__(self, loader: Callable[[], Dict], path: Optional[str] = None,
+                 check_interval: float = 1.0, clock: Callable[[], float] = time.monotonic,
+                 fallback: Optional[Callable[[], Dict]] = None):
+        """
+        Args:
+            loader (callable): 보안 설정 dict를 반환 (읽기/파싱 오류는 예외로 전달)
+            path (str): 변경을 감시할 설정 파일 경로 (없으면 감시하지 않음)
+            check_interval (float): 파일 변경 확인 최소 간격(초)
+            fallback (callable): 정상 설정을 한 번도 읽지 못했을 때 쓸 기본 설정
+        """
+        self.loader = loader
+        self.path = path
+        self.check_interval = check_interval
+        self.clock = clock
+        self.fallback = fallback
+        self.reloads = 0
+        self.failed_reloads = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._config: Dict = {}
+        self._table: Dict[bytes, Credential] = {}
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self.reload()
+
+    @property
+    def config(self) -> Dict:
+        """현재 보안 설정 (필요하면 먼저 다시 읽음)"""
+        self._reload_if_changed()
+        return self._config
+
+    def reload(self):
+        """설정을 다시 읽어 색인 재구성"""
+        with self._lock:
+            signature = self._file_signature()
+            try:
+                config = self.loader()
+                if not isinstance(config, dict):
+                    raise ValueError(f"보안 설정이 객체가 아닙니다: {type(config).__name__}")
+                table = build_credential_table(config)
+            except Exception as e:
+                if self._loaded:
+                    # 다음 파일 변경 때 다시 시도
+                    self._signature = signature
+                    self._checked_at = self.clock()
+                    self.failed_reloads += 1
+                    print(f"⚠ 보안 설정 다시 읽기 실패, 이전 설정 유지: {e}")
+                    return
+                if self.fallback is None:
+                    raise
+                print(f"⚠ 보안 설정 읽기 실패, 기본 설정 사용: {e}")
+                config = self.fallback()
+                table = build_credential_table(config)
+            else:
+                self._loaded = True
+            self._table = table
+            self._config = config
+            self._signature = signature
+            self._checked_at = self.clock()
+            self.reloads += 1
+
+    def lookup(self, credential: Optional[str]) -> Optional[Credential]:
+        """인증 정보 조회 (유효하지 않으면 None)"""
+        if not credential or not isinstance(credential, str):
+            return None
+        self._reload_if_changed()
+        digest = credential_digest(credential)
+        entry = self._table.get(digest)
+        if entry is None or not hmac.compare_digest(entry.digest, digest):
+            return None
+        return entry
+
+    def __len__(self):
+        return len(self._table)
+
+    def _file_signature(self) -> Optional[Tuple]:
+        if not self.path:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _reload_if_changed(self):
+        if not self.path or self.clock() - self._checked_at < self.check_interval:
+            return
+        self._checked_at = self.clock()
+        if self._file_signature() != self._signature:
+            self.reload()
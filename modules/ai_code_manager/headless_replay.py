@@ -0,0 +1,317 @@
+"""
+헤드리스 재생 (Headless Replay)
+마이크와 TTS 없이 발화 코퍼스를 SorisayCore.run()에 그대로 흘려 보내 처리 속도와 정확도를 측정합니다.
+
+코퍼스는 한 줄에 발화 하나인 JSONL 파일입니다:
+    {"text": "테스트 실행해줘", "intent": "test", "plugin": "개발 도구"}
+
+    - intent/plugin은 기대값이며 null은 "없어야 함", 생략하거나 "*"이면 채점하지 않습니다.
+    - plugin은 학습된 지식으로 바로 답한 턴(route="learned")에서는 채점하지 않습니다.
+
+헤드리스 모드에서는
+    - listen()이 코퍼스를 차례로 돌려주고, 끝나면 루프를 멈춥니다 (음성 수집/인식 단계 없음).
+    - 음성 출력은 FakeSpeechEngine으로 보내고 TTS 캐시는 쓰지 않습니다.
+    - 웹 검색은 네트워크 대신 web_results 함수(기본: 결과 없음)를 부릅니다.
+    - 플러그인은 execute_plugins=True가 아니면 실행하지 않고 어떤 명령이 골라졌는지만 기록합니다.
+    - 지식 베이스와 기억 파일은 workdir 아래에 새로 만듭니다.
+
+사용 예:
+    report = replay(load_corpus("tests/data/voice_corpus.jsonl"), repeat=50)
+    print(format_report(report))
+"""
+import contextlib
+import copy
+import gc
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from collections import Counter
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from modules.ai_code_manager.memory_palace import MemoryPalace
+from modules.ai_code_manager.self_learning_engine import SelfLearningEngine
+from modules.ai_code_manager.sorisay_core_controller import SorisayCore
+from modules.ai_code_manager.speech_output import FakeSpeechEngine
+from modules.ai_code_manager.turn_tracing import TurnTracer
+
+ANY = "*"  # 채점하지 않는 기대값
+DEFAULT_CONFIG = "modules/ai_code_manager/settings.json"
+DEFAULT_CORPUS = "tests/data/voice_corpus.jsonl"
+
+
+class Utterance(NamedTuple):
+    """코퍼스 발화 하나"""
+    index: int  # 코퍼스 줄 번호 (1부터)
+    text: str
+    intent: Optional[str]
+    plugin: Optional[str]
+
+
+class TurnResult(NamedTuple):
+    """재생한 턴 하나의 결과"""
+    utterance: Utterance
+    intent: Optional[str]
+    plugin: Optional[str]
+    route: str  # "learned" 또는 "pipeline"
+    duration: float  # 초
+
+
+def load_corpus(path: str) -> List[Utterance]:
+    """JSONL 코퍼스 로드 (빈 줄과 #으로 시작하는 줄은 건너뜀)"""
+    utterances = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number} 줄을 읽을 수 없습니다: {e}")
+            utterances.append(Utterance(
+                line_number,
+                record["text"],
+                record.get("intent", ANY),
+                record.get("plugin", ANY)
+            ))
+    return utterances
+
+
+class HeadlessSorisayCore(SorisayCore):
+    """코퍼스를 입력으로, 가짜 엔진을 출력으로 쓰는 SorisayCore"""
+
+    def __init__(self, utterances: List[Utterance], workdir: str, config_path: str = DEFAULT_CONFIG,
+                 execute_plugins: bool = False,
+                 web_results: Optional[Callable[[str], List[Dict]]] = None):
+        """
+        Args:
+            utterances (list): 재생할 발화 (load_corpus 결과)
+            workdir (str): 지식 베이스/기억 파일을 만들 디렉터리
+            execute_plugins (bool): True면 플러그인 명령을 실제로 실행
+            web_results (callable): 검색어 → 검색 결과 목록 (None이면 항상 결과 없음)
+        """
+        self.utterances = list(utterances)
+        self.workdir = workdir
+        self.execute_plugins = execute_plugins
+        self.web_results = web_results or (lambda query: [])
+        self.web_requests = 0
+        self.plugin_calls = Counter()
+        self.turns: List[TurnResult] = []
+        self.tts_engine = FakeSpeechEngine("headless")
+        self._next_utterance = 0
+        self._current: Optional[Utterance] = None
+        super().__init__(config_path)
+        # 공유 추적기 대신 이 재생 전용 추적기 사용
+        self.tracer = TurnTracer()
+        self.tracer.add_listener(self._record_turn)
+
+    def load_config(self, config_path):
+        """설정 로드 후 파일/네트워크를 쓰는 항목 끄기"""
+        config = copy.deepcopy(super().load_config(config_path))
+        config.setdefault("tts", {})["cache_dir"] = None
+        config["tracing"] = {"slow_turn_threshold": None, "slow_turn_log": None}
+        config["startup"] = {"hot_services": [], "background_warm_up": False}
+        return config
+
+    def register_services(self):
+        """핵심 엔진 중 파일을 쓰는 엔진은 workdir 경로로 다시 등록"""
+        super().register_services()
+        memory_config = self.config.get("memory_palace", {})
+        self.services.register("learning_engine", self.create_learning_engine, eager=True)
+        self.services.register("memory_palace", lambda: MemoryPalace(
+            memory_file=os.path.join(self.workdir, "memories.json"),
+            max_memories=memory_config.get("max_conversations", 1000)), eager=True)
+
+    def create_learning_engine(self) -> SelfLearningEngine:
+        engine = SelfLearningEngine(knowledge_path=os.path.join(self.workdir, "knowledge_base.json"))
+        engine.fetch_web_results = self.fetch_web_results
+        return engine
+
+    def create_plugin_manager(self):
+        plugin_manager = super().create_plugin_manager()
+        if not self.execute_plugins:
+            plugin_manager.execute_command = self.record_plugin_command
+        return plugin_manager
+
+    def create_tts_engine(self):
+        return self.tts_engine
+
+    def fetch_web_results(self, query: str, max_results: int = 3) -> List[Dict]:
+        """네트워크 대신 web_results 함수 호출"""
+        self.web_requests += 1
+        return self.web_results(query)[:max_results]
+
+    def record_plugin_command(self, plugin_name: str, command: str, text: str) -> str:
+        """플러그인 명령을 실행하지 않고 기록만 함"""
+        self.plugin_calls[(plugin_name, command)] += 1
+        return f"{plugin_name}: {command} 명령 (헤드리스 재생에서는 실행하지 않음)"
+
+    def listen(self):
+        """코퍼스의 다음 발화 반환 (다 쓰면 루프 종료)"""
+        if self._next_utterance >= len(self.utterances):
+            self.running = False
+            return None
+        self._current = self.utterances[self._next_utterance]
+        self._next_utterance += 1
+        self.tracer.begin_turn(utterance=self._current.index)
+        return self._current.text
+
+    def _record_turn(self, turn):
+        if self._current is None:
+            return
+        plugin = next((span.attributes.get("plugin") for span in turn.walk() if span.name == "plugin"), None)
+        self.turns.append(TurnResult(
+            self._current,
+            turn.attributes.get("intent"),
+            plugin,
+            turn.attributes.get("route", "pipeline"),
+            turn.duration
+        ))
+        self._current = None
+
+
+def _rss_kb() -> Optional[int]:
+    """현재 프로세스 상주 메모리(KB) - /proc가 없는 환경에서는 None"""
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+def _accuracy(pairs) -> Dict:
+    pairs = list(pairs)
+    correct = sum(1 for expected, actual in pairs if expected == actual)
+    return {"scored": len(pairs), "correct": correct,
+            "accuracy": correct / len(pairs) if pairs else 1.0}
+
+
+def replay(utterances: List[Utterance], repeat: int = 1, workdir: Optional[str] = None,
+           config_path: str = DEFAULT_CONFIG, seed: int = 0, execute_plugins: bool = False,
+           web_results: Optional[Callable[[str], List[Dict]]] = None, quiet: bool = True) -> Dict:
+    """
+    코퍼스를 repeat번 이어 붙여 재생하고 처리량/단계별 시간/정확도/메모리 증가량 보고
+
+    시작(엔진 생성) 시간은 처리량에서 빼고 startup_seconds로 따로 보고합니다.
+    quiet=True면 재생 중 콘솔 출력을 버립니다.
+    """
+    random.seed(seed)
+    corpus = [utterance for _ in range(repeat) for utterance in utterances]
+    own_workdir = workdir is None
+    workdir = tempfile.mkdtemp(prefix="sorisay_replay_") if own_workdir else workdir
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, \
+                (contextlib.redirect_stdout(devnull) if quiet else contextlib.nullcontext()):
+            started = time.perf_counter()
+            core = HeadlessSorisayCore(corpus, workdir, config_path,
+                                       execute_plugins=execute_plugins, web_results=web_results)
+            startup_seconds = time.perf_counter() - started
+
+            gc.collect()
+            objects_before = len(gc.get_objects())
+            rss_before = _rss_kb()
+            started = time.perf_counter()
+            for _ in core.run():
+                pass
+            elapsed = time.perf_counter() - started
+            gc.collect()
+            objects_after = len(gc.get_objects())
+            rss_after = _rss_kb()
+    finally:
+        if own_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    turns = core.turns
+    # 같은 줄에서 같은 결과로 틀린 턴은 한 항목으로 묶음 (반복 재생 시 count 증가)
+    mismatches: Dict[tuple, Dict] = {}
+    for turn in turns:
+        expected = turn.utterance
+        wrong_intent = expected.intent != ANY and turn.intent != expected.intent
+        wrong_plugin = expected.plugin != ANY and turn.route != "learned" and turn.plugin != expected.plugin
+        if not (wrong_intent or wrong_plugin):
+            continue
+        key = (expected.index, turn.intent, turn.plugin if wrong_plugin else ANY)
+        if key not in mismatches:
+            mismatches[key] = {"line": expected.index, "text": expected.text,
+                               "expected_intent": expected.intent, "intent": turn.intent,
+                               "expected_plugin": expected.plugin, "plugin": key[2], "count": 0}
+        mismatches[key]["count"] += 1
+    return {
+        "utterances": len(corpus),
+        "processed": len(turns),
+        "startup_seconds": startup_seconds,
+        "seconds": elapsed,
+        "commands_per_sec": len(turns) / elapsed if elapsed > 0 else 0.0,
+        "stages": core.tracer.snapshot()["stages"],
+        "routes": dict(Counter(turn.route for turn in turns)),
+        "intent": _accuracy((turn.utterance.intent, turn.intent)
+                            for turn in turns if turn.utterance.intent != ANY),
+        "plugin": _accuracy((turn.utterance.plugin, turn.plugin) for turn in turns
+                            if turn.utterance.plugin != ANY and turn.route != "learned"),
+        "mismatches": list(mismatches.values()),
+        "plugin_calls": {f"{plugin}/{command}": count for (plugin, command), count in core.plugin_calls.items()},
+        "web_requests": core.web_requests,
+        "spoken": len(core.tts_engine.spoken),
+        "memory": {
+            "gc_objects_growth": objects_after - objects_before,
+            "rss_growth_kb": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        },
+    }
+
+
+def check_regression(report: Dict, baseline: Dict, max_drop_percent: float) -> List[str]:
+    """
+    기준값과 비교하여 회귀 목록 반환 (빈 목록이면 통과)
+        - 처리량이 기준보다 max_drop_percent% 넘게 떨어짐
+        - 의도 정확도가 기준보다 낮아짐
+    """
+    failures = []
+    baseline_rate = baseline.get("commands_per_sec")
+    if baseline_rate:
+        floor = baseline_rate * (1 - max_drop_percent / 100)
+        if report["commands_per_sec"] < floor:
+            drop = (1 - report["commands_per_sec"] / baseline_rate) * 100
+            failures.append(
+                f"처리량 {report['commands_per_sec']:.1f}명령/초 < 기준 {baseline_rate:.1f}명령/초의 "
+                f"{100 - max_drop_percent:.0f}% ({drop:.1f}% 하락)"
+            )
+    baseline_accuracy = baseline.get("intent_accuracy")
+    if baseline_accuracy is not None and report["intent"]["accuracy"] + 1e-9 < baseline_accuracy:
+        failures.append(
+            f"의도 정확도 {report['intent']['accuracy']:.1%} < 기준 {baseline_accuracy:.1%}"
+        )
+    return failures
+
+
+def format_report(report: Dict, max_mismatches: int = 10) -> str:
+    """replay() 결과를 사람이 읽는 형식으로 정리"""
+    lines = [
+        f"발화 {report['processed']}/{report['utterances']}개 처리, {report['seconds']:.2f}초 "
+        f"(시작 {report['startup_seconds']:.2f}초 제외)",
+        f"처리량: {report['commands_per_sec']:.1f}명령/초",
+        f"의도 정확도: {report['intent']['correct']}/{report['intent']['scored']} ({report['intent']['accuracy']:.1%})",
+        f"플러그인 정확도: {report['plugin']['correct']}/{report['plugin']['scored']} "
+        f"({report['plugin']['accuracy']:.1%}, 학습 응답 턴 제외)",
+        f"응답 경로: {report['routes']}, 웹 검색 요청 {report['web_requests']}회, 음성 출력 {report['spoken']}회",
+    ]
+    memory = report["memory"]
+    rss = f"{memory['rss_growth_kb']:+d}KB" if memory["rss_growth_kb"] is not None else "측정 불가"
+    lines.append(f"메모리 증가: 객체 {memory['gc_objects_growth']:+d}개, RSS {rss}")
+    lines.append("단계별 시간 (ms):")
+    for name, stage in sorted(report["stages"].items(), key=lambda item: -item[1]["avg"] * item[1]["count"]):
+        lines.append(
+            f"  {name:15} {stage['count']:6d}회  평균 {stage['avg'] * 1000:8.2f}  "
+            f"p50 {stage['p50'] * 1000:8.2f}  p95 {stage['p95'] * 1000:8.2f}  p99 {stage['p99'] * 1000:8.2f}"
+        )
+    if report["mismatches"]:
+        lines.append(f"불일치 {len(report['mismatches'])}종 (처음 {max_mismatches}종):")
+        for item in report["mismatches"][:max_mismatches]:
+            detail = f"의도 {item['intent']} (기대 {item['expected_intent']})"
+            if item["plugin"] != ANY:
+                detail += f", 플러그인 {item['plugin']} (기대 {item['expected_plugin']})"
+            lines.append(f"  {item['line']}줄 '{item['text']}' {item['count']}회: {detail}")
+    return "\n".join(lines)
@@ -0,0 +1,220 @@
+"""
+의도 매칭 엔진 (Intent Matcher)
+NLPProcessor의 의도 패턴을 미리 컴파일하고, 정규식 실행 전에
+필수 리터럴 기반 사전 필터로 후보 패턴을 걸러냅니다.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 정규식 메타 문자 (calculate_similarity와 동일한 정리 규칙)
+_CLEAN_PATTERN_RE = re.compile(r'[.*\[\](){}\\|+?^$]')
+
+# 필터링을 포기해야 하는 구조 (그룹, 문자 클래스, 선택)
+_UNFILTERABLE_CHARS = set("|()[]{")
+_QUANTIFIER_CHARS = set("*+?")
+_ANCHOR_CHARS = set(".^$")
+
+
+def pattern_words(pattern: str) -> frozenset:
+    """패턴에서 메타 문자를 제거한 단어 집합"""
+    return frozenset(_CLEAN_PATTERN_RE.sub('', pattern).split())
+
+
+def _is_cased_non_ascii(ch: str) -> bool:
+    """IGNORECASE에서 다른 문자와 대응될 수 있는 비 ASCII 문자인지 확인"""
+    return not ch.isascii() and ch.lower() != ch.upper()
+
+
+def extract_required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    패턴이 매칭되려면 텍스트에 반드시 들어 있어야 하는 리터럴 목록 추출
+    Returns:
+        List[str]: 소문자로 정규화된 필수 리터럴 (비어 있을 수 있음)
+        None: 안전하게 분석할 수 없는 패턴 (항상 정규식으로 검사)
+    """
+    literals = []
+    current = []
+
+    def flush():
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    i = 0
+    length = len(pattern)
+    while i < length:
+        ch = pattern[i]
+
+        if ch in _UNFILTERABLE_CHARS:
+            return None
+
+        if ch in _QUANTIFIER_CHARS or ch in _ANCHOR_CHARS:
+            flush()
+            i += 1
+            continue
+
+        if ch == '\\':
+            if i + 1 >= length:
+                return None
+            escaped = pattern[i + 1]
+            # \d, \b, \x41 같은 특수 이스케이프는 분석하지 않음
+            if escaped.isalnum() or escaped == '_':
+                return None
+            literal, i = escaped, i + 2
+        else:
+            literal, i = ch, i + 1
+
+        # 수량자가 붙은 문자는 필수 문자가 아님
+        if i < length and (pattern[i] in _QUANTIFIER_CHARS or pattern[i] == '{'):
+            flush()
+            continue
+
+        if _is_cased_non_ascii(literal):
+            flush()
+            continue
+
+        current.append(literal.lower())
+
+    flush()
+    return literals
+
+
+class _CompiledPattern:
+    """미리 컴파일된 단일 패턴"""
+
+    __slots__ = ("intent", "pattern", "order", "regex", "words", "literals", "ascii_cased")
+
+    def __init__(self, intent: str, pattern: str, order: Tuple[int, int], regex):
+        self.intent = intent
+        self.pattern = pattern
+        self.order = order
+        self.regex = regex
+        self.words = pattern_words(pattern)
+        self.literals = extract_required_literals(pattern)
+        self.ascii_cased = bool(self.literals) and any(
+            c.isascii() and c.isalpha() for literal in self.literals for c in literal
+        )
+
+    def score(self, text_words: set) -> float:
+        """매칭된 패턴의 유사도 (calculate_similarity와 동일한 결과)"""
+        if not self.words:
+            return 0.5
+        similarity = len(text_words & self.words) / len(self.words)
+        return min(similarity + 0.3, 1.0)
+
+
+class IntentMatcher:
+    """사전 필터 + 컴파일된 정규식 기반 의도 매칭 엔진"""
+
+    def __init__(self, intent_patterns: Optional[Dict] = None):
+        self.entries: List[_CompiledPattern] = []
+        self.intent_order: Dict[str, int] = {}
+        self.pattern_counts: Dict[str, int] = {}
+        # 리터럴 첫 글자 -> 후보 패턴 목록
+        self.char_index: Dict[str, List[_CompiledPattern]] = {}
+        # 사전 필터를 적용할 수 없어 항상 검사하는 패턴
+        self.always_check: List[_CompiledPattern] = []
+
+        if intent_patterns:
+            self.rebuild(intent_patterns)
+
+    def rebuild(self, intent_patterns: Dict):
+        """전체 패턴 설정으로 인덱스 재구성"""
+        self.entries = []
+        self.intent_order = {}
+        self.pattern_counts = {}
+        self.char_index = {}
+        self.always_check = []
+
+        for intent, config in intent_patterns.get("intents", {}).items():
+            for pattern in config.get("patterns", []):
+                self.add(intent, pattern)
+
+    def add(self, intent: str, pattern: str):
+        """패턴 하나를 컴파일하여 인덱스에 추가"""
+        if intent not in self.intent_order:
+            self.intent_order[intent] = len(self.intent_order)
+        index = self.pattern_counts.get(intent, 0)
+        self.pattern_counts[intent] = index + 1
+
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            print(f"⚠ 잘못된 의도 패턴 무시: {intent} / {pattern} ({e})")
+            return
+
+        entry = _CompiledPattern(intent, pattern, (self.intent_order[intent], index), regex)
+        self.entries.append(entry)
+
+        if entry.literals:
+            anchor = max(entry.literals, key=len)
+            self.char_index.setdefault(anchor[0], []).append(entry)
+        else:
+            self.always_check.append(entry)
+
+    def candidates(self, text: str) -> List[_CompiledPattern]:
+        """사전 필터를 통과한 후보 패턴 (원래 검사 순서대로)"""
+        # 비 ASCII 대소문자 문자가 있으면 ASCII 리터럴 비교를 신뢰할 수 없음
+        plain_text = not any(_is_cased_non_ascii(c) for c in text)
+
+        selected = list(self.always_check)
+        for ch in set(text):
+            bucket = self.char_index.get(ch)
+            if bucket:
+                selected.extend(bucket)
+
+        if not plain_text:
+            selected.extend(
+                entry for bucket in self.char_index.values() for entry in bucket
+                if entry.ascii_cased
+            )
+
+        result = []
+        seen = set()
+        for entry in selected:
+            if id(entry) in seen:
+                continue
+            seen.add(id(entry))
+            if (plain_text or not entry.ascii_cased) and entry.literals:
+                if not all(literal in text for literal in entry.literals):
+                    continue
+            result.append(entry)
+
+        result.sort(key=lambda entry: entry.order)
+        return result
+
+    def match(self, text: str, text_words: Optional[set] = None) -> Tuple[Optional[str], float, Optional[str]]:
+        """
+        정규화된(소문자, strip) 텍스트에서 최적 의도 검색
+        Args:
+            text_words: 미리 분리한 단어 집합 (없으면 text.split()으로 계산)
+        Returns:
+            tuple: (intent, score, pattern) 또는 (None, 0.0, None)
+        """
+        best_intent = None
+        best_score = 0.0
+        matched_pattern = None
+        if text_words is None:
+            text_words = set(text.split())
+
+        for entry in self.candidates(text):
+            if entry.regex.search(text):
+                similarity = entry.score(text_words)
+                if similarity > best_score:
+                    best_intent = entry.intent
+                    best_score = similarity
+                    matched_pattern = entry.pattern
+
+        return best_intent, best_score, matched_pattern
+
+    def count_matches(self, text: str) -> Dict[str, int]:
+        """
+        정규화된 텍스트에 일치하는 패턴 수를 의도별로 집계
+        Returns:
+            dict: 등록 순서대로 모든 의도를 포함 (일치가 없으면 0)
+        """
+        counts = {intent: 0 for intent in self.intent_order}
+        for entry in self.candidates(text):
+            if entry.regex.search(text):
+                counts[entry.intent] += 1
+        return counts
@@ -0,0 +1,254 @@
+"""
+작업 스케줄러 (Job Scheduler)
+프로세스 전체의 주기 작업을 스레드 하나에서 협력적으로 실행합니다.
+
+    - 작업은 이름으로 등록하며, 같은 이름을 여러 곳에서 등록해도 한 번만 실행됩니다
+      (쇼핑몰 사이클처럼 여러 화면/에이전트가 같은 작업을 원할 때 중복 실행과 중복 저장 방지).
+      등록한 곳이 여럿이면 가장 짧은 주기를 쓰고, 모두 해제해야 작업이 제거됩니다.
+    - jitter로 시작 시각을 흩어 여러 작업이 같은 순간에 몰리지 않게 합니다.
+    - 작업 실행이 주기보다 오래 걸리면(초과) 밀린 회차를 쌓아 두지 않고 건너뛰어
+      다음 회차부터 다시 주기를 맞춥니다 (역압). 초과와 건너뛴 회차는 통계로 남습니다.
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class ScheduledJob:
+    """등록된 주기 작업 하나의 상태"""
+
+    def __init__(self, name: str, func: Callable[[], object], interval: float, jitter: float):
+        self.name = name
+        self.func = func
+        self.jitter = jitter
+        # 등록한 곳마다의 주기 (가장 짧은 주기로 실행)
+        self.intervals: List[float] = [interval]
+        # 주기 기준 실행 시각과 jitter를 더한 실제 실행 시각 (jitter가 누적되지 않도록 분리)
+        self.next_due = 0.0
+        self.next_run = 0.0
+        self.runs = 0
+        self.errors = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.last_error: Optional[str] = None
+        self.last_result = None
+
+    @property
+    def interval(self) -> float:
+        return min(self.intervals)
+
+    def stats(self) -> Dict:
+        return {
+            "interval": self.interval,
+            "subscribers": len(self.intervals),
+            "runs": self.runs,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "last_duration": round(self.last_duration, 4),
+            "max_duration": round(self.max_duration, 4),
+            "last_error": self.last_error,
+        }
+
+
+class JobScheduler:
+    """이름 있는 주기 작업 스케줄러 (실행 스레드 하나, 다음 실행 시각 순 힙)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, seed: Optional[int] = None):
+        self.clock = clock
+        self._random = random.Random(seed)
+        self._jobs: Dict[str, ScheduledJob] = {}
+        # (다음 실행 시각, 순번, 작업) - 해제되거나 재예약된 항목은 꺼낼 때 걸러냄
+        self._heap: List = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def register(self, name: str, func: Callable[[], object], interval: float,
+                 jitter: float = 0.0, run_immediately: bool = False) -> ScheduledJob:
+        """
+        주기 작업 등록
+        Args:
+            name (str): 작업 이름 (이미 있으면 기존 작업을 공유)
+            func (callable): 인자 없이 호출할 함수
+            interval (float): 실행 주기(초)
+            jitter (float): 첫 실행과 매 회차에 더할 무작위 지연 비율 (0.1이면 주기의 최대 10%)
+            run_immediately (bool): 첫 실행을 주기만큼 기다리지 않고 바로 실행
+        Returns:
+            ScheduledJob: 등록(또는 공유)된 작업
+        """
+        if interval <= 0:
+            raise ValueError(f"작업 주기는 0보다 커야 합니다: {name}={interval}")
+
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is not None:
+                job.intervals.append(interval)
+                # 더 짧은 주기가 들어오면 다음 실행도 앞당김
+                earliest = self.clock() + interval
+                if earliest < job.next_due:
+                    self._schedule(job, earliest)
+                return job
+
+            job = ScheduledJob(name, func, interval, jitter)
+            self._jobs[name] = job
+            first = self.clock() if run_immediately else self.clock() + interval
+            self._schedule(job, first, jittered=not run_immediately)
+            return job
+
+    def unregister(self, name: str, interval: Optional[float] = None) -> bool:
+        """
+        작업 등록 해제 (등록한 곳이 모두 해제해야 실제로 제거)
+        Returns:
+            bool: 작업이 제거되었는지 여부
+        """
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is None:
+                return False
+            if interval is not None and interval in job.intervals:
+                job.intervals.remove(interval)
+            else:
+                job.intervals.pop()
+            if job.intervals:
+                return False
+            del self._jobs[name]
+            self._condition.notify()
+            return True
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._jobs
+
+    def get(self, name: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(name)
+
+    def run_pending(self) -> int:
+        """
+        실행 시각이 된 작업을 모두 실행 (실행 스레드 또는 테스트에서 직접 호출)
+        Returns:
+            int: 실행한 작업 수
+        """
+        executed = 0
+        while True:
+            with self._condition:
+                job = self._pop_due(self.clock())
+            if job is None:
+                return executed
+            self._run(job)
+            executed += 1
+
+    def start(self):
+        """백그라운드 실행 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._loop, name="job-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """실행 스레드 정지 (실행 중인 작업은 끝까지 실행)"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def stats(self) -> Dict[str, Dict]:
+        """작업별 실행 통계"""
+        with self._condition:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def _jitter(self, job: ScheduledJob) -> float:
+        return self._random.uniform(0, job.jitter * job.interval) if job.jitter else 0.0
+
+    def _schedule(self, job: ScheduledJob, due: float, jittered: bool = True):
+        job.next_due = due
+        job.next_run = due + (self._jitter(job) if jittered else 0.0)
+        heapq.heappush(self._heap, (job.next_run, next(self._sequence), job))
+        self._condition.notify()
+
+    def _pop_due(self, now: float) -> Optional[ScheduledJob]:
+        """실행 시각이 된 작업 하나 (해제되었거나 재예약으로 낡은 항목은 버림)"""
+        while self._heap:
+            when, _, job = self._heap[0]
+            if self._jobs.get(job.name) is not job or when != job.next_run:
+                heapq.heappop(self._heap)
+                continue
+            if when > now:
+                return None
+            heapq.heappop(self._heap)
+            return job
+        return None
+
+    def _run(self, job: ScheduledJob):
+        due = job.next_due
+        started = self.clock()
+        try:
+            job.last_result = job.func()
+        except Exception as e:
+            job.errors += 1
+            job.last_error = str(e)
+            print(f"⚠ 예약 작업 '{job.name}' 실행 오류: {e}")
+        finished = self.clock()
+
+        job.runs += 1
+        job.last_duration = finished - started
+        job.max_duration = max(job.max_duration, job.last_duration)
+        interval = job.interval
+        if job.last_duration > interval:
+            job.overruns += 1
+            print(f"⚠ 예약 작업 '{job.name}' 실행 시간 초과: {job.last_duration:.2f}초 (주기 {interval:g}초)")
+
+        # 밀린 회차는 쌓지 않고 건너뜀 - 다음 실행은 항상 미래의 회차
+        next_run = due + interval
+        if next_run <= finished:
+            missed = int((finished - next_run) // interval) + 1
+            job.skipped += missed
+            next_run += missed * interval
+
+        with self._condition:
+            if self._jobs.get(job.name) is job:
+                self._schedule(job, next_run)
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                if self._heap:
+                    timeout = max(0.0, self._heap[0][0] - self.clock())
+                else:
+                    timeout = None
+                if timeout is None or timeout > 0:
+                    # 새 작업 등록이나 정지 요청이 오면 바로 깨어남
+                    self._condition.wait(timeout)
+                    continue
+            self.run_pending()
+
+
+# 프로세스 전체에서 공유하는 스케줄러
+_scheduler: Optional[JobScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> JobScheduler:
+    """공유 스케줄러 반환 (처음 호출 시 생성하고 실행 스레드 시작)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = JobScheduler()
+                _scheduler.start()
+    return _scheduler
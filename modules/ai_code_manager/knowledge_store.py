@@ -0,0 +1,229 @@
+"""
+지식 저장소 (Knowledge Store)
+지식 베이스 변경분을 추가 전용 로그(WAL)에 기록하고,
+백그라운드에서 스냅샷으로 압축합니다.
+
+파일 구성:
+    knowledge_base.json          - 스냅샷 (마지막 압축 시점)
+    knowledge_base.json.wal      - 스냅샷 이후 변경 로그 (JSON Lines)
+    knowledge_base.json.wal.old  - 압축 중인 이전 로그
+"""
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+SEQ_KEY = "_log_seq"
+
+
+class KnowledgeStore:
+    """스냅샷 + 변경 로그 기반 지식 베이스 저장소"""
+
+    def __init__(self, snapshot_path: str, compact_every: int = 500,
+                 fsync: bool = False, background: bool = True):
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path + ".wal"
+        self.old_log_path = snapshot_path + ".wal.old"
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.background = background
+
+        self.data: Dict = {}
+        self.seq = 0
+        self.records_since_compaction = 0
+
+        self._lock = threading.RLock()
+        # 압축은 한 번에 하나만 실행 (늦게 끝난 이전 압축이 새 스냅샷을 덮어쓰지 않도록)
+        self._compaction_lock = threading.Lock()
+        self._log_file = None
+        self._compaction_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+    def load(self, default_factory: Callable[[], Dict]) -> Dict:
+        """스냅샷을 읽고 변경 로그를 재생하여 지식 베이스 복원"""
+        with self._lock:
+            data = None
+            snapshot_seq = 0
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                snapshot_seq = data.pop(SEQ_KEY, 0)
+            if data is None:
+                data = default_factory()
+
+            self.data = data
+            self.seq = snapshot_seq
+            replayed = 0
+            for path in (self.old_log_path, self.log_path):
+                replayed += self._replay(path, snapshot_seq)
+            self.records_since_compaction = replayed
+            return self.data
+
+    def _replay(self, path: str, snapshot_seq: int) -> int:
+        """로그 파일 하나를 재생 (스냅샷에 이미 반영된 레코드는 건너뜀)"""
+        if not os.path.exists(path):
+            return 0
+
+        replayed = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    print(f"⚠ 손상된 지식 로그 레코드 무시: {path}")
+                    continue
+                if record["seq"] <= snapshot_seq:
+                    continue
+                self._apply(record["op"], record["path"], record.get("value"))
+                self.seq = max(self.seq, record["seq"])
+                replayed += 1
+        return replayed
+
+    # ------------------------------------------------------------------
+    # 변경 기록
+    # ------------------------------------------------------------------
+    def append(self, path: List[str], value: Any):
+        """path 위치의 리스트에 값 추가"""
+        self._record("append", path, value)
+
+    def set(self, path: List[str], value: Any):
+        """path 위치에 값 설정"""
+        self._record("set", path, value)
+
+    def delete(self, path: List[str]):
+        """path 위치의 값 삭제"""
+        self._record("delete", path, None)
+
+    def _record(self, op: str, path: List[str], value: Any):
+        with self._lock:
+            self._apply(op, path, value)
+            self.seq += 1
+            record = {"seq": self.seq, "op": op, "path": path}
+            if op != "delete":
+                record["value"] = value
+            self._write_record(record)
+            self.records_since_compaction += 1
+            should_compact = self.records_since_compaction >= self.compact_every
+
+        if should_compact:
+            self.request_compaction()
+
+    def _apply(self, op: str, path: List[str], value: Any):
+        """메모리 상의 지식 베이스에 변경 적용"""
+        parent = self.data
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        last = path[-1]
+
+        if op == "append":
+            parent.setdefault(last, []).append(value)
+        elif op == "set":
+            parent[last] = value
+        elif op == "delete":
+            parent.pop(last, None)
+        else:
+            raise ValueError(f"알 수 없는 로그 연산: {op}")
+
+    def _write_record(self, record: Dict):
+        try:
+            if self._log_file is None:
+                directory = os.path.dirname(self.log_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._log_file = open(self.log_path, 'a', encoding='utf-8')
+            self._log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log_file.flush()
+            if self.fsync:
+                os.fsync(self._log_file.fileno())
+        except Exception as e:
+            print(f"⚠ 지식 로그 기록 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 압축
+    # ------------------------------------------------------------------
+    def request_compaction(self):
+        """스냅샷 압축 요청 (백그라운드 모드면 별도 스레드에서 실행)"""
+        if not self.background:
+            self.compact()
+            return
+
+        with self._lock:
+            if self._compaction_thread and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self.compact, name="KnowledgeStoreCompaction", daemon=True
+            )
+            self._compaction_thread.start()
+
+    def compact(self):
+        """현재 상태를 스냅샷으로 저장하고 반영된 로그 정리"""
+        with self._compaction_lock:
+            try:
+                with self._lock:
+                    snapshot = dict(self.data)
+                    snapshot[SEQ_KEY] = self.seq
+                    text = json.dumps(snapshot, indent=2, ensure_ascii=False)
+                    self._rotate_log()
+                    self.records_since_compaction = 0
+
+                self._write_snapshot(text)
+
+                # 스냅샷에 반영된 이전 로그 제거
+                with self._lock:
+                    if os.path.exists(self.old_log_path):
+                        os.remove(self.old_log_path)
+            except Exception as e:
+                print(f"⚠ 지식 베이스 스냅샷 저장 실패: {e}")
+
+    def _write_snapshot(self, text: str):
+        """스냅샷 파일 원자적 교체 (_compaction_lock 보유 상태에서 호출)"""
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _rotate_log(self):
+        """현재 로그를 .old로 넘기고 새 로그 시작 (lock 보유 상태에서 호출)"""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+        if not os.path.exists(self.log_path):
+            return
+        if os.path.exists(self.old_log_path):
+            # 이전 압축이 끝나지 않은 경우 로그를 이어 붙임
+            with open(self.log_path, 'r', encoding='utf-8') as src, \
+                    open(self.old_log_path, 'a', encoding='utf-8') as dst:
+                dst.write(src.read())
+            os.remove(self.log_path)
+        else:
+            os.replace(self.log_path, self.old_log_path)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None):
+        """진행 중인 백그라운드 압축 대기"""
+        thread = self._compaction_thread
+        if thread and thread.is_alive():
+            thread.join(timeout)
+
+    def close(self):
+        """남은 변경분을 스냅샷으로 압축하고 로그 파일 닫기"""
+        self.wait_for_compaction()
+        with self._lock:
+            pending = self.records_since_compaction > 0 or os.path.exists(self.old_log_path)
+        if pending:
+            self.compact()
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
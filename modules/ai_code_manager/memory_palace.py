@@ -4,16 +4,157 @@
 """
 import json
 import os
+import copy
+import time
+import heapq
+import atexit
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set
 import hashlib
 
+def char_bigrams(text: str) -> Set[str]:
+    """부분 문자열 검색용 글자 2-gram 집합 (공백 포함, 조사가 붙은 한국어 단어도 찾을 수 있음)"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class MemoryIndex:
+    """대화 기억 역색인 (글자 2-gram/태그/중요도 -> 기억 번호)"""
+    
+    def __init__(self):
+        self.entries: Dict[int, Dict] = {}          # 기억 번호 -> 기억
+        self.input_texts: Dict[int, str] = {}       # 소문자 변환한 입력
+        self.response_texts: Dict[int, str] = {}    # 소문자 변환한 응답
+        self.input_postings: Dict[str, Set[int]] = {}
+        self.response_postings: Dict[str, Set[int]] = {}
+        self.tag_postings: Dict[str, Set[int]] = {}
+        self.importance_order: Dict[Any, deque] = {}  # 중요도 -> 오래된 순 기억 번호
+        self.order = deque()                         # 오래된 순 기억 번호
+        self.next_seq = 0
+    
+    def add(self, memory: Dict) -> int:
+        """기억 하나를 색인에 추가"""
+        seq = self.next_seq
+        self.next_seq += 1
+        
+        self.entries[seq] = memory
+        self.order.append(seq)
+        self.input_texts[seq] = memory.get("user_input", "").lower()
+        self.response_texts[seq] = memory.get("ai_response", "").lower()
+        
+        for gram in char_bigrams(self.input_texts[seq]):
+            self.input_postings.setdefault(gram, set()).add(seq)
+        for gram in char_bigrams(self.response_texts[seq]):
+            self.response_postings.setdefault(gram, set()).add(seq)
+        for tag in memory.get("context_tags", []):
+            self.tag_postings.setdefault(tag, set()).add(seq)
+        self.importance_order.setdefault(memory.get("importance_score", 1), deque()).append(seq)
+        return seq
+    
+    def remove_oldest(self, count: int):
+        """가장 오래된 기억 count개를 색인에서 제거"""
+        for _ in range(min(count, len(self.order))):
+            seq = self.order.popleft()
+            memory = self.entries.pop(seq)
+            self._discard(self.input_postings, char_bigrams(self.input_texts.pop(seq)), seq)
+            self._discard(self.response_postings, char_bigrams(self.response_texts.pop(seq)), seq)
+            self._discard(self.tag_postings, memory.get("context_tags", []), seq)
+            # 가장 오래된 기억이므로 중요도 목록에서도 맨 앞에 있음
+            importance = memory.get("importance_score", 1)
+            bucket = self.importance_order[importance]
+            bucket.popleft()
+            if not bucket:
+                del self.importance_order[importance]
+    
+    @staticmethod
+    def _discard(postings: Dict[str, Set[int]], keys, seq: int):
+        for key in keys:
+            bucket = postings.get(key)
+            if bucket is not None:
+                bucket.discard(seq)
+                if not bucket:
+                    del postings[key]
+    
+    def _containing(self, query: str, postings: Dict[str, Set[int]], texts: Dict[int, str]) -> Set[int]:
+        """질의 전체를 부분 문자열로 포함하는 기억 번호"""
+        grams = char_bigrams(query)
+        if grams:
+            # 모든 2-gram을 가진 기억만 후보로 두고 실제 포함 여부 확인
+            buckets = sorted((postings.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*buckets)
+        else:
+            # 한 글자 이하 질의는 전체 확인
+            candidates = texts.keys()
+        return {seq for seq in candidates if query in texts[seq]}
+    
+    def search(self, query: str, query_tags: List[str], limit: int) -> List[tuple]:
+        """
+        게시 목록을 병합하여 상위 limit개 검색 (점수는 전체 순회 방식과 동일)
+        Returns:
+            List[tuple]: [(점수, 기억), ...] 점수 내림차순
+        """
+        query = query.lower()
+        input_matches = self._containing(query, self.input_postings, self.input_texts)
+        response_matches = self._containing(query, self.response_postings, self.response_texts)
+        
+        tag_hits: Dict[int, int] = {}
+        for tag in set(query_tags):
+            for seq in self.tag_postings.get(tag, ()):
+                tag_hits[seq] = tag_hits.get(seq, 0) + 1
+        
+        candidates = input_matches | response_matches | set(tag_hits)
+        
+        def score(seq: int) -> float:
+            # 질의가 입력에 포함되면 3점, 응답에 포함되면 2점, 공통 태그마다 1점
+            value = 0
+            if seq in input_matches:
+                value += 3
+            if seq in response_matches:
+                value += 2
+            value += tag_hits.get(seq, 0)
+            value += self.entries[seq].get("importance_score", 1) * 0.1
+            return value
+        
+        # 동점이면 먼저 저장된 기억 우선
+        top = heapq.nlargest(limit, ((score(seq), -seq) for seq in candidates))
+        results = [(value, self.entries[-neg_seq]) for value, neg_seq in top]
+        
+        # 일치하는 기억이 부족하면 중요도 점수만 있는 기억으로 채움 (항상 일치 점수보다 낮음)
+        for importance in sorted(self.importance_order, reverse=True):
+            if len(results) >= limit or importance <= 0:
+                break
+            for seq in self.importance_order[importance]:
+                if len(results) >= limit:
+                    break
+                if seq not in candidates:
+                    results.append((importance * 0.1, self.entries[seq]))
+        return results
+
+
 class MemoryPalace:
-    def __init__(self, memory_file="memories/sorisay_memories.json"):
+    def __init__(self, memory_file="memories/sorisay_memories.json", max_memories: int = 1000,
+                 write_behind: bool = True, flush_interval: float = 2.0, flush_threshold: int = 20):
         self.memory_file = memory_file
+        self.max_memories = max_memories
+        self.memory_index = MemoryIndex()
         self.memories = self.load_memories()
         self.conversation_context = []
         
+        # 지연 쓰기 설정: 변경분은 백그라운드 writer가 모아서 저장
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._writer_cond = threading.Condition(self._lock)
+        self._writer_thread = None
+        self._dirty = 0
+        self._first_dirty_at = None
+        self._closed = False
+        if write_behind:
+            atexit.register(self.close)
+        
         # 기억 카테고리
         self.memory_categories = {
             "personal": [],      # 사용자 개인 정보
@@ -26,34 +167,127 @@ class MemoryPalace:
         }
     
     def load_memories(self) -> Dict:
-        """기억 파일 로드"""
+        """기억 파일 로드 (검색 색인 재구성)"""
+        memories = None
         try:
             os.makedirs(os.path.dirname(self.memory_file), exist_ok=True)
             if os.path.exists(self.memory_file):
                 with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    memories = json.load(f)
         except Exception as e:
             print(f"기억 로드 실패: {e}")
         
-        return {
-            "conversations": [],
-            "user_profile": {},
-            "emotional_history": [],
-            "learning_moments": [],
-            "creative_collaborations": []
-        }
+        if memories is None:
+            memories = {
+                "conversations": [],
+                "user_profile": {},
+                "emotional_history": [],
+                "learning_moments": [],
+                "creative_collaborations": []
+            }
+        
+        self.rebuild_index(memories)
+        return memories
+    
+    def rebuild_index(self, memories: Dict = None):
+        """대화 기억 전체로 역색인 재구성"""
+        if memories is None:
+            memories = self.memories
+        self.memory_index = MemoryIndex()
+        for memory in memories.get("conversations", []):
+            self.memory_index.add(memory)
     
     def save_memories(self):
-        """기억 파일 저장"""
-        try:
-            os.makedirs(os.path.dirname(self.memory_file), exist_ok=True)
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memories, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"기억 저장 실패: {e}")
+        """기억 파일 즉시 저장 (임시 파일 작성 후 원자적 교체)"""
+        with self._lock:
+            snapshot = self._snapshot()
+            self._dirty = 0
+            self._first_dirty_at = None
+        self._write_snapshot(snapshot)
+    
+    def _snapshot(self) -> Dict:
+        """직렬화용 사본 (lock 보유 상태에서 호출, 대화 항목은 불변이라 얕은 복사)"""
+        snapshot = {}
+        for key, value in self.memories.items():
+            if key == "conversations":
+                snapshot[key] = list(value)
+            else:
+                snapshot[key] = copy.deepcopy(value)
+        return snapshot
+    
+    def _write_snapshot(self, snapshot: Dict):
+        with self._write_lock:
+            try:
+                os.makedirs(os.path.dirname(self.memory_file), exist_ok=True)
+                tmp_path = self.memory_file + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.memory_file)
+            except Exception as e:
+                print(f"기억 저장 실패: {e}")
+    
+    def mark_dirty(self):
+        """변경 표시 (지연 쓰기 모드가 아니면 즉시 저장)"""
+        if not self.write_behind or self._closed:
+            self.save_memories()
+            return
+        
+        with self._lock:
+            self._dirty += 1
+            if self._first_dirty_at is None:
+                self._first_dirty_at = time.monotonic()
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="MemoryPalaceWriter", daemon=True
+                )
+                self._writer_thread.start()
+            self._writer_cond.notify()
+    
+    def _writer_loop(self):
+        """시간/개수 임계값에 도달하면 변경분을 저장하는 백그라운드 writer"""
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._dirty == 0:
+                        self._writer_cond.wait()
+                        continue
+                    waited = time.monotonic() - self._first_dirty_at
+                    if self._dirty >= self.flush_threshold or waited >= self.flush_interval:
+                        break
+                    self._writer_cond.wait(self.flush_interval - waited)
+                if self._closed:
+                    return
+                snapshot = self._snapshot()
+                self._dirty = 0
+                self._first_dirty_at = None
+            self._write_snapshot(snapshot)
+    
+    def flush(self):
+        """저장되지 않은 변경분이 있으면 즉시 저장"""
+        with self._lock:
+            if self._dirty == 0:
+                return
+        self.save_memories()
+    
+    def close(self):
+        """writer를 멈추고 마지막 변경분 저장 (종료 시 호출)"""
+        with self._lock:
+            already_closed = self._closed
+            self._closed = True
+            self._writer_cond.notify_all()
+        writer = self._writer_thread
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        if not already_closed:
+            self.flush()
     
     def remember_conversation(self, user_input: str, ai_response: str, emotion: str = "neutral"):
-        """대화 내용을 기억에 저장"""
+        """대화 내용을 기억에 저장 (파일 저장은 writer가 모아서 처리)"""
+        with self._lock:
+            self._remember(user_input, ai_response, emotion)
+        self.mark_dirty()
+    
+    def _remember(self, user_input: str, ai_response: str, emotion: str):
         memory = {
             "id": hashlib.md5(f"{datetime.now().isoformat()}{user_input}".encode()).hexdigest()[:8],
             "timestamp": datetime.now().isoformat(),
@@ -65,15 +299,16 @@ class MemoryPalace:
         }
         
         self.memories["conversations"].append(memory)
+        self.memory_index.add(memory)
         
         # 중요한 정보는 사용자 프로필에 추가
         self.update_user_profile(user_input)
         
-        # 메모리 정리 (1000개 이상 시 오래된 것 삭제)
-        if len(self.memories["conversations"]) > 1000:
-            self.memories["conversations"] = self.memories["conversations"][-1000:]
-        
-        self.save_memories()
+        # 메모리 정리 (max_memories 초과 시 오래된 것 삭제)
+        excess = len(self.memories["conversations"]) - self.max_memories
+        if excess > 0:
+            del self.memories["conversations"][:excess]
+            self.memory_index.remove_oldest(excess)
     
     def extract_context_tags(self, text: str) -> List[str]:
         """텍스트에서 컨텍스트 태그 추출"""
@@ -141,35 +376,16 @@ class MemoryPalace:
             self.memories["user_profile"]["likes"] = preferences[-10:]  # 최근 10개만 유지
     
     def recall_memories(self, query: str, limit: int = 5) -> List[Dict]:
-        """관련 기억 검색"""
+        """관련 기억 검색 (글자 2-gram/태그 역색인 기반 상위 limit개)"""
+        query_tags = self.extract_context_tags(query)
+        
         relevant_memories = []
-        query_lower = query.lower()
-        
-        for memory in self.memories["conversations"]:
-            score = 0
-            
-            # 텍스트 유사도 기반 점수
-            if query_lower in memory["user_input"].lower():
-                score += 3
-            if query_lower in memory["ai_response"].lower():
-                score += 2
-            
-            # 태그 매칭 점수
-            query_tags = self.extract_context_tags(query)
-            common_tags = set(query_tags) & set(memory["context_tags"])
-            score += len(common_tags)
-            
-            # 중요도 점수
-            score += memory["importance_score"] * 0.1
-            
-            if score > 0:
-                memory_with_score = memory.copy()
-                memory_with_score["relevance_score"] = score
-                relevant_memories.append(memory_with_score)
-        
-        # 점수순으로 정렬하여 상위 결과 반환
-        relevant_memories.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return relevant_memories[:limit]
+        for score, memory in self.memory_index.search(query, query_tags, limit):
+            memory_with_score = memory.copy()
+            memory_with_score["relevance_score"] = score
+            relevant_memories.append(memory_with_score)
+        
+        return relevant_memories
     
     def get_personality_insights(self) -> str:
         """사용자 성격 인사이트 생성"""
@@ -7,15 +7,29 @@ import threading
 import time
 from datetime import datetime
 import random
-from typing import Dict, List
-from autonomous_shopping_mall import AutonomousShoppingMall
+from typing import Dict, List, Optional
+from modules.ai_code_manager.autonomous_shopping_mall import MALL_CYCLE_JOB, get_mall_service
+from modules.ai_code_manager.job_scheduler import get_scheduler
+
+# 공유 스케줄러에 등록하는 주기 작업 (이름, 주기 초)
+# 쇼핑몰 사이클은 대시보드와 같은 이름으로 등록해 한 번만 실행됨
+AUTONOMOUS_JOBS = (
+    (MALL_CYCLE_JOB, 2.0),
+    ("multi_agent.optimization", 10.0),
+    ("multi_agent.performance_review", 20.0),
+    ("multi_agent.collaboration_meeting", 30.0),
+)
 
 class MultiAgentShoppingSystem:
     def __init__(self):
-        self.mall = AutonomousShoppingMall()
+        # 음성 명령과 같은 쇼핑몰 상태를 공유
+        self.mall = get_mall_service()
         self.agents = {}
         self.agent_communications = []
         self.system_running = False
+        self.scheduler = get_scheduler()
+        # 시작/정지가 겹쳐도 주기 작업을 한 번만 등록/해제
+        self.lock = threading.Lock()
         
         # 전문 에이전트들 초기화
         self.initialize_specialist_agents()
@@ -286,37 +300,31 @@ class MultiAgentShoppingSystem:
     
     def start_autonomous_system(self):
         """자율 시스템 시작"""
-        self.system_running = True
-        
-        def system_loop():
-            cycle_count = 0
-            while self.system_running:
-                cycle_count += 1
-                
-                # 주기적 작업들
-                if cycle_count % 5 == 0:  # 5 사이클마다
-                    self.real_time_optimization()
-                
-                if cycle_count % 10 == 0:  # 10 사이클마다
-                    self.agent_performance_review()
-                
-                if cycle_count % 15 == 0:  # 15 사이클마다
-                    self.agent_collaboration_meeting("정기 성과 검토")
-                
-                # 쇼핑몰 기본 운영
-                self.mall.run_autonomous_cycle()
-                
-                time.sleep(2)  # 2초 대기
-        
-        # 백그라운드에서 시스템 실행
-        system_thread = threading.Thread(target=system_loop, daemon=True)
-        system_thread.start()
+        with self.lock:
+            if self.system_running:
+                return {"message": "멀티 에이전트 자율 시스템이 이미 운영 중입니다.", "status": "running"}
+            self.system_running = True
+            
+            # 공유 스케줄러에 주기 작업 등록 (별도 스레드를 만들지 않음)
+            jobs = {
+                MALL_CYCLE_JOB: self.mall.run_autonomous_cycle,
+                "multi_agent.optimization": self.real_time_optimization,
+                "multi_agent.performance_review": self.agent_performance_review,
+                "multi_agent.collaboration_meeting": lambda: self.agent_collaboration_meeting("정기 성과 검토"),
+            }
+            for name, interval in AUTONOMOUS_JOBS:
+                self.scheduler.register(name, jobs[name], interval, jitter=0.1)
         
         return {"message": "멀티 에이전트 자율 시스템이 시작되었습니다!", "status": "running"}
     
     def stop_autonomous_system(self):
         """자율 시스템 정지"""
-        self.system_running = False
+        with self.lock:
+            if not self.system_running:
+                return {"message": "멀티 에이전트 시스템이 이미 정지되어 있습니다.", "status": "stopped"}
+            self.system_running = False
+            for name, interval in AUTONOMOUS_JOBS:
+                self.scheduler.unregister(name, interval)
         return {"message": "멀티 에이전트 시스템이 정지되었습니다.", "status": "stopped"}
     
     def get_system_dashboard(self) -> Dict:
@@ -340,10 +348,26 @@ class MultiAgentShoppingSystem:
         
         return dashboard
 
+# 프로세스 전체에서 공유하는 멀티 에이전트 시스템
+# (multi_agent.* 작업은 에이전트 상태를 다루므로 인스턴스 하나만 등록해야 정지도 가능)
+_multi_agent_system: Optional[MultiAgentShoppingSystem] = None
+_multi_agent_system_lock = threading.Lock()
+
+
+def get_multi_agent_system() -> MultiAgentShoppingSystem:
+    """공유 멀티 에이전트 시스템 반환 (처음 호출 시 한 번만 생성)"""
+    global _multi_agent_system
+    if _multi_agent_system is None:
+        with _multi_agent_system_lock:
+            if _multi_agent_system is None:
+                _multi_agent_system = MultiAgentShoppingSystem()
+    return _multi_agent_system
+
+
 # 소리새 통합 함수
 def create_multi_agent_response(command: str) -> str:
     """소리새용 멀티 에이전트 응답"""
-    system = MultiAgentShoppingSystem()
+    system = get_multi_agent_system()
     cmd_lower = command.lower()
     
     if "멀티" in cmd_lower and "시작" in cmd_lower:
@@ -362,6 +386,12 @@ def create_multi_agent_response(command: str) -> str:
 
 🚀 시스템 상태: 완전 자율 운영 중!"""
     
+    elif "멀티" in cmd_lower and ("정지" in cmd_lower or "중지" in cmd_lower):
+        result = system.stop_autonomous_system()
+        return f"""🛑 {result['message']}
+
+⏸️ 주기 작업(최적화, 성과 검토, 정기 회의)을 모두 해제했습니다."""
+    
     elif "회의" in cmd_lower or "협업" in cmd_lower:
         meeting = system.agent_collaboration_meeting("신제품 출시 전략")
         return f"""🤝 AI 에이전트 협업 회의 완료!
@@ -411,7 +441,7 @@ def create_multi_agent_response(command: str) -> str:
   • 24/7 무인 운영 가능
 
 📱 사용법:
-  • "멀티 에이전트 시작해줘"
+  • "멀티 에이전트 시작해줘" / "멀티 에이전트 정지해줘"
   • "AI 회의 진행해줘"  
   • "시스템 대시보드 보여줘"
   • "실시간 최적화 해줘"
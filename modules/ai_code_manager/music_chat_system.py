@@ -11,13 +11,20 @@
 """
 
 import json
+import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 import uuid
 
+# 방마다 메모리에 두는 최근 메시지 수와 디스크 세그먼트 하나의 메시지 수
+ROOM_BUFFER_SIZE = 500
+SEGMENT_SIZE = 1000
+
 @dataclass
 class ChatUser:
     """채팅 사용자 정보"""
@@ -35,23 +42,166 @@ class ChatUser:
         if self.instruments is None:
             self.instruments = []
 
-@dataclass
 class ChatMessage:
-    """채팅 메시지"""
-    message_id: str
-    user_id: str
-    username: str
-    content: str
-    message_type: str  # 'text', 'music', 'lyrics', 'collaboration'
-    timestamp: str
-    room_id: str
-    music_data: Dict[str, Any] = None  # 음악/가사 데이터
-    
-    def __post_init__(self):
-        if not self.message_id:
-            self.message_id = str(uuid.uuid4())[:8]
-        if not self.timestamp:
-            self.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    """
+    채팅 메시지 (__slots__ 레코드)
+    방마다 수백 개씩 메모리에 머무르므로 인스턴스 dict 없이 보관하고,
+    직렬화 결과(to_dict)는 처음 한 번만 만들어 재사용합니다.
+    """
+    __slots__ = ("message_id", "user_id", "username", "content", "message_type",
+                 "timestamp", "room_id", "music_data", "_serialized")
+    FIELDS = __slots__[:-1]
+
+    def __init__(self, message_id: str, user_id: str, username: str, content: str,
+                 message_type: str, timestamp: str, room_id: str,
+                 music_data: Dict[str, Any] = None):
+        self.message_id = message_id or str(uuid.uuid4())[:8]
+        self.user_id = user_id
+        self.username = username
+        self.content = content
+        self.message_type = message_type  # 'text', 'music', 'lyrics', 'collaboration'
+        self.timestamp = timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.room_id = room_id
+        self.music_data = music_data  # 음악/가사 데이터
+        self._serialized: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 결과 (캐시된 dict이므로 읽기 전용으로 사용)"""
+        if self._serialized is None:
+            self._serialized = {field: getattr(self, field) for field in self.FIELDS}
+        return self._serialized
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatMessage":
+        message = cls(**{field: data.get(field) for field in cls.FIELDS})
+        message._serialized = data
+        return message
+
+    def __repr__(self):
+        return f"ChatMessage({self.message_id!r}, {self.username!r}, {self.content!r})"
+
+
+class RoomHistory:
+    """
+    방 하나의 메시지 기록
+    최근 capacity개는 메모리 링 버퍼에, 밀려난 메시지는 디스크 세그먼트(JSON Lines)에 보관합니다.
+    메시지마다 방 안에서 증가하는 순번을 매기고, 세그먼트는 (첫 순번, 개수, 경로)만 메모리에 둡니다.
+    segment_dir이 없으면 밀려난 메시지는 버립니다.
+    """
+
+    def __init__(self, room_id: str, capacity: int = ROOM_BUFFER_SIZE,
+                 segment_dir: Optional[str] = None, segment_size: int = SEGMENT_SIZE):
+        self.room_id = room_id
+        self.capacity = capacity
+        self.segment_dir = os.path.join(segment_dir, room_id) if segment_dir else None
+        self.segment_size = segment_size
+        self.lock = threading.Lock()
+        self._buffer = deque()
+        self._positions: Dict[str, int] = {}  # 메모리에 있는 메시지 ID -> 순번
+        self._first_seq = 0  # 버퍼 맨 앞 메시지의 순번
+        self._segments: List[List] = []  # [첫 순번, 개수, 경로]
+        self._load_segments()
+
+    @property
+    def total(self) -> int:
+        """지금까지 기록된 전체 메시지 수 (디스크 포함)"""
+        return self._first_seq + len(self._buffer)
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def append(self, message: ChatMessage):
+        with self.lock:
+            if len(self._buffer) >= self.capacity:
+                evicted = self._buffer.popleft()
+                self._positions.pop(evicted.message_id, None)
+                self._spill(self._first_seq, evicted)
+                self._first_seq += 1
+            self._positions[message.message_id] = self.total
+            self._buffer.append(message)
+
+    def recent(self, limit: int) -> List[ChatMessage]:
+        """메모리에 있는 최근 메시지 (오래된 것부터)"""
+        with self.lock:
+            start = max(0, len(self._buffer) - limit)
+            return list(islice(self._buffer, start, None))
+
+    def page(self, limit: int = 50, before: Optional[str] = None) -> Dict[str, Any]:
+        """
+        커서 기반 페이지 조회
+        Args:
+            limit (int): 최대 메시지 수
+            before (str): 이 메시지 ID보다 이전 메시지만 (없으면 최신부터)
+        Returns:
+            dict: messages(오래된 것부터, 직렬화됨), next_before(다음 페이지 커서), has_more
+        """
+        with self.lock:
+            end = self.total if before is None else self._find_sequence(before)
+            if end is None:
+                return {"messages": [], "next_before": None, "has_more": False}
+            start = max(0, end - limit)
+            disk_end = min(end, self._first_seq)
+            messages = self._read_segments(start, disk_end) if start < disk_end else []
+            messages.extend(message.to_dict() for message in islice(
+                self._buffer, max(0, start - self._first_seq), max(0, end - self._first_seq)))
+
+        oldest_available = self._segments[0][0] if self._segments else self._first_seq
+        has_more = start > oldest_available
+        return {
+            "messages": messages,
+            "next_before": messages[0]["message_id"] if has_more and messages else None,
+            "has_more": has_more,
+        }
+
+    def _find_sequence(self, message_id: str) -> Optional[int]:
+        if message_id in self._positions:
+            return self._positions[message_id]
+        # 디스크로 밀려난 메시지 - 최신 세그먼트부터 찾음 (깊은 과거 페이지에서만 발생)
+        for first_seq, _, path in reversed(self._segments):
+            with open(path, 'r', encoding='utf-8') as f:
+                for offset, line in enumerate(f):
+                    if json.loads(line).get("message_id") == message_id:
+                        return first_seq + offset
+        return None
+
+    def _spill(self, sequence: int, message: ChatMessage):
+        if not self.segment_dir:
+            return
+        if not self._segments or self._segments[-1][1] >= self.segment_size:
+            os.makedirs(self.segment_dir, exist_ok=True)
+            path = os.path.join(self.segment_dir, f"{sequence:010d}.jsonl")
+            self._segments.append([sequence, 0, path])
+        segment = self._segments[-1]
+        with open(segment[2], 'a', encoding='utf-8') as f:
+            f.write(json.dumps(message.to_dict(), ensure_ascii=False) + "\n")
+        segment[1] += 1
+
+    def _read_segments(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """디스크에 있는 [start, end) 순번 메시지"""
+        messages = []
+        for first_seq, count, path in self._segments:
+            if first_seq + count <= start or first_seq >= end:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in islice(f, max(0, start - first_seq), min(count, end - first_seq)):
+                    messages.append(json.loads(line))
+        return messages
+
+    def _load_segments(self):
+        """이전 실행에서 남긴 세그먼트 목록 복원 (순번이 이어지도록)"""
+        if not self.segment_dir or not os.path.isdir(self.segment_dir):
+            return
+        for name in sorted(os.listdir(self.segment_dir)):
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self.segment_dir, name)
+            with open(path, 'r', encoding='utf-8') as f:
+                count = sum(1 for _ in f)
+            self._segments.append([int(name[:-len(".jsonl")]), count, path])
+        if self._segments:
+            first_seq, count, _ = self._segments[-1]
+            self._first_seq = first_seq + count
+
 
 @dataclass
 @dataclass
@@ -82,13 +232,21 @@ class MusicChatSystem:
     사용자들이 실시간으로 음악과 가사를 공유하고 협업할 수 있는 플랫폼
     """
     
-    def __init__(self):
-        """음악 채팅 시스템 초기화"""
+    def __init__(self, segment_dir: Optional[str] = "data/music_chat_segments",
+                 room_buffer_size: int = ROOM_BUFFER_SIZE):
+        """
+        음악 채팅 시스템 초기화
+        Args:
+            segment_dir (str): 링 버퍼에서 밀려난 메시지를 보관할 디렉터리 (None이면 보관하지 않음)
+            room_buffer_size (int): 방마다 메모리에 두는 최근 메시지 수
+        """
+        self.segment_dir = segment_dir
+        self.room_buffer_size = room_buffer_size
         
         # 데이터 저장소
         self.users: Dict[str, ChatUser] = {}
         self.rooms: Dict[str, MusicRoom] = {}
-        self.messages: Dict[str, List[ChatMessage]] = {}  # room_id -> messages
+        self.messages: Dict[str, RoomHistory] = {}  # room_id -> 최근 메시지 링 버퍼 + 디스크 세그먼트
         self.active_collaborations: Dict[str, Dict] = {}
         
         # 스레드 안전성을 위한 락
@@ -138,7 +296,10 @@ class MusicChatSystem:
                 **room_data
             )
             self.rooms[room_id] = room
-            self.messages[room_id] = []
+            self.messages[room_id] = self._new_history(room_id)
+    
+    def _new_history(self, room_id: str) -> RoomHistory:
+        return RoomHistory(room_id, self.room_buffer_size, self.segment_dir)
     
     def create_user(self, username: str, favorite_genre: str = "팝", 
                    instruments: List[str] = None) -> ChatUser:
@@ -178,7 +339,7 @@ class MusicChatSystem:
         
         with self.lock:
             self.rooms[room_id] = room
-            self.messages[room_id] = []
+            self.messages[room_id] = self._new_history(room_id)
             
         return room
     
@@ -354,13 +515,21 @@ class MusicChatSystem:
         
         return True
     
-    def get_room_messages(self, room_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """방의 메시지 목록 조회"""
+    def get_room_messages(self, room_id: str, limit: int = 50,
+                          before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """방의 메시지 목록 조회 (before: 이 메시지 ID 이전 메시지만, 오래된 것부터)"""
+        return self.get_room_history(room_id, limit, before)["messages"]
+    
+    def get_room_history(self, room_id: str, limit: int = 50,
+                         before: Optional[str] = None) -> Dict[str, Any]:
+        """
+        방의 메시지 기록 페이지 조회
+        Returns:
+            dict: messages, next_before(더 이전 페이지를 받을 커서), has_more
+        """
         if room_id not in self.messages:
-            return []
-        
-        messages = self.messages[room_id][-limit:]
-        return [asdict(msg) for msg in messages]
+            return {"messages": [], "next_before": None, "has_more": False}
+        return self.messages[room_id].page(limit, before)
     
     def get_room_list(self) -> List[Dict[str, Any]]:
         """채팅방 목록 조회"""
@@ -422,8 +591,8 @@ class MusicChatSystem:
             save_data = {
                 "rooms": {k: asdict(v) for k, v in self.rooms.items()},
                 "recent_messages": {
-                    room_id: [asdict(msg) for msg in messages[-100:]]  # 최근 100개만 저장
-                    for room_id, messages in self.messages.items()
+                    room_id: [msg.to_dict() for msg in history.recent(100)]  # 최근 100개만 저장
+                    for room_id, history in self.messages.items()
                 },
                 "collaborations": self.active_collaborations,
                 "saved_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -437,7 +606,7 @@ class MusicChatSystem:
     
     def get_chat_statistics(self) -> Dict[str, Any]:
         """채팅 시스템 통계"""
-        total_messages = sum(len(messages) for messages in self.messages.values())
+        total_messages = sum(history.total for history in self.messages.values())
         
         return {
             "total_users": len(self.users),
@@ -51,12 +51,15 @@ class MusicChatWebInterface:
         
         @self.app.route('/api/chat/room/<room_id>/messages')
         def get_room_messages(room_id):
-            """방 메시지 조회 API"""
-            limit = request.args.get('limit', 50, type=int)
-            messages = self.chat_system.get_room_messages(room_id, limit)
+            """방 메시지 조회 API (before=<메시지 ID>로 이전 페이지 조회)"""
+            limit = min(request.args.get('limit', 50, type=int), 200)
+            before = request.args.get('before')
+            history = self.chat_system.get_room_history(room_id, limit, before)
             return jsonify({
                 'success': True,
-                'messages': messages
+                'messages': history['messages'],
+                'next_before': history['next_before'],
+                'has_more': history['has_more']
             })
         
         @self.app.route('/api/chat/room/<room_id>/users')
@@ -1,9 +1,52 @@
 import re
 import difflib
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 import json
 import os
 
+from modules.ai_code_manager.intent_matcher import IntentMatcher, pattern_words
+
+FILE_ENTITY_RE = re.compile(r'(\w+\.(py|js|html|css|json|txt|md))', re.IGNORECASE)
+NUMBER_ENTITY_RE = re.compile(r'\b(\d+)\b')
+FUNCTION_TARGET_RE = re.compile(r'함수|function', re.IGNORECASE)
+CLASS_TARGET_RE = re.compile(r'클래스|class', re.IGNORECASE)
+TOKEN_RE = re.compile(r'\b\w+\b')
+
+UNKNOWN_RESPONSE = "죄송합니다. 명령을 이해하지 못했습니다."
+
+
+@dataclass
+class UtteranceAnalysis:
+    """발화 하나에 대한 분석 결과 (한 번 계산하여 처리 루프 전체에서 공유)"""
+    text: str
+    normalized: str
+    tokens: List[str]
+    intent: Optional[str] = None
+    confidence: float = 0.0
+    matched_pattern: Optional[str] = None
+    entities: Dict = field(default_factory=dict)
+    emotion: str = "neutral"
+    mood: Optional[str] = None
+    persona: Optional[str] = None
+    response: str = UNKNOWN_RESPONSE
+    context: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """process_natural_language 호환 딕셔너리"""
+        return {
+            "original_text": self.text,
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "matched_pattern": self.matched_pattern,
+            "entities": self.entities,
+            "emotion": self.emotion,
+            "mood": self.mood,
+            "response": self.response,
+            "context": self.context,
+        }
+
+
 class NLPProcessor:
     """자연어 처리 엔진 - 자연어 명령을 이해하고 적절한 명령어로 변환"""
     
@@ -12,21 +55,24 @@ class NLPProcessor:
         self.intent_patterns = self.load_patterns()
         self.context_memory = []  # 대화 컨텍스트 저장
         self.emotion_patterns = self.get_emotion_patterns()  # 감정 패턴 추가
+        self.emotion_matcher = IntentMatcher({"intents": self.emotion_patterns})
         
     def load_patterns(self) -> Dict:
-        """자연어 패턴 설정 로드"""
+        """자연어 패턴 설정 로드 (의도 매칭 엔진도 함께 컴파일)"""
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    patterns = json.load(f)
             else:
                 # 기본 패턴 생성
-                default_patterns = self.get_default_patterns()
-                self.save_patterns(default_patterns)
-                return default_patterns
+                patterns = self.get_default_patterns()
+                self.save_patterns(patterns)
         except Exception as e:
             print(f"⚠ NLP 패턴 로드 실패: {e}")
-            return self.get_default_patterns()
+            patterns = self.get_default_patterns()
+        
+        self.intent_matcher = IntentMatcher(patterns)
+        return patterns
     
     def save_patterns(self, patterns: Dict):
         """패턴을 파일로 저장"""
@@ -240,37 +286,23 @@ class NLPProcessor:
     def analyze_intent(self, text: str) -> Tuple[Optional[str], float, Optional[str]]:
         """자연어 텍스트에서 의도(intent) 분석"""
         text = text.lower().strip()
-        best_intent = None
-        best_score = 0.0
-        matched_pattern = None
-        
-        # 각 의도별로 패턴 매칭
-        for intent, config in self.intent_patterns["intents"].items():
-            for pattern in config["patterns"]:
-                if re.search(pattern, text, re.IGNORECASE):
-                    # 패턴이 매칭되면 유사도 계산
-                    similarity = self.calculate_similarity(text, pattern)
-                    if similarity > best_score:
-                        best_intent = intent
-                        best_score = similarity
-                        matched_pattern = pattern
         
-        return best_intent, best_score, matched_pattern
+        # 사전 필터를 통과한 컴파일된 패턴만 정규식으로 검사
+        return self.intent_matcher.match(text)
     
     def calculate_similarity(self, text: str, pattern: str) -> float:
         """텍스트와 패턴 간의 유사도 계산"""
         # 정규식 패턴에서 특수문자 제거하여 순수 텍스트로 변환
-        clean_pattern = re.sub(r'[.*\[\](){}\\|+?^$]', '', pattern)
+        words = pattern_words(pattern)
         
         # 단어 기반 유사도 계산
         text_words = set(text.split())
-        pattern_words = set(clean_pattern.split())
         
-        if not pattern_words:
+        if not words:
             return 0.5
         
-        intersection = text_words.intersection(pattern_words)
-        similarity = len(intersection) / len(pattern_words)
+        intersection = text_words.intersection(words)
+        similarity = len(intersection) / len(words)
         
         # 정확한 매칭에 보너스 점수
         if re.search(pattern, text, re.IGNORECASE):
@@ -291,57 +323,68 @@ class NLPProcessor:
         entities = {}
         
         # 파일 확장자 패턴
-        file_patterns = r'(\w+\.(py|js|html|css|json|txt|md))'
-        files = re.findall(file_patterns, text, re.IGNORECASE)
+        files = FILE_ENTITY_RE.findall(text)
         if files:
             entities['files'] = [match[0] for match in files]
         
         # 숫자 패턴 (라인 번호, 개수 등)
-        numbers = re.findall(r'\b(\d+)\b', text)
+        numbers = NUMBER_ENTITY_RE.findall(text)
         if numbers:
             entities['numbers'] = [int(num) for num in numbers]
         
         # 특정 키워드 추출
         if intent == "refactor":
-            if re.search(r'함수|function', text, re.IGNORECASE):
+            if FUNCTION_TARGET_RE.search(text):
                 entities['target'] = 'function'
-            elif re.search(r'클래스|class', text, re.IGNORECASE):
+            elif CLASS_TARGET_RE.search(text):
                 entities['target'] = 'class'
         
         return entities
     
-    def process_natural_language(self, text: str) -> Dict:
-        """자연어 텍스트를 종합적으로 처리"""
-        # 컨텍스트에 추가
+    def analyze_utterance(self, text: str, persona_system=None) -> UtteranceAnalysis:
+        """
+        발화를 한 번만 정규화/토큰화하여 의도, 엔티티, 감정, 기분을 함께 분석
+        Args:
+            persona_system: 주어지면 같은 정규화 텍스트로 사용자 기분과 페르소나도 계산
+        """
+        # 컨텍스트에 추가 (발화당 한 번)
         self.context_memory.append(text)
         if len(self.context_memory) > 5:  # 최근 5개만 유지
             self.context_memory.pop(0)
         
+        normalized = text.lower().strip()
+        analysis = UtteranceAnalysis(
+            text=text,
+            normalized=normalized,
+            tokens=TOKEN_RE.findall(normalized),
+            context=self.context_memory.copy()
+        )
+        
         # 의도 분석
-        intent, confidence, pattern = self.analyze_intent(text)
+        analysis.intent, analysis.confidence, analysis.matched_pattern = \
+            self.intent_matcher.match(normalized, set(normalized.split()))
         
         # 엔티티 추출
-        entities = self.extract_entities(text, intent) if intent else {}
+        if analysis.intent:
+            analysis.entities = self.extract_entities(text, analysis.intent)
         
-        # 감정 분석 (새로운 메서드 사용)
-        emotion = self.analyze_emotion(text)
+        # 감정 분석
+        analysis.emotion = self._best_emotion(normalized)
         
-        # 응답 생성
-        base_response = self.generate_response(intent) if intent else "죄송합니다. 명령을 이해하지 못했습니다."
+        # 사용자 기분 (페르소나 선택용)
+        if persona_system is not None:
+            analysis.mood = persona_system.detect_mood(normalized)
+            analysis.persona = persona_system.map_mood_to_persona(analysis.mood)
         
-        # 감정에 따른 응답 조정
-        response = self.adjust_response_for_emotion(base_response, emotion)
+        # 응답 생성 후 감정에 따른 응답 조정
+        base_response = self.generate_response(analysis.intent) if analysis.intent else UNKNOWN_RESPONSE
+        analysis.response = self.adjust_response_for_emotion(base_response, analysis.emotion)
         
-        return {
-            "original_text": text,
-            "intent": intent,
-            "confidence": confidence,
-            "matched_pattern": pattern,
-            "entities": entities,
-            "emotion": emotion,
-            "response": response,
-            "context": self.context_memory.copy()
-        }
+        return analysis
+    
+    def process_natural_language(self, text: str) -> Dict:
+        """자연어 텍스트를 종합적으로 처리"""
+        return self.analyze_utterance(text).to_dict()
     
     def get_command_mapping(self, intent: str) -> Optional[str]:
         """의도를 실제 명령어로 매핑"""
@@ -366,6 +409,7 @@ class NLPProcessor:
             }
         
         self.intent_patterns["intents"][intent]["patterns"].append(pattern)
+        self.intent_matcher.add(intent, pattern)
         self.save_patterns(self.intent_patterns)
     
     def learn_from_feedback(self, text: str, correct_intent: str):
@@ -422,16 +466,12 @@ class NLPProcessor:
     
     def analyze_emotion(self, text: str) -> str:
         """텍스트에서 감정 분석"""
-        text = text.lower().strip()
-        emotion_scores = {}
-        
-        # 각 감정별로 패턴 매칭 점수 계산
-        for emotion, config in self.emotion_patterns.items():
-            score = 0
-            for pattern in config["patterns"]:
-                if re.search(pattern, text, re.IGNORECASE):
-                    score += 1
-            emotion_scores[emotion] = score
+        return self._best_emotion(text.lower().strip())
+    
+    def _best_emotion(self, text: str) -> str:
+        """정규화된 텍스트에서 가장 많이 일치한 감정"""
+        # 각 감정별로 패턴 매칭 점수 계산 (사전 필터를 통과한 패턴만 검사)
+        emotion_scores = self.emotion_matcher.count_matches(text)
         
         # 가장 높은 점수의 감정 반환
         if emotion_scores:
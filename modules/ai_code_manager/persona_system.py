@@ -4,13 +4,22 @@
 """
 import random
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 class PersonaSystem:
     def __init__(self):
         self.current_persona = "friendly"
         self.persona_history = []
         
+        # 기분별 감지 키워드 (검사 순서대로)
+        self.mood_keywords = {
+            "excited": ["신나", "기대", "놀라워", "대박", "와"],
+            "sad": ["슬프", "우울", "힘들", "지쳐", "피곤"],
+            "curious": ["궁금", "왜", "어떻게", "알고싶", "배우고"],
+            "motivated": ["하고싶", "도전", "목표", "성취", "발전"],
+            "thoughtful": ["생각", "고민", "철학", "의미", "본질"]
+        }
+        
         # 페르소나별 특성 정의
         self.personas = {
             "friendly": {
@@ -52,21 +61,19 @@ class PersonaSystem:
     
     def detect_user_mood(self, text: str) -> str:
         """사용자의 기분을 감지하여 적절한 페르소나 선택"""
-        mood_keywords = {
-            "excited": ["신나", "기대", "놀라워", "대박", "와"],
-            "sad": ["슬프", "우울", "힘들", "지쳐", "피곤"],
-            "curious": ["궁금", "왜", "어떻게", "알고싶", "배우고"],
-            "motivated": ["하고싶", "도전", "목표", "성취", "발전"],
-            "thoughtful": ["생각", "고민", "철학", "의미", "본질"]
-        }
-        
-        text_lower = text.lower()
-        for mood, keywords in mood_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return self.map_mood_to_persona(mood)
+        mood = self.detect_mood(text.lower())
+        if mood:
+            return self.map_mood_to_persona(mood)
         
         return "friendly"  # 기본 페르소나
     
+    def detect_mood(self, text_lower: str) -> Optional[str]:
+        """소문자로 정규화된 텍스트에서 기분 감지 (없으면 None)"""
+        for mood, keywords in self.mood_keywords.items():
+            if any(keyword in text_lower for keyword in keywords):
+                return mood
+        return None
+    
     def map_mood_to_persona(self, mood: str) -> str:
         """기분에 따른 페르소나 매핑"""
         mood_mapping = {
@@ -0,0 +1,349 @@
+"""
+음성 인식 엔진 체인 (Recognition Backends)
+인식 엔진을 설정으로 고르고, 앞 엔진을 쓸 수 없으면(네트워크 오류, 시간 초과, 미설치) 다음 엔진으로 넘어갑니다.
+
+    - SpeechRecognitionBackend: speech_recognition의 recognize_<engine> 호출
+      (google은 온라인, whisper/faster_whisper/vosk/sphinx는 오프라인)
+    - StubBackend: 테스트/헤드리스 재생용 결정적 엔진
+    - 엔진마다 시간 제한(timeout)을 두고, 넘으면 다음 엔진을 시도합니다.
+    - 짧은 구절은 소리 크기/주파수 윤곽(지문)으로 결과를 캐시하여 "상태" 같은
+      같은 명령은 인식 엔진을 부르지 않습니다. 지문은 근사값이므로 "종료"처럼
+      잘못 답하면 안 되는 명령은 cache_exclude로 캐시에서 뺍니다.
+    - 엔진별 지연 시간과 캐시 적중률을 stats()로 보고합니다.
+
+말소리를 알아듣지 못한 경우(UnknownValueError)는 잡음일 가능성이 높으므로 다음 엔진을 시도하지 않습니다.
+"""
+import hashlib
+import json
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+try:
+    import speech_recognition as sr
+    UnknownValueError = sr.UnknownValueError
+    RequestError = sr.RequestError
+except ImportError:
+    sr = None
+
+    class UnknownValueError(Exception):
+        """speech_recognition이 없을 때 쓰는 인식 실패 예외"""
+
+    class RequestError(Exception):
+        """speech_recognition이 없을 때 쓰는 엔진 오류 예외"""
+
+# 지문 계산 설정: 8kHz 16비트로 변환 후 구간별 소리 크기를 8단계로 양자화
+FINGERPRINT_RATE = 8000
+FINGERPRINT_SEGMENTS = 24
+FINGERPRINT_LEVELS = 8
+FINGERPRINT_DURATION_STEP = 0.05  # 길이 구간(초)
+FINGERPRINT_BANDS = 8  # 구간별 주파수 대역 수 (영교차율 기준 100Hz부터 옥타브 단위)
+
+DEFAULT_BACKENDS = [{"engine": "google", "language": "ko-KR", "timeout": 5.0}]
+
+
+class RecognitionResult(NamedTuple):
+    """인식 결과"""
+    text: str
+    backend: str  # 결과를 낸 엔진 이름 ("cache"면 캐시 적중)
+    latency: float  # 초
+    cached: bool
+
+
+class RecognitionBackend(ABC):
+    """인식 엔진 기본 클래스 - 새 엔진은 이 클래스를 상속받아 recognize()를 구현"""
+
+    name = "backend"
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+
+    @abstractmethod
+    def recognize(self, audio) -> str:
+        """
+        음성 인식
+        Args:
+            audio: speech_recognition.AudioData
+        Returns:
+            str: 인식한 텍스트
+        Raises:
+            UnknownValueError: 말소리를 알아듣지 못함 (다음 엔진을 시도하지 않음)
+            RequestError: 엔진을 쓸 수 없음 (다음 엔진으로 넘어감)
+        """
+        pass
+
+
+class SpeechRecognitionBackend(RecognitionBackend):
+    """speech_recognition의 recognize_<engine> 메서드를 쓰는 엔진"""
+
+    def __init__(self, recognizer, engine: str, timeout: Optional[float] = None, **options):
+        super().__init__(timeout)
+        self.recognizer = recognizer
+        self.name = engine
+        self.options = options
+
+    def recognize(self, audio) -> str:
+        method = getattr(self.recognizer, f"recognize_{self.name}", None)
+        if method is None:
+            raise RequestError(f"지원하지 않는 인식 엔진: {self.name}")
+        try:
+            result = method(audio, **self.options)
+        except (UnknownValueError, RequestError):
+            raise
+        except ImportError as e:
+            raise RequestError(f"{self.name} 엔진이 설치되지 않았습니다: {e}")
+        return _result_text(result)
+
+
+class StubBackend(RecognitionBackend):
+    """
+    결정적 테스트 엔진
+    transcripts는 오디오 → 텍스트 함수이거나 지문 → 텍스트 사전이며,
+    결과가 없으면 UnknownValueError, error를 주면 항상 RequestError를 냅니다.
+    """
+
+    def __init__(self, transcripts=None, name: str = "stub", delay: float = 0.0,
+                 error: Optional[str] = None, timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self.name = name
+        self.transcripts = transcripts if transcripts is not None else {}
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def recognize(self, audio) -> str:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error:
+            raise RequestError(self.error)
+        if callable(self.transcripts):
+            text = self.transcripts(audio)
+        else:
+            text = self.transcripts.get(audio_fingerprint(audio))
+        if not text:
+            raise UnknownValueError()
+        return text
+
+
+def _result_text(result) -> str:
+    """엔진별 반환 형식(문자열, vosk의 JSON 문자열/사전)을 텍스트로 통일"""
+    if isinstance(result, dict):
+        result = result.get("text", "")
+    elif isinstance(result, str) and result.lstrip().startswith("{"):
+        try:
+            result = json.loads(result).get("text", "")
+        except ValueError:
+            pass
+    text = str(result).strip()
+    if not text:
+        raise UnknownValueError()
+    return text
+
+
+def audio_duration(audio) -> float:
+    rate = audio.sample_rate * audio.sample_width
+    return len(audio.frame_data) / rate if rate else 0.0
+
+
+def audio_fingerprint(audio) -> str:
+    """
+    소리 크기/주파수 윤곽 지문
+    길이(50ms 단위)와 구간별로 RMS를 최대값 기준 8단계로 나눈 값, 영교차율로 어림한
+    주파수 대역(옥타브 단위)의 해시이므로 같은 녹음이나 거의 같은 발화는 같은 지문이 되고,
+    크기 윤곽만 같은 다른 소리(다른 음높이, 잡음)는 다른 지문이 됩니다.
+    """
+    samples = array('h', audio.get_raw_data(convert_rate=FINGERPRINT_RATE, convert_width=2))
+    duration_bucket = int(audio_duration(audio) / FINGERPRINT_DURATION_STEP)
+    segment = max(1, len(samples) // FINGERPRINT_SEGMENTS)
+    levels = []
+    bands = []
+    for start in range(0, segment * FINGERPRINT_SEGMENTS, segment):
+        chunk = samples[start:start + segment]
+        levels.append(math.sqrt(sum(s * s for s in chunk) / len(chunk)) if chunk else 0.0)
+        bands.append(_frequency_band(chunk))
+    peak = max(levels) or 1.0
+    quantized = []
+    for level, band in zip(levels, bands):
+        step = min(FINGERPRINT_LEVELS - 1, int(level / peak * FINGERPRINT_LEVELS))
+        # 거의 조용한 구간의 영교차율은 잡음에 따라 흔들리므로 대역을 쓰지 않음
+        quantized.append(step * FINGERPRINT_BANDS + (band if step else 0))
+    return hashlib.sha256(duration_bucket.to_bytes(4, "big") + bytes(quantized)).hexdigest()
+
+
+def _frequency_band(chunk) -> int:
+    """영교차율로 어림한 주파수의 옥타브 대역 (0: 200Hz 미만, 1: 200~400Hz, 이후 한 옥타브마다 1씩)"""
+    if len(chunk) < 2:
+        return 0
+    crossings = sum(1 for a, b in zip(chunk, chunk[1:]) if (a < 0) != (b < 0))
+    frequency = crossings * FINGERPRINT_RATE / (2 * len(chunk))
+    if frequency < 200:
+        return 0
+    return min(FINGERPRINT_BANDS - 1, int(math.log2(frequency / 100)))
+
+
+def build_backends(recognizer, configs: List[Dict]) -> List[RecognitionBackend]:
+    """설정 목록으로 엔진 체인 생성 ({"engine": "google", "timeout": 5, 그 밖의 값은 엔진 인자})"""
+    backends = []
+    for config in configs:
+        options = dict(config)
+        engine = options.pop("engine")
+        timeout = options.pop("timeout", None)
+        backends.append(SpeechRecognitionBackend(recognizer, engine, timeout, **options))
+    return backends
+
+
+class RecognitionPipeline:
+    """지문 캐시와 대체 엔진 체인을 가진 음성 인식 단계"""
+
+    def __init__(self, backends: List[RecognitionBackend], cache_size: int = 256,
+                 cache_max_seconds: float = 1.5, clock: Callable[[], float] = time.perf_counter,
+                 cache_exclude: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            backends (list): 시도할 순서대로 나열한 엔진
+            cache_size (int): 지문 캐시 최대 항목 수 (0이면 캐시 안 함)
+            cache_max_seconds (float): 이 길이 이하인 구절만 캐시 (짧은 명령)
+            cache_exclude (callable): 참을 반환한 인식 결과는 캐시하지 않음 (종료처럼 잘못 답하면 안 되는 명령)
+        """
+        self.backends = backends
+        self.cache_size = cache_size
+        self.cache_max_seconds = cache_max_seconds
+        self.cache_exclude = cache_exclude
+        self.clock = clock
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_stats = {"hits": 0, "misses": 0}
+        self._backend_stats = {
+            backend.name: {"calls": 0, "recognized": 0, "unknown": 0, "errors": 0, "timeouts": 0,
+                           "total_latency": 0.0, "max_latency": 0.0}
+            for backend in backends
+        }
+
+    def recognize(self, audio) -> RecognitionResult:
+        """
+        구절 인식 (캐시 → 엔진 순서대로)
+        Raises:
+            UnknownValueError: 말소리를 알아듣지 못함
+            RequestError: 모든 엔진을 쓸 수 없음
+        """
+        started = self.clock()
+        fingerprint = None
+        if self.cache_size and audio_duration(audio) <= self.cache_max_seconds:
+            fingerprint = audio_fingerprint(audio)
+            with self._lock:
+                text = self._cache.get(fingerprint)
+                if text is not None:
+                    self._cache.move_to_end(fingerprint)
+                    self._cache_stats["hits"] += 1
+                    return RecognitionResult(text, "cache", self.clock() - started, True)
+                self._cache_stats["misses"] += 1
+
+        errors = []
+        for backend in self.backends:
+            try:
+                text = self._call(backend, audio)
+            except RequestError as e:
+                errors.append(f"{backend.name}: {e}")
+                continue
+            if fingerprint is not None and not (self.cache_exclude and self.cache_exclude(text)):
+                self._remember(fingerprint, text)
+            return RecognitionResult(text, backend.name, self.clock() - started, False)
+        raise RequestError("사용할 수 있는 인식 엔진이 없습니다 (" + "; ".join(errors) + ")")
+
+    def _call(self, backend: RecognitionBackend, audio) -> str:
+        """엔진 호출 (시간 제한을 넘으면 RequestError)"""
+        stats = self._backend_stats[backend.name]
+        started = self.clock()
+        outcome = "errors"
+        try:
+            try:
+                text = self._run_with_timeout(backend, audio)
+            except TimeoutError:
+                outcome = "timeouts"
+                raise RequestError(f"{backend.timeout}초 안에 응답 없음")
+            except UnknownValueError:
+                outcome = "unknown"
+                raise
+            except RequestError:
+                raise
+            except Exception as e:
+                raise RequestError(str(e))
+            outcome = "recognized"
+            return text
+        finally:
+            latency = self.clock() - started
+            with self._lock:
+                stats["calls"] += 1
+                stats[outcome] += 1
+                stats["total_latency"] += latency
+                stats["max_latency"] = max(stats["max_latency"], latency)
+
+    @staticmethod
+    def _run_with_timeout(backend: RecognitionBackend, audio) -> str:
+        """
+        시간 제한이 있으면 데몬 스레드에서 실행하고 기다림
+        (멈춘 엔진 호출은 버려지며 프로그램 종료를 막지 않음)
+        """
+        if backend.timeout is None:
+            return backend.recognize(audio)
+        outcome = {}
+        done = threading.Event()
+
+        def run():
+            try:
+                outcome["text"] = backend.recognize(audio)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=run, name=f"recognition-{backend.name}", daemon=True).start()
+        if not done.wait(backend.timeout):
+            raise TimeoutError()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["text"]
+
+    def _remember(self, fingerprint: str, text: str):
+        with self._lock:
+            self._cache[fingerprint] = text
+            self._cache.move_to_end(fingerprint)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """엔진별 호출/지연 시간과 캐시 적중률"""
+        with self._lock:
+            lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+            backends = {}
+            for name, stats in self._backend_stats.items():
+                entry = {key: value for key, value in stats.items() if key != "total_latency"}
+                entry["avg_latency"] = stats["total_latency"] / stats["calls"] if stats["calls"] else 0.0
+                backends[name] = entry
+            return {
+                "cache": {
+                    "hits": self._cache_stats["hits"],
+                    "misses": self._cache_stats["misses"],
+                    "hit_rate": self._cache_stats["hits"] / lookups if lookups else 0.0,
+                    "entries": len(self._cache),
+                },
+                "backends": backends,
+            }
+
+    def format_report(self) -> str:
+        """stats()를 사람이 읽는 한 줄씩으로 정리"""
+        stats = self.stats()
+        cache = stats["cache"]
+        lines = [f"[인식] 캐시 적중 {cache['hits']}/{cache['hits'] + cache['misses']} ({cache['hit_rate']:.0%})"]
+        for name, entry in stats["backends"].items():
+            lines.append(
+                f"[인식] {name}: 호출 {entry['calls']}회, 성공 {entry['recognized']}회, "
+                f"오류 {entry['errors']}회, 시간 초과 {entry['timeouts']}회, "
+                f"평균 {entry['avg_latency'] * 1000:.0f}ms, 최대 {entry['max_latency'] * 1000:.0f}ms"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,303 @@
+"""
+응답 저장소 (Response Store)
+성공/실패 응답을 내용 해시로 중복 제거하고, 패턴마다 크기가 제한된
+참조 링과 사용 횟수만 보관합니다. 패턴 수가 한도를 넘으면
+LRU 또는 LFU 정책으로 오래된 패턴을 제거합니다.
+
+지식 베이스 내 구조:
+    response_texts:       {해시: 응답 텍스트}
+    successful_responses: {패턴: {"refs": [해시...], "hits": {해시: 횟수}, "count": 총횟수}}
+    failed_responses:     (successful_responses와 동일)
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+TEXTS_KEY = "response_texts"
+CATEGORY_KEYS = {
+    "success": "successful_responses",
+    "failed": "failed_responses",
+}
+
+
+def response_hash(text: str) -> str:
+    """응답 텍스트의 내용 해시"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class LRUPolicy:
+    """가장 오래 사용되지 않은 패턴부터 제거"""
+
+    def __init__(self):
+        self.order = OrderedDict()
+
+    def add(self, key: str, frequency: int = 1):
+        self.order[key] = None
+        self.order.move_to_end(key)
+
+    def touch(self, key: str):
+        if key in self.order:
+            self.order.move_to_end(key)
+
+    def remove(self, key: str):
+        self.order.pop(key, None)
+
+    def victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        return next((key for key in self.order if key != exclude), None)
+
+    def __len__(self):
+        return len(self.order)
+
+
+class LFUPolicy:
+    """가장 적게 사용된 패턴부터 제거 (동률이면 오래된 것부터)"""
+
+    def __init__(self):
+        self.frequency: Dict[str, int] = {}
+        self.buckets: Dict[int, OrderedDict] = {}
+        self.min_frequency = 0
+
+    def add(self, key: str, frequency: int = 1):
+        self.remove(key)
+        frequency = max(1, frequency)
+        self.frequency[key] = frequency
+        self.buckets.setdefault(frequency, OrderedDict())[key] = None
+        if not self.min_frequency or frequency < self.min_frequency:
+            self.min_frequency = frequency
+
+    def touch(self, key: str):
+        frequency = self.frequency.get(key)
+        if frequency is None:
+            return
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+            if self.min_frequency == frequency:
+                self.min_frequency = frequency + 1
+        self.frequency[key] = frequency + 1
+        self.buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def remove(self, key: str):
+        frequency = self.frequency.pop(key, None)
+        if frequency is None:
+            return
+        bucket = self.buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[frequency]
+            if self.min_frequency == frequency:
+                self.min_frequency = min(self.buckets) if self.buckets else 0
+
+    def victim(self, exclude: Optional[str] = None) -> Optional[str]:
+        if not self.frequency:
+            return None
+        for key in self.buckets[self.min_frequency]:
+            if key != exclude:
+                return key
+        # 최소 빈도 버킷에 제외할 패턴만 있으면 다음 빈도에서 선택
+        for frequency in sorted(self.buckets):
+            for key in self.buckets[frequency]:
+                if key != exclude:
+                    return key
+        return None
+
+    def __len__(self):
+        return len(self.frequency)
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+}
+
+
+class ResponseStore:
+    """중복 제거 + 크기 제한 응답 저장소"""
+
+    def __init__(self, knowledge_store, ring_size: int = 5,
+                 max_patterns: int = 5000, policy: str = "lru"):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"지원하지 않는 제거 정책: {policy}")
+
+        self.knowledge_store = knowledge_store
+        self.ring_size = ring_size
+        self.max_patterns = max_patterns
+        self.policy_name = policy
+
+        self.ref_counts: Dict[str, int] = {}
+        self.policies = {category: EVICTION_POLICIES[policy]() for category in CATEGORY_KEYS}
+        self.bytes_reclaimed = 0
+        self.evicted_patterns = 0
+        self.deduplicated = 0
+
+        self._build_index()
+
+    @property
+    def data(self) -> Dict:
+        return self.knowledge_store.data
+
+    # ------------------------------------------------------------------
+    # 인덱스 구성
+    # ------------------------------------------------------------------
+    def _build_index(self):
+        """로드된 지식 베이스에서 참조 카운트와 제거 정책 상태 재구성"""
+        texts = self.data.setdefault(TEXTS_KEY, {})
+        migrated = False
+
+        for category, key in CATEGORY_KEYS.items():
+            entries = self.data.setdefault(key, {})
+            for pattern in list(entries):
+                entry = entries[pattern]
+                if isinstance(entry, list):
+                    # 이전 형식 (응답 문자열 리스트) 변환
+                    entry = self._migrate_entry(entry, texts)
+                    entries[pattern] = entry
+                    migrated = True
+
+                # 텍스트가 없는 참조는 버림
+                entry["refs"] = [h for h in entry.get("refs", []) if h in texts]
+                entry["hits"] = {h: n for h, n in entry.get("hits", {}).items() if h in entry["refs"]}
+                entry.setdefault("count", sum(entry["hits"].values()))
+
+                for h in entry["refs"]:
+                    self.ref_counts[h] = self.ref_counts.get(h, 0) + 1
+                self.policies[category].add(pattern, entry["count"])
+
+        # 어떤 패턴도 참조하지 않는 텍스트 정리
+        for h in [h for h in texts if h not in self.ref_counts]:
+            del texts[h]
+
+        if migrated:
+            # 변환 결과를 스냅샷으로 한 번 저장해야 이후 변경 로그와 일치함
+            self.knowledge_store.compact()
+
+    def _migrate_entry(self, responses: List[str], texts: Dict) -> Dict:
+        entry = {"refs": [], "hits": {}, "count": 0}
+        for text in responses:
+            h = response_hash(text)
+            texts[h] = text
+            self._push_ref(entry, h)
+        return entry
+
+    def _push_ref(self, entry: Dict, h: str) -> Optional[str]:
+        """링에 참조 추가. 링에서 밀려난 해시 반환"""
+        entry["count"] += 1
+        if h in entry["hits"]:
+            entry["hits"][h] += 1
+            entry["refs"].remove(h)
+            entry["refs"].append(h)
+            return None
+
+        entry["hits"][h] = 1
+        entry["refs"].append(h)
+        if len(entry["refs"]) > self.ring_size:
+            dropped = entry["refs"].pop(0)
+            del entry["hits"][dropped]
+            return dropped
+        return None
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def record(self, category: str, pattern: str, text: str):
+        """패턴에 대한 응답 기록"""
+        key = CATEGORY_KEYS[category]
+        entries = self.data[key]
+        texts = self.data[TEXTS_KEY]
+        h = response_hash(text)
+
+        if h not in texts:
+            self.knowledge_store.set([TEXTS_KEY, h], text)
+        else:
+            self.deduplicated += 1
+
+        entry = entries.get(pattern)
+        is_new_pattern = entry is None
+        if is_new_pattern:
+            entry = {"refs": [], "hits": {}, "count": 0}
+
+        already_referenced = h in entry["hits"]
+        dropped = self._push_ref(entry, h)
+        if not already_referenced:
+            self.ref_counts[h] = self.ref_counts.get(h, 0) + 1
+        self.knowledge_store.set([key, pattern], entry)
+
+        if dropped:
+            self._release(dropped)
+
+        policy = self.policies[category]
+        if is_new_pattern:
+            policy.add(pattern)
+            # 방금 학습한 패턴은 빈도가 가장 낮아도 제거 대상에서 제외
+            self._enforce_capacity(category, keep=pattern)
+        else:
+            policy.touch(pattern)
+
+    def _release(self, h: str):
+        """참조 카운트 감소, 더 이상 참조되지 않으면 텍스트 삭제"""
+        remaining = self.ref_counts.get(h, 0) - 1
+        if remaining > 0:
+            self.ref_counts[h] = remaining
+            return
+
+        self.ref_counts.pop(h, None)
+        text = self.data[TEXTS_KEY].get(h)
+        if text is not None:
+            self.bytes_reclaimed += len(text.encode('utf-8'))
+            self.knowledge_store.delete([TEXTS_KEY, h])
+
+    def _enforce_capacity(self, category: str, keep: Optional[str] = None):
+        policy = self.policies[category]
+        key = CATEGORY_KEYS[category]
+        while len(policy) > self.max_patterns:
+            victim = policy.victim(exclude=keep)
+            if victim is None:
+                break
+            policy.remove(victim)
+            entry = self.data[key].get(victim)
+            self.knowledge_store.delete([key, victim])
+            self.evicted_patterns += 1
+            if entry:
+                for h in entry["refs"]:
+                    self._release(h)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def latest(self, category: str, pattern: str) -> Optional[str]:
+        """패턴의 가장 최근 응답 (O(1))"""
+        entry = self.data[CATEGORY_KEYS[category]].get(pattern)
+        if not entry or not entry["refs"]:
+            return None
+        self.policies[category].touch(pattern)
+        return self.data[TEXTS_KEY].get(entry["refs"][-1])
+
+    def count(self, category: str, pattern: str) -> int:
+        """패턴이 기록된 총 횟수 (O(1))"""
+        entry = self.data[CATEGORY_KEYS[category]].get(pattern)
+        return entry["count"] if entry else 0
+
+    def pattern_counts(self, category: str) -> Dict[str, int]:
+        """카테고리의 패턴별 총 기록 횟수"""
+        return {pattern: entry["count"] for pattern, entry in self.data[CATEGORY_KEYS[category]].items()}
+
+    def responses(self, category: str, pattern: str) -> List[str]:
+        """패턴 링에 남아 있는 응답 (오래된 순)"""
+        entry = self.data[CATEGORY_KEYS[category]].get(pattern)
+        if not entry:
+            return []
+        texts = self.data[TEXTS_KEY]
+        return [texts[h] for h in entry["refs"] if h in texts]
+
+    def get_stats(self) -> Dict:
+        """저장소 현황 (제거로 회수한 바이트 포함)"""
+        return {
+            "unique_responses": len(self.data[TEXTS_KEY]),
+            "success_patterns": len(self.policies["success"]),
+            "failed_patterns": len(self.policies["failed"]),
+            "deduplicated": self.deduplicated,
+            "evicted_patterns": self.evicted_patterns,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "policy": self.policy_name,
+        }
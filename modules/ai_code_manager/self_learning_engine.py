@@ -6,26 +6,40 @@ from datetime import datetime
 import re
 from urllib.parse import quote
 
+from modules.ai_code_manager.knowledge_store import KnowledgeStore
+from modules.ai_code_manager.response_store import ResponseStore
+from modules.ai_code_manager.web_search_cache import WebSearchCache, CachedSearchError
+
 class SelfLearningEngine:
     """자가 학습 및 진화 엔진"""
     
-    def __init__(self, knowledge_path="data/knowledge_base.json"):
+    def __init__(self, knowledge_path="data/knowledge_base.json", compact_every: int = 500,
+                 response_ring_size: int = 5, max_response_patterns: int = 5000,
+                 eviction_policy: str = "lru"):
         self.knowledge_path = knowledge_path
+        # 변경분은 로그에 추가하고 스냅샷은 백그라운드에서 압축
+        self.store = KnowledgeStore(knowledge_path, compact_every=compact_every)
         self.knowledge_base = self.load_knowledge()
+        # 성공/실패 응답은 중복 제거된 크기 제한 저장소로 관리
+        self.response_store = ResponseStore(
+            self.store,
+            ring_size=response_ring_size,
+            max_patterns=max_response_patterns,
+            policy=eviction_policy
+        )
+        # 검색 결과는 정규화된 검색어 기준 TTL 캐시로 관리
+        self.search_cache = WebSearchCache(self.store)
         self.learning_log = []
         self.improvement_suggestions = []
         
     def load_knowledge(self) -> Dict:
-        """지식 베이스 로드"""
+        """지식 베이스 로드 (스냅샷 + 변경 로그 재생)"""
         try:
-            if os.path.exists(self.knowledge_path):
-                with open(self.knowledge_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return self.create_initial_knowledge()
+            return self.store.load(self.create_initial_knowledge)
         except Exception as e:
             print(f"⚠ 지식 베이스 로드 실패: {e}")
-            return self.create_initial_knowledge()
+            self.store.data = self.create_initial_knowledge()
+            return self.store.data
     
     def create_initial_knowledge(self) -> Dict:
         """초기 지식 베이스 생성"""
@@ -34,6 +48,7 @@ class SelfLearningEngine:
             "user_preferences": {},
             "successful_responses": {},
             "failed_responses": {},
+            "response_texts": {},
             "web_search_cache": {},
             "improvement_history": [],
             "capabilities": [
@@ -43,67 +58,61 @@ class SelfLearningEngine:
         }
     
     def save_knowledge(self):
-        """지식 베이스 저장"""
-        try:
-            os.makedirs(os.path.dirname(self.knowledge_path), exist_ok=True)
-            with open(self.knowledge_path, 'w', encoding='utf-8') as f:
-                json.dump(self.knowledge_base, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"⚠ 지식 베이스 저장 실패: {e}")
+        """지식 베이스 전체를 스냅샷으로 저장 (변경 로그 압축)"""
+        self.store.compact()
+    
+    def close(self):
+        """남은 변경 로그를 스냅샷에 반영하고 저장소 닫기"""
+        self.store.close()
     
     def web_search(self, query: str, max_results: int = 3) -> List[Dict]:
-        """웹 검색 수행"""
+        """웹 검색 수행 (캐시 적중 시 네트워크 요청 없음)"""
         try:
-            # 캐시된 결과가 있는지 확인
-            cache_key = f"search_{hash(query)}"
-            if cache_key in self.knowledge_base["web_search_cache"]:
-                cached_result = self.knowledge_base["web_search_cache"][cache_key]
-                # 24시간 이내 캐시만 사용
-                if (datetime.now() - datetime.fromisoformat(cached_result["timestamp"])).hours < 24:
-                    return cached_result["results"]
-            
-            # DuckDuckGo Instant Answer API 사용 (무료)
-            url = f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1&skip_disambig=1"
-            response = requests.get(url, timeout=10)
-            
-            results = []
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Abstract 정보
-                if data.get("Abstract"):
-                    results.append({
-                        "title": data.get("AbstractText", "")[:100],
-                        "content": data.get("Abstract", ""),
-                        "source": data.get("AbstractURL", ""),
-                        "type": "abstract"
-                    })
-                
-                # Related Topics
-                for topic in data.get("RelatedTopics", [])[:max_results-1]:
-                    if isinstance(topic, dict) and topic.get("Text"):
-                        results.append({
-                            "title": topic.get("Text", "")[:100],
-                            "content": topic.get("Text", ""),
-                            "source": topic.get("FirstURL", ""),
-                            "type": "related"
-                        })
-            
-            # 결과 캐시
-            self.knowledge_base["web_search_cache"][cache_key] = {
-                "results": results,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.save_knowledge()
-            
-            return results
-            
+            return self.search_cache.get_or_fetch(
+                query, max_results, lambda: self.fetch_web_results(query, max_results)
+            )
+        except CachedSearchError as e:
+            return [{"title": "검색 실패", "content": f"웹 검색 중 오류가 발생했습니다: {str(e)}", "source": "", "type": "error"}]
         except Exception as e:
             print(f"⚠ 웹 검색 실패: {e}")
             return [{"title": "검색 실패", "content": f"웹 검색 중 오류가 발생했습니다: {str(e)}", "source": "", "type": "error"}]
     
-    def learn_from_interaction(self, user_input: str, response: str, success: bool):
-        """사용자 상호작용에서 학습"""
+    def fetch_web_results(self, query: str, max_results: int = 3) -> List[Dict]:
+        """DuckDuckGo에서 검색 결과 가져오기 (캐시 미적용)"""
+        # DuckDuckGo Instant Answer API 사용 (무료)
+        url = f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1&skip_disambig=1"
+        response = requests.get(url, timeout=10)
+        
+        # 200이 아닌 응답은 예외로 넘겨야 빈 결과가 24시간 캐시되지 않고 짧은 부정 캐시로 남음
+        response.raise_for_status()
+        
+        results = []
+        data = response.json()
+        
+        # Abstract 정보
+        if data.get("Abstract"):
+            results.append({
+                "title": data.get("AbstractText", "")[:100],
+                "content": data.get("Abstract", ""),
+                "source": data.get("AbstractURL", ""),
+                "type": "abstract"
+            })
+        
+        # Related Topics
+        for topic in data.get("RelatedTopics", [])[:max_results-1]:
+            if isinstance(topic, dict) and topic.get("Text"):
+                results.append({
+                    "title": topic.get("Text", "")[:100],
+                    "content": topic.get("Text", ""),
+                    "source": topic.get("FirstURL", ""),
+                    "type": "related"
+                })
+        
+        return results
+    
+    def learn_from_interaction(self, user_input: str, response: str, success: bool,
+                               tokens: Optional[List[str]] = None):
+        """사용자 상호작용에서 학습 (tokens: 이미 분석된 발화의 토큰)"""
         learning_entry = {
             "timestamp": datetime.now().isoformat(),
             "user_input": user_input,
@@ -115,26 +124,20 @@ class SelfLearningEngine:
         
         if success:
             # 성공한 응답 패턴 저장
-            pattern_key = self.extract_pattern(user_input)
-            if pattern_key not in self.knowledge_base["successful_responses"]:
-                self.knowledge_base["successful_responses"][pattern_key] = []
-            self.knowledge_base["successful_responses"][pattern_key].append(response)
+            pattern_key = self.extract_pattern(user_input, tokens)
+            self.response_store.record("success", pattern_key, response)
         else:
             # 실패한 응답 분석
-            pattern_key = self.extract_pattern(user_input)
-            if pattern_key not in self.knowledge_base["failed_responses"]:
-                self.knowledge_base["failed_responses"][pattern_key] = []
-            self.knowledge_base["failed_responses"][pattern_key].append(response)
+            pattern_key = self.extract_pattern(user_input, tokens)
+            self.response_store.record("failed", pattern_key, response)
             
             # 개선 제안 생성
             self.suggest_improvement(user_input, response)
-        
-        self.save_knowledge()
     
-    def extract_pattern(self, text: str) -> str:
+    def extract_pattern(self, text: str, tokens: Optional[List[str]] = None) -> str:
         """텍스트에서 패턴 추출"""
         # 키워드 기반 패턴 추출
-        keywords = re.findall(r'\b\w+\b', text.lower())
+        keywords = tokens if tokens is not None else re.findall(r'\b\w+\b', text.lower())
         return "_".join(sorted(set(keywords))[:5])  # 상위 5개 키워드
     
     def suggest_improvement(self, user_input: str, failed_response: str):
@@ -160,8 +163,8 @@ class SelfLearningEngine:
         improvements = []
         
         # 실패 패턴 분석
-        for pattern, failures in self.knowledge_base["failed_responses"].items():
-            if len(failures) >= 3:  # 3번 이상 실패한 패턴
+        for pattern, failure_count in self.response_store.pattern_counts("failed").items():
+            if failure_count >= 3:  # 3번 이상 실패한 패턴
                 improvements.append(f"패턴 '{pattern}'에 대한 응답 개선 필요")
                 
                 # 웹에서 관련 정보 검색
@@ -172,15 +175,12 @@ class SelfLearningEngine:
                     # 새로운 응답 패턴 생성
                     new_response = self.generate_improved_response(search_results)
                     if new_response:
-                        if pattern not in self.knowledge_base["learned_patterns"]:
-                            self.knowledge_base["learned_patterns"][pattern] = []
-                        self.knowledge_base["learned_patterns"][pattern].append(new_response)
+                        self.store.append(["learned_patterns", pattern], new_response)
                         improvements.append(f"패턴 '{pattern}'에 대한 새로운 응답 생성: {new_response[:50]}...")
         
         # 새로운 기능 제안
         self.suggest_new_features()
         
-        self.save_knowledge()
         return improvements
     
     def generate_improved_response(self, search_results: List[Dict]) -> Optional[str]:
@@ -232,12 +232,14 @@ class SelfLearningEngine:
             "학습된_새_패턴": len(self.knowledge_base["learned_patterns"]),
             "개선_제안": len(self.improvement_suggestions),
             "웹_검색_캐시": len(self.knowledge_base["web_search_cache"]),
+            "웹_검색_캐시_통계": self.search_cache.get_stats(),
+            "응답_저장소": self.response_store.get_stats(),
             "현재_능력": self.knowledge_base["capabilities"]
         }
     
-    def smart_response(self, user_input: str) -> Optional[str]:
+    def smart_response(self, user_input: str, tokens: Optional[List[str]] = None) -> Optional[str]:
         """학습된 지식을 바탕으로 스마트 응답 생성"""
-        pattern = self.extract_pattern(user_input)
+        pattern = self.extract_pattern(user_input, tokens)
         
         # 학습된 패턴이 있는지 확인
         if pattern in self.knowledge_base["learned_patterns"]:
@@ -246,10 +248,9 @@ class SelfLearningEngine:
                 return responses[-1]  # 가장 최근 학습된 응답
         
         # 성공한 응답 패턴 확인
-        if pattern in self.knowledge_base["successful_responses"]:
-            responses = self.knowledge_base["successful_responses"][pattern]
-            if responses:
-                return responses[-1]  # 가장 최근 성공한 응답
+        latest = self.response_store.latest("success", pattern)
+        if latest:
+            return latest  # 가장 최근 성공한 응답
         
         # 웹 검색을 통한 새로운 응답 생성
         if len(user_input.split()) > 2:  # 충분히 구체적인 질문
@@ -0,0 +1,165 @@
+"""
+서비스 레지스트리 (Service Registry)
+엔진을 이름으로 등록해 두고 처음 사용할 때 가져와서(import) 생성합니다.
+설정에서 자주 쓰는(hot) 엔진으로 지정한 것은 백그라운드에서 미리 생성하고,
+각 엔진의 생성 시간으로 시작 시간 보고서를 만듭니다.
+"""
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+def lazy_import(module_name: str, attr: str, *args, **kwargs) -> Callable[[], Any]:
+    """호출될 때 모듈을 가져와 attr(*args, **kwargs)를 실행하는 팩토리"""
+    def factory():
+        module = importlib.import_module(module_name)
+        return getattr(module, attr)(*args, **kwargs)
+    factory.__name__ = f"{module_name}.{attr}"
+    return factory
+
+
+class _ServiceEntry:
+    """등록된 서비스 하나의 상태"""
+
+    def __init__(self, name: str, factory: Callable[[], Any], eager: bool):
+        self.name = name
+        self.factory = factory
+        self.eager = eager
+        self.lock = threading.Lock()
+        self.load_seconds: Optional[float] = None
+        self.loaded_by: Optional[str] = None
+        self.error: Optional[str] = None
+
+
+class ServiceRegistry:
+    """지연 생성 서비스 레지스트리"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.created_at = clock()
+        self.ready_at: Optional[float] = None
+        self._entries: Dict[str, _ServiceEntry] = {}
+        self._instances: Dict[str, Any] = {}
+        self._warm_up_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, factory: Callable[[], Any], eager: bool = False):
+        """서비스 등록 (eager=True면 load_eager에서 바로 생성)"""
+        self._entries[name] = _ServiceEntry(name, factory, eager)
+
+    def provide(self, name: str, instance: Any):
+        """이미 만들어진 인스턴스로 서비스 지정 (테스트 대역 등)"""
+        if name not in self._entries:
+            self.register(name, lambda: instance)
+        self._instances[name] = instance
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str, loaded_by: str = "on_demand") -> Any:
+        """서비스 반환 (처음 요청 시 생성)"""
+        instance = self._instances.get(name)
+        if instance is not None or name in self._instances:
+            return instance
+
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 서비스: {name}")
+
+        with entry.lock:
+            # 다른 스레드(예열)가 먼저 생성했을 수 있음
+            if name in self._instances:
+                return self._instances[name]
+
+            started = self.clock()
+            try:
+                instance = entry.factory()
+            except Exception as e:
+                entry.error = str(e)
+                print(f"⚠ 서비스 생성 실패: {name} ({e})")
+                raise
+            entry.load_seconds = self.clock() - started
+            entry.loaded_by = loaded_by
+            entry.error = None
+            self._instances[name] = instance
+            return instance
+
+    def load_eager(self):
+        """eager로 등록된 서비스를 등록 순서대로 생성"""
+        for entry in list(self._entries.values()):
+            if entry.eager:
+                self.get(entry.name, loaded_by="startup")
+
+    def mark_ready(self):
+        """시작 완료 시점 기록 (보고서의 시작 시간 계산용)"""
+        self.ready_at = self.clock()
+
+    def warm_up(self, names: Iterable[str], background: bool = True) -> Optional[threading.Thread]:
+        """자주 쓰는 서비스를 미리 생성 (background면 별도 스레드)"""
+        names = list(names)
+        for name in names:
+            if name not in self._entries:
+                print(f"⚠ 예열 대상 서비스를 찾을 수 없습니다: {name}")
+        names = [name for name in names if name in self._entries and not self.is_loaded(name)]
+        if not names:
+            return None
+
+        def run():
+            for name in names:
+                try:
+                    self.get(name, loaded_by="warm_up")
+                except Exception:
+                    # 실패는 get에서 기록됨, 실제 사용 시 다시 시도
+                    pass
+
+        if not background:
+            run()
+            return None
+
+        self._warm_up_thread = threading.Thread(target=run, name="ServiceWarmUp", daemon=True)
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def wait_for_warm_up(self, timeout: Optional[float] = None):
+        """진행 중인 예열 대기"""
+        thread = self._warm_up_thread
+        if thread and thread.is_alive():
+            thread.join(timeout)
+
+    def timing_report(self) -> Dict:
+        """서비스별 생성 시간과 시작 소요 시간"""
+        services: List[Dict] = []
+        for entry in self._entries.values():
+            services.append({
+                "name": entry.name,
+                "loaded": self.is_loaded(entry.name),
+                "loaded_by": entry.loaded_by,
+                "load_ms": round(entry.load_seconds * 1000, 1) if entry.load_seconds is not None else None,
+                "error": entry.error,
+            })
+        startup_ms = None
+        if self.ready_at is not None:
+            startup_ms = round((self.ready_at - self.created_at) * 1000, 1)
+        return {
+            "startup_ms": startup_ms,
+            "loaded": sum(1 for s in services if s["loaded"]),
+            "deferred": sum(1 for s in services if not s["loaded"]),
+            "services": services,
+        }
+
+    def format_report(self) -> str:
+        """시작 시간 보고서 문자열"""
+        report = self.timing_report()
+        lines = [f"⏱️ 시작 시간: {report['startup_ms']}ms "
+                 f"(생성 {report['loaded']}개, 지연 {report['deferred']}개)"]
+        loaded = [s for s in report["services"] if s["loaded"]]
+        loaded.sort(key=lambda s: s["load_ms"] or 0, reverse=True)
+        for s in loaded:
+            lines.append(f"   - {s['name']}: {s['load_ms']}ms ({s['loaded_by']})")
+        deferred = [s["name"] for s in report["services"] if not s["loaded"]]
+        if deferred:
+            lines.append(f"   - 첫 사용 시 생성: {', '.join(deferred)}")
+        return "\n".join(lines)
@@ -1,12 +1,12 @@
 import speech_recognition as sr
 import pyttsx3
-import time
 import json
 import os
 import random
 import sys
 import logging
 from datetime import datetime
+from typing import Optional
 
 # 모듈 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,30 +21,33 @@ from modules.plugins.plugin_manager import PluginManager
 from modules.sorisay_dashboard_web import broadcast_voice_command, broadcast_system_status, broadcast_persona_change, broadcast_creative_activity
 from modules.ai_code_manager.nlp_processor import NLPProcessor
 from modules.ai_code_manager.self_learning_engine import SelfLearningEngine
-from modules.ai_code_manager.auto_feature_expansion import AutoFeatureExpansion
-from modules.ai_code_manager.creative_sorisay_engine import CreativeSorisayEngine
 from modules.ai_code_manager.persona_system import PersonaSystem
 from modules.ai_code_manager.memory_palace import MemoryPalace
-from modules.ai_code_manager.ai_collaboration_network import AICollaborationNetwork
-from modules.ai_code_manager.creative_coding_assistant import CreativeCodingAssistant
-from modules.ai_code_manager.smart_plugin_generator import SmartPluginGenerator
-from ai_music_composer import AIMusicComposer, AILyricsWriter, AIMusicLyricsStudio
-from music_chat_system import get_chat_system
-from dream_interpreter import DreamInterpreter
-from virtual_dev_team import VirtualDevelopmentTeam
-from future_prediction_engine import FuturePredictionEngine
-from emotion_color_therapist import EmotionColorTherapist
-from personal_ai_tutor import PersonalAITutor, create_ai_tutor_response
-from realtime_game_generator import RealTimeGameGenerator, create_game_response
-from autonomous_shopping_mall import AutonomousShoppingMall, create_autonomous_mall_response
-from multi_agent_shopping_system import MultiAgentShoppingSystem, create_multi_agent_response
-from autonomous_marketing_system import AutonomousMarketingSystem, create_autonomous_marketing_response
+from modules.ai_code_manager.command_dispatcher import CommandDispatcher
+from modules.ai_code_manager.service_registry import ServiceRegistry, lazy_import
+from modules.ai_code_manager.audio_capture import AudioCapture
+from modules.ai_code_manager.recognition_backends import RecognitionPipeline, build_backends, DEFAULT_BACKENDS
+from modules.ai_code_manager.turn_tracing import get_tracer
+from modules.ai_code_manager.speech_output import (
+    SpeechOutput, Pyttsx3Engine, default_player, PRIORITY_URGENT, PRIORITY_NORMAL
+)
+
+# 종료 명령 단어 (음성 루프에서 가장 먼저 확인)
+EXIT_KEYWORDS = ["종료", "끝", "그만", "정지", "멈춰", "닫아", "shutdown", "exit", "quit", "소리새 안녕"]
+
+
+def is_shutdown_command(text: str) -> bool:
+    """종료 명령 또는 시스템 플러그인의 stop 명령인지 (인식 캐시에서 답하지 않음)"""
+    text = text.lower()
+    return "stop" in text or any(keyword in text for keyword in EXIT_KEYWORDS)
+
 
 class SorisayCore:
     def __init__(self, config_path="modules/ai_code_manager/settings.json"):
         # 로거 설정
         self.logger = setup_logger('SorisayCore', level='INFO')
         self.logger.info("소리새 코어 시스템 초기화 시작")
+        self.services = ServiceRegistry()
         
         # 설정 로드
         self.config = self.load_config(config_path)
@@ -56,81 +59,49 @@ class SorisayCore:
         self.recognizer.dynamic_energy_threshold = voice_config.get("dynamic_energy_threshold", True)
         self.recognizer.pause_threshold = voice_config.get("pause_threshold", 0.8)
         self.recognizer.phrase_threshold = voice_config.get("phrase_threshold", 0.3)
+        self.capture = None  # 연속 음성 수집 단계 (처음 들을 때 시작)
         
-        # TTS 설정
-        self.engine = pyttsx3.init()
-        tts_config = self.config.get("tts", {})
-        self.setup_tts_voice(tts_config)
-        
-        # 플러그인 매니저 초기화
-        self.plugin_manager = PluginManager()
-        self.plugin_manager.load_plugins()
-        
-        # 자연어 처리기 초기화
-        self.nlp_processor = NLPProcessor()
-        
-        # 자가 학습 엔진 초기화
-        self.learning_engine = SelfLearningEngine()
-        
-        # 자동 기능 확장 시스템 초기화
-        self.auto_expansion = AutoFeatureExpansion()
-        
-        # 🎨 창조형 소리새 엔진 초기화
-        self.creative_engine = CreativeSorisayEngine()
-        
-        # 🎭 페르소나 시스템 초기화
-        self.persona_system = PersonaSystem()
-        
-        # 🧠 기억의 궁전 초기화
-        self.memory_palace = MemoryPalace()
-        
-        # 🤝 AI 협업 네트워크 초기화
-        self.ai_network = AICollaborationNetwork()
-        
-        # 🎨 창조적 코딩 어시스턴트 초기화
-        self.coding_assistant = CreativeCodingAssistant()
-        
-        # 🧩 스마트 플러그인 생성기 초기화
-        self.plugin_generator = SmartPluginGenerator()
-        
-        # 🎵 AI 음악 작곡가 초기화
-        self.music_composer = AIMusicComposer()
-        
-        # 📝 AI 작사가 초기화  
-        self.lyrics_writer = AILyricsWriter()
+        # 인식 엔진 체인 (앞 엔진을 쓸 수 없으면 다음 엔진, 짧은 명령은 지문 캐시)
+        self.recognition = RecognitionPipeline(
+            build_backends(self.recognizer, voice_config.get("backends", DEFAULT_BACKENDS)),
+            cache_size=voice_config.get("recognition_cache_size", 256),
+            cache_max_seconds=voice_config.get("recognition_cache_max_seconds", 1.5),
+            cache_exclude=is_shutdown_command
+        )
         
-        # 🎼 AI 음악 작사 스튜디오 통합 시스템 초기화
-        self.music_studio = AIMusicLyricsStudio()
+        # 단계별 지연 시간 추적 (대시보드 /api/metrics에서 조회)
+        tracing_config = self.config.get("tracing", {})
+        self.tracer = get_tracer()
+        self.tracer.configure(
+            slow_turn_threshold=tracing_config.get("slow_turn_threshold"),
+            slow_turn_log=tracing_config.get("slow_turn_log", "logs/slow_turns.jsonl")
+        )
         
-        # 💬 음악 채팅 시스템 초기화
-        self.chat_system = get_chat_system()
-        
-        # 🌙 꿈 해석 시스템 초기화
-        self.dream_interpreter = DreamInterpreter()
-        
-        # 🤖 가상 개발팀 시스템 초기화
-        self.virtual_dev_team = VirtualDevelopmentTeam()
-        
-        # 🔮 미래 예측 엔진 초기화
-        self.prediction_engine = FuturePredictionEngine()
-        
-        # 🎨 감정 색채 치료사 초기화
-        self.color_therapist = EmotionColorTherapist()
-        
-        # 🎓 개인 맞춤 AI 튜터 초기화
-        self.ai_tutor = PersonalAITutor()
-        
-        # 🎮 실시간 게임 생성기 초기화
-        self.game_generator = RealTimeGameGenerator()
+        # TTS 설정 (엔진은 음성 출력 작업 스레드에서 생성, 말하는 동안 메인 루프는 계속 진행)
+        tts_config = self.config.get("tts", {})
+        self.engine = None
+        self.speech = SpeechOutput(
+            self.create_tts_engine,
+            cache_dir=tts_config.get("cache_dir", "data/tts_cache"),
+            player=default_player(),
+            max_cache_entries=tts_config.get("cache_max_entries", 500),
+            observer=self.observe_speech
+        )
+        self.speech.start()
         
-        # 🛒 지능형 자율 쇼핑몰 초기화
-        self.autonomous_mall = AutonomousShoppingMall()
+        # 서브시스템 등록 (핵심 엔진만 바로 생성, 나머지는 처음 사용할 때 생성)
+        self.register_services()
+        self.services.load_eager()
         
-        # 🤖 멀티 AI 에이전트 쇼핑 시스템 초기화
-        self.multi_agent_shopping = MultiAgentShoppingSystem()
+        # 설정에서 자주 쓰는 것으로 지정한 엔진은 미리 생성
+        startup_config = self.config.get("startup", {})
+        self.services.warm_up(
+            startup_config.get("hot_services", []),
+            background=startup_config.get("background_warm_up", True)
+        )
         
-        # 🎯 자율 마케팅 시스템 초기화
-        self.marketing_system = AutonomousMarketingSystem()
+        # 🧭 창의적 기능 라우팅 테이블
+        self.creative_dispatcher = self.build_creative_routes()
         
         # 진화 카운터
         self.interaction_count = 0
@@ -144,6 +115,63 @@ class SorisayCore:
         
         # 대시보드에 시스템 시작 알림
         broadcast_system_status("소리새 시스템 시작됨")
+        
+        self.services.mark_ready()
+        startup_report = self.services.format_report()
+        print(startup_report)
+        self.logger.info(startup_report.replace("\n", " | "))
+    
+    def register_services(self):
+        """서브시스템 등록 (eager=True인 엔진만 시작 시 생성)"""
+        services = self.services
+        memory_config = self.config.get("memory_palace", {})
+        
+        # 매 발화마다 쓰는 핵심 엔진
+        services.register("plugin_manager", self.create_plugin_manager, eager=True)
+        services.register("nlp_processor", NLPProcessor, eager=True)
+        services.register("learning_engine", SelfLearningEngine, eager=True)
+        services.register("persona_system", PersonaSystem, eager=True)
+        services.register("memory_palace", lambda: MemoryPalace(
+            max_memories=memory_config.get("max_conversations", 1000)), eager=True)
+        
+        # 🎨 창조/확장 엔진
+        services.register("auto_expansion", lazy_import("modules.ai_code_manager.auto_feature_expansion", "AutoFeatureExpansion"))
+        services.register("creative_engine", lazy_import("modules.ai_code_manager.creative_sorisay_engine", "CreativeSorisayEngine"))
+        services.register("ai_network", lazy_import("modules.ai_code_manager.ai_collaboration_network", "AICollaborationNetwork"))
+        services.register("coding_assistant", lazy_import("modules.ai_code_manager.creative_coding_assistant", "CreativeCodingAssistant"))
+        services.register("plugin_generator", lazy_import("modules.ai_code_manager.smart_plugin_generator", "SmartPluginGenerator"))
+        
+        # 🎵 음악/채팅
+        services.register("music_composer", lazy_import("ai_music_composer", "AIMusicComposer"))
+        services.register("lyrics_writer", lazy_import("ai_music_composer", "AILyricsWriter"))
+        services.register("music_studio", lazy_import("ai_music_composer", "AIMusicLyricsStudio"))
+        services.register("chat_system", lazy_import("music_chat_system", "get_chat_system"))
+        
+        # 🔮 창의적 기능 엔진
+        services.register("dream_interpreter", lazy_import("dream_interpreter", "DreamInterpreter"))
+        services.register("virtual_dev_team", lazy_import("virtual_dev_team", "VirtualDevelopmentTeam"))
+        services.register("prediction_engine", lazy_import("future_prediction_engine", "FuturePredictionEngine"))
+        services.register("color_therapist", lazy_import("emotion_color_therapist", "EmotionColorTherapist"))
+        services.register("ai_tutor", lazy_import("personal_ai_tutor", "PersonalAITutor"))
+        services.register("game_generator", lazy_import("realtime_game_generator", "RealTimeGameGenerator"))
+        
+        # 🛒 비즈니스 시스템 (데이터 파일/DB를 읽으므로 특히 지연 생성 효과가 큼)
+        services.register("autonomous_mall", lazy_import("modules.ai_code_manager.autonomous_shopping_mall", "get_mall_service"))
+        services.register("multi_agent_shopping", lazy_import("modules.ai_code_manager.multi_agent_shopping_system", "get_multi_agent_system"))
+        services.register("marketing_system", lazy_import("modules.ai_code_manager.autonomous_marketing_system", "get_marketing_service"))
+    
+    def create_plugin_manager(self) -> PluginManager:
+        """플러그인 매니저 생성 및 기본 플러그인 로드"""
+        plugin_manager = PluginManager()
+        plugin_manager.load_plugins()
+        return plugin_manager
+    
+    def __getattr__(self, name):
+        """등록된 서브시스템은 처음 접근할 때 생성"""
+        services = self.__dict__.get("services")
+        if services is not None and name in services:
+            return services.get(name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def load_config(self, config_path):
         """설정 파일 로드"""
@@ -197,6 +225,20 @@ class SorisayCore:
             }
         }
 
+    def create_tts_engine(self):
+        """TTS 엔진 생성 및 음성 설정 (음성 출력 작업 스레드에서 호출)"""
+        self.engine = pyttsx3.init()
+        self.setup_tts_voice(self.config.get("tts", {}))
+        return Pyttsx3Engine(self.engine)
+
+    def observe_speech(self, request):
+        """발화 하나의 대기/재생 시간 기록 (음성 출력 작업 스레드에서 호출)"""
+        if request.started_at is None:
+            return
+        self.tracer.observe("tts_queue", request.started_at - request.queued_at)
+        if request.status in ("spoken", "cached"):
+            self.tracer.observe("tts", request.finished_at - request.started_at)
+
     def setup_tts_voice(self, tts_config):
         """TTS 음성 설정"""
         try:
@@ -261,58 +303,45 @@ class SorisayCore:
             self.logger.error(f"TTS 설정 중 예상치 못한 오류: {e}", exc_info=True)
             print(f"[WARNING] TTS 설정 중 오류: {e}")
 
-    def speak_with_emotion(self, text, emotion="neutral", speed_modifier=1.0):
-        """감정과 속도 조절이 가능한 음성 출력"""
-        try:
-            tts_config = self.config.get("tts", {})
-            effects = tts_config.get("voice_effects", {})
-            
-            # 원래 속도 저장
-            original_rate = self.engine.getProperty('rate')
-            
-            # 감정에 따른 속도 조절 - 더 자연스럽게
-            if effects.get("enable_speed_variation", True):
-                emotion_rates = {
-                    "excited": original_rate * 1.05,  # 살짝만 빠르게
-                    "happy": original_rate * 1.02,   # 아주 살짝 빠르게
-                    "neutral": original_rate,
-                    "sad": original_rate * 0.95,     # 살짝 느리게
-                    "error": original_rate * 0.98,   # 조금 느리게
-                    "success": original_rate * 1.02, # 살짝 빠르게
-                    "casual": original_rate * 0.98   # 편안하게 느리게
-                }
-                new_rate = int(emotion_rates.get(emotion, original_rate) * speed_modifier)
-                self.engine.setProperty('rate', new_rate)
-            else:
-                # 대화 모드에서는 속도 변화 최소화
-                new_rate = int(original_rate * speed_modifier)
-                self.engine.setProperty('rate', new_rate)
-            
-            # 감정에 따른 텍스트 수정
-            if effects.get("enable_emotion", True):
-                text = self.add_emotional_markers(text, emotion)
-            
-            # 자연스러운 일시정지 추가
-            if effects.get("enable_pause_insertion", True):
-                text = self.add_natural_pauses(text)
-            
-            print(f"🗣 [{emotion}] {text}")
-            self.engine.say(text)
-            self.engine.runAndWait()
-            
-            # 원래 속도로 복원
-            self.engine.setProperty('rate', original_rate)
-            
-        except RuntimeError as e:
-            self.logger.error(f"TTS 음성 출력 런타임 오류: {e}", exc_info=True)
-            print(f"[WARNING] 음성 출력 오류: {e}")
-            # 기본 speak 메서드로 fallback
-            self.speak(text)
-        except Exception as e:
-            self.logger.error(f"음성 출력 중 예상치 못한 오류: {e}", exc_info=True)
-            print(f"[WARNING] 음성 출력 오류: {e}")
-            # 기본 speak 메서드로 fallback
-            self.speak(text)
+    def speak_with_emotion(self, text, emotion="neutral", speed_modifier=1.0, priority=None, cache=False):
+        """
+        감정과 속도 조절이 가능한 음성 출력 (음성 출력 큐에 넣고 바로 반환)
+        오류 안내는 긴급 우선순위로 재생 중인 일반 발화보다 먼저 나갑니다.
+        속도는 발화마다 계산하여 요청에 담으므로 엔진 설정을 바꿨다가 되돌리지 않습니다.
+        """
+        tts_config = self.config.get("tts", {})
+        effects = tts_config.get("voice_effects", {})
+        base_rate = tts_config.get("rate", 150)
+        
+        # 감정에 따른 속도 조절 - 더 자연스럽게
+        if effects.get("enable_speed_variation", True):
+            emotion_rates = {
+                "excited": base_rate * 1.05,  # 살짝만 빠르게
+                "happy": base_rate * 1.02,   # 아주 살짝 빠르게
+                "neutral": base_rate,
+                "sad": base_rate * 0.95,     # 살짝 느리게
+                "error": base_rate * 0.98,   # 조금 느리게
+                "success": base_rate * 1.02, # 살짝 빠르게
+                "casual": base_rate * 0.98   # 편안하게 느리게
+            }
+            new_rate = int(emotion_rates.get(emotion, base_rate) * speed_modifier)
+        else:
+            # 대화 모드에서는 속도 변화 최소화
+            new_rate = int(base_rate * speed_modifier)
+        
+        # 감정에 따른 텍스트 수정
+        if effects.get("enable_emotion", True):
+            text = self.add_emotional_markers(text, emotion)
+        
+        # 자연스러운 일시정지 추가
+        if effects.get("enable_pause_insertion", True):
+            text = self.add_natural_pauses(text)
+        
+        if priority is None:
+            priority = PRIORITY_URGENT if emotion == "error" else PRIORITY_NORMAL
+        
+        print(f"🗣 [{emotion}] {text}")
+        return self.speech.say(text, new_rate, emotion=emotion, priority=priority, cache=cache)
 
     def add_emotional_markers(self, text, emotion):
         """감정에 따른 텍스트 마커 추가 - 자연스럽게"""
@@ -348,43 +377,91 @@ class SorisayCore:
         
         return text
 
-    def speak(self, text, emotion="neutral"):
-        """개선된 음성 출력 (감정 지원)"""
-        self.speak_with_emotion(text, emotion)
+    def speak(self, text, emotion="neutral", priority=None, cache=False):
+        """개선된 음성 출력 (감정 지원, 완료를 기다리려면 반환된 요청의 wait() 사용)"""
+        return self.speak_with_emotion(text, emotion, priority=priority, cache=cache)
+
+    def create_audio_capture(self):
+        """
+        연속 음성 수집 단계 생성
+        voice_recognition.audio_file을 지정하면 마이크 대신 오디오 파일을 입력으로 사용합니다.
+        """
+        voice_config = self.config.get("voice_recognition", {})
+        audio_file = voice_config.get("audio_file")
+        barge_in = voice_config.get("barge_in", False)
+        echo_tail = voice_config.get("echo_tail", 0.3)
+        return AudioCapture(
+            self.recognizer,
+            (lambda: sr.AudioFile(audio_file)) if audio_file else sr.Microphone,
+            queue_size=voice_config.get("capture_queue_size", 4),
+            calibration_interval=voice_config.get("calibration_interval", 60.0),
+            calibration_duration=voice_config.get("ambient_noise_duration", 0.5),
+            phrase_time_limit=voice_config.get("phrase_time_limit", 3),
+            # 끼어들기를 쓰지 않으면 소리새가 말하는 동안(잔향 echo_tail초 포함) 녹음된 구절은 명령으로 받지 않음
+            mute=None if barge_in else (lambda start, end: self.speech.spoke_during(start, end, echo_tail))
+        )
 
     def listen(self):
-        try:
-            voice_config = self.config.get("voice_recognition", {})
-            with sr.Microphone() as source:
-                print("🎧 듣는 중...")
-                self.recognizer.adjust_for_ambient_noise(
-                    source, 
-                    duration=voice_config.get("ambient_noise_duration", 0.5)
-                )
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=voice_config.get("timeout", 5), 
-                    phrase_time_limit=voice_config.get("phrase_time_limit", 3)
-                )
-                
-                cmd = self.recognizer.recognize_google(audio, language="ko-KR")
-                print(f"🎙 인식된 명령: '{cmd}'")
-                return cmd.strip()
-                
-        except sr.WaitTimeoutError:
-            print("⏱ 음성 입력 대기 시간 초과")
+        """수집 스레드가 잘라 둔 다음 구절을 인식 (인식하는 동안 다음 구절 수집은 계속됨)"""
+        voice_config = self.config.get("voice_recognition", {})
+        if self.capture is None:
+            self.capture = self.create_audio_capture()
+            self.capture.start()
+            print("🎧 듣는 중...")
+        
+        phrase = self.capture.get(timeout=voice_config.get("timeout", 5))
+        if phrase is None:
+            if self.capture.exhausted:
+                print("🎧 음성 입력이 끝났습니다")
+                self.running = False
+            else:
+                print("⏱ 음성 입력 대기 시간 초과")
             return None
+        
+        # 턴은 사용자가 말을 마친 시점부터 (listen = 구절 수집 후 인식 시작까지 대기)
+        self.tracer.begin_turn(start=phrase.captured_at)
+        self.tracer.record_span("listen", phrase.captured_at, self.tracer.clock())
+        
+        if voice_config.get("barge_in", False):
+            # 사용자가 말을 했으므로 남은 응답은 취소 (끼어들기)
+            self.speech.cancel()
+        
+        try:
+            with self.tracer.span("recognition") as span:
+                result = self.recognition.recognize(phrase.audio)
+                span.attributes["backend"] = result.backend
+            print(f"🎙 인식된 명령: '{result.text}' ({result.backend}, {result.latency * 1000:.0f}ms)")
+            return result.text
         except sr.UnknownValueError:
             print("[WARNING] 음성을 인식하지 못했습니다")
-            self.speak("다시 말씀해 주세요")
+            self.speak("다시 말씀해 주세요", priority=PRIORITY_URGENT, cache=True)
             return None
         except sr.RequestError as e:
-            print(f"🚫 Google Speech Recognition 오류: {e}")
-            self.speak("인터넷 연결을 확인해주세요")
+            print(f"🚫 음성 인식 엔진 오류: {e}")
+            self.speak("인터넷 연결을 확인해주세요", priority=PRIORITY_URGENT, cache=True)
             return None
 
     def run(self):
-        self.speak("진화형 소리새가 준비되었습니다. 저는 스스로 학습하고 발전합니다.")
+        """음성 명령 루프 (종료 시 저장되지 않은 기억/지식을 반드시 저장)"""
+        try:
+            yield from self._run_loop()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """지연 쓰기 중인 기억과 지식 베이스 변경분 저장, 남은 음성 출력 마무리"""
+        self.tracer.end_turn()
+        if self.capture is not None:
+            self.capture.stop()
+        recognition_report = self.recognition.format_report()
+        print(recognition_report)
+        self.logger.info(recognition_report.replace("\n", " | "))
+        self.memory_palace.close()
+        self.learning_engine.close()
+        self.speech.close()
+
+    def _run_loop(self):
+        self.speak("진화형 소리새가 준비되었습니다. 저는 스스로 학습하고 발전합니다.", cache=True)
         
         # 학습 현황 출력
         learning_summary = self.learning_engine.get_learning_summary()
@@ -400,17 +477,24 @@ class SorisayCore:
         while self.running:
             cmd = self.listen()
             if not cmd: 
-                time.sleep(0.5)
+                self.tracer.end_turn()
                 continue
             
             self.interaction_count += 1
+            self.tracer.annotate(command=cmd)
             response_success = False
             final_response = ""
             
+            # 🧠 발화 분석 (의도, 엔티티, 감정, 기분을 한 번에 계산하여 모든 단계에서 공유)
+            with self.tracer.span("nlp"):
+                analysis = self.nlp_processor.analyze_utterance(cmd, self.persona_system)
+            self.tracer.annotate(intent=analysis.intent, confidence=round(analysis.confidence, 2))
+            emotion = analysis.emotion
+            
             # 🎭 페르소나 시스템으로 감정 감지 및 성격 전환
-            user_mood = self.persona_system.detect_user_mood(cmd)
             old_persona = self.persona_system.current_persona
-            self.persona_system.switch_persona(user_mood)
+            with self.tracer.span("persona"):
+                self.persona_system.switch_persona(analysis.persona)
             if old_persona != self.persona_system.current_persona:
                 print(f"🎭 페르소나 변경: {old_persona} → {self.persona_system.current_persona}")
                 broadcast_persona_change(self.persona_system.current_persona)
@@ -419,21 +503,20 @@ class SorisayCore:
                 print(f"🎭 활성 페르소나: {self.persona_system.current_persona}")
             
             # 🛑 종료 명령 최우선 처리
-            if any(keyword in cmd.lower() for keyword in ["종료", "끝", "그만", "정지", "멈춰", "닫아", "shutdown", "exit", "quit", "소리새 안녕"]):
+            if any(keyword in analysis.normalized for keyword in EXIT_KEYWORDS):
                 print("🛑 종료 명령 감지됨!")
-                self.speak("소리새를 종료합니다. 안녕히 가세요!")
+                self.speech.cancel()
+                self.speak("소리새를 종료합니다. 안녕히 가세요!", priority=PRIORITY_URGENT, cache=True)
                 self.running = False
                 broadcast_system_status("시스템 종료 중")
                 yield cmd
                 break
             
-            # 🧠 기억의 궁전에 대화 저장
-            nlp_result = self.nlp_processor.process_natural_language(cmd)
-            emotion = nlp_result.get("emotion", "neutral")
-            
             # 🧠 자가 학습된 지식으로 먼저 응답 시도
-            smart_response = self.learning_engine.smart_response(cmd)
+            with self.tracer.span("smart_response"):
+                smart_response = self.learning_engine.smart_response(cmd, analysis.tokens)
             if smart_response:
+                self.tracer.annotate(route="learned")
                 print(f"🎓 학습된 지식으로 응답: {smart_response[:50]}...")
                 self.speak(smart_response)
                 final_response = smart_response
@@ -441,21 +524,20 @@ class SorisayCore:
                 broadcast_voice_command(cmd, "smart_success")
                 
                 # 학습 기록
-                self.learning_engine.learn_from_interaction(cmd, smart_response, True)
+                with self.tracer.span("knowledge_save"):
+                    self.learning_engine.learn_from_interaction(cmd, smart_response, True, analysis.tokens)
                 yield cmd
                 
             else:
-                # 기존 NLP 처리
-                nlp_result = self.nlp_processor.process_natural_language(cmd)
-                intent = nlp_result["intent"]
-                confidence = nlp_result["confidence"]
+                # 기존 NLP 처리 (위에서 분석한 결과 재사용)
+                intent = analysis.intent
+                confidence = analysis.confidence
                 
                 print(f"🧠 NLP 분석: 의도='{intent}', 신뢰도={confidence:.2f}")
                 
                 # 높은 신뢰도로 의도가 파악된 경우
                 if intent and confidence > 0.5:
                     mapped_command = self.nlp_processor.get_command_mapping(intent)
-                    emotion = nlp_result.get("emotion", "neutral")
                     
                     if mapped_command:
                         plugin_name, command, keyword = self.plugin_manager.find_command(mapped_command)
@@ -464,11 +546,12 @@ class SorisayCore:
                             print(f"✅ 자연어 명령 실행: '{cmd}' -> '{mapped_command}' (플러그인: {plugin_name})")
                             broadcast_voice_command(cmd, "success")
                             
-                            nlp_response = nlp_result["response"]
+                            nlp_response = analysis.response
                             self.speak(nlp_response, emotion)
                             
                             try:
-                                response = self.plugin_manager.execute_command(plugin_name, command, cmd)
+                                with self.tracer.span("plugin", plugin=plugin_name):
+                                    response = self.plugin_manager.execute_command(plugin_name, command, cmd)
                                 if response != nlp_response:
                                     self.speak(response, "success")
                                 
@@ -504,7 +587,7 @@ class SorisayCore:
                             yield cmd
                         else:
                             print(f"✅ 자연어 응답: '{intent}'")
-                            response_text = nlp_result["response"]
+                            response_text = analysis.response
                             self.speak(response_text, emotion)
                             final_response = response_text
                             response_success = True
@@ -512,7 +595,7 @@ class SorisayCore:
                             yield cmd
                     else:
                         print(f"[WARNING] 매핑되지 않은 의도: '{intent}'")
-                        response_text = nlp_result["response"]
+                        response_text = analysis.response
                         self.speak(response_text, emotion)
                         final_response = response_text
                         response_success = False
@@ -521,7 +604,8 @@ class SorisayCore:
                 else:
                     # 🌐 웹 검색을 통한 새로운 지식 획득
                     print(f"🔍 웹 검색을 통한 지식 확장 시도...")
-                    search_results = self.learning_engine.web_search(cmd)
+                    with self.tracer.span("web_search"):
+                        search_results = self.learning_engine.web_search(cmd)
                     
                     if search_results and search_results[0].get("content"):
                         web_response = f"웹에서 찾은 정보입니다: {search_results[0]['content'][:200]}..."
@@ -531,11 +615,13 @@ class SorisayCore:
                         broadcast_voice_command(cmd, "web_search_success")
                         
                         # 새로운 지식으로 학습
-                        self.learning_engine.learn_from_interaction(cmd, web_response, True)
+                        with self.tracer.span("knowledge_save"):
+                            self.learning_engine.learn_from_interaction(cmd, web_response, True, analysis.tokens)
                         yield cmd
                     else:
                         # 🎨 창의적 AI 기능들 처리
-                        creative_response = self.handle_creative_commands(cmd)
+                        with self.tracer.span("creative"):
+                            creative_response = self.handle_creative_commands(cmd)
                         if creative_response:
                             self.speak(creative_response, emotion)
                             final_response = creative_response
@@ -546,67 +632,71 @@ class SorisayCore:
                             # 기존 방식으로 처리
                             plugin_name, command, keyword = self.plugin_manager.find_command(cmd)
                         
-                        if plugin_name and command:
-                            print(f"✅ '{keyword}' 명령어 실행 (플러그인: {plugin_name})")
-                            broadcast_voice_command(cmd, "success")
-                            
-                            try:
-                                response = self.plugin_manager.execute_command(plugin_name, command, cmd)
-                                self.speak(response)
-                                final_response = response
-                                response_success = True
+                            if plugin_name and command:
+                                print(f"✅ '{keyword}' 명령어 실행 (플러그인: {plugin_name})")
+                                broadcast_voice_command(cmd, "success")
                                 
-                                if command == "stop":
-                                    self.running = False
-                                    broadcast_system_status("시스템 종료 중")
+                                try:
+                                    with self.tracer.span("plugin", plugin=plugin_name):
+                                        response = self.plugin_manager.execute_command(plugin_name, command, cmd)
+                                    self.speak(response)
+                                    final_response = response
+                                    response_success = True
                                     
-                            except ImportError as e:
-                                self.logger.error(f"플러그인 모듈 로드 실패: {e}", exc_info=True)
-                                error_msg = f"플러그인을 찾을 수 없습니다: {str(e)}"
-                                print(f"❌ {error_msg}")
-                                self.speak(error_msg)
-                                final_response = error_msg
-                                broadcast_voice_command(cmd, "failed")
-                            except AttributeError as e:
-                                self.logger.error(f"명령어 속성 오류: {e}", exc_info=True)
-                                error_msg = f"명령어 실행 방법이 잘못되었습니다: {str(e)}"
-                                print(f"❌ {error_msg}")
-                                self.speak(error_msg)
-                                final_response = error_msg
-                                broadcast_voice_command(cmd, "failed")
-                            except Exception as e:
-                                self.logger.error(f"명령어 실행 중 예상치 못한 오류: {e}", exc_info=True)
-                                error_msg = f"명령어 실행 중 오류가 발생했습니다: {str(e)}"
-                                print(f"❌ {error_msg}")
-                                self.speak(error_msg)
-                                final_response = error_msg
-                                broadcast_voice_command(cmd, "failed")
-                                
-                            yield cmd
-                        else:
-                            # 완전히 이해하지 못한 경우
-                            unknown_response = "죄송합니다. 아직 이해하지 못하는 요청입니다. 하지만 학습해서 다음엔 더 잘 도와드리겠습니다."
-                            self.speak(unknown_response)
-                            final_response = unknown_response
-                            response_success = False
-                            broadcast_voice_command(cmd, "learning_needed")
-                            yield cmd
+                                    if command == "stop":
+                                        self.running = False
+                                        broadcast_system_status("시스템 종료 중")
+                                        
+                                except ImportError as e:
+                                    self.logger.error(f"플러그인 모듈 로드 실패: {e}", exc_info=True)
+                                    error_msg = f"플러그인을 찾을 수 없습니다: {str(e)}"
+                                    print(f"❌ {error_msg}")
+                                    self.speak(error_msg)
+                                    final_response = error_msg
+                                    broadcast_voice_command(cmd, "failed")
+                                except AttributeError as e:
+                                    self.logger.error(f"명령어 속성 오류: {e}", exc_info=True)
+                                    error_msg = f"명령어 실행 방법이 잘못되었습니다: {str(e)}"
+                                    print(f"❌ {error_msg}")
+                                    self.speak(error_msg)
+                                    final_response = error_msg
+                                    broadcast_voice_command(cmd, "failed")
+                                except Exception as e:
+                                    self.logger.error(f"명령어 실행 중 예상치 못한 오류: {e}", exc_info=True)
+                                    error_msg = f"명령어 실행 중 오류가 발생했습니다: {str(e)}"
+                                    print(f"❌ {error_msg}")
+                                    self.speak(error_msg)
+                                    final_response = error_msg
+                                    broadcast_voice_command(cmd, "failed")
+                                    
+                                yield cmd
+                            else:
+                                # 완전히 이해하지 못한 경우
+                                unknown_response = "죄송합니다. 아직 이해하지 못하는 요청입니다. 하지만 학습해서 다음엔 더 잘 도와드리겠습니다."
+                                self.speak(unknown_response)
+                                final_response = unknown_response
+                                response_success = False
+                                broadcast_voice_command(cmd, "learning_needed")
+                                yield cmd
                 
                 # 모든 상호작용에서 학습
                 if not smart_response:  # 이미 학습하지 않은 경우만
-                    self.learning_engine.learn_from_interaction(cmd, final_response, response_success)
+                    with self.tracer.span("knowledge_save"):
+                        self.learning_engine.learn_from_interaction(cmd, final_response, response_success, analysis.tokens)
                 
                 # 🧠 모든 대화를 기억의 궁전에 저장
-                self.memory_palace.remember_conversation(cmd, final_response, emotion)
+                with self.tracer.span("memory_save"):
+                    self.memory_palace.remember_conversation(cmd, final_response, emotion)
             
             # 🚀 주기적 자가 진화 (50번 상호작용마다)
             if self.interaction_count - self.last_evolution_check >= 50:
-                self.self_evolve()
+                with self.tracer.span("self_evolve"):
+                    self.self_evolve()
                 self.last_evolution_check = self.interaction_count
             
+            self.tracer.end_turn()
             if not self.running:
                 break
-            time.sleep(0.5)
 
     def generate_creative_idea(self, context: str = "") -> str:
         """🎨 창조적 아이디어 생성"""
@@ -647,6 +737,13 @@ class SorisayCore:
         # 학습된 패턴 분석
         learning_data = self.learning_engine.get_learning_summary()
         
+        # 자주 쓰이는 창의적 기능 기록
+        route_stats = self.creative_dispatcher.get_stats()
+        hot_routes = [r for r in route_stats["routes"] if r["hits"]][:3]
+        if hot_routes:
+            summary = ", ".join(f"{r['route']}({r['hits']}회, 평균 {r['avg_ms']}ms)" for r in hot_routes)
+            self.logger.info(f"창의적 기능 사용 현황: {summary} / 미일치 {route_stats['misses']}회")
+        
         evolution_messages = [
             "새로운 대화 패턴을 학습했습니다!",
             "사용자 선호도를 분석하여 개선했습니다!",
@@ -664,123 +761,148 @@ class SorisayCore:
         return evolution_msg
     
     def handle_creative_commands(self, cmd: str) -> str:
-        """🎨 창의적 AI 기능들 처리"""
-        cmd_lower = cmd.lower()
-        
-        # 페르소나 관련 명령어
-        if any(keyword in cmd_lower for keyword in ["페르소나", "성격", "모드", "감정"]):
-            persona_response = self.persona_system.get_persona_response(cmd)
-            # 기억에 저장
-            self.memory_palace.remember_conversation(cmd, persona_response, self.persona_system.current_persona)
-            return persona_response
-        
-        # AI 협업 요청
-        elif any(keyword in cmd_lower for keyword in ["브레인스토밍", "아이디어", "협업", "팀워크"]):
-            session = self.ai_network.brainstorm_session(cmd, 2)
-            response = f"🤝 AI 팀 협업 결과:\n{session['final_solution']}\n\n📊 합의도: {session['consensus_score']:.1f}점"
-            self.memory_palace.remember_conversation(cmd, response, "collaborative")
-            broadcast_creative_activity("collaboration", f"AI 팀 브레인스토밍 (합의도: {session['consensus_score']:.0f}%)")
+        """🎨 창의적 AI 기능들 처리 (라우팅 테이블에서 한 번에 매칭)"""
+        return self.creative_dispatcher.dispatch(cmd)
+    
+    def build_creative_routes(self) -> CommandDispatcher:
+        """창의적 기능 라우팅 테이블 (서브시스템, 키워드, 핸들러)"""
+        dispatcher = CommandDispatcher()
+        dispatcher.register("persona", ["페르소나", "성격", "모드", "감정"], self._creative_persona)
+        dispatcher.register("collaboration", ["브레인스토밍", "아이디어", "협업", "팀워크"], self._creative_collaboration)
+        dispatcher.register("code_poetry", ["코드", "프로그램", "개선", "리팩토링"], self._creative_code_poetry)
+        dispatcher.register("plugin_generation", ["플러그인", "기능 추가", "만들어", "생성"], self._creative_plugin_generation)
+        dispatcher.register("memory_recall", ["기억", "이전", "전에", "예전"], self._creative_memory_recall)
+        dispatcher.register("personality_insights", ["분석", "성격", "인사이트", "특징"], self._creative_personality_insights)
+        dispatcher.register("dream", ["꿈", "해석", "꿈해석", "심리분석"], self._creative_dream)
+        dispatcher.register("tutor", ["학습", "공부", "튜터", "가르쳐", "배우고", "수업", "강의"], self._creative_tutor)
+        dispatcher.register("game", ["게임", "퍼즐", "퀴즈", "놀이", "재미있는"], self._creative_game)
+        dispatcher.register("dev_team", ["개발팀", "프로젝트", "팀관리", "스프린트", "개발진행"], self._creative_dev_team)
+        dispatcher.register("future", ["미래", "예측", "전망", "트렌드", "예상", "분석"], self._creative_future)
+        dispatcher.register("color_therapy", ["색", "색깔", "컬러", "치료", "감정치료", "색채치료"], self._creative_color_therapy)
+        dispatcher.register("music", ["음악", "작곡", "멜로디", "노래"], self._creative_music)
+        dispatcher.register("lyrics", ["작사", "가사", "lyrics", "시"], self._creative_lyrics)
+        dispatcher.register("song", ["완전한 노래", "전체 노래", "노래 만들기", "송 크리에이트"], self._creative_song)
+        dispatcher.register("music_chat", ["채팅", "채팅장", "음악채팅", "채팅방", "대화방"], self._creative_music_chat)
+        dispatcher.register("shopping_mall", ["쇼핑몰", "온라인쇼핑", "상품판매", "자율쇼핑", "스마트쇼핑"], self._creative_shopping_mall)
+        dispatcher.register("multi_agent", ["멀티에이전트", "멀티 에이전트", "다중ai", "협업ai", "에이전트시스템"], self._creative_multi_agent)
+        dispatcher.register("marketing", ["마케팅", "광고", "판매", "홍보", "브랜딩", "캠페인", "자동마케팅", "광고자동화"], self._creative_marketing)
+        return dispatcher
+    
+    def _creative_persona(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """페르소나 관련 명령어"""
+        persona_response = self.persona_system.get_persona_response(cmd)
+        # 기억에 저장
+        self.memory_palace.remember_conversation(cmd, persona_response, self.persona_system.current_persona)
+        return persona_response
+    
+    def _creative_collaboration(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """AI 협업 요청"""
+        session = self.ai_network.brainstorm_session(cmd, 2)
+        response = f"🤝 AI 팀 협업 결과:\n{session['final_solution']}\n\n📊 합의도: {session['consensus_score']:.1f}점"
+        self.memory_palace.remember_conversation(cmd, response, "collaborative")
+        broadcast_creative_activity("collaboration", f"AI 팀 브레인스토밍 (합의도: {session['consensus_score']:.0f}%)")
+        return response
+    
+    def _creative_code_poetry(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """코드 분석 및 개선 요청"""
+        if "분석" in cmd_lower or "개선" in cmd_lower:
+            suggestions = self.coding_assistant.suggest_code_poetry("def example(): pass")
+            response = "🎨 창조적 코딩 제안:\n" + "\n".join(suggestions)
+            self.memory_palace.remember_conversation(cmd, response, "creative")
             return response
-        
-        # 코드 분석 및 개선 요청
-        elif any(keyword in cmd_lower for keyword in ["코드", "프로그램", "개선", "리팩토링"]):
-            if "분석" in cmd_lower or "개선" in cmd_lower:
-                suggestions = self.coding_assistant.suggest_code_poetry("def example(): pass")
-                response = "🎨 창조적 코딩 제안:\n" + "\n".join(suggestions)
-                self.memory_palace.remember_conversation(cmd, response, "creative")
-                return response
-        
-        # 플러그인 생성 요청
-        elif any(keyword in cmd_lower for keyword in ["플러그인", "기능 추가", "만들어", "생성"]):
-            analysis = self.plugin_generator.analyze_user_request(cmd)
-            if analysis['confidence_score'] > 30:
-                result = self.plugin_generator.generate_plugin(cmd)
-                if result['success']:
-                    response = f"🧩 플러그인 자동 생성 완료!\n📁 {result['plugin_info']['name']}\n💡 {result['plugin_info']['description'][:100]}..."
-                    self.memory_palace.remember_conversation(cmd, response, "productive")
-                    broadcast_creative_activity("plugin_generation", f"플러그인 '{result['plugin_info']['name']}' 생성")
-                    return response
-        
-        # 기억 검색 요청
-        elif any(keyword in cmd_lower for keyword in ["기억", "이전", "전에", "예전"]):
-            memories = self.memory_palace.recall_memories(cmd, 3)
-            if memories:
-                response = "🧠 관련 기억을 찾았어요:\n"
-                for i, memory in enumerate(memories[:2], 1):
-                    response += f"{i}. {memory['user_input'][:30]}... ({memory['timestamp'][:10]})\n"
-                return response
-            else:
-                return "🤔 관련된 기억을 찾지 못했어요. 더 구체적으로 말씀해 주시겠어요?"
-        
-        # 성격 인사이트 요청
-        elif any(keyword in cmd_lower for keyword in ["분석", "성격", "인사이트", "특징"]):
-            insights = self.memory_palace.get_personality_insights()
-            self.memory_palace.remember_conversation(cmd, insights, "analytical")
-            return insights
-        
-        # � 꿈 해석 요청
-        elif any(keyword in cmd_lower for keyword in ["꿈", "해석", "꿈해석", "심리분석"]):
-            if "꿈" in cmd_lower:
-                # 꿈 내용 추출
-                dream_text = cmd.replace("꿈", "").replace("해석", "").replace("분석", "").strip()
-                if not dream_text:
-                    dream_text = "물에 떨어져서 무서웠지만 날개가 생겨서 하늘을 날아다녔다"
-                
-                # 나이와 문화권 정보 (기본값 사용)
-                dreamer_age = 25  # 기본 나이
-                culture = "한국"  # 기본 문화권
-                
-                # 꿈 분석 실행
-                analysis = self.dream_interpreter.analyze_dream(dream_text, dreamer_age, culture)
-                
-                # 간단한 응답 생성
-                symbols = analysis.get("상징_분석", {}).get("발견된_상징", {})
-                emotion = analysis.get("감정_분석", {}).get("지배적_감정", "중립")
-                advice = analysis.get("조언", {}).get("우선순위_조언", [])
-                
-                response = f"🌙 꿈 해석 결과:\n"
-                response += f"🔮 발견된 상징: {len(symbols)}개\n"
-                response += f"💭 지배적 감정: {emotion}\n"
-                
-                if advice:
-                    response += f"💡 조언: {advice[0]}\n"
-                
-                # 상세 보고서 생성
-                detailed_report = self.dream_interpreter.create_dream_report(analysis)
-                print(detailed_report)  # 콘솔에 상세 출력
-                
-                broadcast_creative_activity("dream_analysis", f"꿈 해석: {emotion} 감정, {len(symbols)}개 상징")
-                self.memory_palace.remember_conversation(cmd, response, "analytical")
+    
+    def _creative_plugin_generation(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """플러그인 생성 요청"""
+        analysis = self.plugin_generator.analyze_user_request(cmd)
+        if analysis['confidence_score'] > 30:
+            result = self.plugin_generator.generate_plugin(cmd)
+            if result['success']:
+                response = f"🧩 플러그인 자동 생성 완료!\n📁 {result['plugin_info']['name']}\n💡 {result['plugin_info']['description'][:100]}..."
+                self.memory_palace.remember_conversation(cmd, response, "productive")
+                broadcast_creative_activity("plugin_generation", f"플러그인 '{result['plugin_info']['name']}' 생성")
                 return response
-        
-        # 🎓 개인 맞춤 AI 튜터 요청
-        elif any(keyword in cmd_lower for keyword in ["학습", "공부", "튜터", "가르쳐", "배우고", "수업", "강의"]):
-            tutor_response = create_ai_tutor_response(cmd)
+    
+    def _creative_memory_recall(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """기억 검색 요청"""
+        memories = self.memory_palace.recall_memories(cmd, 3)
+        if memories:
+            response = "🧠 관련 기억을 찾았어요:\n"
+            for i, memory in enumerate(memories[:2], 1):
+                response += f"{i}. {memory['user_input'][:30]}... ({memory['timestamp'][:10]})\n"
+            return response
+        else:
+            return "🤔 관련된 기억을 찾지 못했어요. 더 구체적으로 말씀해 주시겠어요?"
+    
+    def _creative_personality_insights(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """성격 인사이트 요청"""
+        insights = self.memory_palace.get_personality_insights()
+        self.memory_palace.remember_conversation(cmd, insights, "analytical")
+        return insights
+    
+    def _creative_dream(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """꿈 해석 요청"""
+        if "꿈" in cmd_lower:
+            # 꿈 내용 추출
+            dream_text = cmd.replace("꿈", "").replace("해석", "").replace("분석", "").strip()
+            if not dream_text:
+                dream_text = "물에 떨어져서 무서웠지만 날개가 생겨서 하늘을 날아다녔다"
+            
+            # 나이와 문화권 정보 (기본값 사용)
+            dreamer_age = 25  # 기본 나이
+            culture = "한국"  # 기본 문화권
+            
+            # 꿈 분석 실행
+            analysis = self.dream_interpreter.analyze_dream(dream_text, dreamer_age, culture)
             
-            # 학습 패턴 분석 (코드가 포함된 경우)
-            if "코드" in cmd_lower or any(lang in cmd_lower for lang in ["python", "javascript", "java"]):
-                # 간단한 코드 예시로 패턴 분석 시연
-                sample_code = "def hello(): print('Hello, World!')"
-                feedback = self.ai_tutor.analyze_coding_pattern(sample_code, "python")
-                if feedback:
-                    tutor_response += "\n\n💡 코딩 스타일 피드백:\n" + "\n".join(feedback[:2])
+            # 간단한 응답 생성
+            symbols = analysis.get("상징_분석", {}).get("발견된_상징", {})
+            emotion = analysis.get("감정_분석", {}).get("지배적_감정", "중립")
+            advice = analysis.get("조언", {}).get("우선순위_조언", [])
             
-            # 격려 메시지 추가
-            if "격려" in cmd_lower or "힘들" in cmd_lower:
-                encouragement = self.ai_tutor.get_personalized_encouragement()
-                tutor_response = encouragement + "\n\n" + tutor_response
+            response = f"🌙 꿈 해석 결과:\n"
+            response += f"🔮 발견된 상징: {len(symbols)}개\n"
+            response += f"💭 지배적 감정: {emotion}\n"
             
-            self.memory_palace.remember_conversation(cmd, tutor_response, "educational")
-            broadcast_creative_activity("ai_tutoring", f"개인 맞춤 학습 지원")
-            return tutor_response
+            if advice:
+                response += f"💡 조언: {advice[0]}\n"
+            
+            # 상세 보고서 생성
+            detailed_report = self.dream_interpreter.create_dream_report(analysis)
+            print(detailed_report)  # 콘솔에 상세 출력
+            
+            broadcast_creative_activity("dream_analysis", f"꿈 해석: {emotion} 감정, {len(symbols)}개 상징")
+            self.memory_palace.remember_conversation(cmd, response, "analytical")
+            return response
+    
+    def _creative_tutor(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """개인 맞춤 AI 튜터 요청"""
+        from personal_ai_tutor import create_ai_tutor_response
+        tutor_response = create_ai_tutor_response(cmd)
         
-        # 🎮 실시간 게임 생성 요청
-        elif any(keyword in cmd_lower for keyword in ["게임", "퍼즐", "퀴즈", "놀이", "재미있는"]):
-            if any(word in cmd_lower for word in ["만들", "생성", "만들어", "게임하자", "놀자"]):
-                # 게임 생성
-                game = self.game_generator.create_game(cmd)
-                
-                response = f"""🎮 {game['data']['name']} 생성 완료!
+        # 학습 패턴 분석 (코드가 포함된 경우)
+        if "코드" in cmd_lower or any(lang in cmd_lower for lang in ["python", "javascript", "java"]):
+            # 간단한 코드 예시로 패턴 분석 시연
+            sample_code = "def hello(): print('Hello, World!')"
+            feedback = self.ai_tutor.analyze_coding_pattern(sample_code, "python")
+            if feedback:
+                tutor_response += "\n\n💡 코딩 스타일 피드백:\n" + "\n".join(feedback[:2])
+        
+        # 격려 메시지 추가
+        if "격려" in cmd_lower or "힘들" in cmd_lower:
+            encouragement = self.ai_tutor.get_personalized_encouragement()
+            tutor_response = encouragement + "\n\n" + tutor_response
+        
+        self.memory_palace.remember_conversation(cmd, tutor_response, "educational")
+        broadcast_creative_activity("ai_tutoring", f"개인 맞춤 학습 지원")
+        return tutor_response
+    
+    def _creative_game(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """실시간 게임 생성 요청"""
+        if any(word in cmd_lower for word in ["만들", "생성", "만들어", "게임하자", "놀자"]):
+            # 게임 생성
+            game = self.game_generator.create_game(cmd)
+            
+            response = f"""🎮 {game['data']['name']} 생성 완료!
 
 ❓ 문제: {game['data']['question']}
 
@@ -788,516 +910,517 @@ class SorisayCore:
 타입: {game['request']['type']} ({game['request']['difficulty']})
 
 답을 말씀해주세요! 🎯"""
-                
-                # 게임 힌트 추가
-                if game['data'].get('hints'):
-                    response += f"\n\n💡 힌트: {game['data']['hints'][0]}"
-                
-                self.memory_palace.remember_conversation(cmd, response, "playful")
-                broadcast_creative_activity("game_generation", f"{game['data']['name']} 생성")
-                return response
             
-            else:
-                # 게임 플레이 (이미 생성된 게임에 대한 답변)
-                if self.game_generator.generated_games:
-                    latest_game = self.game_generator.generated_games[-1]
-                    if latest_game['status'] == 'ready':
-                        # 사용자 입력을 답안으로 처리
-                        result = self.game_generator.play_game(latest_game, cmd)
-                        
-                        response = result['message']
-                        if result.get('hint'):
-                            response += f"\n💡 {result['hint']}"
-                        
-                        if result['game_over']:
-                            if result['success']:
-                                response += f"\n🏆 최종 점수: {latest_game['score']}점!"
-                            latest_game['status'] = 'completed'
-                        
-                        self.memory_palace.remember_conversation(cmd, response, "playful")
-                        return response
-                
-                return "🎮 게임을 먼저 만들어보세요! '퍼즐 게임 만들어줘' 라고 말씀해보세요."
-        
-        # 🤖 가상 개발팀 요청
-        elif any(keyword in cmd_lower for keyword in ["개발팀", "프로젝트", "팀관리", "스프린트", "개발진행"]):
-            if "프로젝트" in cmd_lower and ("생성" in cmd_lower or "만들" in cmd_lower):
-                # 새 프로젝트 생성
-                project_name = "AI 기반 웹 서비스"  # 기본 프로젝트명
-                project = self.virtual_dev_team.create_project(
-                    project_name, 
-                    "혁신적인 AI 기반 웹 서비스 개발 프로젝트",
-                    duration_weeks=4
-                )
-                response = f"🤖 새 프로젝트 생성!\n"
-                response += f"📋 프로젝트: {project['name']}\n"
-                response += f"🆔 ID: {project['id']}\n"
-                response += f"📅 기간: {project['duration_weeks']}주\n"
-                response += f"💰 예산: ${project['budget']['total']:,.0f}\n"
-                response += f"📝 작업 수: {len(project['tasks'])}개"
-                
-                broadcast_creative_activity("project_creation", f"프로젝트 생성: {project['name']}")
-                
-            elif "진행상황" in cmd_lower or "현황" in cmd_lower:
-                # 프로젝트 진행 상황 체크
-                if self.virtual_dev_team.current_projects:
-                    project_id = list(self.virtual_dev_team.current_projects.keys())[0]
-                    progress = self.virtual_dev_team.simulate_daily_progress(project_id)
-                    
-                    response = f"📊 프로젝트 진행 현황\n"
-                    response += f"📈 전체 진행률: {progress['overall_progress']:.1f}%\n"
-                    response += f"✅ 완료 작업: {len(progress['completed_tasks'])}개\n"
-                    response += f"👥 팀 활동: {len(progress['team_activities'])}건\n"
-                    
-                    if progress['completed_tasks']:
-                        latest_task = progress['completed_tasks'][0]
-                        response += f"� 최근 완료: {latest_task['task_title']}"
-                else:
-                    response = "현재 진행 중인 프로젝트가 없습니다."
-                
-            elif "미팅" in cmd_lower or "회의" in cmd_lower:
-                # 팀 미팅 진행
-                meeting = self.virtual_dev_team.conduct_team_meeting("일일스탠드업")
-                response = f"👥 {meeting['type']} 완료!\n"
-                response += f"📅 시간: {meeting['date']}\n"
-                response += f"👨‍💻 참석자: {len(meeting['attendees'])}명\n"
-                response += f"📋 결정사항: {len(meeting['decisions'])}건\n"
-                
-                if meeting['decisions']:
-                    response += f"💡 주요 결정: {meeting['decisions'][0]}"
-                    
-                broadcast_creative_activity("team_meeting", f"{meeting['type']} 미팅 진행")
-                
-            elif "스프린트" in cmd_lower:
-                # 스프린트 계획
-                sprint = self.virtual_dev_team.simulate_sprint_planning()
-                response = f"🏃 스프린트 계획 수립!\n"
-                response += f"🆔 스프린트: {sprint['sprint_id']}\n"
-                response += f"📅 기간: {sprint['duration_weeks']}주\n"
-                response += f"📝 선택 작업: {len(sprint['selected_tasks'])}개\n"
-                response += f"🎯 목표: {sprint['goals'][0] if sprint['goals'] else 'N/A'}"
-                
-                broadcast_creative_activity("sprint_planning", f"스프린트 {sprint['sprint_id']} 계획")
-                
-            elif "분석" in cmd_lower or "리포트" in cmd_lower:
-                # 팀 분석 리포트
-                analytics = self.virtual_dev_team.get_team_analytics()
-                response = f"📊 팀 분석 리포트\n"
-                response += f"👥 팀원: {analytics['team_overview']['total_members']}명\n"
-                response += f"⚡ 팀 효율성: {analytics['productivity_metrics']['team_efficiency']:.1f}%\n"
-                response += f"💚 팀 만족도: {analytics['team_health']['satisfaction_index']:.1f}%\n"
-                response += f"📈 완료율: {analytics['productivity_metrics']['completion_rate']:.1f}%"
-                
-                # 상세 리포트 콘솔 출력
-                detailed_report = self.virtual_dev_team.generate_team_report()
-                print(detailed_report)
-                
-                broadcast_creative_activity("team_analysis", "팀 성과 분석 완료")
-            else:
-                # 기본 팀 상태 정보
-                analytics = self.virtual_dev_team.get_team_analytics()
-                response = f"🤖 가상 개발팀 상태\n"
-                response += f"👥 {analytics['team_overview']['total_members']}명의 전문가들이 대기 중\n"
-                response += f"💪 평균 스킬: {analytics['team_overview']['avg_skill_level']:.1f}/10\n"
-                response += f"🎯 현재 프로젝트: {analytics['project_status']['active_projects']}개"
-                
-            self.memory_palace.remember_conversation(cmd, response, "project_management")
+            # 게임 힌트 추가
+            if game['data'].get('hints'):
+                response += f"\n\n💡 힌트: {game['data']['hints'][0]}"
+            
+            self.memory_palace.remember_conversation(cmd, response, "playful")
+            broadcast_creative_activity("game_generation", f"{game['data']['name']} 생성")
             return response
         
-        # 🔮 미래 예측 요청
-        elif any(keyword in cmd_lower for keyword in ["미래", "예측", "전망", "트렌드", "예상", "분석"]):
-            if "트렌드" in cmd_lower:
-                # 트렌드 분석 요청
-                category = "전체"
-                if "기술" in cmd_lower:
-                    category = "기술"
-                elif "경제" in cmd_lower:
-                    category = "경제"
-                elif "사회" in cmd_lower:
-                    category = "사회"
-                
-                analysis = self.prediction_engine.analyze_future_trends(category)
-                response = f"📈 {category} 트렌드 분석 완료!\n"
-                response += f"🎯 신뢰도: {analysis.get('confidence_score', 0):.1%}\n"
-                
-                # 신흥 트렌드 표시
-                emerging = analysis.get('emerging_trends', [])[:2]
-                if emerging:
-                    response += f"🚀 주요 신흥 트렌드:\n"
-                    for trend in emerging:
-                        response += f"  • {trend['name']}: {trend['predicted_value']:.1%} 성장 예상\n"
-                
-                # 핵심 인사이트
-                insights = analysis.get('key_insights', [])
-                if insights:
-                    response += f"💡 핵심 인사이트: {insights[0]}"
-                
-                broadcast_creative_activity("trend_analysis", f"{category} 트렌드 분석")
-                
-            elif "예측" in cmd_lower or "전망" in cmd_lower:
-                # 미래 예측 생성
-                focus = "전체"
-                if "기술" in cmd_lower:
-                    focus = "기술"
-                elif "사회" in cmd_lower:
-                    focus = "사회"
-                elif "경제" in cmd_lower:
-                    focus = "경제"
-                
-                predictions = self.prediction_engine.generate_predictions(focus, 3)
-                response = f"🔮 {focus} 분야 미래 예측!\n\n"
-                
-                for i, pred in enumerate(predictions, 1):
-                    response += f"{i}. {pred.title}\n"
-                    response += f"   📊 확률: {pred.probability:.1%} | 신뢰도: {pred.confidence.value}\n"
-                    response += f"   ⏰ 시기: {pred.timeframe.value} | 영향도: {pred.impact_score:.1f}/1.0\n\n"
-                
-                broadcast_creative_activity("future_prediction", f"{focus} 분야 예측 {len(predictions)}건")
-                
-            elif "시나리오" in cmd_lower:
-                # 시나리오 시뮬레이션 (최신 예측 기준)
-                predictions = self.prediction_engine.generate_predictions("기술", 1)
-                if predictions:
-                    scenario = self.prediction_engine.simulate_scenario(predictions[0].id)
-                    response = f"🎭 시나리오 시뮬레이션: {predictions[0].title}\n\n"
+        else:
+            # 게임 플레이 (이미 생성된 게임에 대한 답변)
+            if self.game_generator.generated_games:
+                latest_game = self.game_generator.generated_games[-1]
+                if latest_game['status'] == 'ready':
+                    # 사용자 입력을 답안으로 처리
+                    result = self.game_generator.play_game(latest_game, cmd)
                     
-                    scenarios = scenario.get('scenarios', {})
-                    if 'realistic' in scenarios:
-                        real_scenario = scenarios['realistic']
-                        response += f"📋 현실적 시나리오:\n{real_scenario['description']}\n\n"
-                        response += f"⏱️ 예상 일정: {real_scenario['timeline']}\n"
+                    response = result['message']
+                    if result.get('hint'):
+                        response += f"\n💡 {result['hint']}"
                     
-                    # 권장 행동
-                    actions = scenario.get('recommended_actions', [])
-                    if actions:
-                        response += f"\n💡 권장 행동:\n"
-                        for action in actions[:2]:
-                            response += f"  • {action}\n"
-                    
-                    broadcast_creative_activity("scenario_simulation", predictions[0].title)
-                else:
-                    response = "시나리오 생성에 실패했습니다."
+                    if result['game_over']:
+                        if result['success']:
+                            response += f"\n🏆 최종 점수: {latest_game['score']}점!"
+                        latest_game['status'] = 'completed'
                     
-            elif "보고서" in cmd_lower or "리포트" in cmd_lower:
-                # 종합 미래 예측 보고서
-                category = "전체"
-                if "기술" in cmd_lower:
-                    category = "기술"
-                elif "경제" in cmd_lower:
-                    category = "경제"
-                elif "사회" in cmd_lower:
-                    category = "사회"
-                    
-                report = self.prediction_engine.generate_future_report(category)
-                response = f"📋 {category} 미래 예측 보고서가 생성되었습니다!\n"
-                response += "상세 내용은 콘솔에서 확인하세요."
+                    self.memory_palace.remember_conversation(cmd, response, "playful")
+                    return response
+            
+            return "🎮 게임을 먼저 만들어보세요! '퍼즐 게임 만들어줘' 라고 말씀해보세요."
+    
+    def _creative_dev_team(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """가상 개발팀 요청"""
+        if "프로젝트" in cmd_lower and ("생성" in cmd_lower or "만들" in cmd_lower):
+            # 새 프로젝트 생성
+            project_name = "AI 기반 웹 서비스"  # 기본 프로젝트명
+            project = self.virtual_dev_team.create_project(
+                project_name, 
+                "혁신적인 AI 기반 웹 서비스 개발 프로젝트",
+                duration_weeks=4
+            )
+            response = f"🤖 새 프로젝트 생성!\n"
+            response += f"📋 프로젝트: {project['name']}\n"
+            response += f"🆔 ID: {project['id']}\n"
+            response += f"📅 기간: {project['duration_weeks']}주\n"
+            response += f"💰 예산: ${project['budget']['total']:,.0f}\n"
+            response += f"📝 작업 수: {len(project['tasks'])}개"
+            
+            broadcast_creative_activity("project_creation", f"프로젝트 생성: {project['name']}")
+            
+        elif "진행상황" in cmd_lower or "현황" in cmd_lower:
+            # 프로젝트 진행 상황 체크
+            if self.virtual_dev_team.current_projects:
+                project_id = list(self.virtual_dev_team.current_projects.keys())[0]
+                progress = self.virtual_dev_team.simulate_daily_progress(project_id)
                 
-                # 콘솔에 상세 보고서 출력
-                print(report)
+                response = f"📊 프로젝트 진행 현황\n"
+                response += f"📈 전체 진행률: {progress['overall_progress']:.1f}%\n"
+                response += f"✅ 완료 작업: {len(progress['completed_tasks'])}개\n"
+                response += f"👥 팀 활동: {len(progress['team_activities'])}건\n"
                 
-                broadcast_creative_activity("prediction_report", f"{category} 미래 예측 보고서")
+                if progress['completed_tasks']:
+                    latest_task = progress['completed_tasks'][0]
+                    response += f"� 최근 완료: {latest_task['task_title']}"
             else:
-                # 기본 예측 엔진 소개
-                accuracy = self.prediction_engine.get_prediction_accuracy()
-                response = f"🔮 미래 예측 엔진 활성화!\n"
-                response += f"🎯 예측 정확도: {accuracy.get('accuracy_rate', 75):.1f}%\n"
-                response += f"📊 총 예측: {accuracy.get('total_predictions', 0)}건\n"
-                response += f"💡 '미래 트렌드', '예측', '시나리오', '보고서' 등으로 요청하세요!"
+                response = "현재 진행 중인 프로젝트가 없습니다."
             
-            self.memory_palace.remember_conversation(cmd, response, "prediction")
-            return response
-        
-        # � 감정 색채 치료 요청
-        elif any(keyword in cmd_lower for keyword in ["색", "색깔", "컬러", "치료", "감정치료", "색채치료"]):
-            if "분석" in cmd_lower or "진단" in cmd_lower:
-                # 감정 분석 요청
-                if "스트레스" in cmd_lower or "불안" in cmd_lower:
-                    emotion_text = "스트레스받고 불안해요"
-                    context = "일상 생활"
-                elif "우울" in cmd_lower or "슬프" in cmd_lower:
-                    emotion_text = "우울하고 기분이 안좋아요"
-                    context = "개인적 상황"
-                elif "화나" in cmd_lower or "짜증" in cmd_lower:
-                    emotion_text = "화나고 짜증나요"
-                    context = "대인 관계"
-                else:
-                    emotion_text = "감정이 복잡해요"
-                    context = "일반적 상황"
-                
-                analysis = self.color_therapist.analyze_emotion(emotion_text, context)
-                response = f"🎨 감정 분석 완료!\n"
-                
-                primary_emotion = analysis.get('primary_emotion')
-                if primary_emotion and hasattr(primary_emotion, 'value'):
-                    response += f"🎯 주감정: {primary_emotion.value}\n"
-                
-                response += f"📊 감정 강도: {analysis.get('emotion_intensity', 0):.1%}\n"
-                response += f"🔍 복합성: {analysis.get('emotion_complexity', '미상')}\n"
-                response += f"⚡ 긴급도: {analysis.get('urgency_level', '미상')}\n"
-                response += f"💡 '색 추천', '치료 시작' 등으로 요청하세요!"
-                
-                broadcast_creative_activity("emotion_analysis", f"감정 분석: {primary_emotion.value if primary_emotion and hasattr(primary_emotion, 'value') else '미상'}")
-                
-            elif "추천" in cmd_lower or "제안" in cmd_lower or "색깔" in cmd_lower:
-                # 색상 추천
-                emotion_text = "전체적으로 마음이 복잡하고 힘들어요"
-                context = "일상 스트레스"
-                
-                # 사용자 선호도 추출
-                preference = "균형"
-                if "따뜻" in cmd_lower:
-                    preference = "따뜻함"
-                elif "차가" in cmd_lower or "시원" in cmd_lower:
-                    preference = "차가움"
-                elif "강렬" in cmd_lower or "진한" in cmd_lower:
-                    preference = "강렬함"
-                elif "부드럽" in cmd_lower or "연한" in cmd_lower:
-                    preference = "부드러움"
-                
-                analysis = self.color_therapist.analyze_emotion(emotion_text, context)
-                colors = self.color_therapist.recommend_colors(analysis, preference)
+        elif "미팅" in cmd_lower or "회의" in cmd_lower:
+            # 팀 미팅 진행
+            meeting = self.virtual_dev_team.conduct_team_meeting("일일스탠드업")
+            response = f"👥 {meeting['type']} 완료!\n"
+            response += f"📅 시간: {meeting['date']}\n"
+            response += f"👨‍💻 참석자: {len(meeting['attendees'])}명\n"
+            response += f"📋 결정사항: {len(meeting['decisions'])}건\n"
+            
+            if meeting['decisions']:
+                response += f"💡 주요 결정: {meeting['decisions'][0]}"
                 
-                response = f"🎨 색채 치료 추천!\n"
-                response += f"🎯 선호도: {preference}\n\n"
+            broadcast_creative_activity("team_meeting", f"{meeting['type']} 미팅 진행")
+            
+        elif "스프린트" in cmd_lower:
+            # 스프린트 계획
+            sprint = self.virtual_dev_team.simulate_sprint_planning()
+            response = f"🏃 스프린트 계획 수립!\n"
+            response += f"🆔 스프린트: {sprint['sprint_id']}\n"
+            response += f"📅 기간: {sprint['duration_weeks']}주\n"
+            response += f"📝 선택 작업: {len(sprint['selected_tasks'])}개\n"
+            response += f"🎯 목표: {sprint['goals'][0] if sprint['goals'] else 'N/A'}"
+            
+            broadcast_creative_activity("sprint_planning", f"스프린트 {sprint['sprint_id']} 계획")
+            
+        elif "분석" in cmd_lower or "리포트" in cmd_lower:
+            # 팀 분석 리포트
+            analytics = self.virtual_dev_team.get_team_analytics()
+            response = f"📊 팀 분석 리포트\n"
+            response += f"👥 팀원: {analytics['team_overview']['total_members']}명\n"
+            response += f"⚡ 팀 효율성: {analytics['productivity_metrics']['team_efficiency']:.1f}%\n"
+            response += f"💚 팀 만족도: {analytics['team_health']['satisfaction_index']:.1f}%\n"
+            response += f"📈 완료율: {analytics['productivity_metrics']['completion_rate']:.1f}%"
+            
+            # 상세 리포트 콘솔 출력
+            detailed_report = self.virtual_dev_team.generate_team_report()
+            print(detailed_report)
+            
+            broadcast_creative_activity("team_analysis", "팀 성과 분석 완료")
+        else:
+            # 기본 팀 상태 정보
+            analytics = self.virtual_dev_team.get_team_analytics()
+            response = f"🤖 가상 개발팀 상태\n"
+            response += f"👥 {analytics['team_overview']['total_members']}명의 전문가들이 대기 중\n"
+            response += f"💪 평균 스킬: {analytics['team_overview']['avg_skill_level']:.1f}/10\n"
+            response += f"🎯 현재 프로젝트: {analytics['project_status']['active_projects']}개"
+            
+        self.memory_palace.remember_conversation(cmd, response, "project_management")
+        return response
+    
+    def _creative_future(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """미래 예측 요청"""
+        if "트렌드" in cmd_lower:
+            # 트렌드 분석 요청
+            category = "전체"
+            if "기술" in cmd_lower:
+                category = "기술"
+            elif "경제" in cmd_lower:
+                category = "경제"
+            elif "사회" in cmd_lower:
+                category = "사회"
+            
+            analysis = self.prediction_engine.analyze_future_trends(category)
+            response = f"📈 {category} 트렌드 분석 완료!\n"
+            response += f"🎯 신뢰도: {analysis.get('confidence_score', 0):.1%}\n"
+            
+            # 신흥 트렌드 표시
+            emerging = analysis.get('emerging_trends', [])[:2]
+            if emerging:
+                response += f"🚀 주요 신흥 트렌드:\n"
+                for trend in emerging:
+                    response += f"  • {trend['name']}: {trend['predicted_value']:.1%} 성장 예상\n"
+            
+            # 핵심 인사이트
+            insights = analysis.get('key_insights', [])
+            if insights:
+                response += f"💡 핵심 인사이트: {insights[0]}"
+            
+            broadcast_creative_activity("trend_analysis", f"{category} 트렌드 분석")
+            
+        elif "예측" in cmd_lower or "전망" in cmd_lower:
+            # 미래 예측 생성
+            focus = "전체"
+            if "기술" in cmd_lower:
+                focus = "기술"
+            elif "사회" in cmd_lower:
+                focus = "사회"
+            elif "경제" in cmd_lower:
+                focus = "경제"
+            
+            predictions = self.prediction_engine.generate_predictions(focus, 3)
+            response = f"🔮 {focus} 분야 미래 예측!\n\n"
+            
+            for i, pred in enumerate(predictions, 1):
+                response += f"{i}. {pred.title}\n"
+                response += f"   📊 확률: {pred.probability:.1%} | 신뢰도: {pred.confidence.value}\n"
+                response += f"   ⏰ 시기: {pred.timeframe.value} | 영향도: {pred.impact_score:.1f}/1.0\n\n"
+            
+            broadcast_creative_activity("future_prediction", f"{focus} 분야 예측 {len(predictions)}건")
+            
+        elif "시나리오" in cmd_lower:
+            # 시나리오 시뮬레이션 (최신 예측 기준)
+            predictions = self.prediction_engine.generate_predictions("기술", 1)
+            if predictions:
+                scenario = self.prediction_engine.simulate_scenario(predictions[0].id)
+                response = f"🎭 시나리오 시뮬레이션: {predictions[0].title}\n\n"
                 
-                for i, color in enumerate(colors[:3], 1):
-                    response += f"{i}. {color.name} ({color.hex_code})\n"
-                    response += f"   💫 효과: {', '.join(color.emotion_effects[:2])}\n"
-                    response += f"   🌡️ 온도감: {'따뜻함' if color.warmth > 0.6 else '차가움' if color.warmth < 0.4 else '중성'}\n\n"
+                scenarios = scenario.get('scenarios', {})
+                if 'realistic' in scenarios:
+                    real_scenario = scenarios['realistic']
+                    response += f"📋 현실적 시나리오:\n{real_scenario['description']}\n\n"
+                    response += f"⏱️ 예상 일정: {real_scenario['timeline']}\n"
                 
-                response += "💡 '치료 시작'으로 정식 세션을 시작할 수 있어요!"
+                # 권장 행동
+                actions = scenario.get('recommended_actions', [])
+                if actions:
+                    response += f"\n💡 권장 행동:\n"
+                    for action in actions[:2]:
+                        response += f"  • {action}\n"
                 
-                broadcast_creative_activity("color_recommendation", f"{len(colors)}개 색상 추천")
+                broadcast_creative_activity("scenario_simulation", predictions[0].title)
+            else:
+                response = "시나리오 생성에 실패했습니다."
                 
-            elif "시작" in cmd_lower or "세션" in cmd_lower or "치료시작" in cmd_lower:
-                # 치료 세션 시작
-                emotion_text = "요즘 감정이 복잡하고 힘들어요"
-                context = "일상 생활의 스트레스"
+        elif "보고서" in cmd_lower or "리포트" in cmd_lower:
+            # 종합 미래 예측 보고서
+            category = "전체"
+            if "기술" in cmd_lower:
+                category = "기술"
+            elif "경제" in cmd_lower:
+                category = "경제"
+            elif "사회" in cmd_lower:
+                category = "사회"
                 
-                session = self.color_therapist.create_therapy_session(emotion_text, context, "균형", 15)
-                if session:
-                    response = f"🎨 색채 치료 세션 시작!\n"
-                    response += f"📋 세션 ID: {session.session_id}\n"
-                    response += f"🎯 치료 유형: {session.therapy_type.value}\n"
-                    response += f"⏰ 예상 시간: {session.session_duration}분\n"
-                    response += f"💪 예상 효과: {session.effectiveness_score:.1%}\n\n"
-                    
-                    response += f"🎨 추천 색상:\n"
-                    for color in session.recommended_colors[:2]:
-                        response += f"  • {color.name} ({color.hex_code})\n"
-                    
-                    response += f"\n💡 '보고서 {session.session_id}'로 상세 결과를 확인하세요!"
-                    
-                    broadcast_creative_activity("therapy_session", f"치료 세션 {session.session_id}")
-                else:
-                    response = "세션 생성에 실패했습니다. 다시 시도해주세요."
+            report = self.prediction_engine.generate_future_report(category)
+            response = f"📋 {category} 미래 예측 보고서가 생성되었습니다!\n"
+            response += "상세 내용은 콘솔에서 확인하세요."
             
-            elif "보고서" in cmd_lower:
-                # 세션 보고서 (최신 세션)
-                if self.color_therapist.therapy_history:
-                    latest_session_id = list(self.color_therapist.therapy_history.keys())[-1]
-                    report = self.color_therapist.get_session_report(latest_session_id)
-                    response = f"📋 최신 치료 세션 보고서가 생성되었습니다!\n"
-                    response += "상세 내용은 콘솔에서 확인하세요."
-                    
-                    # 콘솔에 상세 보고서 출력
-                    print(report)
-                    
-                    broadcast_creative_activity("therapy_report", f"세션 보고서: {latest_session_id}")
-                else:
-                    response = "아직 치료 세션이 없습니다. '치료 시작'으로 세션을 만들어보세요!"
-                    
-            elif "통계" in cmd_lower or "상태" in cmd_lower:
-                # 치료사 통계
-                stats = self.color_therapist.get_therapist_stats()
-                response = f"🎨 색채 치료사 통계\n"
-                response += f"📊 총 세션: {stats['total_sessions']}건\n"
-                response += f"🎯 평균 효과: {stats['average_effectiveness']:.1%}\n"
-                response += f"😊 주요 감정: {stats['most_common_emotion']}\n"
-                response += f"💊 주요 치료: {stats['most_used_therapy']}\n"
-                response += f"🎨 색상 DB: {stats['color_database_size']}개\n"
-                response += f"⭐ 경험치: {stats['therapist_experience']:.1f}"
-                
-                broadcast_creative_activity("therapist_stats", f"통계 조회: {stats['total_sessions']}건")
-            else:
-                # 기본 색채 치료 소개
-                stats = self.color_therapist.get_therapist_stats()
-                response = f"🎨 감정 색채 치료사 활성화!\n"
-                response += f"💫 색상 데이터베이스: {stats['color_database_size']}개 색상\n"
-                response += f"📊 총 세션: {stats['total_sessions']}건\n"
-                response += f"💡 명령어:\n"
-                response += f"  • '감정 분석' - 현재 감정 상태 분석\n"
-                response += f"  • '색 추천' - 맞춤 색상 추천\n"
-                response += f"  • '치료 시작' - 정식 치료 세션 시작\n"
-                response += f"  • '보고서' - 세션 결과 확인\n"
-                response += f"  • '통계' - 치료사 현황"
+            # 콘솔에 상세 보고서 출력
+            print(report)
             
-            self.memory_palace.remember_conversation(cmd, response, "color_therapy")
-            return response
+            broadcast_creative_activity("prediction_report", f"{category} 미래 예측 보고서")
+        else:
+            # 기본 예측 엔진 소개
+            accuracy = self.prediction_engine.get_prediction_accuracy()
+            response = f"🔮 미래 예측 엔진 활성화!\n"
+            response += f"🎯 예측 정확도: {accuracy.get('accuracy_rate', 75):.1f}%\n"
+            response += f"📊 총 예측: {accuracy.get('total_predictions', 0)}건\n"
+            response += f"💡 '미래 트렌드', '예측', '시나리오', '보고서' 등으로 요청하세요!"
         
-        # 🎵 음악 작곡 요청
-        elif any(keyword in cmd_lower for keyword in ["음악", "작곡", "멜로디", "노래"]):
-            if "코드" in cmd_lower and ("음악" in cmd_lower or "작곡" in cmd_lower):
-                # 코드를 음악으로 변환
-                sample_code = "def hello_world():\n    for i in range(10):\n        if i % 2 == 0:\n            print(f'Hello {i}')"
-                emotion = self.persona_system.current_persona
-                composition = self.music_composer.compose_from_code(sample_code, emotion)
-                response = self.music_composer.play_composition_text(composition)
-                broadcast_creative_activity("music_composition", f"코드 기반 작곡: {composition['title']}")
+        self.memory_palace.remember_conversation(cmd, response, "prediction")
+        return response
+    
+    def _creative_color_therapy(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """감정 색채 치료 요청"""
+        if "분석" in cmd_lower or "진단" in cmd_lower:
+            # 감정 분석 요청
+            if "스트레스" in cmd_lower or "불안" in cmd_lower:
+                emotion_text = "스트레스받고 불안해요"
+                context = "일상 생활"
+            elif "우울" in cmd_lower or "슬프" in cmd_lower:
+                emotion_text = "우울하고 기분이 안좋아요"
+                context = "개인적 상황"
+            elif "화나" in cmd_lower or "짜증" in cmd_lower:
+                emotion_text = "화나고 짜증나요"
+                context = "대인 관계"
             else:
-                # 감정 기반 작곡
-                emotion = self.persona_system.current_persona
-                composition = self.music_composer.compose_by_emotion(emotion, 8)
-                response = self.music_composer.play_composition_text(composition)
-                broadcast_creative_activity("music_composition", f"감정 기반 작곡: {composition['title']}")
+                emotion_text = "감정이 복잡해요"
+                context = "일반적 상황"
             
-            self.memory_palace.remember_conversation(cmd, response, "creative")
-            return response
-
-        # 📝 작사 요청
-        elif any(keyword in cmd_lower for keyword in ["작사", "가사", "lyrics", "시"]):
-            # 명령어에서 감정과 테마 추출
-            emotion = "happy"  # 기본값
-            theme = None
+            analysis = self.color_therapist.analyze_emotion(emotion_text, context)
+            response = f"🎨 감정 분석 완료!\n"
             
-            if any(word in cmd_lower for word in ["슬픈", "sad", "우울"]):
-                emotion = "sad"
-            elif any(word in cmd_lower for word in ["사랑", "로맨틱", "romantic"]):
-                emotion = "romantic"  
-            elif any(word in cmd_lower for word in ["신나는", "에너지", "energetic", "활기"]):
-                emotion = "energetic"
+            primary_emotion = analysis.get('primary_emotion')
+            if primary_emotion and hasattr(primary_emotion, 'value'):
+                response += f"🎯 주감정: {primary_emotion.value}\n"
             
-            # 테마 추출 (간단한 키워드 기반)
-            theme_keywords = ["사랑", "이별", "꿈", "희망", "우정", "가족"]
-            for keyword in theme_keywords:
-                if keyword in cmd_lower:
-                    theme = keyword
-                    break
+            response += f"📊 감정 강도: {analysis.get('emotion_intensity', 0):.1%}\n"
+            response += f"🔍 복합성: {analysis.get('emotion_complexity', '미상')}\n"
+            response += f"⚡ 긴급도: {analysis.get('urgency_level', '미상')}\n"
+            response += f"💡 '색 추천', '치료 시작' 등으로 요청하세요!"
             
-            # 가사 생성
-            lyrics_info = self.lyrics_writer.generate_lyrics(emotion, theme, lines=8)
-            response = self.lyrics_writer.format_lyrics_display(lyrics_info)
+            broadcast_creative_activity("emotion_analysis", f"감정 분석: {primary_emotion.value if primary_emotion and hasattr(primary_emotion, 'value') else '미상'}")
             
-            broadcast_creative_activity("lyrics_writing", f"작사 완성: {lyrics_info['title']}")
-            self.memory_palace.remember_conversation(cmd, response, "creative")
-            return response
-
-        # 🎼 완전한 노래 생성 (작곡 + 작사)
-        elif any(keyword in cmd_lower for keyword in ["완전한 노래", "전체 노래", "노래 만들기", "송 크리에이트"]):
-            # 명령어에서 감정과 테마 추출
-            emotion = "happy"  # 기본값
-            theme = None
+        elif "추천" in cmd_lower or "제안" in cmd_lower or "색깔" in cmd_lower:
+            # 색상 추천
+            emotion_text = "전체적으로 마음이 복잡하고 힘들어요"
+            context = "일상 스트레스"
             
-            if any(word in cmd_lower for word in ["슬픈", "sad", "우울"]):
-                emotion = "sad"
-            elif any(word in cmd_lower for word in ["사랑", "로맨틱", "romantic"]):
-                emotion = "romantic"  
-            elif any(word in cmd_lower for word in ["신나는", "에너지", "energetic", "활기"]):
-                emotion = "energetic"
+            # 사용자 선호도 추출
+            preference = "균형"
+            if "따뜻" in cmd_lower:
+                preference = "따뜻함"
+            elif "차가" in cmd_lower or "시원" in cmd_lower:
+                preference = "차가움"
+            elif "강렬" in cmd_lower or "진한" in cmd_lower:
+                preference = "강렬함"
+            elif "부드럽" in cmd_lower or "연한" in cmd_lower:
+                preference = "부드러움"
             
-            # 테마 추출
-            if "테마" in cmd_lower or "주제" in cmd_lower:
-                theme_words = cmd_lower.split()
-                for i, word in enumerate(theme_words):
-                    if word in ["테마", "주제"] and i + 1 < len(theme_words):
-                        theme = theme_words[i + 1]
-                        break
+            analysis = self.color_therapist.analyze_emotion(emotion_text, context)
+            colors = self.color_therapist.recommend_colors(analysis, preference)
             
-            # 완전한 노래 생성
-            complete_song = self.music_studio.create_complete_song(emotion, theme)
-            response = self.music_studio.display_complete_song(complete_song)
+            response = f"🎨 색채 치료 추천!\n"
+            response += f"🎯 선호도: {preference}\n\n"
             
-            broadcast_creative_activity("complete_song", f"완전한 노래 생성: {complete_song['title']}")
-            self.memory_palace.remember_conversation(cmd, response, "creative")
-            return response
-
-        # 💬 음악 채팅장 요청
-        elif any(keyword in cmd_lower for keyword in ["채팅", "채팅장", "음악채팅", "채팅방", "대화방"]):
-            if "생성" in cmd_lower or "만들기" in cmd_lower or "만들어" in cmd_lower:
-                # 채팅방 생성 요청
-                response = "💬 음악 채팅방을 만드시겠어요?\n\n"
-                response += "🎵 **음악 채팅장 기능:**\n"
-                response += "- 실시간 음악 작품 공유\n"
-                response += "- 작곡/작사 협업 프로젝트\n"
-                response += "- 장르별 전문 채팅방\n"
-                response += "- AI 음악 생성 도구 내장\n\n"
-                response += "📝 **채팅방 유형:**\n"
-                response += "- 🎼 일반 음악 채팅\n"
-                response += "- 🤝 작곡 협업실\n"
-                response += "- 📝 작사 워크샵\n"
-                response += "- 🎸 실시간 잼 세션\n\n"
-                response += "웹 브라우저에서 /music-chat으로 접속하세요!"
-            elif "목록" in cmd_lower or "리스트" in cmd_lower:
-                # 채팅방 목록 조회
-                rooms = self.chat_system.get_room_list()
-                response = f"💬 **활성 채팅방 목록** ({len(rooms)}개):\n\n"
+            for i, color in enumerate(colors[:3], 1):
+                response += f"{i}. {color.name} ({color.hex_code})\n"
+                response += f"   💫 효과: {', '.join(color.emotion_effects[:2])}\n"
+                response += f"   🌡️ 온도감: {'따뜻함' if color.warmth > 0.6 else '차가움' if color.warmth < 0.4 else '중성'}\n\n"
+            
+            response += "💡 '치료 시작'으로 정식 세션을 시작할 수 있어요!"
+            
+            broadcast_creative_activity("color_recommendation", f"{len(colors)}개 색상 추천")
+            
+        elif "시작" in cmd_lower or "세션" in cmd_lower or "치료시작" in cmd_lower:
+            # 치료 세션 시작
+            emotion_text = "요즘 감정이 복잡하고 힘들어요"
+            context = "일상 생활의 스트레스"
+            
+            session = self.color_therapist.create_therapy_session(emotion_text, context, "균형", 15)
+            if session:
+                response = f"🎨 색채 치료 세션 시작!\n"
+                response += f"📋 세션 ID: {session.session_id}\n"
+                response += f"🎯 치료 유형: {session.therapy_type.value}\n"
+                response += f"⏰ 예상 시간: {session.session_duration}분\n"
+                response += f"💪 예상 효과: {session.effectiveness_score:.1%}\n\n"
                 
-                for room in rooms:
-                    response += f"🎵 **{room['room_name']}**\n"
-                    response += f"   📝 {room['description']}\n"
-                    response += f"   👥 {room['current_users']}/{room['max_users']}명\n"
-                    response += f"   🎶 장르: {room['genre']}\n\n"
+                response += f"🎨 추천 색상:\n"
+                for color in session.recommended_colors[:2]:
+                    response += f"  • {color.name} ({color.hex_code})\n"
                 
-                if not rooms:
-                    response += "아직 생성된 채팅방이 없습니다.\n"
-                    response += "'채팅방 만들어줘'라고 말씀해보세요!"
-            elif "통계" in cmd_lower or "현황" in cmd_lower:
-                # 채팅 시스템 통계
-                stats = self.chat_system.get_chat_statistics()
-                response = "📊 **음악 채팅장 현황:**\n\n"
-                response += f"👥 총 사용자: {stats['total_users']}명\n"
-                response += f"🏠 총 채팅방: {stats['total_rooms']}개\n"
-                response += f"💬 총 메시지: {stats['total_messages']}개\n"
-                response += f"🤝 활성 협업: {stats['active_collaborations']}개\n"
-                response += f"🟢 온라인 사용자: {stats['online_users']}명\n\n"
-                response += "웹에서 실시간 채팅을 즐겨보세요!"
+                response += f"\n💡 '보고서 {session.session_id}'로 상세 결과를 확인하세요!"
+                
+                broadcast_creative_activity("therapy_session", f"치료 세션 {session.session_id}")
             else:
-                # 기본 채팅장 소개
-                response = "🎵💬 **AI 음악 채팅장에 오신 것을 환영합니다!**\n\n"
-                response += "✨ **주요 기능:**\n"
-                response += "- 🎼 실시간 음악 작품 공유\n"
-                response += "- 📝 가사 창작 및 피드백\n"
-                response += "- 🤝 협업 작곡/작사 프로젝트\n"
-                response += "- 🎸 라이브 잼 세션\n"
-                response += "- 🤖 AI 음악 생성 도구\n\n"
-                response += "🌐 **접속 방법:**\n"
-                response += "웹 브라우저에서 '/music-chat'으로 접속하세요!\n\n"
-                response += "💡 **명령어:**\n"
-                response += "- '채팅방 만들어줘' - 새 방 생성\n"
-                response += "- '채팅방 목록' - 방 리스트 보기\n"
-                response += "- '채팅 통계' - 시스템 현황\n"
+                response = "세션 생성에 실패했습니다. 다시 시도해주세요."
+        
+        elif "보고서" in cmd_lower:
+            # 세션 보고서 (최신 세션)
+            if self.color_therapist.therapy_history:
+                latest_session_id = list(self.color_therapist.therapy_history.keys())[-1]
+                report = self.color_therapist.get_session_report(latest_session_id)
+                response = f"📋 최신 치료 세션 보고서가 생성되었습니다!\n"
+                response += "상세 내용은 콘솔에서 확인하세요."
+                
+                # 콘솔에 상세 보고서 출력
+                print(report)
+                
+                broadcast_creative_activity("therapy_report", f"세션 보고서: {latest_session_id}")
+            else:
+                response = "아직 치료 세션이 없습니다. '치료 시작'으로 세션을 만들어보세요!"
+                
+        elif "통계" in cmd_lower or "상태" in cmd_lower:
+            # 치료사 통계
+            stats = self.color_therapist.get_therapist_stats()
+            response = f"🎨 색채 치료사 통계\n"
+            response += f"📊 총 세션: {stats['total_sessions']}건\n"
+            response += f"🎯 평균 효과: {stats['average_effectiveness']:.1%}\n"
+            response += f"😊 주요 감정: {stats['most_common_emotion']}\n"
+            response += f"💊 주요 치료: {stats['most_used_therapy']}\n"
+            response += f"🎨 색상 DB: {stats['color_database_size']}개\n"
+            response += f"⭐ 경험치: {stats['therapist_experience']:.1f}"
             
-            broadcast_creative_activity("music_chat", "음악 채팅장 활용")
-            self.memory_palace.remember_conversation(cmd, response, "social")
-            return response
-
-        # 🛒 지능형 자율 쇼핑몰 요청
-        elif any(keyword in cmd_lower for keyword in ["쇼핑몰", "온라인쇼핑", "상품판매", "자율쇼핑", "스마트쇼핑"]):
-            mall_response = create_autonomous_mall_response(cmd)
-            self.memory_palace.remember_conversation(cmd, mall_response, "business")
-            broadcast_creative_activity("autonomous_shopping", "지능형 쇼핑몰 운영")
-            return mall_response
+            broadcast_creative_activity("therapist_stats", f"통계 조회: {stats['total_sessions']}건")
+        else:
+            # 기본 색채 치료 소개
+            stats = self.color_therapist.get_therapist_stats()
+            response = f"🎨 감정 색채 치료사 활성화!\n"
+            response += f"💫 색상 데이터베이스: {stats['color_database_size']}개 색상\n"
+            response += f"📊 총 세션: {stats['total_sessions']}건\n"
+            response += f"💡 명령어:\n"
+            response += f"  • '감정 분석' - 현재 감정 상태 분석\n"
+            response += f"  • '색 추천' - 맞춤 색상 추천\n"
+            response += f"  • '치료 시작' - 정식 치료 세션 시작\n"
+            response += f"  • '보고서' - 세션 결과 확인\n"
+            response += f"  • '통계' - 치료사 현황"
         
-        # 🤖 멀티 AI 에이전트 시스템 요청
-        elif any(keyword in cmd_lower for keyword in ["멀티에이전트", "멀티 에이전트", "다중ai", "협업ai", "에이전트시스템"]):
-            agent_response = create_multi_agent_response(cmd)
-            self.memory_palace.remember_conversation(cmd, agent_response, "collaborative")
-            broadcast_creative_activity("multi_agent_system", "멀티 AI 협업 시스템")
-            return agent_response
+        self.memory_palace.remember_conversation(cmd, response, "color_therapy")
+        return response
+    
+    def _creative_music(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """음악 작곡 요청"""
+        if "코드" in cmd_lower and ("음악" in cmd_lower or "작곡" in cmd_lower):
+            # 코드를 음악으로 변환
+            sample_code = "def hello_world():\n    for i in range(10):\n        if i % 2 == 0:\n            print(f'Hello {i}')"
+            emotion = self.persona_system.current_persona
+            composition = self.music_composer.compose_from_code(sample_code, emotion)
+            response = self.music_composer.play_composition_text(composition)
+            broadcast_creative_activity("music_composition", f"코드 기반 작곡: {composition['title']}")
+        else:
+            # 감정 기반 작곡
+            emotion = self.persona_system.current_persona
+            composition = self.music_composer.compose_by_emotion(emotion, 8)
+            response = self.music_composer.play_composition_text(composition)
+            broadcast_creative_activity("music_composition", f"감정 기반 작곡: {composition['title']}")
         
-        # 🎯 자율 마케팅 시스템 요청
-        elif any(keyword in cmd_lower for keyword in ["마케팅", "광고", "판매", "홍보", "브랜딩", "캠페인", "자동마케팅", "광고자동화"]):
-            marketing_response = create_autonomous_marketing_response(cmd)
-            self.memory_palace.remember_conversation(cmd, marketing_response, "marketing")
-            broadcast_creative_activity("autonomous_marketing", "자율 마케팅 시스템 운영")
-            return marketing_response
+        self.memory_palace.remember_conversation(cmd, response, "creative")
+        return response
+    
+    def _creative_lyrics(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """작사 요청"""
+        # 명령어에서 감정과 테마 추출
+        emotion = "happy"  # 기본값
+        theme = None
+        
+        if any(word in cmd_lower for word in ["슬픈", "sad", "우울"]):
+            emotion = "sad"
+        elif any(word in cmd_lower for word in ["사랑", "로맨틱", "romantic"]):
+            emotion = "romantic"  
+        elif any(word in cmd_lower for word in ["신나는", "에너지", "energetic", "활기"]):
+            emotion = "energetic"
+        
+        # 테마 추출 (간단한 키워드 기반)
+        theme_keywords = ["사랑", "이별", "꿈", "희망", "우정", "가족"]
+        for keyword in theme_keywords:
+            if keyword in cmd_lower:
+                theme = keyword
+                break
         
-        return None  # 창의적 기능에 해당하지 않음
+        # 가사 생성
+        lyrics_info = self.lyrics_writer.generate_lyrics(emotion, theme, lines=8)
+        response = self.lyrics_writer.format_lyrics_display(lyrics_info)
+        
+        broadcast_creative_activity("lyrics_writing", f"작사 완성: {lyrics_info['title']}")
+        self.memory_palace.remember_conversation(cmd, response, "creative")
+        return response
+    
+    def _creative_song(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """완전한 노래 생성 (작곡 + 작사)"""
+        # 명령어에서 감정과 테마 추출
+        emotion = "happy"  # 기본값
+        theme = None
+        
+        if any(word in cmd_lower for word in ["슬픈", "sad", "우울"]):
+            emotion = "sad"
+        elif any(word in cmd_lower for word in ["사랑", "로맨틱", "romantic"]):
+            emotion = "romantic"  
+        elif any(word in cmd_lower for word in ["신나는", "에너지", "energetic", "활기"]):
+            emotion = "energetic"
+        
+        # 테마 추출
+        if "테마" in cmd_lower or "주제" in cmd_lower:
+            theme_words = cmd_lower.split()
+            for i, word in enumerate(theme_words):
+                if word in ["테마", "주제"] and i + 1 < len(theme_words):
+                    theme = theme_words[i + 1]
+                    break
+        
+        # 완전한 노래 생성
+        complete_song = self.music_studio.create_complete_song(emotion, theme)
+        response = self.music_studio.display_complete_song(complete_song)
+        
+        broadcast_creative_activity("complete_song", f"완전한 노래 생성: {complete_song['title']}")
+        self.memory_palace.remember_conversation(cmd, response, "creative")
+        return response
+    
+    def _creative_music_chat(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """음악 채팅장 요청"""
+        if "생성" in cmd_lower or "만들기" in cmd_lower or "만들어" in cmd_lower:
+            # 채팅방 생성 요청
+            response = "💬 음악 채팅방을 만드시겠어요?\n\n"
+            response += "🎵 **음악 채팅장 기능:**\n"
+            response += "- 실시간 음악 작품 공유\n"
+            response += "- 작곡/작사 협업 프로젝트\n"
+            response += "- 장르별 전문 채팅방\n"
+            response += "- AI 음악 생성 도구 내장\n\n"
+            response += "📝 **채팅방 유형:**\n"
+            response += "- 🎼 일반 음악 채팅\n"
+            response += "- 🤝 작곡 협업실\n"
+            response += "- 📝 작사 워크샵\n"
+            response += "- 🎸 실시간 잼 세션\n\n"
+            response += "웹 브라우저에서 /music-chat으로 접속하세요!"
+        elif "목록" in cmd_lower or "리스트" in cmd_lower:
+            # 채팅방 목록 조회
+            rooms = self.chat_system.get_room_list()
+            response = f"💬 **활성 채팅방 목록** ({len(rooms)}개):\n\n"
+            
+            for room in rooms:
+                response += f"🎵 **{room['room_name']}**\n"
+                response += f"   📝 {room['description']}\n"
+                response += f"   👥 {room['current_users']}/{room['max_users']}명\n"
+                response += f"   🎶 장르: {room['genre']}\n\n"
+            
+            if not rooms:
+                response += "아직 생성된 채팅방이 없습니다.\n"
+                response += "'채팅방 만들어줘'라고 말씀해보세요!"
+        elif "통계" in cmd_lower or "현황" in cmd_lower:
+            # 채팅 시스템 통계
+            stats = self.chat_system.get_chat_statistics()
+            response = "📊 **음악 채팅장 현황:**\n\n"
+            response += f"👥 총 사용자: {stats['total_users']}명\n"
+            response += f"🏠 총 채팅방: {stats['total_rooms']}개\n"
+            response += f"💬 총 메시지: {stats['total_messages']}개\n"
+            response += f"🤝 활성 협업: {stats['active_collaborations']}개\n"
+            response += f"🟢 온라인 사용자: {stats['online_users']}명\n\n"
+            response += "웹에서 실시간 채팅을 즐겨보세요!"
+        else:
+            # 기본 채팅장 소개
+            response = "🎵💬 **AI 음악 채팅장에 오신 것을 환영합니다!**\n\n"
+            response += "✨ **주요 기능:**\n"
+            response += "- 🎼 실시간 음악 작품 공유\n"
+            response += "- 📝 가사 창작 및 피드백\n"
+            response += "- 🤝 협업 작곡/작사 프로젝트\n"
+            response += "- 🎸 라이브 잼 세션\n"
+            response += "- 🤖 AI 음악 생성 도구\n\n"
+            response += "🌐 **접속 방법:**\n"
+            response += "웹 브라우저에서 '/music-chat'으로 접속하세요!\n\n"
+            response += "💡 **명령어:**\n"
+            response += "- '채팅방 만들어줘' - 새 방 생성\n"
+            response += "- '채팅방 목록' - 방 리스트 보기\n"
+            response += "- '채팅 통계' - 시스템 현황\n"
+        
+        broadcast_creative_activity("music_chat", "음악 채팅장 활용")
+        self.memory_palace.remember_conversation(cmd, response, "social")
+        return response
+    
+    def _creative_shopping_mall(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """지능형 자율 쇼핑몰 요청"""
+        mall_response = create_autonomous_mall_response(cmd)
+        self.memory_palace.remember_conversation(cmd, mall_response, "business")
+        broadcast_creative_activity("autonomous_shopping", "지능형 쇼핑몰 운영")
+        return mall_response
+    
+    def _creative_multi_agent(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """멀티 AI 에이전트 시스템 요청"""
+        agent_response = create_multi_agent_response(cmd)
+        self.memory_palace.remember_conversation(cmd, agent_response, "collaborative")
+        broadcast_creative_activity("multi_agent_system", "멀티 AI 협업 시스템")
+        return agent_response
+    
+    def _creative_marketing(self, cmd: str, cmd_lower: str) -> Optional[str]:
+        """자율 마케팅 시스템 요청"""
+        from modules.ai_code_manager.autonomous_marketing_system import create_autonomous_marketing_response
+        marketing_response = create_autonomous_marketing_response(cmd)
+        self.memory_palace.remember_conversation(cmd, marketing_response, "marketing")
+        broadcast_creative_activity("autonomous_marketing", "자율 마케팅 시스템 운영")
+        return marketing_response
 
 
 def create_autonomous_mall_response(user_request):
     """자율 쇼핑몰 응답 생성"""
-    mall = AutonomousShoppingMall()
+    from modules.ai_code_manager.autonomous_shopping_mall import get_mall_service
+    # 명령마다 새로 만들지 않고 공유 쇼핑몰 서비스 사용 (데이터는 처음 한 번만 로드)
+    mall = get_mall_service()
     
     # 쇼핑몰 자율 운영 시작
     mall_status = mall.run_autonomous_cycle()
@@ -1316,7 +1439,9 @@ def create_autonomous_mall_response(user_request):
 
 def create_multi_agent_response(user_request):
     """멀티 AI 에이전트 응답 생성"""
-    agent_system = MultiAgentShoppingSystem()
+    from modules.ai_code_manager.multi_agent_shopping_system import get_multi_agent_system
+    # 명령마다 새로 만들지 않고 공유 멀티 에이전트 시스템 사용
+    agent_system = get_multi_agent_system()
     
     # 7개 에이전트 협업 회의 시작
     meeting_result = agent_system.agent_collaboration_meeting("멀티 AI 협업 프로젝트")
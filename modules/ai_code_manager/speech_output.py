@@ -0,0 +1,380 @@
+"""
+음성 출력 작업자 (Speech Output)
+TTS를 전용 스레드에서 실행하여 메인 루프가 말하는 동안 멈추지 않게 합니다.
+
+    - 우선순위 큐: 오류 안내와 종료 인사(URGENT)가 일반 응답보다 먼저 나가고,
+      URGENT 요청이 들어오면 재생 중인 덜 급한 발화를 끊습니다.
+    - 끼어들기(barge-in): cancel()로 재생 중인 발화와 대기 중인 발화를 취소합니다.
+    - 음성 캐시: (텍스트, 감정, 속도, 음성)의 해시를 파일 이름으로 렌더링한 오디오를 디스크에 보관하고
+      같은 발화는 다시 합성하지 않고 바로 재생합니다. 한 번만 나오는 응답까지 파일로 렌더링하지 않도록
+      두 번째로 나올 때(또는 cache=True로 요청할 때) 캐시에 넣습니다.
+      재생기가 없는 플랫폼에서는 캐시 없이 엔진으로 바로 말합니다.
+
+TTS 엔진은 engine_factory로 작업자 스레드 안에서 생성합니다 (pyttsx3/SAPI는 만든 스레드에서만 써야 함).
+테스트와 헤드리스 실행에서는 FakeSpeechEngine/FakeAudioPlayer로 바꿔 끼울 수 있습니다.
+"""
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Callable, List, Optional
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+# 요청 우선순위 (작을수록 먼저)
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class SpeechRequest:
+    """발화 요청 하나"""
+
+    def __init__(self, text: str, rate: int, emotion: str, priority: int, cache: bool):
+        self.text = text
+        self.rate = rate
+        self.emotion = emotion
+        self.priority = priority
+        self.cache = cache
+        self.status = "queued"  # queued, spoken, cached, cancelled, error
+        self.done = threading.Event()
+        self.queued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+
+class Pyttsx3Engine:
+    """pyttsx3 엔진 어댑터 (작업자 스레드에서만 호출)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    @property
+    def voice_id(self) -> str:
+        return str(self.engine.getProperty('voice'))
+
+    def speak(self, text: str, rate: int):
+        self.engine.setProperty('rate', rate)
+        self.engine.say(text)
+        self.engine.runAndWait()
+
+    def render(self, text: str, rate: int, path: str):
+        self.engine.setProperty('rate', rate)
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+
+    def stop(self):
+        self.engine.stop()
+
+
+class WinsoundPlayer:
+    """Windows 기본 WAV 재생기 (재생이 끝날 때까지 블록, stop은 다른 스레드에서 호출)"""
+
+    def play(self, path: str):
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
+
+    def stop(self):
+        winsound.PlaySound(None, 0)
+
+
+def default_player():
+    """이 플랫폼에서 쓸 수 있는 재생기 (없으면 None - 캐시 없이 엔진으로 말함)"""
+    return WinsoundPlayer() if winsound is not None else None
+
+
+class FakeSpeechEngine:
+    """테스트/헤드리스용 엔진 - 말한 내용을 기록하고 글자당 seconds_per_char초 동안 '말함'"""
+
+    def __init__(self, voice_id: str = "fake", seconds_per_char: float = 0.0):
+        self.voice_id = voice_id
+        self.seconds_per_char = seconds_per_char
+        self.spoken: List[tuple] = []
+        self.rendered: List[tuple] = []
+        self.stopped = 0
+        self._stop = threading.Event()
+
+    def speak(self, text: str, rate: int):
+        self._stop.clear()
+        self.spoken.append((text, rate))
+        self._stop.wait(len(text) * self.seconds_per_char)
+
+    def render(self, text: str, rate: int, path: str):
+        self.rendered.append((text, rate))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def stop(self):
+        self.stopped += 1
+        self._stop.set()
+
+
+class FakeAudioPlayer:
+    """테스트/헤드리스용 재생기 - 재생한 파일 내용을 기록"""
+
+    def __init__(self):
+        self.played: List[str] = []
+
+    def play(self, path: str):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.played.append(f.read())
+
+    def stop(self):
+        pass
+
+
+class SpeechOutput:
+    """우선순위 큐를 가진 음성 출력 작업자"""
+
+    def __init__(self, engine_factory: Callable[[], object], cache_dir: Optional[str] = None,
+                 player=None, max_cache_entries: int = 500,
+                 observer: Optional[Callable[[SpeechRequest], None]] = None):
+        """
+        Args:
+            engine_factory (callable): 작업자 스레드에서 호출하여 엔진을 만드는 함수
+            cache_dir (str): 렌더링한 음성 보관 디렉터리 (None이면 캐시 안 함)
+            player: play(path)/stop()을 가진 재생기 (None이면 캐시 안 함)
+            max_cache_entries (int): 캐시 파일 최대 수 (넘으면 오래 안 쓴 것부터 삭제)
+            observer (callable): 요청 하나를 처리할 때마다 호출 (대기/재생 시간 기록용)
+        """
+        self.engine_factory = engine_factory
+        self.observer = observer
+        self.cache_dir = cache_dir if player is not None else None
+        self.player = player
+        self.max_cache_entries = max_cache_entries
+        self.engine = None
+        self.stats = Counter()
+        self._queue: List = []  # (우선순위, 순번, 요청)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._current: Optional[SpeechRequest] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self._playback = deque(maxlen=32)  # 최근 재생 구간 (시작, 끝) - 자기 목소리 구절 판별용
+        # 한 번만 들은 캐시 키 (두 번째부터 캐시, 캐시 색인과 같은 크기로 오래된 것부터 버림)
+        self._seen: "OrderedDict[str, int]" = OrderedDict()
+        self._cache_index: "OrderedDict[str, str]" = OrderedDict()  # 키 -> 경로 (LRU 순)
+        self._load_cache_index()
+
+    def start(self):
+        """작업자 스레드 시작 (엔진은 스레드 안에서 생성)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="speech-output", daemon=True)
+            self._thread.start()
+
+    def say(self, text: str, rate: int, emotion: str = "neutral",
+            priority: int = PRIORITY_NORMAL, cache: bool = False) -> SpeechRequest:
+        """
+        발화 요청 (바로 반환, 완료는 요청의 wait()로 확인)
+        URGENT 요청은 재생 중인 덜 급한 발화를 끊고 먼저 나갑니다.
+        """
+        request = SpeechRequest(text, rate, emotion, priority, cache)
+        with self._condition:
+            if self._closing:
+                request.status = "cancelled"
+                request.done.set()
+                return request
+            heapq.heappush(self._queue, (priority, next(self._sequence), request))
+            self.stats["requested"] += 1
+            current = self._current
+            self._condition.notify_all()
+        if current is not None and current.priority > priority == PRIORITY_URGENT:
+            self._interrupt(current)
+        return request
+
+    def cancel(self, min_priority: int = PRIORITY_NORMAL) -> int:
+        """
+        끼어들기 - 우선순위가 min_priority 이하로 급하지 않은 발화를 재생 중인 것까지 취소
+        Returns:
+            int: 취소한 요청 수
+        """
+        with self._condition:
+            kept, cancelled = [], []
+            for entry in self._queue:
+                (cancelled if entry[0] >= min_priority else kept).append(entry)
+            heapq.heapify(kept)
+            self._queue = kept
+            current = self._current
+            self._condition.notify_all()
+        for _, _, request in cancelled:
+            request.status = "cancelled"
+            request.done.set()
+        count = len(cancelled)
+        if current is not None and current.priority >= min_priority:
+            self._interrupt(current)
+            count += 1
+        self.stats["cancelled"] += count
+        return count
+
+    @property
+    def busy(self) -> bool:
+        with self._condition:
+            return self._current is not None or bool(self._queue)
+
+    def spoke_during(self, start: float, end: float, tail: float = 0.0) -> bool:
+        """
+        start~end(time.monotonic 기준) 동안 말하고 있었는지
+        재생이 끝난 뒤 tail초(스피커 잔향)까지 말하는 중으로 봅니다.
+        """
+        with self._condition:
+            intervals = list(self._playback)
+            if self._current is not None and self._current.started_at is not None:
+                intervals.append((self._current.started_at, None))
+        return any(began <= end and (finished is None or start < finished + tail)
+                   for began, finished in intervals)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """대기 중이거나 재생 중인 발화가 모두 끝날 때까지 대기"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._current is not None or self._queue:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """남은 발화를 마저 말하고 작업자 종료"""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def cache_key(self, request: SpeechRequest, voice_id: str) -> str:
+        payload = json.dumps([request.text, request.emotion, request.rate, voice_id], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _interrupt(self, request: SpeechRequest):
+        request.status = "cancelled"
+        try:
+            if self.player is not None:
+                self.player.stop()
+            if self.engine is not None:
+                self.engine.stop()
+        except Exception as e:
+            print(f"⚠ 음성 출력 중단 실패: {e}")
+
+    def _next_request(self) -> Optional[SpeechRequest]:
+        with self._condition:
+            while not self._queue:
+                if self._closing:
+                    return None
+                self._condition.wait()
+            _, _, request = heapq.heappop(self._queue)
+            self._current = request
+            request.started_at = time.monotonic()
+            return request
+
+    def _worker(self):
+        try:
+            self.engine = self.engine_factory()
+        except Exception as e:
+            print(f"⚠ TTS 엔진 생성 실패: {e}")
+            self.engine = None
+
+        while True:
+            request = self._next_request()
+            if request is None:
+                return
+            try:
+                if self.engine is None:
+                    request.status = "error"
+                else:
+                    self._speak(request)
+            except Exception as e:
+                request.status = "error"
+                self.stats["errors"] += 1
+                print(f"⚠ 음성 출력 오류: {e}")
+            finally:
+                request.finished_at = time.monotonic()
+                with self._condition:
+                    self._playback.append((request.started_at, request.finished_at))
+                    self._current = None
+                    self._condition.notify_all()
+                request.done.set()
+                if self.observer is not None:
+                    try:
+                        self.observer(request)
+                    except Exception as e:
+                        print(f"⚠ 음성 출력 기록 실패: {e}")
+
+    def _speak(self, request: SpeechRequest):
+        if request.status == "cancelled":
+            return
+        if self.cache_dir is None:
+            self.engine.speak(request.text, request.rate)
+            self._finish(request, "spoken")
+            return
+
+        key = self.cache_key(request, self.engine.voice_id)
+        path = self._cache_index.get(key)
+        if path is not None and os.path.exists(path):
+            self._cache_index.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            self.player.play(path)
+            self._finish(request, "cached")
+            return
+
+        count = self._seen.pop(key, 0) + 1
+        if request.cache or count >= 2:
+            path = self._render(key, request)
+            self.player.play(path)
+            self._finish(request, "cached")
+            return
+
+        self._seen[key] = count
+        while len(self._seen) > self.max_cache_entries:
+            self._seen.popitem(last=False)
+        self.engine.speak(request.text, request.rate)
+        self._finish(request, "spoken")
+
+    def _finish(self, request: SpeechRequest, status: str):
+        # 재생 중 끼어들기로 취소된 요청은 취소 상태 유지
+        if request.status != "cancelled":
+            request.status = status
+            self.stats[status] += 1
+
+    def _render(self, key: str, request: SpeechRequest) -> str:
+        """발화를 파일로 렌더링해 캐시에 추가 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.join(self.cache_dir, key[:2])
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, key + ".wav")
+        temp_path = path + ".tmp"
+        self.engine.render(request.text, request.rate, temp_path)
+        os.replace(temp_path, path)
+        self.stats["rendered"] += 1
+
+        self._cache_index[key] = path
+        while len(self._cache_index) > self.max_cache_entries:
+            _, old_path = self._cache_index.popitem(last=False)
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+        return path
+
+    def _load_cache_index(self):
+        """이전 실행에서 렌더링한 캐시 파일 목록 복원 (수정 시각 순)"""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for directory in os.scandir(self.cache_dir):
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory.path):
+                if entry.name.endswith(".wav"):
+                    entries.append((entry.stat().st_mtime, entry.name[:-len(".wav")], entry.path))
+        for _, key, path in sorted(entries):
+            self._cache_index[key] = path
@@ -0,0 +1,94 @@
+"""
+스트리밍 집계 (Streaming Aggregates)
+이벤트가 발생할 때마다 갱신하는 집계 자료구조입니다.
+보고서를 만들 때 전체 이력을 다시 훑지 않으므로 조회 비용이 이력 크기와 무관합니다.
+
+    TopK              - 점수 상위 k개만 유지하는 최소 힙
+    TimeBucketCounter - 시간 구간별 개수와 최근 구간 합계
+"""
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+class TopK:
+    """
+    점수 상위 k개 항목 (크기 k의 최소 힙)
+    점수가 같으면 먼저 추가된 항목이 앞섭니다 (안정 정렬과 같은 순서).
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        # (점수, -순번, 항목) - 힙의 맨 앞이 가장 낮은 순위
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+
+    def add(self, score: float, item: Any):
+        entry = (score, -next(self._counter), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        """높은 점수 순 항목 (최대 k개)"""
+        return [item for _, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class TimeBucketCounter:
+    """
+    시간 구간별 이벤트 수
+    window_seconds 안의 구간만 남기고 합계를 누적해 두므로
+    최근 구간 합계 조회는 만료된 구간 정리만큼의 비용만 듭니다.
+    """
+
+    def __init__(self, window_seconds: float = 24 * 3600, bucket_seconds: float = 60,
+                 clock: Callable[[], float] = time.time):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock
+        self._buckets: Deque[List] = deque()  # [구간 시작 번호, 개수]
+        self._total = 0
+
+    def add(self, timestamp: Optional[float] = None, count: int = 1):
+        """timestamp(초) 시점에 count개 기록 (없으면 현재 시각)"""
+        timestamp = self.clock() if timestamp is None else timestamp
+        bucket = int(timestamp // self.bucket_seconds)
+        if bucket <= self._oldest_bucket():
+            # 이미 창 밖으로 나간 과거 이벤트
+            return
+
+        if self._buckets and self._buckets[-1][0] == bucket:
+            self._buckets[-1][1] += count
+        elif not self._buckets or self._buckets[-1][0] < bucket:
+            self._buckets.append([bucket, count])
+        else:
+            # 순서가 뒤바뀐 이벤트 (드묾) - 제자리에 삽입
+            for index, entry in enumerate(self._buckets):
+                if entry[0] == bucket:
+                    entry[1] += count
+                    break
+                if entry[0] > bucket:
+                    self._buckets.insert(index, [bucket, count])
+                    break
+        self._total += count
+        self._expire()
+
+    def total(self) -> int:
+        """최근 window_seconds 동안의 이벤트 수"""
+        self._expire()
+        return self._total
+
+    def _oldest_bucket(self) -> int:
+        """창 밖으로 밀려난 마지막 구간 번호"""
+        return int((self.clock() - self.window_seconds) // self.bucket_seconds)
+
+    def _expire(self):
+        oldest = self._oldest_bucket()
+        while self._buckets and self._buckets[0][0] <= oldest:
+            self._total -= self._buckets.popleft()[1]
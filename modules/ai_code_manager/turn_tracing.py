@@ -0,0 +1,269 @@
+"""
+음성 대화 턴 지연 시간 추적 (Turn Tracing)
+발화 하나(턴)를 처리하는 단계마다 구간(span)을 기록하고, 단계별 고정 크기 히스토그램에 누적합니다.
+
+    - 히스토그램은 고정된 경계(1ms ~ 30s)의 구간별 횟수만 보관하므로 메모리가 늘지 않고,
+      p50/p95/p99는 구간 안에서 선형 보간하여 계산합니다.
+    - 같은 히스토그램을 Prometheus 텍스트 형식(_bucket/_sum/_count)으로 내보냅니다.
+    - 턴 전체 시간이 slow_turn_threshold초를 넘으면 구간 트리 전체를 느린 턴 로그(JSONL)에 남깁니다.
+
+사용 예:
+    tracer.begin_turn(start=phrase.captured_at)
+    with tracer.span("nlp"):
+        analysis = ...
+    tracer.end_turn()
+
+진행 중인 턴이 없을 때의 span()/observe()는 히스토그램에만 기록합니다 (TTS 작업자 스레드 등).
+"""
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# 히스토그램 구간 경계(초) - 마지막 구간은 +Inf
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TURN_STAGE = "turn"
+METRIC_NAME = "sorisay_stage_latency_seconds"
+
+
+class LatencyHistogram:
+    """고정 경계 지연 시간 히스토그램"""
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """q(0~1) 분위수 - 해당 구간 안에서 선형 보간 (+Inf 구간은 최대값 사용)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+class Span:
+    """구간 하나 (이름, 시작/끝 시각, 하위 구간)"""
+
+    __slots__ = ("name", "start", "end", "children", "attributes")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.end: Optional[float] = None
+        self.children: List["Span"] = []
+        self.attributes: Dict = {}
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else self.start) - self.start
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self, origin: Optional[float] = None) -> Dict:
+        origin = self.start if origin is None else origin
+        data = {
+            "name": self.name,
+            "offset_ms": round((self.start - origin) * 1000, 2),
+            "duration_ms": round(self.duration * 1000, 2),
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in self.children]
+        return data
+
+
+class TurnTracer:
+    """턴 단위 구간 기록과 단계별 히스토그램"""
+
+    def __init__(self, slow_turn_threshold: Optional[float] = None,
+                 slow_turn_log: Optional[str] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            slow_turn_threshold (float): 이 시간(초)을 넘은 턴은 느린 턴으로 기록 (None이면 안 함)
+            slow_turn_log (str): 느린 턴 구간 트리를 남길 JSONL 파일 경로
+            clock (callable): 시각 함수 (음성 수집 단계와 같은 time.monotonic)
+        """
+        self.slow_turn_threshold = slow_turn_threshold
+        self.slow_turn_log = slow_turn_log
+        self.clock = clock
+        self.slow_turns = 0
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._turn: Optional[Span] = None
+        self._stack: List[Span] = []
+        self._listeners: List[Callable[[Span], None]] = []
+
+    def configure(self, slow_turn_threshold: Optional[float] = None, slow_turn_log: Optional[str] = None):
+        """느린 턴 기록 설정 변경"""
+        self.slow_turn_threshold = slow_turn_threshold
+        self.slow_turn_log = slow_turn_log
+
+    def add_listener(self, callback: Callable[[Span], None]):
+        """끝난 턴(Span)을 받을 함수 등록 (헤드리스 재생의 턴별 채점 등)"""
+        self._listeners.append(callback)
+
+    @property
+    def active_turn(self) -> Optional[Span]:
+        return self._turn
+
+    def begin_turn(self, start: Optional[float] = None, **attributes) -> Span:
+        """턴 시작 (진행 중인 턴이 있으면 먼저 끝냄)"""
+        self.end_turn()
+        self._turn = Span(TURN_STAGE, self.clock() if start is None else start)
+        self._turn.attributes.update(attributes)
+        self._stack = [self._turn]
+        return self._turn
+
+    def annotate(self, **attributes):
+        """진행 중인 턴에 속성 추가 (명령어, 응답 경로 등)"""
+        if self._turn is not None:
+            self._turn.attributes.update(attributes)
+
+    def end_turn(self) -> Optional[Span]:
+        """턴 종료 - 모든 구간을 히스토그램에 반영하고 느리면 로그에 기록"""
+        turn = self._turn
+        if turn is None:
+            return None
+        self._turn = None
+        self._stack = []
+        turn.end = self.clock()
+        with self._lock:
+            for span in turn.walk():
+                self._histogram(span.name).observe(span.duration)
+        if self.slow_turn_threshold is not None and turn.duration >= self.slow_turn_threshold:
+            self._log_slow_turn(turn)
+        for callback in self._listeners:
+            callback(turn)
+        return turn
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """단계 구간 (턴 안에서는 현재 구간의 하위 구간, 밖에서는 히스토그램에만 기록)"""
+        span = Span(name, self.clock())
+        span.attributes.update(attributes)
+        in_turn = self._turn is not None
+        if in_turn:
+            self._stack[-1].children.append(span)
+            self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end = self.clock()
+            if in_turn and self._stack and self._stack[-1] is span:
+                self._stack.pop()
+            elif not in_turn:
+                self.observe(name, span.duration)
+
+    def record_span(self, name: str, start: float, end: float, **attributes):
+        """이미 지난 구간을 현재 턴에 추가 (턴이 없으면 히스토그램에만 기록)"""
+        if self._turn is None:
+            self.observe(name, end - start)
+            return
+        span = Span(name, start)
+        span.end = end
+        span.attributes.update(attributes)
+        self._stack[-1].children.append(span)
+
+    def observe(self, name: str, seconds: float):
+        """턴과 관계없이 단계 시간 하나 기록 (스레드 안전)"""
+        with self._lock:
+            self._histogram(name).observe(seconds)
+
+    def snapshot(self) -> Dict:
+        """단계별 횟수/평균/p50/p95/p99/최대 (초)"""
+        with self._lock:
+            stages = {name: histogram.summary() for name, histogram in self._histograms.items()}
+        return {"stages": stages, "slow_turns": self.slow_turns, "slow_turn_threshold": self.slow_turn_threshold}
+
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = [
+            f"# HELP {METRIC_NAME} Latency of each voice loop stage in seconds.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for name in sorted(self._histograms):
+                histogram = self._histograms[name]
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.bounds, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{METRIC_NAME}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_bucket{{stage="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{METRIC_NAME}_sum{{stage="{name}"}} {histogram.total}')
+                lines.append(f'{METRIC_NAME}_count{{stage="{name}"}} {histogram.count}')
+            slow_turns = self.slow_turns
+        lines.append("# HELP sorisay_slow_turns_total Turns slower than the slow turn threshold.")
+        lines.append("# TYPE sorisay_slow_turns_total counter")
+        lines.append(f"sorisay_slow_turns_total {slow_turns}")
+        return "\n".join(lines) + "\n"
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        return histogram
+
+    def _log_slow_turn(self, turn: Span):
+        self.slow_turns += 1
+        print(f"⚠ 느린 턴: {turn.duration:.2f}초 (기준 {self.slow_turn_threshold}초)")
+        if not self.slow_turn_log:
+            return
+        record = {"timestamp": datetime.now().isoformat(), "trace": turn.to_dict()}
+        try:
+            directory = os.path.dirname(self.slow_turn_log)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.slow_turn_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"⚠ 느린 턴 로그 저장 실패: {e}")
+
+
+_tracer: Optional[TurnTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> TurnTracer:
+    """공유 추적기 반환 (음성 루프가 기록하고 대시보드가 읽음)"""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = TurnTracer()
+    return _tracer
@@ -0,0 +1,175 @@
+"""
+웹 검색 캐시 (Web Search Cache)
+정규화된 검색어로 안정적인 캐시 키를 만들고 TTL과 크기 제한을 적용합니다.
+실패한 검색은 짧은 TTL로 부정 캐시하며, 같은 검색어의 동시 요청은
+하나의 네트워크 요청으로 합칩니다.
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+CACHE_KEY = "web_search_cache"
+
+
+class CachedSearchError(Exception):
+    """부정 캐시에 기록된 검색 실패"""
+
+
+def normalize_query(query: str) -> str:
+    """대소문자와 공백 차이를 없앤 검색어"""
+    return re.sub(r'\s+', ' ', query.strip().lower())
+
+
+def make_cache_key(query: str, max_results: int) -> str:
+    """프로세스와 무관하게 항상 같은 캐시 키"""
+    digest = hashlib.sha1(f"{normalize_query(query)}|{max_results}".encode('utf-8')).hexdigest()
+    return f"search_{digest[:20]}"
+
+
+class _PendingSearch:
+    """진행 중인 검색 (동시 요청 병합용)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.results = None
+        self.error: Optional[str] = None
+
+
+class WebSearchCache:
+    """TTL + 크기 제한 + 부정 캐시 + 요청 병합 검색 캐시"""
+
+    def __init__(self, knowledge_store, ttl_seconds: float = 24 * 3600,
+                 negative_ttl_seconds: float = 300, max_entries: int = 500,
+                 clock: Callable[[], float] = time.time):
+        self.knowledge_store = knowledge_store
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._order = OrderedDict()
+        self._in_flight: Dict[str, _PendingSearch] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "negative_hits": 0,
+            "coalesced": 0,
+            "expired": 0,
+            "evicted": 0,
+        }
+
+        self._load_entries()
+
+    @property
+    def entries(self) -> Dict:
+        return self.knowledge_store.data.setdefault(CACHE_KEY, {})
+
+    def _load_entries(self):
+        """저장된 캐시 중 유효한 항목만 남김"""
+        now = self.clock()
+        entries = self.entries
+        for key in list(entries):
+            entry = entries[key]
+            # expires_at이 없는 항목은 hash() 기반의 이전 형식이라 다시 적중할 수 없음
+            if not isinstance(entry, dict) or "expires_at" not in entry or entry["expires_at"] <= now:
+                del entries[key]
+                continue
+            self._order[key] = None
+
+    def get_or_fetch(self, query: str, max_results: int, fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        캐시된 결과 반환, 없으면 fetch 실행 후 캐시
+        Raises:
+            CachedSearchError: 최근 실패가 부정 캐시에 남아 있는 경우
+            Exception: fetch에서 발생한 오류 (부정 캐시에 기록됨)
+        """
+        key = make_cache_key(query, max_results)
+
+        with self._lock:
+            entry = self._get_valid(key)
+            if entry is not None:
+                if entry.get("negative"):
+                    self.stats["negative_hits"] += 1
+                    raise CachedSearchError(entry.get("error", "검색 실패"))
+                self.stats["hits"] += 1
+                return entry["results"]
+
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self.stats["coalesced"] += 1
+                owner = False
+            else:
+                self.stats["misses"] += 1
+                pending = _PendingSearch()
+                self._in_flight[key] = pending
+                owner = True
+
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise CachedSearchError(pending.error)
+            return pending.results
+
+        try:
+            results = fetch()
+        except Exception as e:
+            pending.error = str(e)
+            self._store(key, query, {"negative": True, "error": pending.error}, self.negative_ttl_seconds)
+            raise
+        else:
+            pending.results = results
+            self._store(key, query, {"results": results}, self.ttl_seconds)
+            return results
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.event.set()
+
+    def _get_valid(self, key: str) -> Optional[Dict]:
+        """만료되지 않은 항목 반환 (lock 보유 상태에서 호출)"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry["expires_at"] <= self.clock():
+            self.stats["expired"] += 1
+            self._remove(key)
+            return None
+        self._order.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, query: str, payload: Dict, ttl: float):
+        now = self.clock()
+        entry = {
+            "query": normalize_query(query),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
+            "expires_at": now + ttl,
+        }
+        entry.update(payload)
+
+        with self._lock:
+            self.knowledge_store.set([CACHE_KEY, key], entry)
+            self._order[key] = None
+            self._order.move_to_end(key)
+            while len(self._order) > self.max_entries:
+                oldest = next(iter(self._order))
+                self._remove(oldest)
+                self.stats["evicted"] += 1
+
+    def _remove(self, key: str):
+        self._order.pop(key, None)
+        if key in self.entries:
+            self.knowledge_store.delete([CACHE_KEY, key])
+
+    def get_stats(self) -> Dict:
+        """적중/실패 카운터와 현재 크기"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._order)
+        lookups = stats["hits"] + stats["negative_hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (stats["hits"] + stats["negative_hits"] + stats["coalesced"]) / lookups if lookups else 0.0
+        return stats
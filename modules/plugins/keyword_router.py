@@ -0,0 +1,128 @@
+"""
+키워드 라우터 (Aho–Corasick 자동자)
+등록된 모든 키워드를 하나의 자동자로 컴파일하여
+발화를 한 번만 훑으면서 모든 키워드 적중을 찾습니다.
+키워드 수가 늘어나도 검색 시간은 발화 길이에 비례합니다.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class KeywordHit:
+    """키워드 적중 정보"""
+
+    __slots__ = ("keyword", "value", "start", "order")
+
+    def __init__(self, keyword: str, value: Any, start: int, order: int):
+        self.keyword = keyword
+        self.value = value
+        self.start = start
+        self.order = order
+
+    def __repr__(self):
+        return f"KeywordHit({self.keyword!r}, start={self.start})"
+
+
+class KeywordAutomaton:
+    """다중 키워드 검색 자동자"""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # 노드에서 끝나는 키워드
+        self.terminal: List[Optional[str]] = [None]
+        # 노드에서 끝나는 모든 키워드 (실패 링크로 이어지는 키워드 포함, build에서 계산)
+        self.output: List[List[str]] = [[]]
+        self.values: Dict[str, Any] = {}
+        self.orders: Dict[str, int] = {}
+        self._built = True
+
+    def add(self, keyword: str, value: Any):
+        """키워드 추가 (같은 키워드를 다시 추가하면 값만 교체)"""
+        keyword = keyword.lower()
+        if not keyword:
+            return
+
+        if keyword in self.values:
+            self.values[keyword] = value
+            return
+
+        node = 0
+        for ch in keyword:
+            next_node = self.goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.terminal.append(None)
+                self.output.append([])
+                self.goto[node][ch] = next_node
+            node = next_node
+
+        self.terminal[node] = keyword
+        self.values[keyword] = value
+        self.orders[keyword] = len(self.orders)
+        self._built = False
+
+    def build(self):
+        """실패 링크 계산 (키워드 추가 후 검색 전에 한 번 호출)"""
+        if self._built:
+            return
+
+        queue = deque()
+        for node in self.goto[0].values():
+            self.fail[node] = 0
+            self.output[node] = self._own_output(node)
+            queue.append(node)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self._own_output(child) + self.output[self.fail[child]]
+
+        self._built = True
+
+    def _own_output(self, node: int) -> List[str]:
+        keyword = self.terminal[node]
+        return [keyword] if keyword is not None else []
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """텍스트에 나타난 모든 키워드 적중 (겹침 포함, 끝 위치 순)"""
+        self.build()
+        text = text.lower()
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            for keyword in self.output[node]:
+                hits.append(KeywordHit(keyword, self.values[keyword],
+                                       i - len(keyword) + 1, self.orders[keyword]))
+        return hits
+
+    def best_match(self, text: str) -> Optional[KeywordHit]:
+        """
+        가장 긴 키워드 적중 반환
+        길이가 같으면 먼저 나타난 키워드, 위치도 같으면 먼저 등록된 키워드
+        """
+        best = None
+        best_rank: Optional[Tuple[int, int, int]] = None
+        for hit in self.find_all(text):
+            rank = (-len(hit.keyword), hit.start, hit.order)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = hit, rank
+        return best
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, keyword: str):
+        return keyword.lower() in self.values
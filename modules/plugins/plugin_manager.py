@@ -7,11 +7,13 @@ import os
 import importlib
 from typing import Dict, List, Type
 from .base_plugin import SorisayPlugin
+from .keyword_router import KeywordAutomaton
 
 class PluginManager:
     def __init__(self):
         self.plugins: Dict[str, SorisayPlugin] = {}
         self.command_map: Dict[str, tuple] = {}  # {keyword: (plugin_name, command)}
+        self.keyword_router = KeywordAutomaton()  # command_map 키워드 검색용 자동자
         
     def load_plugins(self):
         """플러그인 폴더에서 모든 플러그인을 자동 로드"""
@@ -35,20 +37,21 @@ class PluginManager:
         for command, keywords in commands.items():
             for keyword in keywords:
                 self.command_map[keyword.lower()] = (plugin.name, command)
+                self.keyword_router.add(keyword, (plugin.name, command))
+        self.keyword_router.build()
         
         print(f"[PLUGIN] 플러그인 등록됨: {plugin.name}")
     
     def find_command(self, text: str) -> tuple:
         """
-        텍스트에서 명령어 찾기
+        텍스트에서 명령어 찾기 (가장 긴 키워드 우선, 같으면 먼저 나온 키워드)
         Returns:
             tuple: (plugin_name, command, keyword) 또는 (None, None, None)
         """
-        text_lower = text.lower()
-        
-        for keyword, (plugin_name, command) in self.command_map.items():
-            if keyword in text_lower:
-                return plugin_name, command, keyword
+        hit = self.keyword_router.best_match(text)
+        if hit:
+            plugin_name, command = hit.value
+            return plugin_name, command, hit.keyword
         
         return None, None, None
     
@@ -1,4 +1,4 @@
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, jsonify, request
 from flask_socketio import SocketIO, emit
 import json
 import os
@@ -9,6 +9,10 @@ import threading
 import time
 import hashlib
 from functools import wraps
+from modules.ai_code_manager.broadcast_coalescer import BroadcastCoalescer
+from modules.ai_code_manager.credential_index import CredentialIndex
+from modules.ai_code_manager.job_scheduler import get_scheduler
+from modules.ai_code_manager.turn_tracing import get_tracer
 
 # 로깅 설정 import
 try:
@@ -26,73 +30,60 @@ try:
 except ImportError:
     music_chat_available = False
 
+SECURITY_CONFIG_PATH = "config/security_config.json"
+
 # 🔒 보안 설정 로드
+def default_security_config():
+    """설정 파일을 한 번도 읽지 못했을 때 쓰는 기본 보안 설정"""
+    return {
+        "security": {
+            "allowed_commands": ["리팩터링", "동기화", "상태", "테스트", "정리", "도움말"],
+            "max_failed_attempts": 5
+        }
+    }
+
 def load_security_config():
+    """보안 설정 파일 읽기 (오류는 기록 후 전달, 처리는 credential_index가 함)"""
     try:
-        with open("config/security_config.json", "r", encoding="utf-8") as f:
+        with open(SECURITY_CONFIG_PATH, "r", encoding="utf-8") as f:
             config = json.load(f)
-            logger.info("보안 설정 파일 로드 완료")
-            return config
     except FileNotFoundError:
-        logger.warning("보안 설정 파일이 없습니다. 기본 설정을 사용합니다.")
-        print("⚠️ 보안 설정 파일이 없습니다. 기본 설정을 사용합니다.")
-        return {
-            "security": {
-                "allowed_commands": ["리팩터링", "동기화", "상태", "테스트", "정리", "도움말"],
-                "max_failed_attempts": 5
-            }
-        }
+        logger.warning("보안 설정 파일이 없습니다.")
+        raise
     except json.JSONDecodeError as e:
         logger.error(f"보안 설정 파일 JSON 파싱 오류: {e}", exc_info=True)
-        print(f"⚠️ 보안 설정 파일 형식 오류: {e}")
-        return {
-            "security": {
-                "allowed_commands": ["리팩터링", "동기화", "상태", "테스트", "정리", "도움말"],
-                "max_failed_attempts": 5
-            }
-        }
+        raise
     except Exception as e:
         logger.error(f"보안 설정 로드 중 예상치 못한 오류: {e}", exc_info=True)
-        print(f"⚠️ 보안 설정 로드 실패: {e}")
-        return {
-            "security": {
-                "allowed_commands": ["리팩터링", "동기화", "상태", "테스트", "정리", "도움말"],
-                "max_failed_attempts": 5
-            }
-        }
+        raise
+    logger.info("보안 설정 파일 로드 완료")
+    return config
 
-security_config = load_security_config()
+# 보안 설정과 인증 정보 색인 (설정 파일이 바뀌면 자동으로 다시 읽고, 읽기 실패 시 이전 설정 유지)
+credential_index = CredentialIndex(load_security_config, SECURITY_CONFIG_PATH,
+                                   fallback=default_security_config)
 failed_attempts = {}  # IP별 실패 횟수 추적
 active_sessions = {}  # 활성 세션 관리
 
+def security_settings():
+    """현재 보안 설정의 security 항목"""
+    return credential_index.config.get("security", {})
+
 # 🔑 인증 관련 함수들
 def verify_api_key(api_key):
     """API 키 검증"""
-    api_keys = security_config.get("security", {}).get("api_keys", {})
-    return api_key in api_keys.values()
+    entry = credential_index.lookup(api_key)
+    return entry is not None and entry.kind == "api_key"
 
 def verify_token(token):
     """액세스 토큰 검증"""
-    tokens = security_config.get("security", {}).get("access_tokens", {})
-    return token in tokens.values()
+    entry = credential_index.lookup(token)
+    return entry is not None and entry.kind == "token"
 
 def get_permission_level(credential):
     """자격 증명에 따른 권한 레벨 반환"""
-    permissions = security_config.get("security", {}).get("permissions", {})
-    
-    # API 키로 검색
-    api_keys = security_config.get("security", {}).get("api_keys", {})
-    for key_name, key_value in api_keys.items():
-        if credential == key_value:
-            return permissions.get(key_name, [])
-    
-    # 토큰으로 검색
-    tokens = security_config.get("security", {}).get("access_tokens", {})
-    for token_name, token_value in tokens.items():
-        if credential == token_value:
-            return permissions.get(token_name, [])
-    
-    return []
+    entry = credential_index.lookup(credential)
+    return sorted(entry.permissions) if entry else []
 
 def require_auth(permission=None):
     """인증 데코레이터"""
@@ -107,13 +98,13 @@ def require_auth(permission=None):
                 return jsonify({"error": "인증이 필요합니다", "code": "AUTH_REQUIRED"}), 401
             
             credential = api_key or token
-            if not verify_api_key(credential) and not verify_token(credential):
+            entry = credential_index.lookup(credential)
+            if entry is None:
                 return jsonify({"error": "유효하지 않은 인증 정보", "code": "INVALID_CREDENTIALS"}), 401
             
             # 권한 확인
             if permission:
-                user_permissions = get_permission_level(credential)
-                if permission not in user_permissions and "all" not in user_permissions:
+                if not entry.allows(permission):
                     return jsonify({"error": "권한이 부족합니다", "code": "INSUFFICIENT_PERMISSIONS"}), 403
             
             return f(*args, **kwargs)
@@ -130,10 +121,18 @@ if music_chat_available:
 else:
     music_chat_system = None
 
+# 대시보드 브로드캐스트 묶음 전송 주기 (초)
+BROADCAST_INTERVAL = 0.25
+# 주기 안에서 마지막 값만 보내는 상태형 이벤트 (클라이언트 batchHandlers에 있는 이름만)
+LATEST_ONLY_EVENTS = ("system_status", "persona_update")
+
 # 실시간 상태 관리
 class DashboardState:
     def __init__(self):
         self.lock = Lock()
+        # 변경 때마다 바로 보내지 않고 주기마다 묶어서 전송 (통계는 변경 항목만)
+        self.broadcaster = BroadcastCoalescer(socketio.emit, self.get_stats, latest_only=LATEST_ONLY_EVENTS)
+        self._broadcast_scheduled = False
         self.voice_commands = []
         self.system_status = "대기 중"
         self.active_plugins = []
@@ -171,21 +170,40 @@ class DashboardState:
             if len(self.voice_commands) > 20:
                 self.voice_commands.pop(0)
                 
-        # 클라이언트에 실시간 업데이트 전송
-        socketio.emit('command_update', command_data)
-        socketio.emit('stats_update', self.get_stats())
+        # 클라이언트에 실시간 업데이트 전송 (다음 주기에 묶어서)
+        self.broadcast('voice_command', command_data)
     
     def set_system_status(self, status):
         with self.lock:
             self.system_status = status
-        socketio.emit('status_update', {"status": status})
+        self.broadcast('system_status', {"status": status})
     
     def set_listening_status(self, is_listening):
         with self.lock:
             self.is_listening = is_listening
-        socketio.emit('listening_update', {"is_listening": is_listening})
+        # 듣기 상태는 통계(is_listening) 변경 항목으로만 전송
+        self.broadcast_stats()
+    
+    def broadcast(self, event, data):
+        """이벤트와 통계 변경을 다음 전송 주기에 보내도록 등록 (처음 호출 시 전송 작업 시작)"""
+        self._schedule_broadcast()
+        self.broadcaster.queue(event, data)
+        self.broadcaster.mark_stats_dirty()
+    
+    def broadcast_stats(self):
+        """이벤트 없이 통계 변경 항목만 다음 전송 주기에 보냄"""
+        self._schedule_broadcast()
+        self.broadcaster.mark_stats_dirty()
+    
+    def _schedule_broadcast(self):
+        """처음 호출 시 주기 전송 작업 등록"""
+        if not self._broadcast_scheduled:
+            self._broadcast_scheduled = True
+            get_scheduler().register("dashboard.broadcast", self.broadcaster.flush, BROADCAST_INTERVAL)
     
     def get_stats(self):
+        # 음악 채팅 통계는 상태 잠금 밖에서 한 번만 조회
+        rooms = music_chat_system.get_room_list() if music_chat_system else []
         with self.lock:
             return {
                 "total_commands": self.command_count,
@@ -203,8 +221,8 @@ class DashboardState:
                 "generated_plugins": self.generated_plugins,
                 "creative_activities": len(self.creative_activities),
                 # 🎵 음악 채팅 통계
-                "chat_rooms": len(music_chat_system.list_rooms()) if music_chat_system else 0,
-                "chat_users": sum(len(room.current_users) for room in music_chat_system.list_rooms().values()) if music_chat_system else 0,
+                "chat_rooms": len(rooms),
+                "chat_users": sum(room["current_users"] for room in rooms),
                 "total_chat_messages": self.total_chat_messages
             }
     
@@ -212,7 +230,7 @@ class DashboardState:
         """🎭 페르소나 업데이트"""
         with self.lock:
             self.current_persona = persona
-        socketio.emit('persona_update', {"current_persona": persona})
+        self.broadcast('persona_update', {"current_persona": persona})
     
     def add_creative_activity(self, activity_type, description):
         """🎨 창의적 활동 추가"""
@@ -236,8 +254,7 @@ class DashboardState:
             if len(self.creative_activities) > 10:
                 self.creative_activities.pop(0)
                 
-        socketio.emit('creative_update', activity)
-        socketio.emit('stats_update', self.get_stats())
+        self.broadcast('creative_update', activity)
 
 dashboard_state = DashboardState()
 
@@ -444,14 +461,34 @@ let startTime = Date.now();
 // 소켓 이벤트 리스너
 socket.on('voice_command', function(data) {
     addCommandToLog(data.command, data.status);
-    updateStats();
 });
 
 socket.on('system_status', function(data) {
     updateSystemStatus(data.status);
 });
 
-socket.on('stats_update', function(data) {
+// 접속 시 전체 통계, 이후에는 묶음 메시지로 변경된 항목만 수신
+const stats = {};
+socket.on('stats_update', applyStats);
+
+// 서버가 주기마다 묶어 보낸 이벤트 처리
+const batchHandlers = {
+    'voice_command': (data) => addCommandToLog(data.command, data.status),
+    'system_status': (data) => updateSystemStatus(data.status),
+    'persona_update': (data) => console.log('페르소나 변경:', data.current_persona),
+    'creative_update': (data) => addCreativeActivityToLog(data)
+};
+socket.on('dashboard_batch', function(batch) {
+    batch.events.forEach(function(item) {
+        const handler = batchHandlers[item.event];
+        if (handler) handler(item.data);
+    });
+    if (batch.stats) applyStats(batch.stats);
+});
+
+function applyStats(delta) {
+    Object.assign(stats, delta);
+    const data = stats;
     document.getElementById('total-commands').textContent = data.total_commands;
     document.getElementById('recent-commands').textContent = data.recent_commands;
     document.getElementById('active-plugins').textContent = data.active_plugins.length;
@@ -482,7 +519,7 @@ socket.on('stats_update', function(data) {
     if (data.chat_users !== undefined) {
         document.getElementById('chat-users').textContent = data.chat_users;
     }
-});
+}
 
 // 🎭 페르소나 업데이트 이벤트
 socket.on('persona_update', function(data) {
@@ -681,11 +718,6 @@ function sendRemoteCommand() {
     }
 }
 
-// 통계 업데이트 요청
-function updateStats() {
-    socket.emit('get_stats');
-}
-
 // 가동 시간 업데이트
 function updateUptime() {
     const uptime = Math.floor((Date.now() - startTime) / 1000);
@@ -695,10 +727,8 @@ function updateUptime() {
         `${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
 }
 
-// 초기화 및 주기적 업데이트
+// 가동 시간 표시 (통계는 서버가 변경 시 보내므로 폴링하지 않음)
 setInterval(updateUptime, 1000);
-setInterval(updateStats, 5000);
-updateStats();
 </script>
 </body>
 </html>"""
@@ -709,7 +739,7 @@ def index():
     api_key = request.args.get('api_key')
     token = request.args.get('token')
     
-    if security_config.get("security", {}).get("require_auth", False):
+    if security_settings().get("require_auth", False):
         if not api_key and not token:
             return """
             <h1>🔒 소리새 AI 대시보드 - 인증 필요</h1>
@@ -722,7 +752,7 @@ def index():
             """
         
         credential = api_key or token
-        if not verify_api_key(credential) and not verify_token(credential):
+        if credential_index.lookup(credential) is None:
             return "<h1>❌ 인증 실패</h1><p>유효하지 않은 인증 정보입니다.</p>"
     
     return render_template_string(HTML)
@@ -732,6 +762,21 @@ def index():
 def api_stats():
     return jsonify(dashboard_state.get_stats())
 
+@app.route("/api/broadcast/stats")
+@require_auth("dashboard")
+def api_broadcast_stats():
+    """브로드캐스트 전송/생략 카운터"""
+    return jsonify(dashboard_state.broadcaster.stats())
+
+@app.route("/api/metrics")
+@require_auth("dashboard")
+def api_metrics():
+    """음성 루프 단계별 지연 시간 (JSON, ?format=prometheus면 Prometheus 텍스트 형식)"""
+    tracer = get_tracer()
+    if request.args.get("format") == "prometheus":
+        return Response(tracer.prometheus_text(), mimetype="text/plain; version=0.0.4")
+    return jsonify(tracer.snapshot())
+
 @app.route("/api/auth/verify")
 def verify_auth():
     """🔑 인증 정보 검증 API"""
@@ -742,14 +787,13 @@ def verify_auth():
         return jsonify({"valid": False, "error": "인증 정보 없음"}), 401
     
     credential = api_key or token
-    is_valid = verify_api_key(credential) or verify_token(credential)
+    entry = credential_index.lookup(credential)
     
-    if is_valid:
-        permissions = get_permission_level(credential)
+    if entry:
         return jsonify({
             "valid": True,
-            "permissions": permissions,
-            "credential_type": "api_key" if verify_api_key(credential) else "token"
+            "permissions": sorted(entry.permissions),
+            "credential_type": entry.kind
         })
     else:
         return jsonify({"valid": False, "error": "유효하지 않은 인증 정보"}), 401
@@ -759,8 +803,8 @@ def verify_auth():
 def list_keys():
     """🔐 API 키 목록 (마스터 키만 접근 가능)"""
     return jsonify({
-        "api_keys": list(security_config.get("security", {}).get("api_keys", {}).keys()),
-        "tokens": list(security_config.get("security", {}).get("access_tokens", {}).keys())
+        "api_keys": list(security_settings().get("api_keys", {}).keys()),
+        "tokens": list(security_settings().get("access_tokens", {}).keys())
     })
 
 @socketio.on("remote_command")
@@ -769,23 +813,23 @@ def handle_remote_command(data):
     auth_credential = data.get('auth', '')  # 소켓에서 인증 정보 받기
     
     # 🔑 소켓 인증 검증
-    if security_config.get("security", {}).get("require_auth", False):
+    if security_settings().get("require_auth", False):
         if not auth_credential:
             emit("auth_error", {"message": "인증이 필요합니다"})
             return
         
-        if not verify_api_key(auth_credential) and not verify_token(auth_credential):
+        entry = credential_index.lookup(auth_credential)
+        if entry is None:
             emit("auth_error", {"message": "유효하지 않은 인증 정보"})
             return
         
         # 명령어 실행 권한 확인
-        permissions = get_permission_level(auth_credential)
-        if "commands" not in permissions and "all" not in permissions:
+        if not entry.allows("commands"):
             emit("auth_error", {"message": "명령어 실행 권한이 없습니다"})
             return
     
     # 🔒 명령어 보안 검증
-    allowed_commands = security_config.get("security", {}).get("allowed_commands", [])
+    allowed_commands = security_settings().get("allowed_commands", [])
     if command not in allowed_commands:
         print(f"🚫 허용되지 않은 명령어: {command}")
         emit("security_warning", {"message": f"허용되지 않은 명령어: {command}"})
@@ -793,7 +837,11 @@ def handle_remote_command(data):
     
     print(f"📡 웹에서 원격 명령 수신: {command}")
     dashboard_state.add_voice_command(f"[원격] {command}")
-    emit("voice_command", {"command": f"[원격] {command}", "status": "success"}, broadcast=True)
+
+@socketio.on("connect")
+def handle_connect():
+    """새 클라이언트에 전체 통계 전송 (이후 변경분은 묶음 메시지로)"""
+    emit("stats_update", dashboard_state.get_stats())
 
 @socketio.on("get_stats")
 def handle_get_stats():
@@ -995,12 +1043,10 @@ def handle_send_message(data):
 def broadcast_voice_command(command, status="success"):
     """음성 명령을 대시보드에 브로드캐스트"""
     dashboard_state.add_voice_command(command, status)
-    socketio.emit("voice_command", {"command": command, "status": status})
 
 def broadcast_system_status(status):
     """시스템 상태를 대시보드에 브로드캐스트"""
     dashboard_state.set_system_status(status)
-    socketio.emit("system_status", {"status": status})
 
 def broadcast_persona_change(persona):
     """🎭 페르소나 변경을 대시보드에 브로드캐스트"""
@@ -142,6 +142,25 @@ def main():
         ('tests/test_emotion_nlp.py', '6. 감정 NLP 테스트'),
         ('tests/test_creative_sorisay.py', '7. 창조형 소리새 테스트'),
         ('tests/final_system_test.py', '8. 최종 시스템 테스트'),
+        ('tests/test_intent_matcher.py', '9. 의도 매칭 엔진 테스트'),
+        ('tests/test_knowledge_store.py', '10. 지식 저장소 테스트'),
+        ('tests/test_keyword_router.py', '11. 키워드 라우터 테스트'),
+        ('tests/test_command_dispatcher.py', '12. 명령 디스패처 테스트'),
+        ('tests/test_service_registry.py', '13. 서비스 레지스트리 테스트'),
+        ('tests/test_game_economy.py', '14. 게임 경제 시스템 테스트'),
+        ('tests/test_shopping_mall.py', '15. 자율 쇼핑몰 테스트'),
+        ('tests/test_job_scheduler.py', '16. 작업 스케줄러 테스트'),
+        ('tests/test_broadcast_coalescer.py', '17. 브로드캐스트 묶음 전송 테스트'),
+        ('tests/test_credential_index.py', '18. 인증 정보 색인 테스트'),
+        ('tests/test_music_chat.py', '19. 음악 채팅 메시지 기록 테스트'),
+        ('tests/test_speech_output.py', '20. 음성 출력 큐 테스트'),
+        ('tests/test_audio_capture.py', '21. 연속 음성 수집 테스트'),
+        ('tests/test_recognition_backends.py', '22. 음성 인식 엔진 체인 테스트'),
+        ('tests/test_turn_tracing.py', '23. 턴 지연 시간 추적 테스트'),
+        ('tests/test_headless_replay.py', '24. 헤드리스 재생 테스트'),
+        ('tests/test_web_search_cache.py', '25. 웹 검색 캐시 테스트'),
+        ('tests/test_response_store.py', '26. 응답 저장소 테스트'),
+        ('tests/test_memory_palace.py', '27. 기억의 궁전 테스트'),
     ]
     
     # 필수 테스트 실행
@@ -7,6 +7,7 @@ API 키와 액세스 토큰을 생성, 관리, 검증하는 도구
 
 import json
 import hashlib
+import os
 import secrets
 import string
 from datetime import datetime, timedelta
@@ -27,9 +28,11 @@ class SecurityKeyManager:
             self.config = {"security": {"api_keys": {}, "access_tokens": {}, "permissions": {}}}
     
     def save_config(self):
-        """보안 설정 저장"""
-        with open(self.config_path, "w", encoding="utf-8") as f:
+        """보안 설정 저장 (임시 파일에 쓴 뒤 교체 - 대시보드가 읽는 도중 반쯤 쓴 파일을 보지 않도록)"""
+        temp_path = self.config_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(self.config, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.config_path)
         print(f"✅ 설정이 {self.config_path}에 저장되었습니다.")
     
     def generate_api_key(self, key_type="user"):
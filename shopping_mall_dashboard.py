@@ -10,10 +10,10 @@ import json
 import os
 from datetime import datetime
 import threading
-import time
 import webbrowser
-from modules.ai_code_manager.autonomous_shopping_mall import AutonomousShoppingMall
-from modules.ai_code_manager.autonomous_marketing_system import AutonomousMarketingSystem
+from modules.ai_code_manager.autonomous_shopping_mall import MALL_CYCLE_JOB, get_mall_service
+from modules.ai_code_manager.autonomous_marketing_system import MARKETING_CYCLE_JOB, get_marketing_service
+from modules.ai_code_manager.job_scheduler import get_scheduler
 
 app = Flask(__name__)
 
@@ -31,36 +31,35 @@ dashboard_data = {
 def initialize_systems():
     """시스템 초기화"""
     global shopping_mall, marketing_system
-    shopping_mall = AutonomousShoppingMall()
-    marketing_system = AutonomousMarketingSystem()
+    shopping_mall = get_mall_service()
+    marketing_system = get_marketing_service()
 
 def update_dashboard_data():
-    """대시보드 데이터 주기적 업데이트"""
+    """대시보드 데이터 갱신 (운영 사이클은 스케줄러가 따로 실행하고 여기서는 결과만 읽음)"""
     global dashboard_data, shopping_mall, marketing_system
     
-    while True:
-        try:
-            if shopping_mall and marketing_system:
-                # 쇼핑몰 현황 업데이트
-                mall_cycle = shopping_mall.run_autonomous_cycle()
-                dashboard_data["mall_status"] = mall_cycle
-                
-                # 상품 데이터 업데이트
-                if hasattr(shopping_mall, 'products') and shopping_mall.products:
-                    dashboard_data["products"] = shopping_mall.products[-10:]  # 최근 10개
-                
-                # 마케팅 데이터 업데이트
-                marketing_cycle = marketing_system.run_autonomous_marketing_cycle()
-                dashboard_data["marketing_campaigns"] = marketing_system.ad_campaigns[-5:]  # 최근 5개
-                
-                # 분석 데이터 업데이트
-                analytics = marketing_system.generate_sales_analytics_report()
-                dashboard_data["analytics"] = analytics
-                
-        except Exception as e:
-            print(f"대시보드 업데이트 오류: {e}")
-        
-        time.sleep(10)  # 10초마다 업데이트
+    if shopping_mall and marketing_system:
+        with shopping_mall.lock:
+            # 쇼핑몰 현황 업데이트
+            dashboard_data["mall_status"] = shopping_mall.last_cycle
+            # 상품 데이터 업데이트
+            dashboard_data["products"] = shopping_mall.products[-10:]  # 최근 10개
+        
+        with marketing_system.lock:
+            # 마케팅 데이터 업데이트
+            dashboard_data["marketing_campaigns"] = marketing_system.ad_campaigns[-5:]  # 최근 5개
+            # 분석 데이터 업데이트
+            dashboard_data["analytics"] = marketing_system.generate_sales_analytics_report()
+
+def schedule_dashboard_jobs(interval: float = 10.0):
+    """
+    공유 스케줄러에 운영 사이클과 대시보드 갱신 등록 (10초마다)
+    쇼핑몰 사이클은 멀티 에이전트 시스템과 같은 작업을 공유하므로 한 프로세스에서 한 번만 실행됩니다.
+    """
+    scheduler = get_scheduler()
+    scheduler.register(MALL_CYCLE_JOB, shopping_mall.run_autonomous_cycle, interval, jitter=0.1)
+    scheduler.register(MARKETING_CYCLE_JOB, marketing_system.run_autonomous_marketing_cycle, interval, jitter=0.1)
+    scheduler.register("dashboard.refresh", update_dashboard_data, interval, run_immediately=True)
 
 @app.route('/')
 def dashboard():
@@ -76,7 +75,8 @@ def get_dashboard_data():
 def get_mall_status():
     """쇼핑몰 현황 API"""
     if shopping_mall:
-        status = shopping_mall.run_autonomous_cycle()
+        # 스케줄러가 돌린 마지막 사이클 결과 (아직 없을 때만 한 번 실행)
+        status = shopping_mall.last_cycle or shopping_mall.run_autonomous_cycle()
         return jsonify(status)
     return jsonify({"error": "쇼핑몰 시스템 미초기화"})
 
@@ -624,9 +624,8 @@ def start_dashboard_server():
     # 시스템 초기화
     initialize_systems()
     
-    # 백그라운드 데이터 업데이트 시작
-    update_thread = threading.Thread(target=update_dashboard_data, daemon=True)
-    update_thread.start()
+    # 백그라운드 운영 사이클과 데이터 업데이트 등록
+    schedule_dashboard_jobs()
     
     print("✅ 대시보드 준비 완료!")
     print("🔗 브라우저에서 http://localhost:5000 을 열어주세요")
@@ -16,6 +16,12 @@ from datetime import datetime, timedelta
 from collections import defaultdict, deque
 import uuid
 
+# NumPy는 선택 사항 (배치 시뮬레이션 가속용, 없으면 순수 Python으로 생성)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # SQLite datetime adapter 설정 (Python 3.12 호환)
 def adapt_datetime(ts):
     return ts.isoformat()
@@ -40,15 +46,78 @@ sys.path.append(os.getcwd())
 class GameEconomyDatabase:
     """게임 경제 데이터베이스 관리 클래스"""
     
+    # 대량 기록용 SQL (executemany가 준비된 문장 하나를 재사용)
+    USER_INSERT_SQL = '''
+        INSERT OR REPLACE INTO users 
+        (user_id, username, total_earnings, daily_earnings, level) 
+        VALUES (?, ?, ?, ?, ?)
+    '''
+    ACTIVITY_INSERT_SQL = '''
+        INSERT INTO activity_log 
+        (activity_id, user_id, activity_type, activity_description, earnings, quality_score, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    BATCH_ACTIVITY_INSERT_SQL = '''
+        INSERT INTO activity_log 
+        (activity_id, user_id, activity_type, activity_description, earnings, duration_minutes, quality_score, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    # 사용자별로 합산한 경험치 반영 (레벨은 create_user_activity와 같은 기준으로 상승만)
+    BATCH_EXPERIENCE_UPDATE_SQL = '''
+        UPDATE users
+        SET experience_points = experience_points + ?,
+            level = MAX(level, CAST((experience_points + ?) / ? AS INTEGER) + 1),
+            last_active = ?
+        WHERE rowid = ?
+    '''
+    
     def __init__(self, db_path="game_economy.db"):
         """
         데이터베이스 초기화
         Args:
-            db_path (str): 데이터베이스 파일 경로
+            db_path (str): 데이터베이스 파일 경로 (":memory:"이면 메모리 DB)
         """
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.configure_connection()
         self.init_tables()
+    
+    def configure_connection(self):
+        """대량 기록에 맞춘 연결 설정 (WAL 저널, 동기화 완화)"""
+        cursor = self.conn.cursor()
+        if self.db_path != ":memory:":
+            # 읽기와 쓰기가 서로 막지 않고, 커밋마다 전체 저널을 다시 쓰지 않음
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # 무작위 UUID 키로 인덱스 페이지를 자주 오가므로 페이지 캐시를 넉넉히 (64MB)
+        cursor.execute("PRAGMA cache_size=-65536")
+        
+    def insert_many(self, sql, rows, chunk_size=5000):
+        """
+        여러 행을 청크 단위 트랜잭션으로 기록
+        Args:
+            sql (str): INSERT 문
+            rows (iterable): 기록할 행 (제너레이터 가능)
+            chunk_size (int): 한 트랜잭션에 기록할 행 수
+        Returns:
+            int: 기록한 행 수
+        """
+        cursor = self.conn.cursor()
+        total = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                with self.conn:
+                    cursor.executemany(sql, chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            with self.conn:
+                cursor.executemany(sql, chunk)
+            total += len(chunk)
+        return total
         
     def init_tables(self):
         """필요한 테이블들을 생성"""
@@ -95,6 +164,16 @@ class GameEconomyDatabase:
             )
         ''')
         
+        # 일일 정산 내역 - 날짜별 사용자 지급액 (같은 날짜를 다시 정산할 때 되돌리는 데 사용)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_settlements (
+                date DATE,
+                user_id TEXT,
+                share REAL,
+                PRIMARY KEY (date, user_id)
+            )
+        ''')
+        
         # 콘텐츠 라이브러리 - 사용자가 만든 콘텐츠 관리
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS content_library (
@@ -112,8 +191,33 @@ class GameEconomyDatabase:
             )
         ''')
         
+        self.create_indexes()
+        
         self.conn.commit()
         print("✅ 게임 경제 데이터베이스 초기화 완료")
+    
+    # 조회 조건에 쓰이는 컬럼 인덱스 {이름: (테이블, 컬럼)}
+    SECONDARY_INDEXES = {
+        'idx_activity_log_user_id': ('activity_log', 'user_id'),
+        'idx_activity_log_timestamp': ('activity_log', 'timestamp'),
+        'idx_content_library_user_id': ('content_library', 'user_id'),
+        # 일일 정산 집계가 테이블을 읽지 않고 인덱스만으로 끝나도록 하는 커버링 인덱스
+        'idx_activity_log_settlement': ('activity_log', 'timestamp, user_id, quality_score'),
+    }
+    
+    def create_indexes(self):
+        """보조 인덱스 생성 (이미 있으면 무시)"""
+        cursor = self.conn.cursor()
+        for name, (table, column) in self.SECONDARY_INDEXES.items():
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})')
+        self.conn.commit()
+    
+    def drop_indexes(self):
+        """보조 인덱스 삭제 (대량 기록 후 create_indexes로 한 번에 다시 생성)"""
+        cursor = self.conn.cursor()
+        for name in self.SECONDARY_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+        self.conn.commit()
 
 class SorisayAIPartner:
     """소리새 AI 파트너 - 사용자와 협업하는 AI 시스템"""
@@ -276,9 +380,14 @@ class SorisayAIPartner:
 class GameEconomyEngine:
     """게임 경제 엔진 - 전체 경제 시스템의 핵심"""
     
-    def __init__(self):
-        """경제 엔진 초기화"""
-        self.db = GameEconomyDatabase()
+    def __init__(self, db_path="game_economy.db", initial_users=None):
+        """
+        경제 엔진 초기화
+        Args:
+            db_path (str): 데이터베이스 파일 경로
+            initial_users (int): 생성할 가상 사용자 수 (None이면 기본 구성, 0이면 생성 안 함)
+        """
+        self.db = GameEconomyDatabase(db_path)
         self.ai_partner = SorisayAIPartner()
         
         # 경제 시스템 파라미터
@@ -300,13 +409,22 @@ class GameEconomyEngine:
         }
         
         # 경제 시뮬레이션을 위한 가상 사용자 생성
-        self.simulate_initial_economy()
+        if initial_users != 0:
+            self.simulate_initial_economy(initial_users)
         
         print("💰 게임 경제 엔진 초기화 완료!")
     
-    def simulate_initial_economy(self):
-        """초기 경제 시뮬레이션을 위한 가상 데이터 생성"""
+    def simulate_initial_economy(self, total_users=None, chunk_size=5000):
+        """
+        초기 경제 시뮬레이션을 위한 가상 데이터 생성
+        Args:
+            total_users (int): 생성할 사용자 수 (None이면 기본 구성 10,600명, 타입 비율은 유지)
+            chunk_size (int): 한 트랜잭션에 기록할 사용자 수
+        Returns:
+            dict: 생성한 사용자/활동 수와 소요 시간
+        """
         print("🎭 가상 사용자 생성 중...")
+        started = time.perf_counter()
         
         # 다양한 사용자 타입 생성
         user_types = [
@@ -315,133 +433,230 @@ class GameEconomyEngine:
             {'type': 'power_user', 'count': 100, 'avg_earning': 75.0},
             {'type': 'social', 'count': 2000, 'avg_earning': 15.0}
         ]
+        if total_users is not None:
+            user_types = self._scale_user_types(user_types, total_users)
         
+        activity_types = ['content_creation', 'ad_viewing', 'social_interaction']
+        descriptions = {t: f"{t.replace('_', ' ').title()} 활동" for t in activity_types}
+        now = datetime.now()
+        # 최근 7일 활동 (어댑터와 같은 ISO 문자열로 미리 변환하여 행마다 변환하지 않음)
+        activity_dates = [(now - timedelta(days=day)).isoformat() for day in range(7)]
+        
+        # 빈 DB에 대량으로 넣을 때는 인덱스를 나중에 한 번에 만드는 편이 빠름
         cursor = self.db.conn.cursor()
+        defer_indexes = cursor.execute('SELECT 1 FROM activity_log LIMIT 1').fetchone() is None
+        if defer_indexes:
+            self.db.drop_indexes()
+        
+        users = []
+        activities = []
+        user_count = 0
+        activity_count = 0
         
         for user_type in user_types:
+            avg_earning = user_type['avg_earning']
             for i in range(user_type['count']):
                 user_id = str(uuid.uuid4())
-                username = f"{user_type['type']}_user_{i+1}"
-                
-                # 사용자 생성
-                cursor.execute('''
-                    INSERT OR REPLACE INTO users 
-                    (user_id, username, total_earnings, daily_earnings, level) 
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    user_id, username, 
-                    user_type['avg_earning'] * random.uniform(5, 30),  # 총 수익
-                    user_type['avg_earning'] * random.uniform(0.8, 1.2),  # 일일 수익
+                users.append((
+                    user_id, f"{user_type['type']}_user_{i+1}",
+                    avg_earning * random.uniform(5, 30),  # 총 수익
+                    avg_earning * random.uniform(0.8, 1.2),  # 일일 수익
                     random.randint(1, 10)  # 레벨
                 ))
                 
                 # 활동 기록 생성
-                for day in range(7):  # 최근 7일 활동
+                for activity_date in activity_dates:
                     if random.random() < 0.7:  # 70% 확률로 활동
-                        activity_id = str(uuid.uuid4())
-                        activity_type = random.choice(['content_creation', 'ad_viewing', 'social_interaction'])
-                        earnings = user_type['avg_earning'] * random.uniform(0.5, 1.5)
-                        quality_score = random.uniform(5.0, 9.5)
-                        
-                        activity_date = datetime.now() - timedelta(days=day)
-                        
-                        cursor.execute('''
-                            INSERT INTO activity_log 
-                            (activity_id, user_id, activity_type, activity_description, earnings, quality_score, timestamp)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            activity_id, user_id, activity_type,
-                            f"{activity_type.replace('_', ' ').title()} 활동",
-                            earnings, quality_score, activity_date
+                        activity_type = random.choice(activity_types)
+                        activities.append((
+                            str(uuid.uuid4()), user_id, activity_type, descriptions[activity_type],
+                            avg_earning * random.uniform(0.5, 1.5),  # 수익
+                            random.uniform(5.0, 9.5),  # 품질 점수
+                            activity_date
                         ))
-        
-        self.db.conn.commit()
-        print(f"✅ 가상 사용자 {sum(ut['count'] for ut in user_types)}명 생성 완료!")
+                
+                if len(users) >= chunk_size:
+                    user_count += len(users)
+                    activity_count += len(activities)
+                    self._write_seed_chunk(users, activities)
+                    users, activities = [], []
+        
+        if users:
+            user_count += len(users)
+            activity_count += len(activities)
+            self._write_seed_chunk(users, activities)
+        
+        if defer_indexes:
+            self.db.create_indexes()
+        
+        elapsed = time.perf_counter() - started
+        print(f"✅ 가상 사용자 {user_count:,}명 생성 완료! (활동 {activity_count:,}건, {elapsed:.2f}초)")
+        return {'users': user_count, 'activities': activity_count, 'seconds': elapsed}
     
-    def calculate_daily_revenue_distribution(self):
-        """일일 광고 수익 계산 및 분배"""
-        cursor = self.db.conn.cursor()
-        
-        # 오늘 활동한 사용자 수 조회
-        today = datetime.now().date()
-        cursor.execute('''
-            SELECT COUNT(DISTINCT user_id) FROM activity_log 
-            WHERE DATE(timestamp) = ?
-        ''', (today,))
-        
-        active_users = cursor.fetchone()[0] or 1000  # 기본값 1000명
-        
-        # 총 광고 수익 계산
-        ads_per_user = random.uniform(8, 15)  # 사용자당 광고 시청 수
-        total_ad_revenue = active_users * ads_per_user * self.economy_config['base_ad_revenue_per_user']
-        
-        # 사용자 분배 금액
-        user_distribution_amount = total_ad_revenue * self.economy_config['user_distribution_rate']
-        
-        # 개별 사용자 수익 계산 및 분배
-        cursor.execute('''
-            SELECT user_id, COUNT(*) as activity_count, AVG(quality_score) as avg_quality
-            FROM activity_log 
-            WHERE DATE(timestamp) = ?
-            GROUP BY user_id
-        ''', (today,))
-        
-        user_activities = cursor.fetchall()
-        total_activity_weight = 0
-        
-        # 가중치 계산 (활동량 + 품질)
-        for user_id, activity_count, avg_quality in user_activities:
-            weight = activity_count * (avg_quality / 10)
-            total_activity_weight += weight
-        
-        # 각 사용자에게 수익 분배
-        user_earnings = {}
-        for user_id, activity_count, avg_quality in user_activities:
-            weight = activity_count * (avg_quality / 10)
+    def _scale_user_types(self, user_types, total_users):
+        """사용자 타입 비율을 유지하면서 총 사용자 수 조정"""
+        base_total = sum(ut['count'] for ut in user_types)
+        scaled = [dict(ut, count=int(ut['count'] * total_users / base_total)) for ut in user_types]
+        # 반올림 오차는 가장 큰 그룹에 반영
+        largest = max(scaled, key=lambda ut: ut['count'])
+        largest['count'] += total_users - sum(ut['count'] for ut in scaled)
+        return scaled
+    
+    def _write_seed_chunk(self, users, activities):
+        """사용자와 활동 묶음을 한 트랜잭션으로 기록"""
+        with self.db.conn:
+            cursor = self.db.conn.cursor()
+            cursor.executemany(GameEconomyDatabase.USER_INSERT_SQL, users)
+            cursor.executemany(GameEconomyDatabase.ACTIVITY_INSERT_SQL, activities)
+    
+    def calculate_daily_revenue_distribution(self, day=None, verbose=True):
+        """
+        일일 광고 수익 계산 및 분배 (집합 단위 정산)
+        활동 집계, 가중치 계산, 일일 최대 수익 제한을 모두 SQL에서 처리하고
+        사용자 수익은 한 번의 UPDATE로 반영합니다.
+        Args:
+            day (date): 정산할 날짜 (None이면 오늘)
+            verbose (bool): 정산 결과 출력 여부
+        Returns:
+            dict: 정산 결과
+        """
+        day = day or datetime.now().date()
+        # 날짜 문자열 범위 조건은 timestamp 인덱스를 사용할 수 있음
+        # ('YYYY-MM-DD HH:MM:SS'와 'YYYY-MM-DDTHH:MM:SS' 형식 모두 포함)
+        day_range = (day.isoformat(), (day + timedelta(days=1)).isoformat())
+        
+        with self.db.conn:
+            cursor = self.db.conn.cursor()
+            cursor.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS settlement_weights (
+                    user_id TEXT PRIMARY KEY,
+                    activity_count INTEGER,
+                    avg_quality REAL,
+                    weight REAL,
+                    share REAL
+                )
+            ''')
+            cursor.execute('DELETE FROM settlement_weights')
+            
+            # 사용자별 활동량과 평균 품질을 한 번에 집계 (가중치 = 활동량 × 품질/10)
+            cursor.execute('''
+                INSERT INTO settlement_weights (user_id, activity_count, avg_quality, weight)
+                SELECT user_id, COUNT(*), AVG(quality_score), COUNT(*) * AVG(quality_score) / 10.0
+                FROM activity_log
+                WHERE timestamp >= ? AND timestamp < ?
+                GROUP BY user_id
+            ''', day_range)
+            
+            participants, total_activity_weight = cursor.execute(
+                'SELECT COUNT(*), COALESCE(SUM(weight), 0) FROM settlement_weights'
+            ).fetchone()
+            active_users = participants or 1000  # 기본값 1000명
+            
+            # 총 광고 수익 계산
+            ads_per_user = random.uniform(8, 15)  # 사용자당 광고 시청 수
+            total_ad_revenue = active_users * ads_per_user * self.economy_config['base_ad_revenue_per_user']
+            
+            # 사용자 분배 금액
+            user_distribution_amount = total_ad_revenue * self.economy_config['user_distribution_rate']
+            
+            # 이미 정산한 날짜를 다시 정산하면 (force) 그날 지급한 몫을 먼저 되돌림
+            cursor.execute('''
+                UPDATE users
+                SET total_earnings = total_earnings - (
+                    SELECT d.share FROM daily_settlements AS d
+                    WHERE d.date = ? AND d.user_id = users.user_id
+                )
+                WHERE user_id IN (SELECT user_id FROM daily_settlements WHERE date = ?)
+            ''', (day.isoformat(), day.isoformat()))
+            cursor.execute('DELETE FROM daily_settlements WHERE date = ?', (day.isoformat(),))
             
             if total_activity_weight > 0:
-                user_share = (weight / total_activity_weight) * user_distribution_amount
-                # 일일 최대 수익 제한
-                user_share = min(user_share, self.economy_config['max_daily_earnings'])
-                user_earnings[user_id] = user_share
+                # 가중치 비율로 분배하고 일일 최대 수익 제한 (어뷰징 방지)
+                cursor.execute('''
+                    UPDATE settlement_weights
+                    SET share = MIN(weight / ? * ?, ?)
+                ''', (total_activity_weight, user_distribution_amount,
+                      self.economy_config['max_daily_earnings']))
+                cursor.execute('''
+                    INSERT INTO daily_settlements (date, user_id, share)
+                    SELECT ?, user_id, share FROM settlement_weights
+                ''', (day.isoformat(),))
                 
-                # 사용자 수익 업데이트
+                # 사용자 수익 일괄 업데이트
+                # (UPDATE ... FROM은 SQLite 3.33+ 전용이라 이전 버전에서도 되는 상관 서브쿼리 사용,
+                #  settlement_weights.user_id가 기본 키라 사용자마다 색인 조회 한 번)
                 cursor.execute('''
-                    UPDATE users 
-                    SET daily_earnings = ?, total_earnings = total_earnings + ?
-                    WHERE user_id = ?
-                ''', (user_share, user_share, user_id))
-        
-        # 일일 통계 저장
-        cursor.execute('''
-            INSERT OR REPLACE INTO ad_revenue_pool 
-            (date, total_ad_revenue, total_users, avg_ads_per_user) 
-            VALUES (?, ?, ?, ?)
-        ''', (today, total_ad_revenue, active_users, ads_per_user))
-        
-        self.db.conn.commit()
+                    UPDATE users
+                    SET daily_earnings = (
+                            SELECT s.share FROM settlement_weights AS s WHERE s.user_id = users.user_id
+                        ),
+                        total_earnings = total_earnings + (
+                            SELECT s.share FROM settlement_weights AS s WHERE s.user_id = users.user_id
+                        )
+                    WHERE user_id IN (SELECT user_id FROM settlement_weights)
+                ''')
+            
+            # 일일 통계 저장 (정산 완료 표시를 겸함)
+            cursor.execute('''
+                INSERT OR REPLACE INTO ad_revenue_pool 
+                (date, total_ad_revenue, total_users, avg_ads_per_user) 
+                VALUES (?, ?, ?, ?)
+            ''', (day, total_ad_revenue, active_users, ads_per_user))
         
         # 실시간 통계 업데이트
-        avg_earning = user_distribution_amount / len(user_activities) if user_activities else 0
+        avg_earning = user_distribution_amount / participants if participants else 0
         self.real_time_stats.update({
             'active_users': active_users,
             'total_daily_revenue': total_ad_revenue,
             'average_user_earning': avg_earning,
-            'content_creation_rate': len(user_activities) / active_users if active_users > 0 else 0
+            'content_creation_rate': participants / active_users if active_users > 0 else 0
         })
         
-        print(f"💰 일일 수익 분배 완료:")
-        print(f"  📊 총 광고 수익: ${total_ad_revenue:,.2f}")
-        print(f"  👥 활성 사용자: {active_users:,}명")
-        print(f"  💵 평균 개인 수익: ${avg_earning:.2f}")
+        if verbose:
+            print(f"💰 일일 수익 분배 완료 ({day}):")
+            print(f"  📊 총 광고 수익: ${total_ad_revenue:,.2f}")
+            print(f"  👥 활성 사용자: {active_users:,}명")
+            print(f"  💵 평균 개인 수익: ${avg_earning:.2f}")
         
         return {
+            'date': day,
             'total_revenue': total_ad_revenue,
             'distributed_amount': user_distribution_amount,
             'active_users': active_users,
             'average_earning': avg_earning
         }
     
+    def settle_days(self, start_day, end_day=None, force=False, verbose=False):
+        """
+        기간 내 날짜를 하루씩 정산 (장애 후 누락된 날짜 보충용)
+        이미 정산된 날짜(ad_revenue_pool에 기록된 날짜)는 건너뛰므로
+        중간에 중단되어도 다시 실행하면 남은 날짜만 처리합니다.
+        Args:
+            start_day (date): 시작 날짜
+            end_day (date): 마지막 날짜 (포함, None이면 어제)
+            force (bool): 이미 정산된 날짜도 다시 정산
+            verbose (bool): 날짜별 결과 출력 여부
+        Returns:
+            list: 이번에 정산한 날짜별 결과
+        """
+        end_day = end_day or (datetime.now().date() - timedelta(days=1))
+        cursor = self.db.conn.cursor()
+        settled = {
+            row[0] for row in cursor.execute(
+                'SELECT date FROM ad_revenue_pool WHERE date >= ? AND date <= ?',
+                (start_day.isoformat(), end_day.isoformat()))
+        }
+        
+        results = []
+        day = start_day
+        while day <= end_day:
+            if force or day.isoformat() not in settled:
+                results.append(self.calculate_daily_revenue_distribution(day, verbose=verbose))
+            day += timedelta(days=1)
+        
+        print(f"📅 정산 완료: {len(results)}일 처리 ({len(settled) if not force else 0}일은 이미 정산됨)")
+        return results
+    
     def create_user_activity(self, user_id, activity_type, activity_details=None):
         """
         사용자 활동 생성 및 수익 계산
@@ -485,14 +700,15 @@ class GameEconomyEngine:
         duration = activity_details.get('duration_minutes', random.randint(15, 120))
         
         # 활동 기록 저장
+        # 정산 날짜 기준(로컬 날짜)과 맞도록 현재 로컬 시각을 기록
         cursor.execute('''
             INSERT INTO activity_log 
-            (activity_id, user_id, activity_type, activity_description, earnings, duration_minutes, quality_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (activity_id, user_id, activity_type, activity_description, earnings, duration_minutes, quality_score, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             activity_id, user_id, activity_type,
             activity_details.get('description', f"{activity_type} 활동"),
-            final_earnings, duration, quality_score
+            final_earnings, duration, quality_score, datetime.now()
         ))
         
         # 사용자 경험치 및 레벨 업데이트
@@ -509,7 +725,7 @@ class GameEconomyEngine:
         cursor.execute('SELECT experience_points, level FROM users WHERE user_id = ?', (user_id,))
         exp, current_level = cursor.fetchone()
         
-        new_level = (exp // self.economy_config['level_up_threshold']) + 1
+        new_level = int(exp // self.economy_config['level_up_threshold']) + 1
         if new_level > current_level:
             cursor.execute('UPDATE users SET level = ? WHERE user_id = ?', (new_level, user_id))
             print(f"🎉 사용자 레벨업! Lv.{current_level} → Lv.{new_level}")
@@ -532,9 +748,22 @@ class GameEconomyEngine:
 class GameEconomySimulator:
     """게임 경제 시뮬레이터 - 실시간 시뮬레이션 및 데모"""
     
-    def __init__(self):
-        """시뮬레이터 초기화"""
-        self.economy_engine = GameEconomyEngine()
+    # 배치 시뮬레이션 활동 종류 (실시간 시뮬레이션과 동일)
+    BATCH_ACTIVITY_TYPES = ['content_creation', 'ad_viewing', 'social_interaction',
+                            'tutorial_creation', 'community_moderation']
+    _BATCH_DESCRIPTIONS = [f"배치 {t.replace('_', ' ').title()}" for t in BATCH_ACTIVITY_TYPES]
+    _BATCH_BASE_EARNINGS = [20.0, 2.0, 5.0, 35.0, 15.0]
+    # 하루 중 초 단위 시각 문자열 (행마다 datetime 변환을 하지 않도록 미리 생성)
+    _TIME_OF_DAY = [f"T{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)]
+    
+    def __init__(self, db_path="game_economy.db", initial_users=None):
+        """
+        시뮬레이터 초기화
+        Args:
+            db_path (str): 데이터베이스 파일 경로
+            initial_users (int): 생성할 가상 사용자 수 (None이면 기본 구성)
+        """
+        self.economy_engine = GameEconomyEngine(db_path, initial_users)
         self.simulation_running = False
         
     def run_real_time_simulation(self, duration_minutes=5):
@@ -558,6 +787,9 @@ class GameEconomySimulator:
             'user_interactions': 0
         }
         
+        # 사용자 ID는 한 번만 읽어 두고 메모리에서 추출 (활동마다 ORDER BY RANDOM() 정렬 방지)
+        user_ids = [row[0] for row in self.economy_engine.db.conn.execute('SELECT user_id FROM users')]
+        
         while time.time() < end_time and self.simulation_running:
             # 매 10초마다 새로운 활동 시뮬레이션
             try:
@@ -566,12 +798,8 @@ class GameEconomySimulator:
                 
                 for _ in range(num_activities):
                     # 랜덤 사용자 선택
-                    cursor = self.economy_engine.db.conn.cursor()
-                    cursor.execute('SELECT user_id FROM users ORDER BY RANDOM() LIMIT 1')
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        user_id = result[0]
+                    if user_ids:
+                        user_id = random.choice(user_ids)
                         
                         # 랜덤 활동 타입 선택
                         activity_type = random.choice([
@@ -628,6 +856,173 @@ class GameEconomySimulator:
         
         return simulation_stats
     
+    def run_batch_simulation(self, days=1, activities_per_user=3.0, seed=42,
+                             start_day=None, chunk_size=20000, settle=True):
+        """
+        헤드리스 배치 시뮬레이션 (대기 없이 CPU 속도로 하루 단위 진행)
+        사용자 ID를 메모리 배열로 한 번 읽어 두고 하루치 활동을 한꺼번에 생성한 뒤
+        청크 단위 트랜잭션으로 기록합니다. NumPy가 있으면 배열 연산으로 생성합니다.
+        같은 seed면 같은 활동이 생성됩니다 (NumPy 사용 여부에 따라 수열은 다름).
+        Args:
+            days (int): 시뮬레이션할 일 수
+            activities_per_user (float): 사용자당 하루 평균 활동 수
+            seed (int): 난수 시드
+            start_day (date): 첫 시뮬레이션 날짜 (None이면 오늘부터 days일 전)
+            chunk_size (int): 한 트랜잭션에 기록할 행 수
+            settle (bool): 날짜마다 일일 수익 분배 실행
+        Returns:
+            dict: 전체 통계와 날짜별 결과
+        """
+        engine = self.economy_engine
+        rowids, user_ids = [], []
+        # rowid 순서로 고정 (인덱스 순서는 무작위 UUID에 따라 달라져 시드 재현성이 깨짐)
+        for rowid, user_id in engine.db.conn.execute('SELECT rowid, user_id FROM users ORDER BY rowid'):
+            rowids.append(rowid)
+            user_ids.append(user_id)
+        if not user_ids:
+            print("⚠ 시뮬레이션할 사용자가 없습니다")
+            return None
+        
+        start_day = start_day or (datetime.now().date() - timedelta(days=days))
+        generate = self._generate_batch_numpy if np is not None else self._generate_batch_python
+        print(f"⚡ 배치 시뮬레이션 시작: 사용자 {len(user_ids):,}명 × {days}일 "
+              f"({'NumPy' if np is not None else 'Python'} 생성)")
+        
+        run_prefix = uuid.uuid4().hex[:12]
+        threshold = engine.economy_config['level_up_threshold']
+        totals = {
+            'total_activities': 0,
+            'total_earnings': 0.0,
+            'content_created': 0,
+            'user_interactions': 0
+        }
+        daily_results = []
+        started = time.perf_counter()
+        
+        for day_index in range(days):
+            day = start_day + timedelta(days=day_index)
+            day_started = time.perf_counter()
+            batch = generate(len(user_ids), activities_per_user, seed + day_index)
+            
+            # 활동 기록
+            date_prefix = day.isoformat()
+            id_prefix = f"{run_prefix}-{date_prefix}-"
+            activity_types = self.BATCH_ACTIVITY_TYPES
+            descriptions = self._BATCH_DESCRIPTIONS
+            time_of_day = self._TIME_OF_DAY
+            rows = (
+                (id_prefix + str(i), user_ids[u], activity_types[t], descriptions[t],
+                 earning, duration, quality, date_prefix + time_of_day[second])
+                for i, (u, t, earning, duration, quality, second) in enumerate(zip(
+                    batch['user_index'], batch['type_index'], batch['earnings'],
+                    batch['duration'], batch['quality'], batch['second']))
+            )
+            count = engine.db.insert_many(GameEconomyDatabase.BATCH_ACTIVITY_INSERT_SQL, rows, chunk_size)
+            
+            # 경험치와 레벨은 사용자별로 합산하여 한 번씩만 갱신
+            last_active = date_prefix + time_of_day[-1]
+            updates = (
+                (gained, gained, threshold, last_active, rowids[u])
+                for u, gained in batch['experience'].items()
+            )
+            engine.db.insert_many(GameEconomyDatabase.BATCH_EXPERIENCE_UPDATE_SQL, updates, chunk_size)
+            
+            revenue = engine.calculate_daily_revenue_distribution(day, verbose=False) if settle else None
+            
+            totals['total_activities'] += count
+            totals['total_earnings'] += batch['total_earnings']
+            totals['content_created'] += batch['content_created']
+            totals['user_interactions'] += batch['user_interactions']
+            day_seconds = time.perf_counter() - day_started
+            daily_results.append({'date': day, 'activities': count, 'seconds': day_seconds, 'revenue': revenue})
+            print(f"  📅 {day}: 활동 {count:,}건 | 수익 ${batch['total_earnings']:,.2f} | {day_seconds:.2f}초")
+        
+        elapsed = time.perf_counter() - started
+        totals.update({
+            'days': days,
+            'users': len(user_ids),
+            'seconds': elapsed,
+            'activities_per_second': totals['total_activities'] / elapsed if elapsed > 0 else 0.0,
+            'daily': daily_results
+        })
+        print(f"✅ 배치 시뮬레이션 완료: 활동 {totals['total_activities']:,}건, {elapsed:.2f}초 "
+              f"({totals['activities_per_second']:,.0f}건/초)")
+        return totals
+    
+    def _batch_parameters(self):
+        """create_user_activity와 같은 품질/수익 계산 상수"""
+        engine = self.economy_engine
+        ai_boost = engine.ai_partner.capabilities.get('creative_assistance', 8.0) / 10 * 3
+        return ai_boost, engine.economy_config['quality_bonus_multiplier'] / 10
+    
+    def _generate_batch_numpy(self, user_count, activities_per_user, seed):
+        """하루치 활동을 NumPy 배열로 생성"""
+        rng = np.random.default_rng(seed)
+        ai_boost, multiplier = self._batch_parameters()
+        n = int(rng.poisson(user_count * activities_per_user))
+        
+        user_index = rng.integers(0, user_count, n)
+        type_index = rng.integers(0, len(self.BATCH_ACTIVITY_TYPES), n)
+        quality = rng.uniform(5.0, 7.5, n)
+        # 40% 확률로 AI 협업, 콘텐츠 제작이면 품질 향상
+        boosted = (rng.random(n) < 0.4) & (type_index == 0)
+        quality[boosted] = np.minimum(10.0, quality[boosted] + ai_boost)
+        earnings = np.asarray(self._BATCH_BASE_EARNINGS)[type_index] * quality * multiplier
+        experience = (earnings * 10).astype(np.int64)
+        
+        per_user = np.bincount(user_index, weights=experience, minlength=user_count).astype(np.int64)
+        active = np.nonzero(per_user)[0]
+        return {
+            'user_index': user_index.tolist(),
+            'type_index': type_index.tolist(),
+            'earnings': earnings.tolist(),
+            'duration': rng.integers(10, 61, n).tolist(),
+            'quality': quality.tolist(),
+            'second': np.sort(rng.integers(0, 86400, n)).tolist(),
+            'experience': dict(zip(active.tolist(), per_user[active].tolist())),
+            'total_earnings': float(earnings.sum()),
+            'content_created': int(np.count_nonzero((type_index == 0) | (type_index == 3))),
+            'user_interactions': int(np.count_nonzero(type_index == 2)),
+        }
+    
+    def _generate_batch_python(self, user_count, activities_per_user, seed):
+        """하루치 활동을 순수 Python으로 생성 (NumPy가 없을 때)"""
+        rng = random.Random(seed)
+        rand = rng.random
+        ai_boost, multiplier = self._batch_parameters()
+        expected = user_count * activities_per_user
+        n = max(0, int(round(rng.gauss(expected, expected ** 0.5))))
+        base_earnings = self._BATCH_BASE_EARNINGS
+        type_count = len(self.BATCH_ACTIVITY_TYPES)
+        
+        user_index = [int(rand() * user_count) for _ in range(n)]
+        type_index = [int(rand() * type_count) for _ in range(n)]
+        quality = []
+        earnings = []
+        experience = defaultdict(int)
+        for u, t in zip(user_index, type_index):
+            q = 5.0 + rand() * 2.5
+            # 40% 확률로 AI 협업, 콘텐츠 제작이면 품질 향상
+            if rand() < 0.4 and t == 0:
+                q = min(10.0, q + ai_boost)
+            earning = base_earnings[t] * q * multiplier
+            quality.append(q)
+            earnings.append(earning)
+            experience[u] += int(earning * 10)
+        
+        return {
+            'user_index': user_index,
+            'type_index': type_index,
+            'earnings': earnings,
+            'duration': [10 + int(rand() * 51) for _ in range(n)],
+            'quality': quality,
+            'second': sorted(int(rand() * 86400) for _ in range(n)),
+            'experience': experience,
+            'total_earnings': sum(earnings),
+            'content_created': sum(1 for t in type_index if t == 0 or t == 3),
+            'user_interactions': type_index.count(2),
+        }
+    
     def print_simulation_results(self, simulation_stats, revenue_distribution):
         """시뮬레이션 결과 출력"""
         print("\n" + "=" * 80)
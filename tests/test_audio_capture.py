@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+연속 음성 수집(구절 분할, 제한된 큐, 주기적 보정, 오디오 파일 입력) 테스트
+"""
+
+import sys
+import os
+import math
+import struct
+import shutil
+import tempfile
+import threading
+import time
+import wave
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import speech_recognition as sr
+
+from modules.ai_code_manager.audio_capture import AudioCapture
+from modules.ai_code_manager.speech_output import FakeSpeechEngine, SpeechOutput
+
+SAMPLE_RATE = 16000
+
+
+def write_phrases_wav(path, bursts, burst_seconds=0.6, gap_seconds=2.0):
+    """무음 사이에 bursts개의 소리 구간이 있는 WAV 생성"""
+    def silence(seconds):
+        return [0] * int(SAMPLE_RATE * seconds)
+
+    def tone(seconds):
+        return [int(12000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(int(SAMPLE_RATE * seconds))]
+
+    samples = silence(gap_seconds)
+    for _ in range(bursts):
+        samples += tone(burst_seconds) + silence(gap_seconds)
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSource:
+    """with 문으로 열고 닫는 가짜 마이크"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class ScriptedRecognizer:
+    """listen 호출마다 스크립트의 구절을 돌려주는 가짜 인식기 (스크립트가 끝나면 무음)"""
+
+    def __init__(self, script, clock=None, seconds_per_phrase=0.0):
+        self.script = list(script)
+        self.clock = clock
+        self.seconds_per_phrase = seconds_per_phrase
+        self.silent_listens = 0
+
+    def adjust_for_ambient_noise(self, source, duration=1):
+        pass
+
+    def listen(self, source, timeout=None, phrase_time_limit=None):
+        if not self.script:
+            self.silent_listens += 1
+            threading.Event().wait(0.01)
+            raise sr.WaitTimeoutError("무음")
+        if self.clock is not None:
+            self.clock.now += self.seconds_per_phrase
+        return self.script.pop(0)
+
+
+def wait_until(condition, timeout=2.0):
+    """조건이 참이 될 때까지 대기"""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return True
+        threading.Event().wait(0.01)
+    return condition()
+
+
+def test_audio_file_segmentation():
+    """sr.AudioFile 입력을 무음 기준으로 구절별로 잘라 큐에 넣고 파일 끝에서 끝나는지 확인"""
+    print("✓ 테스트 1: 오디오 파일 구절 분할")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "phrases.wav")
+        write_phrases_wav(path, bursts=3)
+        recognizer = sr.Recognizer()
+        capture = AudioCapture(recognizer, lambda: sr.AudioFile(path), queue_size=8)
+        capture.start()
+
+        phrases = []
+        while True:
+            phrase = capture.get(timeout=5)
+            if phrase is None:
+                break
+            phrases.append(phrase)
+        capture.stop()
+
+        durations = [len(p.audio.frame_data) / (SAMPLE_RATE * 2) for p in phrases]
+        if len(phrases) != 3 or not capture.exhausted or capture.stats["calibrations"] != 1:
+            print(f"  ❌ 구절 {len(phrases)}개 {durations}, 통계 {capture.stats}")
+            return False
+        if any(not 0.6 <= d <= 2.0 for d in durations):
+            print(f"  ❌ 구절 길이 {durations}")
+            return False
+        print(f"  ✅ 구절 3개 ({', '.join(f'{d:.2f}초' for d in durations)}), 보정 1회")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_capture_overlaps_recognition():
+    """앞 구절을 인식하는 동안 다음 구절 수집이 계속되고, 큐가 차면 오래된 구절을 버리는지 확인"""
+    print("✓ 테스트 2: 인식과 수집 겹침, 제한된 큐")
+    recognizer = ScriptedRecognizer(["구절 1", "구절 2"])
+    capture = AudioCapture(recognizer, FakeSource)
+    capture.start()
+    try:
+        first = capture.get(timeout=2)
+        # 구절 1을 '인식'하는 동안 (get을 다시 부르기 전에) 수집 스레드가 구절 2를 큐에 넣음
+        if first.audio != "구절 1" or not wait_until(lambda: capture.phrases.qsize() == 1):
+            print("  ❌ 인식 중 다음 구절이 수집되지 않음")
+            return False
+    finally:
+        capture.stop()
+
+    recognizer = ScriptedRecognizer([f"구절 {i}" for i in range(10)])
+    capture = AudioCapture(recognizer, FakeSource, queue_size=3)
+    capture.start()
+    try:
+        wait_until(lambda: recognizer.silent_listens > 0)
+        queued = [capture.get(timeout=1).audio for _ in range(3)]
+        if queued != ["구절 7", "구절 8", "구절 9"] or capture.stats["dropped_full"] != 7:
+            print(f"  ❌ 큐 {queued}, 통계 {capture.stats}")
+            return False
+    finally:
+        capture.stop()
+    print("  ✅ 인식 중 다음 구절 대기, 큐 3개 유지 (오래된 구절 7개 버림)")
+    return True
+
+
+def test_periodic_calibration_and_mute():
+    """보정은 간격이 지났을 때만 다시 하고, 음소거 중 들린 구절은 버리는지 확인"""
+    print("✓ 테스트 3: 주기적 재보정과 음소거")
+    clock = FakeClock()
+    recognizer = ScriptedRecognizer([f"구절 {i}" for i in range(6)], clock=clock, seconds_per_phrase=25.0)
+    # 처음 두 구절(25초, 50초)은 소리새가 말하는 중에 들림
+    capture = AudioCapture(recognizer, FakeSource, queue_size=8, calibration_interval=60.0,
+                           mute=lambda start, end: end <= 50, clock=clock)
+    capture.start()
+    try:
+        wait_until(lambda: recognizer.silent_listens > 0)
+    finally:
+        capture.stop()
+
+    received = []
+    while not capture.phrases.empty():
+        received.append(capture.phrases.get_nowait().audio)
+    if capture.stats["dropped_muted"] != 2 or received != [f"구절 {i}" for i in range(2, 6)]:
+        print(f"  ❌ 받은 구절 {received}, 통계 {capture.stats}")
+        return False
+    # 0초(시작), 75초, 150초에만 보정 (listen 25초 간격, 보정 간격 60초)
+    if capture.stats["calibrations"] != 3:
+        print(f"  ❌ 보정 {capture.stats['calibrations']}회")
+        return False
+    print("  ✅ 음소거 중 2개 버림, 구절 4개 수신, 150초 동안 보정 3회")
+    return True
+
+
+def test_drops_phrase_overlapping_own_speech():
+    """소리새 발화가 끝난 뒤에 돌려받았더라도 녹음 구간이 발화와 겹친 구절은 버리는지 확인"""
+    print("✓ 테스트 4: 자기 목소리 구절 버림")
+    speech = SpeechOutput(lambda: FakeSpeechEngine(seconds_per_char=0.02))
+    speech.start()
+    prompt = speech.say("다시 말씀해 주세요", 150)  # 약 0.2초 재생
+
+    class EchoRecognizer(ScriptedRecognizer):
+        """첫 구절: 안내 음성을 녹음한 1초 구절 (안내가 끝난 뒤 반환)
+        두 번째 구절: 안내가 끝나고 0.4초 뒤 시작한 0.1초 구절"""
+
+        def listen(self, source, timeout=None, phrase_time_limit=None):
+            if not self.script:
+                return super().listen(source, timeout, phrase_time_limit)
+            seconds = self.script.pop(0)
+            if seconds == 1.0:
+                prompt.wait(2.0)
+            else:
+                time.sleep(0.5)
+            return sr.AudioData(b"\0\0" * int(SAMPLE_RATE * seconds), SAMPLE_RATE, 2)
+
+    recognizer = EchoRecognizer([1.0, 0.1])
+    capture = AudioCapture(recognizer, FakeSource, queue_size=4,
+                           mute=lambda start, end: speech.spoke_during(start, end, tail=0.1))
+    capture.start()
+    try:
+        wait_until(lambda: recognizer.silent_listens > 0)
+    finally:
+        capture.stop()
+        speech.close()
+
+    if speech.busy or capture.stats["dropped_muted"] != 1 or capture.phrases.qsize() != 1:
+        print(f"  ❌ 통계 {capture.stats}, 남은 구절 {capture.phrases.qsize()}개")
+        return False
+    kept = capture.phrases.get_nowait().audio
+    if len(kept.frame_data) != int(SAMPLE_RATE * 0.1) * 2:
+        print("  ❌ 안내 음성 구절이 남음")
+        return False
+    print("  ✅ 안내 음성과 겹친 구절 버림 (반환 시점에는 이미 조용했음), 이후 구절은 수신")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 연속 음성 수집 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_audio_file_segmentation,
+        test_capture_overlaps_recognition,
+        test_periodic_calibration_and_mute,
+        test_drops_phrase_overlapping_own_speech,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+대시보드 브로드캐스트 묶음 전송(주기별 묶음, 통계 델타) 테스트
+"""
+
+import sys
+import os
+import re
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.broadcast_coalescer import BATCH_EVENT, BroadcastCoalescer
+
+
+class FakeDashboard:
+    """전송 기록과 통계를 가진 테스트용 대시보드"""
+
+    def __init__(self):
+        self.sent = []
+        self.state = {"total_commands": 0, "error_count": 0, "current_persona": "friendly"}
+        self.stats_calls = 0
+
+    def emit(self, event, data):
+        self.sent.append((event, data))
+
+    def get_stats(self):
+        self.stats_calls += 1
+        return dict(self.state)
+
+
+def test_burst_is_coalesced():
+    """명령이 몰려도 주기당 메시지 하나와 통계 계산 한 번만 하는지 확인"""
+    print("✓ 테스트 1: 몰린 명령 묶음 전송")
+    dashboard = FakeDashboard()
+    coalescer = BroadcastCoalescer(dashboard.emit, dashboard.get_stats, latest_only=("status_update",))
+
+    for i in range(100):
+        dashboard.state["total_commands"] += 1
+        coalescer.queue("voice_command", {"command": f"명령 {i}"})
+        coalescer.mark_stats_dirty()
+        coalescer.queue("status_update", {"status": f"상태 {i}"})
+
+    if not coalescer.flush() or len(dashboard.sent) != 1 or dashboard.stats_calls != 1:
+        print(f"  ❌ 전송 {len(dashboard.sent)}회, 통계 계산 {dashboard.stats_calls}회")
+        return False
+    event, payload = dashboard.sent[0]
+    commands = [item for item in payload["events"] if item["event"] == "voice_command"]
+    statuses = [item for item in payload["events"] if item["event"] == "status_update"]
+    if event != BATCH_EVENT or len(commands) != 50 or commands[-1]["data"]["command"] != "명령 99":
+        print(f"  ❌ 명령 이벤트 {len(commands)}개")
+        return False
+    if statuses != [{"event": "status_update", "data": {"status": "상태 99"}}]:
+        print(f"  ❌ 상태 이벤트 {statuses}")
+        return False
+
+    counters = coalescer.stats()
+    if counters["requested"] != 300 or counters["sent"] != 1 or counters["suppressed"] != 299 \
+            or counters["events_dropped"] != 50 or counters["events_replaced"] != 99:
+        print(f"  ❌ 카운터 {counters}")
+        return False
+    print(f"  ✅ 요청 {counters['requested']}건 → 전송 1건 (명령 50개, 마지막 상태 1개)")
+    return True
+
+
+def test_stats_delta():
+    """통계는 바뀐 항목만 보내고, 바뀐 게 없으면 보내지 않는지 확인"""
+    print("✓ 테스트 2: 통계 델타 전송")
+    dashboard = FakeDashboard()
+    coalescer = BroadcastCoalescer(dashboard.emit, dashboard.get_stats)
+
+    coalescer.mark_stats_dirty()
+    coalescer.flush()
+    if dashboard.sent[-1][1]["stats"] != dashboard.state:
+        print(f"  ❌ 첫 전송은 전체 통계여야 함: {dashboard.sent[-1]}")
+        return False
+
+    dashboard.state["error_count"] = 1
+    coalescer.mark_stats_dirty()
+    coalescer.flush()
+    if dashboard.sent[-1][1] != {"events": [], "stats": {"error_count": 1}}:
+        print(f"  ❌ 델타 {dashboard.sent[-1][1]}")
+        return False
+
+    coalescer.mark_stats_dirty()
+    if coalescer.flush() or len(dashboard.sent) != 2:
+        print("  ❌ 값이 같은데 전송됨")
+        return False
+    if coalescer.flush():
+        print("  ❌ 보낼 것이 없는데 전송됨")
+        return False
+
+    counters = coalescer.stats()
+    if counters["stats_deltas"] != 2 or counters["stats_unchanged"] != 1:
+        print(f"  ❌ 카운터 {counters}")
+        return False
+    print("  ✅ 전체 → 변경 항목 1개 → 변경 없음(생략)")
+    return True
+
+
+def test_stats_failure_keeps_events():
+    """통계 계산이 실패해도 모아 둔 이벤트를 잃지 않고 다음 주기에 보내는지 확인"""
+    print("✓ 테스트 3: 통계 실패 시 이벤트 보존")
+    dashboard = FakeDashboard()
+    failures = [AttributeError("통계 조회 실패")]
+
+    def flaky_stats():
+        if failures:
+            raise failures.pop()
+        return dashboard.get_stats()
+
+    coalescer = BroadcastCoalescer(dashboard.emit, flaky_stats, latest_only=("status_update",))
+    coalescer.queue("voice_command", {"command": "테스트"})
+    coalescer.queue("status_update", {"status": "처리 중"})
+    coalescer.mark_stats_dirty()
+    try:
+        coalescer.flush()
+        print("  ❌ 통계 실패가 전달되지 않음")
+        return False
+    except AttributeError:
+        pass
+    if dashboard.sent:
+        print(f"  ❌ 실패한 주기에 전송됨: {dashboard.sent}")
+        return False
+
+    if not coalescer.flush() or len(dashboard.sent) != 1:
+        print(f"  ❌ 다음 주기 전송 {len(dashboard.sent)}회")
+        return False
+    payload = dashboard.sent[0][1]
+    events = [item["event"] for item in payload["events"]]
+    if events != ["voice_command", "status_update"] or payload.get("stats") != dashboard.state:
+        print(f"  ❌ 다음 주기 묶음 {payload}")
+        return False
+    print("  ✅ 실패한 주기의 이벤트와 통계를 다음 주기에 전송")
+    return True
+
+
+def test_dashboard_events_sent_once():
+    """대시보드 변경이 클라이언트가 처리하는 이벤트 이름으로 한 번씩만 전송되는지 확인"""
+    print("✓ 테스트 4: 대시보드 이벤트 중복 없음")
+    import modules.sorisay_dashboard_web as dashboard_web
+
+    handled = set(re.findall(r"'(\w+)':", dashboard_web.HTML.split("const batchHandlers = {")[1].split("};")[0]))
+    unhandled = set(dashboard_web.LATEST_ONLY_EVENTS) - handled
+    if unhandled:
+        print(f"  ❌ 처리기가 없는 상태형 이벤트: {unhandled}")
+        return False
+
+    sent = []
+    original_state = dashboard_web.dashboard_state
+    state = dashboard_web.DashboardState()
+    state.broadcaster.emit = lambda event, data: sent.append(data)
+    try:
+        dashboard_web.dashboard_state = state
+        dashboard_web.broadcast_voice_command("테스트")
+        dashboard_web.broadcast_system_status("처리 중")
+        state.set_listening_status(True)
+        dashboard_web.broadcast_persona_change("genius")
+        dashboard_web.broadcast_creative_activity("memory_save", "기억 저장")
+        state.broadcaster.flush()
+    finally:
+        dashboard_web.dashboard_state = original_state
+
+    events = [item["event"] for batch in sent for item in batch["events"]]
+    if sorted(events) != ["creative_update", "persona_update", "system_status", "voice_command"]:
+        print(f"  ❌ 전송된 이벤트 {events}")
+        return False
+    if set(events) - handled:
+        print(f"  ❌ 처리기가 없는 이벤트: {set(events) - handled}")
+        return False
+    stats = {}
+    for batch in sent:
+        stats.update(batch.get("stats", {}))
+    if not stats.get("is_listening"):
+        print("  ❌ 듣기 상태가 통계로 전송되지 않음")
+        return False
+    print("  ✅ 변경마다 처리되는 이벤트 1개, 듣기 상태는 통계로 전송")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 브로드캐스트 묶음 전송 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_burst_is_coalesced,
+        test_stats_delta,
+        test_stats_failure_keeps_events,
+        test_dashboard_events_sent_once,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
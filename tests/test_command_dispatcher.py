@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+명령 디스패처(라우팅 테이블) 테스트
+"""
+
+import sys
+import os
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.command_dispatcher import CommandDispatcher
+
+
+def build_dispatcher(calls):
+    """핵심 컨트롤러 라우팅 테이블 일부를 본뜬 디스패처"""
+    def handler(name, result="ok"):
+        def handle(cmd, cmd_lower):
+            calls.append(name)
+            return None if result is None else f"{name}:{cmd_lower}"
+        return handle
+
+    dispatcher = CommandDispatcher()
+    dispatcher.register("persona", ["페르소나", "성격", "모드", "감정"], handler("persona"))
+    dispatcher.register("collaboration", ["브레인스토밍", "아이디어", "협업", "팀워크"], handler("collaboration"))
+    dispatcher.register("code_poetry", ["코드", "프로그램", "개선", "리팩토링"], handler("code_poetry", None))
+    dispatcher.register("personality_insights", ["분석", "성격", "인사이트", "특징"], handler("personality_insights"))
+    dispatcher.register("future", ["미래", "예측", "전망", "트렌드", "예상", "분석"], handler("future"))
+    dispatcher.register("color_therapy", ["색", "색깔", "컬러", "치료", "감정치료", "색채치료"], handler("color_therapy"))
+    dispatcher.register("music", ["음악", "작곡", "멜로디", "노래"], handler("music"))
+    dispatcher.register("song", ["완전한 노래", "전체 노래", "노래 만들기", "송 크리에이트"], handler("song"))
+    dispatcher.register("multi_agent", ["멀티에이전트", "멀티 에이전트", "다중ai", "협업ai", "에이전트시스템"], handler("multi_agent"))
+    return dispatcher
+
+
+def test_route_resolution():
+    """구체적인 키워드를 가진 경로가 선택되는지 확인"""
+    print("✓ 테스트 1: 경로 선택 규칙")
+    dispatcher = build_dispatcher([])
+    cases = {
+        "페르소나 바꿔줘": "persona",
+        "성격 보여줘": "persona",  # 동률이면 먼저 등록된 경로
+        "내 성격 분석해줘": "personality_insights",
+        "미래 분석": "future",
+        "감정치료 시작": "color_therapy",
+        "노래 만들기 해줘": "song",
+        "노래 틀어줘": "music",
+        "협업AI 켜줘": "multi_agent",
+        "오늘 날씨": None,
+    }
+    for text, expected in cases.items():
+        route = dispatcher.resolve(text)
+        name = route.name if route else None
+        if name != expected:
+            print(f"  ❌ '{text}': {name} != {expected}")
+            return False
+    print("  ✅ 경로 선택 정상")
+    return True
+
+
+def test_dispatch_and_stats():
+    """핸들러 실행, 미처리 시 다른 경로로 넘어가지 않음, 통계 기록 확인"""
+    print("✓ 테스트 2: 실행 및 통계")
+    calls = []
+    dispatcher = build_dispatcher(calls)
+
+    if dispatcher.dispatch("Future 미래 예측") != "future:future 미래 예측":
+        print("  ❌ 핸들러 응답 불일치")
+        return False
+    # 코드 경로가 처리하지 않으면 다른 경로로 넘어가지 않고 None
+    if dispatcher.dispatch("코드 보여줘") is not None or calls[-1] != "code_poetry":
+        print("  ❌ 미처리 경로 동작 불일치")
+        return False
+    dispatcher.dispatch("아무 관련 없는 말")
+
+    stats = dispatcher.get_stats()
+    by_name = {r["route"]: r for r in stats["routes"]}
+    if by_name["future"]["hits"] != 1 or by_name["future"]["handled"] != 1:
+        print(f"  ❌ future 통계 불일치: {by_name['future']}")
+        return False
+    if by_name["code_poetry"]["hits"] != 1 or by_name["code_poetry"]["handled"] != 0:
+        print(f"  ❌ code_poetry 통계 불일치: {by_name['code_poetry']}")
+        return False
+    if stats["misses"] != 1 or stats["routes"][0]["hits"] != 1:
+        print(f"  ❌ 미일치 통계 불일치: {stats}")
+        return False
+    print("  ✅ 경로별 적중/지연 통계 기록")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 명령 디스패처 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_route_resolution,
+        test_dispatch_and_stats,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+인증 정보 색인(해시 조회, 권한, 설정 변경 시 재구성) 테스트
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import contextlib
+import io
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.credential_index import CredentialIndex, build_credential_table
+from security_key_manager import SecurityKeyManager
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def write_config(path, config):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+
+def file_loader(path):
+    def load():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return load
+
+
+SAMPLE_CONFIG = {
+    "security": {
+        "api_keys": {"master_key": "MASTER-123", "user_key": "USER-456"},
+        "access_tokens": {"readonly_token": "RO-789"},
+        "permissions": {
+            "master_key": ["all"],
+            "user_key": ["dashboard", "commands"],
+            "readonly_token": ["dashboard"],
+        },
+        "require_auth": True,
+    }
+}
+
+
+def test_lookup_and_permissions():
+    """키/토큰 조회와 권한 확인이 기존 선형 검색과 같은 결과인지 확인"""
+    print("✓ 테스트 1: 인증 정보 조회와 권한")
+    index = CredentialIndex(lambda: SAMPLE_CONFIG)
+
+    master = index.lookup("MASTER-123")
+    user = index.lookup("USER-456")
+    readonly = index.lookup("RO-789")
+    if (master.name, master.kind) != ("master_key", "api_key") or readonly.kind != "token":
+        print(f"  ❌ 조회 결과 {master}, {readonly}")
+        return False
+    if not master.allows("config") or not user.allows("commands") or user.allows("config") \
+            or readonly.allows("commands") or not readonly.allows(None):
+        print("  ❌ 권한 판정 오류")
+        return False
+    for invalid in (None, "", "USER-45", "user-456", 456):
+        if index.lookup(invalid) is not None:
+            print(f"  ❌ 잘못된 인증 정보 통과: {invalid!r}")
+            return False
+
+    table = build_credential_table(SAMPLE_CONFIG)
+    if any(b"USER-456" in digest for digest in table) or len(table) != 3:
+        print("  ❌ 색인에 원본 키 보관 또는 항목 수 오류")
+        return False
+    print("  ✅ 키 2개, 토큰 1개 조회 및 권한 판정 정상")
+    return True
+
+
+def test_reload_after_key_manager_save():
+    """SecurityKeyManager가 설정을 저장하면 다음 확인 주기에 색인이 다시 만들어지는지 확인"""
+    print("✓ 테스트 2: 키 관리 도구 저장 후 자동 재구성")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "security_config.json")
+        write_config(path, SAMPLE_CONFIG)
+        clock = FakeClock()
+        index = CredentialIndex(file_loader(path), path, check_interval=1.0, clock=clock)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = SecurityKeyManager(path)
+            new_key = manager.add_api_key("ci", "admin")
+            manager.revoke_key("user_key")
+            manager.save_config()
+
+        # 확인 간격 전에는 파일을 다시 보지 않음
+        if index.lookup(new_key) is not None or index.reloads != 1:
+            print("  ❌ 확인 간격 전에 재구성됨")
+            return False
+
+        clock.now += 1.5
+        entry = index.lookup(new_key)
+        if entry is None or not entry.allows("logs") or index.lookup("USER-456") is not None:
+            print(f"  ❌ 재구성 후 조회 {entry}")
+            return False
+        if os.path.exists(path + ".tmp") or index.reloads != 2:
+            print(f"  ❌ 임시 파일 남음 또는 재구성 {index.reloads}회")
+            return False
+
+        # 변경이 없으면 다시 읽지 않음
+        clock.now += 5
+        index.lookup(new_key)
+        if index.reloads != 2:
+            print("  ❌ 변경 없이 재구성됨")
+            return False
+        print("  ✅ 새 키 인식, 폐기한 키 거부, 변경 없을 때 재구성 없음")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_invalid_reload_keeps_last_good_config():
+    """다시 읽을 때 파일이 깨지거나 없어져도 이전 설정과 색인을 유지하는지 확인"""
+    print("✓ 테스트 3: 잘못된 설정 재읽기 시 이전 설정 유지")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "security_config.json")
+        write_config(path, SAMPLE_CONFIG)
+        clock = FakeClock()
+        fallback = lambda: {"security": {"max_failed_attempts": 5}}
+        index = CredentialIndex(file_loader(path), path, check_interval=1.0, clock=clock, fallback=fallback)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for broken in ('{"security": {"api_keys": ', '[1, 2]', '{"security": []}', None):
+                if broken is None:
+                    os.remove(path)
+                else:
+                    with open(path, 'w', encoding='utf-8') as f:
+                        f.write(broken)
+                clock.now += 1.5
+                if not index.config["security"].get("require_auth") or index.lookup("MASTER-123") is None:
+                    print(f"  ❌ 잘못된 설정으로 교체됨: {broken!r}")
+                    return False
+        if index.reloads != 1 or index.failed_reloads != 4:
+            print(f"  ❌ 재구성 {index.reloads}회, 실패 {index.failed_reloads}회")
+            return False
+
+        # 파일을 고치면 다음 확인 때 반영
+        fixed = json.loads(json.dumps(SAMPLE_CONFIG))
+        fixed["security"]["api_keys"]["master_key"] = "MASTER-NEW"
+        write_config(path, fixed)
+        clock.now += 1.5
+        if index.lookup("MASTER-NEW") is None or index.lookup("MASTER-123") is not None:
+            print("  ❌ 수정된 설정이 반영되지 않음")
+            return False
+
+        # 처음부터 읽지 못하면 기본 설정을 쓰고, 정상 파일이 생기면 교체
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("{")
+        with contextlib.redirect_stdout(io.StringIO()):
+            fresh = CredentialIndex(file_loader(path), path, check_interval=1.0, clock=clock, fallback=fallback)
+        if fresh.config != fallback() or len(fresh) != 0:
+            print(f"  ❌ 기본 설정 사용 실패: {fresh.config}")
+            return False
+        write_config(path, SAMPLE_CONFIG)
+        clock.now += 1.5
+        if fresh.lookup("USER-456") is None:
+            print("  ❌ 기본 설정 이후 정상 설정이 반영되지 않음")
+            return False
+        print("  ✅ 파싱 오류/파일 없음 시 이전 키와 require_auth 유지, 수정 후 반영")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 인증 정보 색인 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_lookup_and_permissions,
+        test_reload_after_key_manager_save,
+        test_invalid_reload_keeps_last_good_config,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+게임 경제 시스템 데이터베이스 테스트
+"""
+
+import sys
+import os
+import math
+import random
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from sorisay_game_economy_system import GameEconomyEngine, GameEconomySimulator
+from game_economy_sweep import build_scenarios, run_sweep
+
+
+def test_bulk_seed():
+    """대량 생성 결과와 인덱스, WAL 설정 확인"""
+    print("✓ 테스트 1: 대량 초기 데이터 생성")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        engine = GameEconomyEngine(os.path.join(temp_dir, "economy.db"), initial_users=0)
+        seed = engine.simulate_initial_economy(total_users=2345, chunk_size=500)
+        cursor = engine.db.conn.cursor()
+
+        users = cursor.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        activities = cursor.execute("SELECT COUNT(*) FROM activity_log").fetchone()[0]
+        if users != 2345 or seed['users'] != 2345 or activities != seed['activities']:
+            print(f"  ❌ 생성 수 불일치: 사용자 {users}, 활동 {activities} / {seed}")
+            return False
+
+        orphans = cursor.execute(
+            "SELECT COUNT(*) FROM activity_log WHERE user_id NOT IN (SELECT user_id FROM users)").fetchone()[0]
+        if orphans:
+            print(f"  ❌ 사용자 없는 활동 {orphans}건")
+            return False
+
+        indexes = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        expected = {"idx_activity_log_user_id", "idx_activity_log_timestamp", "idx_content_library_user_id"}
+        if not expected <= indexes:
+            print(f"  ❌ 인덱스 누락: {expected - indexes}")
+            return False
+
+        journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            print(f"  ❌ 저널 모드: {journal_mode}")
+            return False
+
+        plan = " ".join(str(row) for row in cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM activity_log WHERE user_id = ?", ("x",)))
+        if "idx_activity_log_user_id" not in plan:
+            print(f"  ❌ 인덱스 미사용: {plan}")
+            return False
+        engine.db.conn.close()
+        print(f"  ✅ 사용자 {users:,}명 / 활동 {activities:,}건 생성, 인덱스 사용")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_set_based_settlement():
+    """집합 단위 정산이 사용자별 계산과 같은 결과를 내는지, 기간 정산이 이미 정산된 날짜를 건너뛰는지 확인"""
+    print("✓ 테스트 2: 집합 단위 일일 수익 정산")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        engine = GameEconomyEngine(os.path.join(temp_dir, "economy.db"), initial_users=0)
+        engine.simulate_initial_economy(total_users=800)
+        cursor = engine.db.conn.cursor()
+        day = datetime.now().date() - timedelta(days=2)
+
+        # 기존 방식: 사용자별 활동을 모두 읽어 Python에서 가중치 계산
+        rows = cursor.execute(
+            "SELECT user_id, quality_score FROM activity_log WHERE DATE(timestamp) = ?", (day.isoformat(),)).fetchall()
+        per_user = {}
+        for user_id, quality in rows:
+            per_user.setdefault(user_id, []).append(quality)
+        weights = {u: len(q) * (sum(q) / len(q)) / 10 for u, q in per_user.items()}
+        before = dict(cursor.execute("SELECT user_id, total_earnings FROM users").fetchall())
+
+        result = engine.calculate_daily_revenue_distribution(day, verbose=False)
+        total_weight = sum(weights.values())
+        cap = engine.economy_config['max_daily_earnings']
+        after = dict(cursor.execute("SELECT user_id, total_earnings FROM users").fetchall())
+        for user_id, weight in weights.items():
+            expected = min(weight / total_weight * result['distributed_amount'], cap)
+            if abs(after[user_id] - before[user_id] - expected) > 1e-6:
+                print(f"  ❌ 분배 불일치: {user_id} {after[user_id] - before[user_id]} != {expected}")
+                return False
+        untouched = [u for u in before if u not in weights and after[u] != before[u]]
+        if result['active_users'] != len(weights) or untouched:
+            print(f"  ❌ 활성 사용자 {result['active_users']} != {len(weights)}, 비활성 변경 {len(untouched)}")
+            return False
+
+        plan = " ".join(str(row) for row in cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT user_id, COUNT(*), AVG(quality_score) FROM activity_log "
+            "WHERE timestamp >= ? AND timestamp < ? GROUP BY user_id", ("a", "b")))
+        if "COVERING INDEX idx_activity_log_settlement" not in plan:
+            print(f"  ❌ 커버링 인덱스 미사용: {plan}")
+            return False
+
+        # 기간 정산: 이미 정산한 날짜는 건너뜀
+        settled = engine.settle_days(day - timedelta(days=3), day)
+        if [r['date'] for r in settled] != [day - timedelta(days=d) for d in (3, 2, 1)]:
+            print(f"  ❌ 기간 정산 날짜: {[r['date'] for r in settled]}")
+            return False
+        if engine.settle_days(day - timedelta(days=3), day):
+            print("  ❌ 재실행 시 다시 정산됨")
+            return False
+
+        # 강제 재정산: 이전에 지급한 몫을 되돌린 뒤 다시 지급하므로 같은 광고 수익이면 누적 수익이 그대로여야 함
+        totals = []
+        for _ in range(2):
+            random.seed(7)
+            engine.settle_days(day - timedelta(days=3), day, force=True)
+            totals.append(dict(cursor.execute("SELECT user_id, total_earnings FROM users").fetchall()))
+        if any(abs(totals[1][u] - totals[0][u]) > 1e-6 for u in totals[0]):
+            print("  ❌ 강제 재정산 시 수익이 중복 지급됨")
+            return False
+        paid = cursor.execute("SELECT SUM(share) FROM daily_settlements").fetchone()[0]
+        if abs(sum(totals[1].values()) - sum(before.values()) - paid) > 1e-6:
+            print(f"  ❌ 누적 수익 증가분이 날짜별 지급 내역 합계({paid:.2f})와 다름")
+            return False
+        engine.db.conn.close()
+        print(f"  ✅ 활성 사용자 {len(weights)}명 정산 일치, 기간 정산 3일 처리 후 재실행 0일, 강제 재정산 중복 지급 없음")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_batch_simulation():
+    """배치 시뮬레이션이 같은 시드에서 같은 활동을 만들고 경험치/정산까지 반영하는지 확인"""
+    print("✓ 테스트 3: 배치 시뮬레이션")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        simulator = GameEconomySimulator(os.path.join(temp_dir, "economy.db"), initial_users=0)
+        engine = simulator.economy_engine
+        engine.simulate_initial_economy(total_users=500)
+        cursor = engine.db.conn.cursor()
+
+        first = simulator._generate_batch_python(500, 2.0, 11)
+        second = simulator._generate_batch_python(500, 2.0, 11)
+        if first != second:
+            print("  ❌ 같은 시드에서 다른 활동 생성")
+            return False
+
+        # 설정 파일 등에서 실수로 들어온 기준값이어도 레벨은 정수로 저장돼야 함
+        engine.economy_config['level_up_threshold'] = 1000.0
+        exp_before = cursor.execute("SELECT SUM(experience_points) FROM users").fetchone()[0]
+        logged_before = cursor.execute("SELECT COUNT(*) FROM activity_log").fetchone()[0]
+        start_day = datetime.now().date() - timedelta(days=30)
+        result = simulator.run_batch_simulation(days=2, activities_per_user=2.0, seed=11,
+                                                start_day=start_day, chunk_size=300)
+
+        logged = cursor.execute("SELECT COUNT(*) FROM activity_log").fetchone()[0] - logged_before
+        if logged != result['total_activities'] or logged == 0:
+            print(f"  ❌ 기록 수 불일치: {logged} != {result['total_activities']}")
+            return False
+
+        in_range = cursor.execute(
+            "SELECT COUNT(*) FROM activity_log WHERE timestamp >= ? AND timestamp < ?",
+            (start_day.isoformat(), (start_day + timedelta(days=2)).isoformat())).fetchone()[0]
+        if in_range != logged:
+            print(f"  ❌ 날짜 범위 밖 활동: {logged - in_range}건")
+            return False
+
+        expected_exp = sum(first['experience'].values()) + sum(
+            simulator._generate_batch_python(500, 2.0, 12)['experience'].values())
+        gained = cursor.execute("SELECT SUM(experience_points) FROM users").fetchone()[0] - exp_before
+        if gained != expected_exp:
+            print(f"  ❌ 경험치 불일치: {gained} != {expected_exp}")
+            return False
+
+        fractional = cursor.execute("SELECT COUNT(*) FROM users WHERE typeof(level) != 'integer'").fetchone()[0]
+        if fractional:
+            print(f"  ❌ 정수가 아닌 레벨: {fractional}명")
+            return False
+
+        settled = cursor.execute("SELECT COUNT(*) FROM ad_revenue_pool WHERE date >= ?",
+                                 (start_day.isoformat(),)).fetchone()[0]
+        if settled < 2:
+            print(f"  ❌ 정산된 날짜 수: {settled}")
+            return False
+        engine.db.conn.close()
+        print(f"  ✅ 2일 활동 {logged:,}건 기록, 경험치 {gained:,} 반영, 날짜별 정산 완료")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_parameter_sweep():
+    """파라미터 스윕이 작업자 수와 무관하게 같은 결과를 내고 신뢰구간을 계산하는지 확인"""
+    print("✓ 테스트 4: 몬테카를로 파라미터 스윕")
+    scenarios = build_scenarios({'user_distribution_rate': [0.6, 0.8]})
+    if [name for name, _ in scenarios] != ['user_distribution_rate=0.6', 'user_distribution_rate=0.8']:
+        print(f"  ❌ 시나리오 구성: {scenarios}")
+        return False
+    try:
+        build_scenarios({'unknown_param': [1.0]})
+        print("  ❌ 알 수 없는 파라미터가 허용됨")
+        return False
+    except ValueError:
+        pass
+    thresholds = build_scenarios({'level_up_threshold': [500.0, 2000.0]})
+    if [overrides['level_up_threshold'] for _, overrides in thresholds] != [500, 2000] or \
+            not all(isinstance(overrides['level_up_threshold'], int) for _, overrides in thresholds):
+        print(f"  ❌ 레벨업 기준이 정수로 변환되지 않음: {thresholds}")
+        return False
+    try:
+        build_scenarios({'level_up_threshold': [1500.5]})
+        print("  ❌ 소수 레벨업 기준이 허용됨")
+        return False
+    except ValueError:
+        pass
+
+    options = dict(replications=3, users=300, days=1, activities_per_user=2.0, base_seed=7)
+    serial = run_sweep(scenarios, workers=1, **options)
+    parallel = run_sweep(scenarios, workers=2, **options)
+    # 사용자 ID(UUID) 순서에 따른 부동소수점 합산 순서 차이만 허용
+    for name in serial['scenarios']:
+        for key, values in serial['scenarios'][name]['samples'].items():
+            others = parallel['scenarios'][name]['samples'][key]
+            if not all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9) for a, b in zip(values, others)):
+                print(f"  ❌ 작업자 수에 따라 결과가 다름: {name} {key}")
+                return False
+
+    low = serial['scenarios']['user_distribution_rate=0.6']
+    high = serial['scenarios']['user_distribution_rate=0.8']
+    # 같은 시드(공통 난수)에서 분배 비율만 다르므로 반복마다 개인 수익이 커야 함
+    if not all(h > l for h, l in zip(high['samples']['avg_user_earning'], low['samples']['avg_user_earning'])):
+        print("  ❌ 분배 비율 증가가 개인 수익에 반영되지 않음")
+        return False
+    mean, half_width = high['metrics']['avg_user_earning']
+    if high['runs'] != 3 or not half_width > 0:
+        print(f"  ❌ 신뢰구간 계산 오류: {high['runs']}회, ±{half_width}")
+        return False
+    print(f"  ✅ 시나리오 2개 × 3회, 직렬/병렬 결과 일치, 평균 개인 수익 {mean:.2f} ± {half_width:.2f}")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 게임 경제 시스템 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_bulk_seed,
+        test_set_based_settlement,
+        test_batch_simulation,
+        test_parameter_sweep,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
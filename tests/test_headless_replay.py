@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 재생(코퍼스 입력, 가짜 음성 출력, 웹 검색 대역, 채점, 처리량 회귀 검사) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.headless_replay import (
+    ANY, DEFAULT_CORPUS, Utterance, check_regression, load_corpus, replay
+)
+
+# 음성 루프가 종료 명령으로 받아들이는 단어 (코퍼스 중간에 있으면 재생이 멈춤)
+EXIT_KEYWORDS = ["종료", "끝", "그만", "정지", "멈춰", "닫아", "shutdown", "exit", "quit", "소리새 안녕"]
+
+
+def test_corpus_file():
+    """저장된 코퍼스가 읽히고 종료 명령이 섞여 있지 않은지 확인"""
+    print("✓ 테스트 1: 코퍼스 파일")
+    utterances = load_corpus(DEFAULT_CORPUS)
+    if len(utterances) < 20:
+        print(f"  ❌ 발화 {len(utterances)}개")
+        return False
+    stopping = [u.text for u in utterances if any(keyword in u.text.lower() for keyword in EXIT_KEYWORDS)]
+    if stopping:
+        print(f"  ❌ 종료 명령이 포함됨: {stopping}")
+        return False
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "corpus.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('# 주석\n\n{"text": "테스트 실행해줘", "intent": "test"}\n{"text": "고마워", "plugin": null}\n')
+        loaded = load_corpus(path)
+        if loaded != [Utterance(3, "테스트 실행해줘", "test", ANY), Utterance(4, "고마워", ANY, None)]:
+            print(f"  ❌ 로드 결과 {loaded}")
+            return False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print(f"  ✅ 발화 {len(utterances)}개, 생략한 기대값은 채점하지 않음")
+    return True
+
+
+def test_replay_scoring():
+    """코퍼스가 루프를 끝까지 돌고, 의도/플러그인이 채점되며, 반복 발화는 학습 응답으로 처리되는지 확인"""
+    print("✓ 테스트 2: 재생과 채점")
+    utterances = [
+        Utterance(1, "테스트 실행해줘", "test", "개발 도구"),
+        Utterance(2, "오늘 서울 날씨 알려줘", None, None),
+        Utterance(3, "안녕 반가워", "status", ANY),  # 일부러 틀린 기대값
+    ]
+    queries = []
+
+    def web_results(query):
+        queries.append(query)
+        if "날씨" in query:
+            return [{"title": "날씨", "content": "맑음", "source": "", "type": "abstract"}]
+        return []
+
+    workdir = tempfile.mkdtemp()
+    try:
+        report = replay(utterances, repeat=2, workdir=workdir, web_results=web_results)
+        created = sorted(os.listdir(workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if report["processed"] != 6 or report["commands_per_sec"] <= 0:
+        print(f"  ❌ 처리 {report['processed']}/6")
+        return False
+    if report["plugin_calls"] != {"개발 도구/test": 1}:
+        print(f"  ❌ 플러그인 호출 {report['plugin_calls']}")
+        return False
+    if report["routes"].get("learned", 0) < 1 or report["web_requests"] != len(queries) or not queries:
+        print(f"  ❌ 응답 경로 {report['routes']}, 웹 검색 {report['web_requests']}회")
+        return False
+    if (report["intent"]["scored"], report["intent"]["correct"]) != (6, 4):
+        print(f"  ❌ 의도 채점 {report['intent']}")
+        return False
+    if [(m["line"], m["count"]) for m in report["mismatches"]] != [(3, 2)]:
+        print(f"  ❌ 불일치 {report['mismatches']}")
+        return False
+    if report["plugin"]["accuracy"] != 1.0 or report["spoken"] < 6:
+        print(f"  ❌ 플러그인 채점 {report['plugin']}, 음성 출력 {report['spoken']}회")
+        return False
+    if not any(name.startswith("knowledge_base") for name in created) or "turn" not in report["stages"]:
+        print(f"  ❌ 작업 디렉터리 {created}, 단계 {list(report['stages'])}")
+        return False
+    print(f"  ✅ 6턴 처리 ({report['routes']}), 의도 4/6, 플러그인은 기록만 함")
+    return True
+
+
+def test_check_regression():
+    """처리량 하락 비율과 의도 정확도 기준 비교"""
+    print("✓ 테스트 3: 기준값 회귀 검사")
+    baseline = {"commands_per_sec": 1000.0, "intent_accuracy": 0.75}
+    report = {"commands_per_sec": 850.0, "intent": {"accuracy": 0.75}}
+    if check_regression(report, baseline, 20):
+        print("  ❌ 15% 하락을 20% 허용 기준에서 실패로 판단")
+        return False
+    failures = check_regression(report, baseline, 10)
+    if len(failures) != 1 or "15.0% 하락" not in failures[0]:
+        print(f"  ❌ 10% 허용 기준 결과 {failures}")
+        return False
+    report["intent"]["accuracy"] = 0.7
+    if len(check_regression(report, baseline, 20)) != 1 or check_regression(report, {}, 20):
+        print("  ❌ 정확도 하락 또는 빈 기준값 처리 오류")
+        return False
+    print("  ✅ 허용 범위 안/밖 처리량과 정확도 하락 판별")
+    return True
+
+
+def test_creative_turn_skips_plugin():
+    """창의적 응답 턴이 플러그인 분기로 넘어가 이전 턴의 플러그인을 다시 실행하지 않는지 확인"""
+    print("✓ 테스트 4: 창의적 응답 후 플러그인 미실행")
+    utterances = [
+        # 첫 턴이면 플러그인 변수가 아직 없음 (UnboundLocalError)
+        Utterance(1, "새로운 아이디어 생각해줘", "creative", None),
+        Utterance(2, "테스트 실행해줘", "test", "개발 도구"),
+        # 플러그인 턴 다음이면 이전 턴의 플러그인이 다시 실행됨
+        Utterance(3, "스스로 개선해봐", "self_improve", None),
+    ]
+    workdir = tempfile.mkdtemp()
+    try:
+        report = replay(utterances, repeat=1, workdir=workdir, web_results=lambda query: [])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if report["processed"] != 3:
+        print(f"  ❌ 처리 {report['processed']}/3")
+        return False
+    if report["plugin_calls"] != {"개발 도구/test": 1} or report["plugin"]["accuracy"] != 1.0:
+        print(f"  ❌ 플러그인 호출 {report['plugin_calls']}, 불일치 {report['mismatches']}")
+        return False
+    print("  ✅ 창의적 응답 턴은 플러그인을 실행하지 않음")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 헤드리스 재생 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_corpus_file,
+        test_replay_scoring,
+        test_check_regression,
+        test_creative_turn_skips_plugin,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+의도 매칭 엔진 테스트 - 기존 순차 정규식 방식과 결과가 같은지 확인
+"""
+
+import sys
+import os
+import re
+import random
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.nlp_processor import NLPProcessor
+from modules.ai_code_manager.intent_matcher import extract_required_literals
+from modules.ai_code_manager.persona_system import PersonaSystem
+
+
+def legacy_analyze_intent(nlp, text):
+    """기존 analyze_intent 구현 (비교 기준)"""
+    text = text.lower().strip()
+    best_intent, best_score, matched_pattern = None, 0.0, None
+    for intent, config in nlp.intent_patterns["intents"].items():
+        for pattern in config["patterns"]:
+            if re.search(pattern, text, re.IGNORECASE):
+                similarity = nlp.calculate_similarity(text, pattern)
+                if similarity > best_score:
+                    best_intent, best_score, matched_pattern = intent, similarity, pattern
+    return best_intent, best_score, matched_pattern
+
+
+def legacy_analyze_emotion(nlp, text):
+    """기존 analyze_emotion 구현 (비교 기준)"""
+    text = text.lower().strip()
+    scores = {}
+    for emotion, config in nlp.emotion_patterns.items():
+        scores[emotion] = sum(1 for p in config["patterns"] if re.search(p, text, re.IGNORECASE))
+    best = max(scores, key=scores.get)
+    return best if scores[best] > 0 else "neutral"
+
+
+def test_literal_extraction():
+    """필수 리터럴 추출 테스트"""
+    print("✓ 테스트 1: 필수 리터럴 추출")
+    cases = {
+        r".*코드.*정리.*": ["코드", "정리"],
+        r".*Git.*sync.*": ["git", "sync"],
+        r".*!+.*": [],
+        r".*(a|b).*": None,
+        r".*\d+.*": None,
+        f".*{re.escape('3.5 버전')}.*": ["3.5 버전"],
+    }
+    for pattern, expected in cases.items():
+        result = extract_required_literals(pattern)
+        if result != expected:
+            print(f"  ❌ {pattern}: {result} != {expected}")
+            return False
+    print("  ✅ 리터럴 추출 정상")
+    return True
+
+
+def test_matches_legacy_results():
+    """기존 구현과 동일한 (intent, score, pattern) 반환 확인"""
+    print("✓ 테스트 2: 기존 구현과 결과 비교")
+    nlp = NLPProcessor()
+
+    words = set()
+    for config in nlp.intent_patterns["intents"].values():
+        for pattern in config["patterns"]:
+            words.update(re.sub(r'[.*\\]', ' ', pattern).split())
+    words = sorted(words) + ["HELP", "Sync", "ſ", "K", "!!", "ㅎㅎ"]
+
+    rng = random.Random(42)
+    for _ in range(3000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+        expected = legacy_analyze_intent(nlp, text)
+        actual = nlp.analyze_intent(text)
+        if expected != actual:
+            print(f"  ❌ '{text}': {actual} != {expected}")
+            return False
+    print("  ✅ 3000개 문장 결과 일치")
+    return True
+
+
+def test_add_pattern_updates_matcher():
+    """add_pattern 호출 시 매칭 엔진에 즉시 반영되는지 확인"""
+    print("✓ 테스트 3: 학습된 패턴 반영")
+    nlp = NLPProcessor()
+    nlp.save_patterns = lambda patterns: None  # 설정 파일 보호
+
+    text = "오늘 점심 메뉴 골라줘"
+    nlp.learn_from_feedback(text, "lunch_menu")
+    intent, score, pattern = nlp.analyze_intent(text)
+    if intent != "lunch_menu" or (intent, score, pattern) != legacy_analyze_intent(nlp, text):
+        print(f"  ❌ 학습 결과 미반영: {intent}, {score}, {pattern}")
+        return False
+    print("  ✅ 학습된 패턴 즉시 매칭")
+    return True
+
+
+def test_emotion_matches_legacy():
+    """사전 필터 기반 감정 분석이 기존 순차 검사와 같은지 확인"""
+    print("✓ 테스트 4: 감정 분석 결과 비교")
+    nlp = NLPProcessor()
+
+    words = set()
+    for config in nlp.emotion_patterns.values():
+        for pattern in config["patterns"]:
+            words.update(re.sub(r'[.*+\\]', ' ', pattern).split())
+    words = sorted(words) + ["!", "와와", "빨리!!", "OK", "ſ", "정말"]
+
+    rng = random.Random(7)
+    for _ in range(3000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+        expected = legacy_analyze_emotion(nlp, text)
+        actual = nlp.analyze_emotion(text)
+        if expected != actual:
+            print(f"  ❌ '{text}': {actual} != {expected}")
+            return False
+    print("  ✅ 3000개 문장 결과 일치")
+    return True
+
+
+def test_single_pass_analysis():
+    """발화 분석 한 번으로 의도/감정/기분이 모두 계산되고 컨텍스트는 한 번만 기록되는지 확인"""
+    print("✓ 테스트 5: 단일 패스 발화 분석")
+    nlp = NLPProcessor()
+    persona = PersonaSystem()
+
+    text = "궁금한데 코드 정리해줘 main.py 빨리!"
+    analysis = nlp.analyze_utterance(text, persona)
+
+    if (analysis.intent, analysis.confidence, analysis.matched_pattern) != legacy_analyze_intent(nlp, text):
+        print(f"  ❌ 의도 불일치: {analysis.intent}")
+        return False
+    if analysis.emotion != legacy_analyze_emotion(nlp, text):
+        print(f"  ❌ 감정 불일치: {analysis.emotion}")
+        return False
+    if analysis.persona != persona.detect_user_mood(text) or analysis.mood != "curious":
+        print(f"  ❌ 기분 불일치: {analysis.mood} / {analysis.persona}")
+        return False
+    if analysis.entities.get("files") != ["main.py"]:
+        print(f"  ❌ 엔티티 불일치: {analysis.entities}")
+        return False
+    if nlp.context_memory != [text]:
+        print(f"  ❌ 컨텍스트 중복 기록: {nlp.context_memory}")
+        return False
+    print("  ✅ 한 번의 분석으로 모든 결과 계산")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 의도 매칭 엔진 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_literal_extraction,
+        test_matches_legacy_results,
+        test_add_pattern_updates_matcher,
+        test_emotion_matches_legacy,
+        test_single_pass_analysis,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
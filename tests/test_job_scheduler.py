@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+공유 작업 스케줄러(주기 작업, 중복 등록, 초과 실행) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import time
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager import job_scheduler
+from modules.ai_code_manager.job_scheduler import JobScheduler
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def test_shared_job_runs_once():
+    """같은 이름으로 여러 번 등록해도 한 번만 실행되고, 모두 해제해야 제거되는지 확인"""
+    print("✓ 테스트 1: 같은 이름 작업 공유")
+    clock = FakeClock()
+    scheduler = JobScheduler(clock=clock)
+    calls = []
+    scheduler.register("cycle", lambda: calls.append("a"), 10.0)
+    scheduler.register("cycle", lambda: calls.append("b"), 2.0)
+
+    for _ in range(10):
+        clock.advance(2.0)
+        scheduler.run_pending()
+    if calls != ["a"] * 10:
+        print(f"  ❌ 실행 기록 {calls}")
+        return False
+
+    if scheduler.unregister("cycle", 2.0) or scheduler.get("cycle").interval != 10.0:
+        print("  ❌ 첫 해제 후 작업이 제거되었거나 주기가 그대로임")
+        return False
+    if not scheduler.unregister("cycle", 10.0) or "cycle" in scheduler:
+        print("  ❌ 마지막 해제 후에도 작업이 남음")
+        return False
+    clock.advance(20.0)
+    if scheduler.run_pending() != 0:
+        print("  ❌ 해제된 작업이 실행됨")
+        return False
+    print("  ✅ 2초 주기로 10회 실행 (중복 없음), 해제 후 제거")
+    return True
+
+
+def test_overrun_skips_missed_ticks():
+    """실행이 주기보다 길면 밀린 회차를 건너뛰고 초과로 기록하는지 확인"""
+    print("✓ 테스트 2: 초과 실행과 역압")
+    clock = FakeClock()
+    scheduler = JobScheduler(clock=clock)
+    durations = [3.5, 0.1, 0.1]
+
+    def slow_job():
+        clock.advance(durations.pop(0))
+
+    job = scheduler.register("slow", slow_job, 1.0)
+    clock.advance(1.0)
+    if scheduler.run_pending() != 1:
+        print("  ❌ 밀린 회차가 연달아 실행됨")
+        return False
+    stats = scheduler.stats()["slow"]
+    if stats["overruns"] != 1 or stats["skipped"] != 3 or job.next_run <= clock():
+        print(f"  ❌ 통계 {stats}, 다음 실행 {job.next_run} (현재 {clock()})")
+        return False
+
+    clock.advance(job.next_run - clock())
+    scheduler.run_pending()
+    if scheduler.stats()["slow"]["runs"] != 2 or scheduler.stats()["slow"]["overruns"] != 1:
+        print(f"  ❌ 정상 회차 통계 {scheduler.stats()['slow']}")
+        return False
+    print(f"  ✅ 3.5초 실행 → 초과 1회, {stats['skipped']}회차 건너뜀, 다음 회차부터 정상")
+    return True
+
+
+def test_jitter_and_errors():
+    """jitter가 주기에 누적되지 않고, 예외가 나도 작업이 계속 예약되는지 확인"""
+    print("✓ 테스트 3: jitter와 작업 오류")
+    clock = FakeClock()
+    scheduler = JobScheduler(clock=clock, seed=7)
+    start = clock()
+    job = scheduler.register("jittered", lambda: None, 10.0, jitter=0.5)
+    for _ in range(50):
+        if not 0 <= job.next_run - job.next_due <= 5.0:
+            print(f"  ❌ jitter 범위 밖: {job.next_run - job.next_due}")
+            return False
+        clock.now = job.next_run
+        scheduler.run_pending()
+    if job.next_due != start + 10.0 * 51 or job.skipped:
+        print(f"  ❌ 기준 시각이 밀림: {job.next_due - start}")
+        return False
+
+    def failing():
+        raise RuntimeError("테스트 오류")
+
+    failing_job = scheduler.register("failing", failing, 1.0)
+    for _ in range(3):
+        clock.advance(1.0)
+        scheduler.run_pending()
+    if failing_job.errors != 3 or "failing" not in scheduler:
+        print(f"  ❌ 오류 {failing_job.errors}회, 등록 유지 {'failing' in scheduler}")
+        return False
+    print("  ✅ jitter는 주기의 50% 이내, 기준 시각 유지, 오류 3회 후에도 예약 유지")
+    return True
+
+
+def test_background_thread():
+    """실행 스레드가 실제 시계로 작업을 실행하고 정지하는지 확인"""
+    print("✓ 테스트 4: 백그라운드 실행 스레드")
+    scheduler = JobScheduler()
+    calls = []
+    scheduler.start()
+    scheduler.register("tick", lambda: calls.append(time.monotonic()), 0.02, run_immediately=True)
+    time.sleep(0.25)
+    scheduler.stop()
+    count = len(calls)
+    time.sleep(0.05)
+    if count < 4 or len(calls) != count or scheduler.running:
+        print(f"  ❌ 실행 {count}회, 정지 후 {len(calls)}회")
+        return False
+    print(f"  ✅ 0.25초 동안 {count}회 실행, 정지 후 추가 실행 없음")
+    return True
+
+
+def test_multi_agent_shares_mall_cycle():
+    """멀티 에이전트 시스템 여러 개와 대시보드가 쇼핑몰 사이클 하나를 공유하는지 확인"""
+    print("✓ 테스트 5: 멀티 에이전트 자율 운영 등록")
+    from modules.ai_code_manager import autonomous_shopping_mall
+    from modules.ai_code_manager.autonomous_shopping_mall import AutonomousShoppingMall, MALL_CYCLE_JOB
+    from modules.ai_code_manager.multi_agent_shopping_system import AUTONOMOUS_JOBS, MultiAgentShoppingSystem
+
+    temp_dir = tempfile.mkdtemp()
+    previous_mall = autonomous_shopping_mall._mall_service
+    previous_scheduler = job_scheduler._scheduler
+    clock = FakeClock()
+    try:
+        mall = AutonomousShoppingMall(os.path.join(temp_dir, "mall.json"))
+        autonomous_shopping_mall._mall_service = mall
+        scheduler = JobScheduler(clock=clock, seed=1)
+        job_scheduler._scheduler = scheduler
+
+        first = MultiAgentShoppingSystem()
+        second = MultiAgentShoppingSystem()
+        first.start_autonomous_system()
+        first.start_autonomous_system()
+        second.start_autonomous_system()
+        if set(scheduler.stats()) != {name for name, _ in AUTONOMOUS_JOBS}:
+            print(f"  ❌ 등록된 작업 {list(scheduler.stats())}")
+            return False
+
+        for _ in range(30):
+            clock.advance(1.0)
+            scheduler.run_pending()
+        cycle = scheduler.stats()[MALL_CYCLE_JOB]
+        # 2초 주기 + 최대 10% jitter → 30초 동안 14~15회
+        if cycle["subscribers"] != 2 or not 13 <= cycle["runs"] <= 15 or not mall.last_cycle:
+            print(f"  ❌ 쇼핑몰 사이클 통계 {cycle}")
+            return False
+
+        first.stop_autonomous_system()
+        if MALL_CYCLE_JOB not in scheduler:
+            print("  ❌ 다른 시스템이 쓰는 작업까지 제거됨")
+            return False
+        second.stop_autonomous_system()
+        if scheduler.stats():
+            print(f"  ❌ 정지 후 남은 작업 {list(scheduler.stats())}")
+            return False
+        mall.close()
+        print(f"  ✅ 시스템 2개 → 쇼핑몰 사이클 1개 ({cycle['runs']}회 실행), 정지 후 모두 해제")
+        return True
+    finally:
+        autonomous_shopping_mall._mall_service = previous_mall
+        job_scheduler._scheduler = previous_scheduler
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_multi_agent_voice_start_stop():
+    """음성 명령으로 여러 번 시작해도 작업이 한 번만 등록되고 정지 명령으로 모두 해제되는지 확인"""
+    print("✓ 테스트 6: 멀티 에이전트 음성 명령 시작/정지")
+    from modules.ai_code_manager import autonomous_shopping_mall, multi_agent_shopping_system
+    from modules.ai_code_manager.autonomous_shopping_mall import AutonomousShoppingMall
+    from modules.ai_code_manager.multi_agent_shopping_system import AUTONOMOUS_JOBS, create_multi_agent_response
+
+    temp_dir = tempfile.mkdtemp()
+    previous_mall = autonomous_shopping_mall._mall_service
+    previous_system = multi_agent_shopping_system._multi_agent_system
+    previous_scheduler = job_scheduler._scheduler
+    try:
+        mall = AutonomousShoppingMall(os.path.join(temp_dir, "mall.json"))
+        autonomous_shopping_mall._mall_service = mall
+        multi_agent_shopping_system._multi_agent_system = None
+        scheduler = JobScheduler(clock=FakeClock(), seed=1)
+        job_scheduler._scheduler = scheduler
+
+        for _ in range(3):
+            create_multi_agent_response("멀티 에이전트 시작해줘")
+        stats = scheduler.stats()
+        if set(stats) != {name for name, _ in AUTONOMOUS_JOBS} or any(job["subscribers"] != 1 for job in stats.values()):
+            print(f"  ❌ 세 번 시작 후 작업 {stats}")
+            return False
+
+        create_multi_agent_response("멀티 에이전트 정지해줘")
+        if scheduler.stats():
+            print(f"  ❌ 정지 후 남은 작업 {list(scheduler.stats())}")
+            return False
+        create_multi_agent_response("멀티 에이전트 정지해줘")
+        create_multi_agent_response("멀티 에이전트 시작해줘")
+        if any(job["subscribers"] != 1 for job in scheduler.stats().values()):
+            print(f"  ❌ 다시 시작 후 작업 {scheduler.stats()}")
+            return False
+        create_multi_agent_response("멀티 에이전트 정지해줘")
+        mall.close()
+        print(f"  ✅ 시작 3번 → 작업 {len(AUTONOMOUS_JOBS)}개 한 번씩 등록, 정지 후 모두 해제")
+        return True
+    finally:
+        autonomous_shopping_mall._mall_service = previous_mall
+        multi_agent_shopping_system._multi_agent_system = previous_system
+        job_scheduler._scheduler = previous_scheduler
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 작업 스케줄러 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_shared_job_runs_once,
+        test_overrun_skips_missed_ticks,
+        test_jitter_and_errors,
+        test_background_thread,
+        test_multi_agent_shares_mall_cycle,
+        test_multi_agent_voice_start_stop,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
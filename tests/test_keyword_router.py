@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 라우터(Aho–Corasick) 및 플러그인 명령어 검색 테스트
+"""
+
+import sys
+import os
+import random
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.plugins.keyword_router import KeywordAutomaton
+from modules.plugins.plugin_manager import PluginManager
+from modules.plugins.base_plugin import SorisayPlugin
+
+
+class KeywordPlugin(SorisayPlugin):
+    """테스트용 플러그인"""
+
+    def __init__(self, name, commands):
+        self._name = name
+        self._commands = commands
+
+    def get_commands(self):
+        return self._commands
+
+    def execute(self, command, text):
+        return command
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def description(self):
+        return "테스트 플러그인"
+
+
+def test_find_all_matches_brute_force():
+    """자동자 검색 결과가 단순 부분 문자열 검색과 같은지 확인"""
+    print("✓ 테스트 1: 전체 적중 검색")
+    rng = random.Random(3)
+    alphabet = "가나다ab"
+    for _ in range(300):
+        automaton = KeywordAutomaton()
+        keywords = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)}
+        for keyword in keywords:
+            automaton.add(keyword, keyword)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+
+        expected = sorted(
+            (i, kw) for kw in keywords for i in range(len(text)) if text.startswith(kw, i)
+        )
+        actual = sorted((hit.start, hit.keyword) for hit in automaton.find_all(text))
+        if expected != actual:
+            print(f"  ❌ '{text}' / {sorted(keywords)}: {actual} != {expected}")
+            return False
+    print("  ✅ 300개 사례 일치")
+    return True
+
+
+def test_longest_match_first():
+    """가장 긴 키워드가 등록 순서와 무관하게 선택되는지 확인"""
+    print("✓ 테스트 2: 최장 일치 우선")
+    manager = PluginManager()
+    manager.register_plugin(KeywordPlugin("basic", {"status": ["상태"], "help": ["도움말"]}))
+    manager.register_plugin(KeywordPlugin("detail", {"full_status": ["현재상태"]}))
+
+    cases = {
+        "현재상태 알려줘": ("detail", "full_status", "현재상태"),
+        "상태 알려줘": ("basic", "status", "상태"),
+        "도움말이랑 상태": ("basic", "help", "도움말"),
+        "아무 말": (None, None, None),
+    }
+    for text, expected in cases.items():
+        result = manager.find_command(text)
+        if result != expected:
+            print(f"  ❌ '{text}': {result} != {expected}")
+            return False
+    print("  ✅ 최장 일치 및 동률 처리 정상")
+    return True
+
+
+def test_many_generated_plugins():
+    """자동 생성 플러그인 수백 개 등록 후에도 기존 명령어가 정상 검색되는지 확인"""
+    print("✓ 테스트 3: 대량 플러그인 등록")
+    manager = PluginManager()
+    manager.register_plugin(KeywordPlugin("system", {"sync": ["동기화", "sync"]}))
+    for i in range(300):
+        manager.register_plugin(KeywordPlugin(f"auto_{i}", {f"cmd_{i}": [f"자동기능{i}번", f"auto{i}x"]}))
+
+    if manager.find_command("Git SYNC 해줘") != ("system", "sync", "sync"):
+        print("  ❌ 기존 명령어 검색 실패")
+        return False
+    if manager.find_command("자동기능123번 실행") != ("auto_123", "cmd_123", "자동기능123번"):
+        print("  ❌ 생성된 명령어 검색 실패")
+        return False
+    print(f"  ✅ 키워드 {len(manager.keyword_router)}개 등록 후 검색 정상")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 키워드 라우터 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_find_all_matches_brute_force,
+        test_longest_match_first,
+        test_many_generated_plugins,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
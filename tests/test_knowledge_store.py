@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+지식 저장소(스냅샷 + 변경 로그) 테스트
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.knowledge_store import KnowledgeStore
+
+
+def initial_knowledge():
+    return {"successful_responses": {}, "failed_responses": {}, "web_search_cache": {}}
+
+
+def dump(data):
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+def test_replay_after_restart():
+    """로그만 남은 상태에서 재시작 시 복원 확인"""
+    print("✓ 테스트 1: 변경 로그 재생")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "knowledge_base.json")
+        store = KnowledgeStore(path, compact_every=10**6)
+        store.load(initial_knowledge)
+        for i in range(30):
+            store.append(["successful_responses", f"패턴_{i % 4}"], f"응답 {i}")
+        store.set(["web_search_cache", "search_abc"], {"results": [], "timestamp": "2025-01-01"})
+
+        restored = KnowledgeStore(path)
+        restored.load(initial_knowledge)
+        if dump(restored.data) != dump(store.data):
+            print("  ❌ 재생 결과가 원본과 다릅니다")
+            return False
+        print("  ✅ 로그 재생으로 동일한 상태 복원")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_compaction_is_idempotent():
+    """압축 도중 중단되어도 레코드가 중복 적용되지 않는지 확인"""
+    print("✓ 테스트 2: 압축 중단 복구")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "knowledge_base.json")
+        store = KnowledgeStore(path, compact_every=10**6, background=False)
+        store.load(initial_knowledge)
+        for i in range(10):
+            store.append(["failed_responses", "모름"], f"실패 {i}")
+
+        # 스냅샷은 저장됐지만 .old 로그 삭제 전에 중단된 상황 재현
+        with open(store.log_path, 'r', encoding='utf-8') as f:
+            pending_log = f.read()
+        store.compact()
+        with open(store.old_log_path, 'w', encoding='utf-8') as f:
+            f.write(pending_log)
+        store.append(["failed_responses", "모름"], "실패 10")
+
+        restored = KnowledgeStore(path)
+        restored.load(initial_knowledge)
+        count = len(restored.data["failed_responses"]["모름"])
+        if count != 11:
+            print(f"  ❌ 레코드 수 불일치: {count} != 11")
+            return False
+        print("  ✅ 스냅샷 이후 레코드만 재생")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_truncated_tail_record():
+    """마지막 줄이 잘린 로그도 로드되는지 확인"""
+    print("✓ 테스트 3: 손상된 로그 꼬리 처리")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "knowledge_base.json")
+        store = KnowledgeStore(path, compact_every=10**6)
+        store.load(initial_knowledge)
+        store.append(["successful_responses", "안녕"], "안녕하세요")
+        store.close()
+        with open(path + ".wal", 'a', encoding='utf-8') as f:
+            f.write('{"seq": 99, "op": "app')
+
+        restored = KnowledgeStore(path)
+        restored.load(initial_knowledge)
+        if restored.data["successful_responses"].get("안녕") != ["안녕하세요"]:
+            print("  ❌ 스냅샷 데이터 손실")
+            return False
+        print("  ✅ 손상된 레코드만 무시")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_concurrent_compaction():
+    """늦게 끝난 이전 압축이 새 스냅샷을 덮어쓰거나 새 로그를 지우지 않는지 확인"""
+    print("✓ 테스트 4: 동시 압축 직렬화")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "knowledge_base.json")
+        store = KnowledgeStore(path, compact_every=10**6)
+        store.load(initial_knowledge)
+        store.append(["successful_responses", "안녕"], "응답 0")
+
+        # 첫 번째(백그라운드) 압축은 스냅샷 쓰기 직전에 멈춤
+        entered, release = threading.Event(), threading.Event()
+        write_snapshot = store._write_snapshot
+
+        def slow_write(text):
+            if not entered.is_set():
+                entered.set()
+                release.wait(5)
+            write_snapshot(text)
+
+        store._write_snapshot = slow_write
+        store.request_compaction()
+        entered.wait(5)
+
+        # 그 사이 새 변경 후 직접 저장 (save_knowledge 경로)
+        store.append(["successful_responses", "안녕"], "응답 1")
+        direct = threading.Thread(target=store.compact)
+        direct.start()
+        direct.join(0.2)
+        release.set()
+        direct.join(5)
+        store.wait_for_compaction(5)
+
+        restored = KnowledgeStore(path)
+        restored.load(initial_knowledge)
+        responses = restored.data["successful_responses"].get("안녕")
+        if responses != ["응답 0", "응답 1"]:
+            print(f"  ❌ 복원 결과: {responses}")
+            return False
+        print("  ✅ 압축이 순서대로 실행되어 최신 변경 보존")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 지식 저장소 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_replay_after_restart,
+        test_compaction_is_idempotent,
+        test_truncated_tail_record,
+        test_concurrent_compaction,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
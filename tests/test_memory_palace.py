@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+기억의 궁전(기억 검색 색인, 지연 쓰기) 테스트
+"""
+
+import sys
+import os
+import json
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.memory_palace import MemoryPalace
+
+CONVERSATIONS = [
+    ("음악을 틀어줘", "네, 음악을 재생할게요"),
+    ("신나는 음악이 듣고 싶어", "신나는 노래를 찾아볼게요"),
+    ("내 이름은 민수야", "반가워요 민수님"),
+    ("파이썬으로 웹 개발하는 법 알려줘", "플라스크로 시작해보세요"),
+    ("오늘 프로젝트 계획을 세우자", "목표부터 정리해볼까요?"),
+    ("날씨가 좋아서 기쁘다", "저도 기뻐요!"),
+    ("코딩은 어려워", "천천히 같이 해봐요"),
+    ("노래 추천해줘", "요즘 인기 있는 음악은 이거예요"),
+    ("AI 머신러닝 공부 중이야", "멋진 목표네요"),
+    ("Music please", "Playing MUSIC now"),
+]
+
+
+def old_recall(palace, query, limit=5):
+    """색인 도입 전의 전체 순회 검색 (부분 문자열 + 태그 + 중요도)"""
+    relevant_memories = []
+    query_lower = query.lower()
+    for memory in palace.memories["conversations"]:
+        score = 0
+        if query_lower in memory["user_input"].lower():
+            score += 3
+        if query_lower in memory["ai_response"].lower():
+            score += 2
+        query_tags = palace.extract_context_tags(query)
+        common_tags = set(query_tags) & set(memory["context_tags"])
+        score += len(common_tags)
+        score += memory["importance_score"] * 0.1
+        if score > 0:
+            memory_with_score = memory.copy()
+            memory_with_score["relevance_score"] = score
+            relevant_memories.append(memory_with_score)
+    relevant_memories.sort(key=lambda x: x["relevance_score"], reverse=True)
+    return relevant_memories[:limit]
+
+
+def summarize(memories):
+    return [(m["user_input"], m["relevance_score"]) for m in memories]
+
+
+def make_palace(temp_dir, **kwargs):
+    return MemoryPalace(os.path.join(temp_dir, "memories.json"), write_behind=False, **kwargs)
+
+
+def test_recall_with_particles():
+    """조사가 붙은 한국어 단어도 조사 없는 검색어로 찾는지 확인"""
+    print("✓ 테스트 1: 조사가 붙은 단어 검색")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        palace = make_palace(temp_dir)
+        for user_input, ai_response in CONVERSATIONS:
+            palace.remember_conversation(user_input, ai_response)
+
+        recalled = [m["user_input"] for m in palace.recall_memories("음악", 3)]
+        if recalled != ["음악을 틀어줘", "신나는 음악이 듣고 싶어", "노래 추천해줘"]:
+            print(f"  ❌ '음악' 검색 결과: {recalled}")
+            return False
+        recalled = [m["user_input"] for m in palace.recall_memories("music", 1)]
+        if recalled != ["Music please"]:
+            print(f"  ❌ 대소문자 무시 검색 결과: {recalled}")
+            return False
+        print("  ✅ '음악'으로 '음악을', '음악이', '음악은' 포함 기억 검색")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_recall_matches_full_scan():
+    """색인 검색 결과가 전체 순회 부분 문자열 검색과 같은지 확인 (기억 정리 후 포함)"""
+    print("✓ 테스트 2: 전체 순회 검색과 결과 비교")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        palace = make_palace(temp_dir, max_memories=40)
+        rng = random.Random(5)
+        for _ in range(60):
+            user_input, ai_response = rng.choice(CONVERSATIONS)
+            palace.remember_conversation(user_input, ai_response)
+
+        queries = ["음악", "음악을 틀어줘", "민수", "이름", "개발", "프로젝트 계획", "기쁘", "목표",
+                   "노래", "MUSIC", "음", " ", "", "없는 단어", "코딩 공부", "ai"]
+        for query in queries:
+            for limit in (1, 3, 5, 50):
+                expected = summarize(old_recall(palace, query, limit))
+                actual = summarize(palace.recall_memories(query, limit))
+                if actual != expected:
+                    print(f"  ❌ '{query}' (limit={limit}): {actual} != {expected}")
+                    return False
+        print(f"  ✅ 검색어 {len(queries)}개 × limit 4종 결과 일치")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def saved_inputs(path):
+    """파일에 저장된 대화 입력 목록"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [m["user_input"] for m in json.load(f)["conversations"]]
+
+
+def test_write_behind_batches_until_close():
+    """지연 쓰기 모드에서 변경분이 모였다가 close() 때 저장되는지 확인"""
+    print("✓ 테스트 3: 지연 쓰기 close() 저장")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "memories.json")
+        palace = MemoryPalace(path, flush_interval=60, flush_threshold=1000)
+        for i in range(5):
+            palace.remember_conversation(f"대화 {i}", "응답")
+        time.sleep(0.1)
+        if saved_inputs(path):
+            print("  ❌ 임계값 전에 파일에 저장됨")
+            return False
+        palace.close()
+        if saved_inputs(path) != [f"대화 {i}" for i in range(5)]:
+            print(f"  ❌ close() 후 저장 내용: {saved_inputs(path)}")
+            return False
+        # 닫힌 뒤의 변경은 즉시 저장
+        palace.remember_conversation("대화 5", "응답")
+        if len(saved_inputs(path)) != 6:
+            print("  ❌ close() 이후 변경이 저장되지 않음")
+            return False
+        print("  ✅ 변경 5건을 모아 close() 때 한 번에 저장")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_write_behind_interval_and_threshold():
+    """시간 간격과 개수 임계값에 도달하면 writer가 저장하는지 확인"""
+    print("✓ 테스트 4: 지연 쓰기 간격/임계값 저장")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "memories.json")
+        palace = MemoryPalace(path, flush_interval=0.2, flush_threshold=1000)
+        palace.remember_conversation("간격 저장", "응답")
+        deadline = time.time() + 5
+        while not saved_inputs(path) and time.time() < deadline:
+            time.sleep(0.05)
+        if saved_inputs(path) != ["간격 저장"]:
+            print("  ❌ 저장 간격이 지나도 저장되지 않음")
+            return False
+        palace.close()
+
+        path = os.path.join(temp_dir, "threshold.json")
+        palace = MemoryPalace(path, flush_interval=60, flush_threshold=10)
+        for i in range(10):
+            palace.remember_conversation(f"대화 {i}", "응답")
+        deadline = time.time() + 5
+        while len(saved_inputs(path)) < 10 and time.time() < deadline:
+            time.sleep(0.05)
+        if len(saved_inputs(path)) != 10:
+            print(f"  ❌ 임계값 도달 후 저장 {len(saved_inputs(path))}건")
+            return False
+        palace.close()
+        print("  ✅ 간격 경과와 임계값 도달 시 백그라운드 저장")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_write_behind_no_loss_at_shutdown():
+    """동시 기록 후 종료해도 (close() 호출 없이 프로세스 종료 포함) 변경분이 남는지 확인"""
+    print("✓ 테스트 5: 종료 시 변경분 보존")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, "memories.json")
+        palace = MemoryPalace(path, max_memories=10000, flush_interval=0.05, flush_threshold=7)
+
+        def remember(n):
+            for i in range(50):
+                palace.remember_conversation(f"스레드 {n} 대화 {i}", "응답")
+
+        workers = [threading.Thread(target=remember, args=(n,)) for n in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        palace.close()
+        if sorted(saved_inputs(path)) != sorted(f"스레드 {n} 대화 {i}" for n in range(4) for i in range(50)):
+            print(f"  ❌ 동시 기록 {len(saved_inputs(path))}/200건 저장")
+            return False
+
+        # close()를 부르지 않고 끝나는 프로세스는 atexit에서 저장
+        path = os.path.join(temp_dir, "atexit.json")
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from modules.ai_code_manager.memory_palace import MemoryPalace\n"
+            "palace = MemoryPalace(sys.argv[2], flush_interval=60, flush_threshold=1000)\n"
+            "for i in range(30):\n"
+            "    palace.remember_conversation(f'종료 전 대화 {i}', '응답')\n"
+        )
+        subprocess.run([sys.executable, "-c", script, parent_dir, path], check=True, timeout=60)
+        if len(saved_inputs(path)) != 30:
+            print(f"  ❌ 프로세스 종료 후 {len(saved_inputs(path))}/30건 저장")
+            return False
+        print("  ✅ 동시 기록 200건과 프로세스 종료 전 30건 모두 저장")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 기억의 궁전 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_recall_with_particles,
+        test_recall_matches_full_scan,
+        test_write_behind_batches_until_close,
+        test_write_behind_interval_and_threshold,
+        test_write_behind_no_loss_at_shutdown,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+음악 채팅 메시지 기록(방별 링 버퍼, 디스크 세그먼트, 커서 페이지) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, os.path.join(parent_dir, "modules", "ai_code_manager"))
+
+from music_chat_system import ChatMessage, MusicChatSystem
+
+ROOM = "default_0"
+
+
+def fill_room(chat, count):
+    """사용자 한 명이 방에 들어가 count개 메시지 전송 (입장 메시지 포함 count + 1개)"""
+    user = chat.create_user("작곡가")
+    chat.join_room(user.user_id, ROOM)
+    for i in range(count):
+        chat.send_message(user.user_id, ROOM, f"메시지 {i}")
+    return user
+
+
+def read_all_pages(chat, limit):
+    """커서를 따라 최신부터 끝까지 읽어 오래된 순으로 반환"""
+    pages = 0
+    messages = []
+    before = None
+    while True:
+        page = chat.get_room_history(ROOM, limit, before)
+        messages = page["messages"] + messages
+        pages += 1
+        if not page["has_more"]:
+            return messages, pages
+        before = page["next_before"]
+
+
+def test_ring_buffer_is_bounded():
+    """방의 메모리 메시지 수가 버퍼 크기를 넘지 않고, 통계는 전체 수를 세는지 확인"""
+    print("✓ 테스트 1: 방별 링 버퍼")
+    chat = MusicChatSystem(segment_dir=None, room_buffer_size=20)
+    fill_room(chat, 200)
+    history = chat.messages[ROOM]
+    if len(history) != 20 or history.total != 201:
+        print(f"  ❌ 메모리 {len(history)}개, 전체 {history.total}개")
+        return False
+    recent = chat.get_room_messages(ROOM, limit=5)
+    if [m["content"] for m in recent] != [f"메시지 {i}" for i in range(195, 200)]:
+        print(f"  ❌ 최근 메시지 {recent}")
+        return False
+    if chat.get_chat_statistics()["total_messages"] != 201:
+        print("  ❌ 통계 메시지 수 오류")
+        return False
+
+    message = history.recent(1)[0]
+    if hasattr(message, "__dict__") or message.to_dict() is not message.to_dict():
+        print("  ❌ __slots__ 레코드가 아니거나 직렬화 결과가 캐시되지 않음")
+        return False
+    print("  ✅ 201개 전송 → 메모리 20개 유지, 직렬화 캐시 재사용")
+    return True
+
+
+def test_pagination_spills_to_disk():
+    """밀려난 메시지가 디스크 세그먼트로 옮겨지고 커서 페이지로 빠짐없이 읽히는지 확인"""
+    print("✓ 테스트 2: 디스크 세그먼트와 커서 페이지")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        chat = MusicChatSystem(segment_dir=temp_dir, room_buffer_size=15)
+        fill_room(chat, 99)
+
+        messages, pages = read_all_pages(chat, limit=7)
+        contents = [m["content"] for m in messages]
+        if len(messages) != 100 or contents[1:] != [f"메시지 {i}" for i in range(99)] or pages != 15:
+            print(f"  ❌ {len(messages)}개, {pages}페이지")
+            return False
+        if len({m["message_id"] for m in messages}) != 100:
+            print("  ❌ 페이지 사이에 중복 메시지")
+            return False
+
+        # 디스크에 있는 메시지를 커서로 지정
+        oldest_ids = [m["message_id"] for m in messages[:10]]
+        page = chat.get_room_history(ROOM, 3, before=oldest_ids[5])
+        if [m["message_id"] for m in page["messages"]] != oldest_ids[2:5]:
+            print(f"  ❌ 디스크 커서 페이지 {page}")
+            return False
+        if chat.get_room_history(ROOM, 5, before="없는ID")["messages"]:
+            print("  ❌ 없는 커서로 메시지 반환")
+            return False
+
+        # 재시작 후에도 이전 기록이 이어짐
+        restarted = MusicChatSystem(segment_dir=temp_dir, room_buffer_size=15)
+        if restarted.messages[ROOM].total != 85:
+            print(f"  ❌ 재시작 후 디스크 메시지 {restarted.messages[ROOM].total}개")
+            return False
+        fill_room(restarted, 1)
+        restored, _ = read_all_pages(restarted, limit=50)
+        if [m["content"] for m in restored[:86]] != contents[:85] + ["작곡가님이 입장하셨습니다."]:
+            print("  ❌ 재시작 후 순번이 이어지지 않음")
+            return False
+        print(f"  ✅ 100개를 7개씩 {pages}페이지로 조회, 디스크 커서와 재시작 후 기록 유지")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_message_round_trip():
+    """메시지 레코드가 dict로 변환되고 다시 복원되는지 확인"""
+    print("✓ 테스트 3: 메시지 직렬화")
+    message = ChatMessage("", "u1", "작사가", "가사", "lyrics", "", "room", {"title": "봄"})
+    data = message.to_dict()
+    restored = ChatMessage.from_dict(dict(data))
+    if not message.message_id or not message.timestamp or restored.to_dict() != data:
+        print(f"  ❌ 직렬화 결과 {data}")
+        return False
+    print("  ✅ ID/시각 자동 생성, dict 왕복 일치")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 음악 채팅 메시지 기록 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_ring_buffer_is_bounded,
+        test_pagination_spills_to_disk,
+        test_message_round_trip,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+음성 인식 엔진 체인(대체 엔진, 시간 제한, 지문 캐시, 통계) 테스트
+"""
+
+import sys
+import os
+import math
+import random
+import struct
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import speech_recognition as sr
+
+from modules.ai_code_manager.recognition_backends import (
+    RecognitionPipeline, SpeechRecognitionBackend, StubBackend, audio_fingerprint
+)
+
+SAMPLE_RATE = 16000
+
+
+def make_audio(pattern, seconds_per_step=0.1, frequency=300, noise=False):
+    """pattern의 각 값(0~1)을 소리 크기로 하는 구간들로 AudioData 생성 (noise=True면 백색 잡음)"""
+    samples = []
+    rng = random.Random(7)
+    for level in pattern:
+        for i in range(int(SAMPLE_RATE * seconds_per_step)):
+            if noise:
+                # 사인파와 RMS가 같도록 균등 분포 폭 조정 (사인파 RMS = 진폭/√2, 균등 분포 RMS = 폭/√3)
+                samples.append(int(10000 * level * math.sqrt(1.5) * rng.uniform(-1, 1)))
+            else:
+                samples.append(int(10000 * level * math.sin(2 * math.pi * frequency * i / SAMPLE_RATE)))
+    return sr.AudioData(struct.pack(f"<{len(samples)}h", *samples), SAMPLE_RATE, 2)
+
+
+class FakeRecognizer:
+    """recognize_<engine> 메서드만 가진 가짜 인식기"""
+
+    def recognize_vosk(self, audio):
+        return '{"text": "종료"}'
+
+    def recognize_whisper(self, audio, model="base", language=None):
+        raise ImportError("No module named 'whisper'")
+
+
+def test_fingerprint_cache():
+    """같은 짧은 명령은 엔진을 부르지 않고, 긴 구절이나 다른 소리는 캐시하지 않는지 확인"""
+    print("✓ 테스트 1: 지문 캐시")
+    stop_command = make_audio([0, 1, 0.6, 0.2, 1, 0.1])
+    status_command = make_audio([0, 0.3, 1, 1, 0.4, 0.1])
+    long_phrase = make_audio([0.5, 1] * 10)
+    transcripts = {
+        audio_fingerprint(stop_command): "종료",
+        audio_fingerprint(status_command): "상태",
+        audio_fingerprint(long_phrase): "오늘 날씨 어때",
+    }
+    backend = StubBackend(transcripts)
+    pipeline = RecognitionPipeline([backend], cache_max_seconds=1.5)
+
+    results = [pipeline.recognize(audio) for audio in
+               (stop_command, stop_command, status_command, stop_command, long_phrase, long_phrase)]
+    texts = [result.text for result in results]
+    cached = [result.cached for result in results]
+    if texts != ["종료", "종료", "상태", "종료", "오늘 날씨 어때", "오늘 날씨 어때"]:
+        print(f"  ❌ 인식 결과 {texts}")
+        return False
+    if cached != [False, True, False, True, False, False] or backend.calls != 4:
+        print(f"  ❌ 캐시 적중 {cached}, 엔진 호출 {backend.calls}회")
+        return False
+
+    stats = pipeline.stats()["cache"]
+    if stats["hits"] != 2 or stats["misses"] != 2 or stats["hit_rate"] != 0.5:
+        print(f"  ❌ 캐시 통계 {stats}")
+        return False
+    print("  ✅ 짧은 명령 4건 중 2건 캐시 적중, 2초 구절은 매번 인식")
+    return True
+
+
+def test_same_envelope_does_not_collide():
+    """크기 윤곽이 같아도 주파수가 다른 소리는 서로의 캐시 결과를 받지 않고, 종료 명령은 캐시하지 않는지 확인"""
+    print("✓ 테스트 2: 같은 크기 윤곽의 다른 소리")
+    envelope = [0, 1, 0.6, 0.2, 1, 0.1]
+    sounds = {
+        "상태": make_audio(envelope, frequency=200),
+        "종료": make_audio(envelope, frequency=900),
+        "도움말": make_audio(envelope, noise=True),
+    }
+    fingerprints = {text: audio_fingerprint(audio) for text, audio in sounds.items()}
+    if len(set(fingerprints.values())) != 3:
+        print(f"  ❌ 지문 충돌 {fingerprints}")
+        return False
+
+    backend = StubBackend({fingerprint: text for text, fingerprint in fingerprints.items()})
+    pipeline = RecognitionPipeline([backend], cache_exclude=lambda text: "종료" in text)
+    order = ["상태", "종료", "도움말", "상태", "종료", "도움말"]
+    results = [pipeline.recognize(sounds[text]) for text in order]
+    if [result.text for result in results] != order:
+        print(f"  ❌ 인식 결과 {[result.text for result in results]}")
+        return False
+    cached = [result.cached for result in results]
+    if cached != [False, False, False, True, False, True] or backend.calls != 4:
+        print(f"  ❌ 캐시 적중 {cached}, 엔진 호출 {backend.calls}회")
+        return False
+    print("  ✅ 200Hz/900Hz/잡음 지문이 모두 다르고, 종료 명령은 매번 엔진으로 인식")
+    return True
+
+
+def test_fallback_chain_and_timeouts():
+    """앞 엔진의 오류/시간 초과는 다음 엔진으로 넘어가고, 못 알아들은 소리는 넘기지 않는지 확인"""
+    print("✓ 테스트 3: 대체 엔진과 시간 제한")
+    audio = make_audio([0, 1, 1, 0])
+    online = StubBackend(name="online", error="네트워크에 연결할 수 없음")
+    slow = StubBackend(lambda a: "느린 결과", name="slow", delay=0.5, timeout=0.05)
+    offline = StubBackend(lambda a: "상태 알려줘", name="offline")
+    pipeline = RecognitionPipeline([online, slow, offline], cache_size=0)
+
+    result = pipeline.recognize(audio)
+    if (result.text, result.backend, result.cached) != ("상태 알려줘", "offline", False):
+        print(f"  ❌ 결과 {result}")
+        return False
+    stats = pipeline.stats()["backends"]
+    if stats["online"]["errors"] != 1 or stats["slow"]["timeouts"] != 1 or stats["offline"]["recognized"] != 1:
+        print(f"  ❌ 엔진 통계 {stats}")
+        return False
+    if stats["slow"]["max_latency"] > 0.4:
+        print(f"  ❌ 시간 제한을 넘겨 기다림 ({stats['slow']['max_latency']:.2f}초)")
+        return False
+
+    # 못 알아들은 경우는 다음 엔진을 시도하지 않음
+    noise = StubBackend({}, name="primary")
+    backup = StubBackend(lambda a: "다른 결과", name="backup")
+    try:
+        RecognitionPipeline([noise, backup], cache_size=0).recognize(audio)
+        print("  ❌ 못 알아들은 소리가 다음 엔진으로 넘어감")
+        return False
+    except sr.UnknownValueError:
+        pass
+    if backup.calls != 0:
+        print("  ❌ 대체 엔진 호출됨")
+        return False
+
+    # 모든 엔진을 쓸 수 없으면 RequestError
+    try:
+        RecognitionPipeline([online], cache_size=0).recognize(audio)
+        print("  ❌ 모든 엔진 실패인데 결과 반환")
+        return False
+    except sr.RequestError:
+        pass
+    print("  ✅ 오류 → 시간 초과 → 오프라인 엔진 순서로 대체, 잡음은 대체하지 않음")
+    return True
+
+
+def test_speech_recognition_backend():
+    """speech_recognition 엔진 결과 형식 통일과 미설치 엔진 처리 확인"""
+    print("✓ 테스트 4: speech_recognition 엔진 어댑터")
+    recognizer = FakeRecognizer()
+    audio = make_audio([1])
+    vosk = SpeechRecognitionBackend(recognizer, "vosk")
+    whisper = SpeechRecognitionBackend(recognizer, "whisper", model="base", language="korean")
+    missing = SpeechRecognitionBackend(recognizer, "unknown_engine")
+
+    if vosk.recognize(audio) != "종료":
+        print("  ❌ vosk JSON 결과 변환 실패")
+        return False
+    result = RecognitionPipeline([missing, whisper, vosk], cache_size=0).recognize(audio)
+    if result.backend != "vosk":
+        print(f"  ❌ 미설치/미지원 엔진을 건너뛰지 못함: {result}")
+        return False
+    print("  ✅ 미지원 → 미설치 엔진을 건너뛰고 vosk 결과 사용")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 음성 인식 엔진 체인 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_fingerprint_cache,
+        test_same_envelope_does_not_collide,
+        test_fallback_chain_and_timeouts,
+        test_speech_recognition_backend,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
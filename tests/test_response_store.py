@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+응답 저장소(중복 제거, 참조 카운트, LRU/LFU 제거) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.knowledge_store import KnowledgeStore
+from modules.ai_code_manager.response_store import ResponseStore, TEXTS_KEY, response_hash
+
+
+def initial_knowledge():
+    return {"successful_responses": {}, "failed_responses": {}, "response_texts": {}}
+
+
+def make_store(temp_dir, **kwargs):
+    knowledge = KnowledgeStore(os.path.join(temp_dir, "knowledge_base.json"), compact_every=10**6)
+    knowledge.load(initial_knowledge)
+    return knowledge, ResponseStore(knowledge, **kwargs)
+
+
+def test_deduplication():
+    """같은 응답 텍스트는 패턴이 달라도 한 번만 저장되는지 확인"""
+    print("✓ 테스트 1: 응답 중복 제거")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        knowledge, store = make_store(temp_dir)
+        for pattern in ("안녕", "안녕_하세요", "반가워"):
+            store.record("success", pattern, "안녕하세요! 무엇을 도와드릴까요?")
+        store.record("success", "안녕", "안녕하세요! 무엇을 도와드릴까요?")
+
+        texts = knowledge.data[TEXTS_KEY]
+        h = response_hash("안녕하세요! 무엇을 도와드릴까요?")
+        if list(texts) != [h] or store.ref_counts[h] != 3 or store.deduplicated != 3:
+            print(f"  ❌ 텍스트 {len(texts)}개, 참조 {store.ref_counts.get(h)}, 중복 {store.deduplicated}")
+            return False
+        if store.count("success", "안녕") != 2 or store.responses("success", "안녕") != [texts[h]]:
+            print(f"  ❌ 패턴 기록 {store.count('success', '안녕')}회")
+            return False
+
+        reloaded = KnowledgeStore(knowledge.snapshot_path)
+        reloaded.load(initial_knowledge)
+        restored = ResponseStore(reloaded)
+        if restored.ref_counts != store.ref_counts:
+            print(f"  ❌ 재시작 후 참조 카운트 {restored.ref_counts}")
+            return False
+        print("  ✅ 패턴 3개가 텍스트 1개를 공유, 재시작 후 참조 카운트 동일")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_ref_count_release():
+    """링에서 밀려나거나 제거된 응답은 마지막 참조가 사라질 때만 텍스트가 삭제되는지 확인"""
+    print("✓ 테스트 2: 참조 카운트 해제")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        knowledge, store = make_store(temp_dir, ring_size=2)
+        store.record("success", "날씨", "공유 응답")
+        store.record("success", "기온", "공유 응답")
+        store.record("success", "날씨", "응답 2")
+        store.record("success", "날씨", "응답 3")  # "공유 응답"이 날씨 링에서 밀려남
+
+        texts = knowledge.data[TEXTS_KEY]
+        shared = response_hash("공유 응답")
+        if shared not in texts or store.ref_counts[shared] != 1:
+            print(f"  ❌ 다른 패턴이 참조 중인 텍스트 처리 오류: {store.ref_counts.get(shared)}")
+            return False
+
+        store.record("success", "날씨", "응답 4")
+        store.record("success", "기온", "응답 5")
+        store.record("success", "기온", "응답 6")  # 마지막 참조도 밀려남
+        if shared in texts or shared in store.ref_counts:
+            print("  ❌ 참조가 없는 텍스트가 남아 있음")
+            return False
+        if store.bytes_reclaimed < len("공유 응답".encode('utf-8')):
+            print(f"  ❌ 회수 바이트 {store.bytes_reclaimed}")
+            return False
+        print(f"  ✅ 마지막 참조가 사라질 때만 삭제 ({store.bytes_reclaimed}바이트 회수)")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_lru_eviction():
+    """LRU 정책은 가장 오래 사용되지 않은 패턴을 제거하는지 확인"""
+    print("✓ 테스트 3: LRU 제거")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        knowledge, store = make_store(temp_dir, max_patterns=3, policy="lru")
+        for pattern in ("가", "나", "다"):
+            store.record("success", pattern, f"{pattern} 응답")
+        store.latest("success", "가")  # 가를 최근 사용으로 이동
+        store.record("success", "라", "라 응답")
+
+        patterns = sorted(knowledge.data["successful_responses"])
+        if patterns != ["가", "다", "라"] or response_hash("나 응답") in knowledge.data[TEXTS_KEY]:
+            print(f"  ❌ 남은 패턴 {patterns}")
+            return False
+        print("  ✅ 가장 오래 사용되지 않은 패턴과 그 텍스트 제거")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_lfu_keeps_new_pattern():
+    """LFU 정책에서 방금 학습한 패턴이 곧바로 제거되지 않는지 확인"""
+    print("✓ 테스트 4: LFU 제거 (새 패턴 보존)")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        knowledge, store = make_store(temp_dir, max_patterns=3, policy="lfu")
+        for pattern in ("가", "나", "다"):
+            for i in range(3):
+                store.record("success", pattern, f"{pattern} 응답 {i}")
+        store.record("success", "나", "나 응답 3")
+
+        # 기존 패턴이 모두 빈도 1보다 높아도 새 패턴은 남고 가장 적게 쓰인 기존 패턴이 제거됨
+        store.record("success", "라", "라 응답")
+        patterns = sorted(knowledge.data["successful_responses"])
+        if patterns != ["나", "다", "라"]:
+            print(f"  ❌ 남은 패턴 {patterns}")
+            return False
+        if store.latest("success", "라") != "라 응답":
+            print("  ❌ 새 패턴 응답을 찾을 수 없음")
+            return False
+        store.record("success", "마", "마 응답")
+        patterns = sorted(knowledge.data["successful_responses"])
+        if patterns != ["나", "다", "마"] or store.get_stats()["evicted_patterns"] != 2:
+            print(f"  ❌ 두 번째 제거 후 패턴 {patterns}")
+            return False
+        print("  ✅ 새 패턴은 보존, 빈도가 가장 낮은 기존 패턴부터 제거")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 응답 저장소 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_deduplication,
+        test_ref_count_release,
+        test_lru_eviction,
+        test_lfu_keeps_new_pattern,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+서비스 레지스트리(지연 생성 + 예열) 테스트
+"""
+
+import sys
+import os
+import threading
+import time
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.service_registry import ServiceRegistry, lazy_import
+
+
+class SlowEngine:
+    """생성에 시간이 걸리는 엔진"""
+    created = 0
+
+    def __init__(self):
+        time.sleep(0.05)
+        SlowEngine.created += 1
+
+
+def test_lazy_creation():
+    """처음 사용할 때만 생성되는지 확인"""
+    print("✓ 테스트 1: 지연 생성")
+    registry = ServiceRegistry()
+    registry.register("core", dict, eager=True)
+    registry.register("ordered", lazy_import("collections", "OrderedDict"))
+    registry.load_eager()
+    registry.mark_ready()
+
+    if not registry.is_loaded("core") or registry.is_loaded("ordered"):
+        print("  ❌ eager/지연 구분 실패")
+        return False
+    if type(registry.get("ordered")).__name__ != "OrderedDict" or registry.get("ordered") is not registry.get("ordered"):
+        print("  ❌ 지연 생성 결과 불일치")
+        return False
+
+    report = registry.timing_report()
+    by_name = {s["name"]: s for s in report["services"]}
+    if by_name["core"]["loaded_by"] != "startup" or by_name["ordered"]["loaded_by"] != "on_demand":
+        print(f"  ❌ 보고서 불일치: {report}")
+        return False
+    print("  ✅ 첫 사용 시 한 번만 생성")
+    return True
+
+
+def test_concurrent_first_use():
+    """예열 스레드와 동시에 요청해도 한 번만 생성되는지 확인"""
+    print("✓ 테스트 2: 동시 요청 및 백그라운드 예열")
+    SlowEngine.created = 0
+    registry = ServiceRegistry()
+    registry.register("slow", SlowEngine)
+    registry.register("deferred", SlowEngine)
+
+    thread = registry.warm_up(["slow", "없는서비스"], background=True)
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(registry.get("slow"))) for _ in range(5)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    registry.wait_for_warm_up()
+
+    if thread is None or SlowEngine.created != 1 or len({id(r) for r in results}) != 1:
+        print(f"  ❌ 생성 횟수: {SlowEngine.created}")
+        return False
+    if registry.is_loaded("deferred"):
+        print("  ❌ 예열 대상이 아닌 서비스가 생성됨")
+        return False
+    print("  ✅ 동시 요청 시에도 한 번만 생성")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 서비스 레지스트리 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_lazy_creation,
+        test_concurrent_first_use,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
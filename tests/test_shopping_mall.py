@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+자율 쇼핑몰 상태 저장(주문 로그 + 스냅샷), 공유 서비스, 분석 집계 테스트
+"""
+
+import sys
+import os
+import json
+import random
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager import autonomous_shopping_mall, multi_agent_shopping_system
+from modules.ai_code_manager.autonomous_shopping_mall import AutonomousShoppingMall, get_mall_service
+from modules.ai_code_manager.autonomous_marketing_system import AutonomousMarketingSystem
+from modules.ai_code_manager.streaming_aggregates import TimeBucketCounter, TopK
+
+
+def count_lines(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for line in f if line.strip())
+
+
+def test_legacy_orders_migrated():
+    """스냅샷 안의 이전 주문 목록이 주문 로그로 한 번만 옮겨지는지 확인"""
+    print("✓ 테스트 1: 이전 형식 주문 이전")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data_file = os.path.join(temp_dir, "mall.json")
+        legacy_orders = [
+            {"order_id": f"ORD_{i + 1:06d}", "product_id": "PRD_0001", "product_name": "테스트",
+             "price": 1000, "order_date": "2025-01-01T00:00:00", "status": "완료"}
+            for i in range(25)
+        ]
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump({"products": [], "orders": legacy_orders, "inventory": {},
+                       "mall_stats": {"total_revenue": 25000, "total_sales": 25, "active_products": 0,
+                                      "customer_satisfaction": 85.0, "market_position": "성장중"}}, f)
+
+        mall = AutonomousShoppingMall(data_file)
+        with open(data_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if "orders" in snapshot or snapshot.get("order_count") != 25:
+            print(f"  ❌ 스냅샷에 주문이 남음: {list(snapshot)}")
+            return False
+        if count_lines(mall.order_log.path) != 25 or mall.order_log.count != 25:
+            print(f"  ❌ 주문 로그 {count_lines(mall.order_log.path)}줄")
+            return False
+        mall.close()
+
+        reopened = AutonomousShoppingMall(data_file)
+        if reopened.order_log.count != 25 or count_lines(reopened.order_log.path) != 25:
+            print("  ❌ 다시 열 때 주문이 중복 이전됨")
+            return False
+        reopened.close()
+        print("  ✅ 주문 25건을 로그로 이전, 재시작 시 중복 없음")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_orders_appended_not_rewritten():
+    """주문은 로그에 추가만 되고, 스냅샷은 상태가 바뀔 때만 저장되는지 확인"""
+    print("✓ 테스트 2: 주문 로그 추가 기록과 변경 시 스냅샷")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        random.seed(3)
+        data_file = os.path.join(temp_dir, "mall.json")
+        mall = AutonomousShoppingMall(data_file)
+        for _ in range(30):
+            mall.run_autonomous_cycle()
+
+        total_sales = mall.mall_stats["total_sales"]
+        if mall.order_log.count != total_sales or count_lines(mall.order_log.path) != total_sales:
+            print(f"  ❌ 주문 로그 {mall.order_log.count}건 != 판매 {total_sales}건")
+            return False
+
+        with open(data_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if "orders" in snapshot:
+            print("  ❌ 스냅샷에 주문 목록이 저장됨")
+            return False
+
+        # 변경이 없으면 스냅샷을 다시 쓰지 않음
+        written = mall.snapshots_written
+        mall.analyze_performance()
+        if mall.save_mall_data() or mall.snapshots_written != written:
+            print("  ❌ 변경 없이 스냅샷 저장")
+            return False
+
+        # 재시작 후 주문 번호가 이어지는지 확인
+        mall.close()
+        restored = AutonomousShoppingMall(data_file)
+        if restored.order_log.count != total_sales or restored.mall_stats != mall.mall_stats:
+            print("  ❌ 재시작 후 상태 불일치")
+            return False
+        last_id = restored.orders[-1]["order_id"] if restored.orders else "ORD_000000"
+        if last_id != f"ORD_{total_sales:06d}":
+            print(f"  ❌ 마지막 주문 번호 {last_id}")
+            return False
+        restored.close()
+        print(f"  ✅ 30회 운영, 주문 {total_sales}건 로그 기록, 스냅샷 {written}회 저장")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_shared_service():
+    """음성 명령 응답이 공유 쇼핑몰 인스턴스를 재사용하는지 확인"""
+    print("✓ 테스트 3: 공유 쇼핑몰 서비스")
+    temp_dir = tempfile.mkdtemp()
+    previous = autonomous_shopping_mall._mall_service
+    try:
+        autonomous_shopping_mall._mall_service = AutonomousShoppingMall(os.path.join(temp_dir, "mall.json"))
+        first = get_mall_service()
+        autonomous_shopping_mall.create_autonomous_mall_response("쇼핑몰 운영 시작해줘")
+        autonomous_shopping_mall.create_autonomous_mall_response("쇼핑몰 성과 분석해줘")
+        if get_mall_service() is not first:
+            print("  ❌ 명령마다 새 인스턴스 생성")
+            return False
+        # 멀티 에이전트 시스템도 같은 모듈(같은 공유 쇼핑몰)을 써야 함
+        if multi_agent_shopping_system.get_mall_service() is not first or "autonomous_shopping_mall" in sys.modules:
+            print("  ❌ 쇼핑몰 모듈이 두 번 로드됨 (공유 인스턴스가 둘)")
+            return False
+        first.close()
+        print("  ✅ 명령 간, 멀티 에이전트 시스템과 같은 인스턴스 사용")
+        return True
+    finally:
+        autonomous_shopping_mall._mall_service = previous
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_streaming_primitives():
+    """상위 k개 힙과 시간 구간 집계 확인"""
+    print("✓ 테스트 4: 스트리밍 집계 자료구조")
+    top = TopK(3)
+    scores = [5, 1, 9, 5, 7, 9, 2]
+    for index, score in enumerate(scores):
+        top.add(score, index)
+    expected = [i for i, _ in sorted(enumerate(scores), key=lambda e: e[1], reverse=True)[:3]]
+    if top.items() != expected:
+        print(f"  ❌ 상위 항목 {top.items()} != {expected}")
+        return False
+
+    now = [100000.0]
+    counter = TimeBucketCounter(window_seconds=3600, bucket_seconds=60, clock=lambda: now[0])
+    for offset in (-4000, -3000, -100, -10, 0):
+        counter.add(now[0] + offset)
+    if counter.total() != 4:
+        print(f"  ❌ 최근 1시간 이벤트 {counter.total()} != 4")
+        return False
+    now[0] += 700
+    if counter.total() != 3:
+        print(f"  ❌ 시간 경과 후 이벤트 {counter.total()} != 3")
+        return False
+    print("  ✅ 상위 k개 순서와 시간 창 만료 정상")
+    return True
+
+
+def test_mall_analysis_matches_full_scan():
+    """스트리밍 집계로 만든 성과 분석이 전체 이력을 훑은 결과와 같은지 확인"""
+    print("✓ 테스트 5: 쇼핑몰 성과 분석 집계")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        random.seed(5)
+        data_file = os.path.join(temp_dir, "mall.json")
+        mall = AutonomousShoppingMall(data_file)
+        for _ in range(40):
+            mall.run_autonomous_cycle()
+        mall.close()
+        mall = AutonomousShoppingMall(data_file)
+
+        analysis = mall.analyze_performance()
+        categories = {}
+        for product in mall.products:
+            categories[product["category"]] = categories.get(product["category"], 0) + 1
+        since = (datetime.now() - timedelta(days=1)).isoformat()
+        expected = {
+            "재고_현황": sum(mall.inventory.values()),
+            "최근_주문수": sum(1 for o in mall.order_log.iter_orders() if o["order_date"] > since),
+            "인기_카테고리": max(categories.keys(), key=categories.get),
+        }
+        for key, value in expected.items():
+            if analysis[key] != value:
+                print(f"  ❌ {key}: {analysis[key]} != {value}")
+                return False
+        mall.close()
+        print(f"  ✅ 재고 {expected['재고_현황']}개, 최근 주문 {expected['최근_주문수']}건, "
+              f"인기 카테고리 {expected['인기_카테고리']} 일치")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def full_scan_marketing_report(system):
+    """집계 없이 모든 캠페인을 훑어 만든 리포트 (비교 기준)"""
+    campaigns = system.ad_campaigns
+    platforms = {}
+    for campaign in campaigns:
+        for platform in campaign["platforms"]:
+            entry = platforms.setdefault(platform, {"campaigns": 0, "cost": 0, "revenue": 0, "conversions": 0})
+            entry["campaigns"] += 1
+            share = 1 / len(campaign["platforms"])
+            for key in ("cost", "revenue", "conversions"):
+                entry[key] += campaign["performance_metrics"].get(key, 0) * share
+    return {
+        "total_campaigns": len(campaigns),
+        "active_campaigns": len([c for c in campaigns if c["status"] == "활성"]),
+        "total_revenue": int(sum(c["performance_metrics"].get("revenue", 0) for c in campaigns)),
+        "total_cost": int(sum(c["performance_metrics"].get("cost", 0) for c in campaigns)),
+        "platforms": {p: {k: int(v) if k != "campaigns" else v for k, v in e.items()} for p, e in platforms.items()},
+        "top": [c["campaign_id"] for c in sorted(
+            campaigns, key=lambda c: c["performance_metrics"].get("roi", 0), reverse=True)[:5]],
+    }
+
+
+def test_marketing_report_matches_full_scan():
+    """마케팅 리포트 누적 집계가 전체 캠페인 재계산과 같은지 확인 (재시작 후 포함)"""
+    print("✓ 테스트 6: 마케팅 분석 리포트 집계")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        random.seed(9)
+        data_file = os.path.join(temp_dir, "marketing.json")
+        system = AutonomousMarketingSystem(data_file)
+        for _ in range(25):
+            system.run_autonomous_marketing_cycle()
+        restarted = AutonomousMarketingSystem(data_file)
+
+        for label, target in (("실행 중", system), ("재시작 후", restarted)):
+            report = target.generate_sales_analytics_report()
+            expected = full_scan_marketing_report(target)
+            actual = {
+                "total_campaigns": report["summary"]["total_campaigns"],
+                "active_campaigns": report["summary"]["active_campaigns"],
+                "total_revenue": report["summary"]["total_revenue"],
+                "total_cost": report["summary"]["total_cost"],
+                "platforms": {p: {k: v for k, v in e.items() if k != "roi"}
+                              for p, e in report["platform_performance"].items()},
+                "top": [c["campaign_id"] for c in report["top_performing_campaigns"]],
+            }
+            if actual != expected:
+                print(f"  ❌ {label} 리포트 불일치:\n    {actual}\n    {expected}")
+                return False
+        print(f"  ✅ 캠페인 {len(system.ad_campaigns)}개 리포트 일치 (재시작 후 포함)")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 자율 쇼핑몰 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_legacy_orders_migrated,
+        test_orders_appended_not_rewritten,
+        test_shared_service,
+        test_streaming_primitives,
+        test_mall_analysis_matches_full_scan,
+        test_marketing_report_matches_full_scan,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+음성 출력 작업자(우선순위 큐, 끼어들기, 합성 음성 캐시) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.speech_output import (
+    SpeechOutput, FakeSpeechEngine, FakeAudioPlayer, PRIORITY_URGENT, PRIORITY_LOW
+)
+
+
+class GatedEngine(FakeSpeechEngine):
+    """첫 발화에서 gate가 열릴 때까지 멈춰 있는 엔진 (큐에 요청을 쌓기 위함)"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def speak(self, text, rate):
+        self.spoken.append((text, rate))
+        self.started.set()
+        self.gate.wait(5)
+
+
+def test_priority_order():
+    """긴급 요청이 대기 중인 일반 발화보다 먼저 나가고, 같은 우선순위는 들어온 순서를 지키는지 확인"""
+    print("✓ 테스트 1: 우선순위 순서")
+    engine = GatedEngine()
+    speech = SpeechOutput(lambda: engine)
+    speech.start()
+    try:
+        first = speech.say("첫 번째", 150, priority=PRIORITY_URGENT)
+        engine.started.wait(5)
+        speech.say("잡담 1", 150, priority=PRIORITY_LOW)
+        speech.say("일반 1", 150)
+        speech.say("일반 2", 150)
+        speech.say("오류 안내", 147, priority=PRIORITY_URGENT)
+        engine.gate.set()
+        if not speech.wait_idle(5):
+            print("  ❌ 큐가 비워지지 않음")
+            return False
+        order = [text for text, _ in engine.spoken]
+        if order != ["첫 번째", "오류 안내", "일반 1", "일반 2", "잡담 1"] or first.status != "spoken":
+            print(f"  ❌ 재생 순서 {order}")
+            return False
+        print(f"  ✅ {' → '.join(order)}")
+        return True
+    finally:
+        speech.close()
+
+
+def test_barge_in_and_preemption():
+    """cancel()이 재생 중인 발화와 대기 발화를 끊고, 긴급 요청은 일반 발화를 끊는지 확인"""
+    print("✓ 테스트 2: 끼어들기와 긴급 발화 선점")
+    engine = FakeSpeechEngine(seconds_per_char=1.0)
+    speech = SpeechOutput(lambda: engine)
+    speech.start()
+    try:
+        long_reply = speech.say("아주 긴 응답입니다", 150)
+        queued = speech.say("다음 응답", 150)
+        while not engine.spoken:
+            threading.Event().wait(0.01)
+        if speech.cancel() != 2 or not speech.wait_idle(2):
+            print("  ❌ 취소 후에도 재생 중")
+            return False
+        if long_reply.status != "cancelled" or queued.status != "cancelled" or len(engine.spoken) != 1:
+            print(f"  ❌ 상태 {long_reply.status}, {queued.status}, 재생 {engine.spoken}")
+            return False
+
+        chatter = speech.say("한참 이어지는 잡담입니다", 150)
+        while len(engine.spoken) < 2:
+            threading.Event().wait(0.01)
+        engine.seconds_per_char = 0.0
+        urgent = speech.say("오류가 발생했습니다", 147, priority=PRIORITY_URGENT)
+        if not urgent.wait(2) or chatter.status != "cancelled" or urgent.status != "spoken":
+            print(f"  ❌ 선점 실패: 잡담 {chatter.status}, 긴급 {urgent.status}")
+            return False
+        print("  ✅ 끼어들기로 2건 취소, 긴급 안내가 잡담을 끊고 재생")
+        return True
+    finally:
+        speech.close()
+
+
+def test_phrase_cache():
+    """반복 발화와 고정 문구는 렌더링한 파일을 재생하고, 속도/음성이 다르면 따로 캐시하는지 확인"""
+    print("✓ 테스트 3: 합성 음성 캐시")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        engine = FakeSpeechEngine(voice_id="voice-a")
+        player = FakeAudioPlayer()
+        speech = SpeechOutput(lambda: engine, cache_dir=temp_dir, player=player)
+        speech.start()
+        speech.say("날씨가 맑아요", 150)        # 처음: 바로 합성
+        speech.say("날씨가 맑아요", 150)        # 두 번째: 렌더링 후 재생
+        speech.say("날씨가 맑아요", 150)        # 세 번째: 캐시 재생
+        speech.say("다시 말씀해 주세요", 150, cache=True)
+        speech.say("다시 말씀해 주세요", 150, cache=True)
+        speech.say("다시 말씀해 주세요", 160, cache=True)
+        speech.close()
+
+        if engine.spoken != [("날씨가 맑아요", 150)] or len(engine.rendered) != 3:
+            print(f"  ❌ 합성 {engine.spoken}, 렌더링 {engine.rendered}")
+            return False
+        if speech.stats["cache_hits"] != 2 or len(player.played) != 5:
+            print(f"  ❌ 통계 {dict(speech.stats)}, 재생 {player.played}")
+            return False
+
+        # 재시작 후에도 디스크 캐시 사용, 음성이 바뀌면 다시 렌더링
+        restarted_engine = FakeSpeechEngine(voice_id="voice-a")
+        restarted = SpeechOutput(lambda: restarted_engine, cache_dir=temp_dir, player=FakeAudioPlayer())
+        restarted.start()
+        restarted.say("다시 말씀해 주세요", 150)
+        restarted.close()
+        other_engine = FakeSpeechEngine(voice_id="voice-b")
+        other = SpeechOutput(lambda: other_engine, cache_dir=temp_dir, player=FakeAudioPlayer())
+        other.start()
+        other.say("다시 말씀해 주세요", 150, cache=True)
+        other.close()
+        if restarted_engine.rendered or restarted.stats["cache_hits"] != 1 or len(other_engine.rendered) != 1:
+            print("  ❌ 재시작 후 캐시 재사용 또는 음성별 구분 실패")
+            return False
+        print(f"  ✅ 발화 6건 중 렌더링 {len(engine.rendered)}건, 캐시 재생 {speech.stats['cache_hits']}건")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_seen_counts_bounded():
+    """한 번만 들은 발화 기록이 캐시 크기를 넘지 않고, 최근 발화는 두 번째부터 캐시되는지 확인"""
+    print("✓ 테스트 4: 발화 횟수 기록 크기 제한")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        engine = FakeSpeechEngine()
+        speech = SpeechOutput(lambda: engine, cache_dir=temp_dir, player=FakeAudioPlayer(), max_cache_entries=3)
+        speech.start()
+        for i in range(50):
+            speech.say(f"한 번만 하는 말 {i}", 150)
+        speech.say("한 번만 하는 말 49", 150)   # 최근 기록은 남아 있어 렌더링
+        speech.say("한 번만 하는 말 0", 150)    # 오래된 기록은 버려져 다시 바로 합성
+        speech.close()
+
+        if len(speech._seen) > 3:
+            print(f"  ❌ 기록 {len(speech._seen)}개")
+            return False
+        if [text for text, _ in engine.rendered] != ["한 번만 하는 말 49"] or len(engine.spoken) != 51:
+            print(f"  ❌ 렌더링 {engine.rendered}, 합성 {len(engine.spoken)}건")
+            return False
+        print(f"  ✅ 발화 50종 후 기록 {len(speech._seen)}개, 최근 반복 발화만 캐시")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 음성 출력 큐 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_priority_order,
+        test_barge_in_and_preemption,
+        test_phrase_cache,
+        test_seen_counts_bounded,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
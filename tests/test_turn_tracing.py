@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+음성 대화 턴 지연 시간 추적(히스토그램 분위수, 구간 트리, 느린 턴 로그, Prometheus 형식) 테스트
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import contextlib
+import io
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager.turn_tracing import LatencyHistogram, TurnTracer, METRIC_NAME
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_histogram_percentiles():
+    """고정 구간 히스토그램의 분위수가 실제 값에 가깝고 최대값을 넘지 않는지 확인"""
+    print("✓ 테스트 1: 히스토그램 분위수")
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.observe(ms / 1000)
+    summary = histogram.summary()
+    expected = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+    for key, value in expected.items():
+        if abs(summary[key] - value) > value * 0.1:
+            print(f"  ❌ {key} = {summary[key]:.3f} (기대 {value})")
+            return False
+    if summary["count"] != 1000 or summary["max"] != 1.0 or summary["p99"] > summary["max"]:
+        print(f"  ❌ 요약 {summary}")
+        return False
+    if len(histogram.counts) != 15 or LatencyHistogram().percentile(0.5) != 0.0:
+        print("  ❌ 구간 수가 고정되지 않았거나 빈 히스토그램 분위수 오류")
+        return False
+    print(f"  ✅ 1~1000ms 1000개 → p50 {summary['p50'] * 1000:.0f}ms, "
+          f"p95 {summary['p95'] * 1000:.0f}ms, p99 {summary['p99'] * 1000:.0f}ms")
+    return True
+
+
+def test_turn_spans_and_slow_log():
+    """턴의 단계 구간이 트리로 기록되고, 느린 턴만 로그 파일에 남는지 확인"""
+    print("✓ 테스트 2: 턴 구간 트리와 느린 턴 로그")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        log_path = os.path.join(temp_dir, "logs", "slow_turns.jsonl")
+        clock = FakeClock()
+        tracer = TurnTracer(slow_turn_threshold=2.0, slow_turn_log=log_path, clock=clock)
+
+        # 느린 턴: 수집 후 0.2초 대기, 인식 0.5초, 플러그인 안에서 웹 검색 1.5초
+        captured_at = clock.now
+        clock.now += 0.2
+        tracer.begin_turn(start=captured_at)
+        tracer.record_span("listen", captured_at, clock.now)
+        with tracer.span("recognition", backend="google"):
+            clock.now += 0.5
+        tracer.annotate(command="오늘 뉴스 알려줘")
+        with tracer.span("plugin", plugin="news"):
+            clock.now += 0.1
+            with tracer.span("web_search"):
+                clock.now += 1.5
+        with contextlib.redirect_stdout(io.StringIO()):
+            slow = tracer.end_turn()
+
+        # 빠른 턴
+        tracer.begin_turn()
+        with tracer.span("nlp"):
+            clock.now += 0.01
+        tracer.end_turn()
+
+        if round(slow.duration, 3) != 2.3 or tracer.slow_turns != 1 or tracer.end_turn() is not None:
+            print(f"  ❌ 턴 시간 {slow.duration}, 느린 턴 {tracer.slow_turns}")
+            return False
+        with open(log_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        trace = records[0]["trace"]
+        plugin = trace["children"][2]
+        if len(records) != 1 or trace["attributes"]["command"] != "오늘 뉴스 알려줘":
+            print(f"  ❌ 로그 {records}")
+            return False
+        if [c["name"] for c in trace["children"]] != ["listen", "recognition", "plugin"] \
+                or plugin["children"][0]["name"] != "web_search" or plugin["children"][0]["offset_ms"] != 800.0:
+            print(f"  ❌ 구간 트리 {trace}")
+            return False
+
+        stages = tracer.snapshot()["stages"]
+        if stages["turn"]["count"] != 2 or stages["web_search"]["count"] != 1 or stages["nlp"]["count"] != 1:
+            print(f"  ❌ 단계별 횟수 {stages}")
+            return False
+        print("  ✅ 2.3초 턴만 로그 기록 (listen → recognition → plugin/web_search), 단계별 히스토그램 반영")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_prometheus_export():
+    """턴 밖의 기록과 Prometheus 텍스트 형식(누적 구간, 합계, 횟수) 확인"""
+    print("✓ 테스트 3: Prometheus 텍스트 형식")
+    tracer = TurnTracer()
+    with tracer.span("tts"):
+        pass
+    for seconds in (0.003, 0.2, 0.2, 45.0):
+        tracer.observe("recognition", seconds)
+    text = tracer.prometheus_text()
+    lines = text.splitlines()
+
+    expected = [
+        f'{METRIC_NAME}_bucket{{stage="recognition",le="0.005"}} 1',
+        f'{METRIC_NAME}_bucket{{stage="recognition",le="0.25"}} 3',
+        f'{METRIC_NAME}_bucket{{stage="recognition",le="30.0"}} 3',
+        f'{METRIC_NAME}_bucket{{stage="recognition",le="+Inf"}} 4',
+        f'{METRIC_NAME}_count{{stage="recognition"}} 4',
+        f'{METRIC_NAME}_count{{stage="tts"}} 1',
+        "sorisay_slow_turns_total 0",
+    ]
+    missing = [line for line in expected if line not in lines]
+    if missing or f"# TYPE {METRIC_NAME} histogram" not in lines or not text.endswith("\n"):
+        print(f"  ❌ 누락된 줄 {missing}")
+        return False
+    if not 30.0 < tracer.snapshot()["stages"]["recognition"]["p99"] <= 45.0:
+        print("  ❌ +Inf 구간 분위수는 마지막 경계와 최대값 사이여야 함")
+        return False
+    print(f"  ✅ {len(lines)}줄 출력, 누적 구간/+Inf/합계/횟수 일치")
+    return True
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 턴 지연 시간 추적 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_histogram_percentiles,
+        test_turn_spans_and_slow_log,
+        test_prometheus_export,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+웹 검색 캐시(요청 병합, TTL, 부정 캐시) 테스트
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import requests
+
+# 모듈 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from modules.ai_code_manager import self_learning_engine
+from modules.ai_code_manager.knowledge_store import KnowledgeStore
+from modules.ai_code_manager.self_learning_engine import SelfLearningEngine
+from modules.ai_code_manager.web_search_cache import CachedSearchError, WebSearchCache
+
+
+class FakeClock:
+    """직접 시간을 넘기는 시계"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(temp_dir, clock, **kwargs):
+    store = KnowledgeStore(os.path.join(temp_dir, "knowledge_base.json"), compact_every=10**6)
+    store.load(dict)
+    return WebSearchCache(store, clock=clock, **kwargs)
+
+
+def test_coalescing():
+    """같은 검색어의 동시 요청이 네트워크 요청 한 번으로 합쳐지는지 확인"""
+    print("✓ 테스트 1: 동시 요청 병합")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache = make_cache(temp_dir, time.time)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return [{"title": "서울", "content": "맑음"}]
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get_or_fetch("서울 날씨", 3, fetch)))
+        owner.start()
+        started.wait(5)
+        waiters = [threading.Thread(target=lambda: results.append(cache.get_or_fetch("  서울   날씨 ", 3, fetch)))
+                   for _ in range(4)]
+        for thread in waiters:
+            thread.start()
+        # 대기 스레드가 진행 중인 요청에 합류할 때까지 기다림
+        deadline = time.time() + 5
+        while cache.get_stats()["coalesced"] < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for thread in [owner] + waiters:
+            thread.join(5)
+
+        stats = cache.get_stats()
+        if len(calls) != 1 or len(results) != 5 or any(r != results[0] for r in results):
+            print(f"  ❌ 네트워크 요청 {len(calls)}회, 결과 {len(results)}개")
+            return False
+        if (stats["misses"], stats["coalesced"]) != (1, 4):
+            print(f"  ❌ 통계 {stats}")
+            return False
+        print("  ✅ 동시 요청 5개가 네트워크 요청 1회로 합쳐짐")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_ttl_expiry():
+    """TTL 안에서는 캐시 적중, 만료 후에는 다시 가져오는지 확인"""
+    print("✓ 테스트 2: TTL 만료")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        clock = FakeClock()
+        cache = make_cache(temp_dir, clock, ttl_seconds=60)
+        calls = []
+
+        def fetch():
+            calls.append(clock())
+            return [{"title": f"결과 {len(calls)}"}]
+
+        first = cache.get_or_fetch("파이썬", 3, fetch)
+        clock.now += 59
+        second = cache.get_or_fetch("파이썬", 3, fetch)
+        clock.now += 2
+        third = cache.get_or_fetch("파이썬", 3, fetch)
+
+        stats = cache.get_stats()
+        if len(calls) != 2 or first != second or third == first:
+            print(f"  ❌ 네트워크 요청 {len(calls)}회")
+            return False
+        if (stats["hits"], stats["expired"]) != (1, 1):
+            print(f"  ❌ 통계 {stats}")
+            return False
+        print("  ✅ TTL 안에서 적중, 만료 후 새로 가져옴")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_negative_cache():
+    """실패한 검색은 짧은 TTL 동안만 오류로 기억하는지 확인"""
+    print("✓ 테스트 3: 부정 캐시")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        clock = FakeClock()
+        cache = make_cache(temp_dir, clock, ttl_seconds=3600, negative_ttl_seconds=300)
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise ConnectionError("연결 실패")
+
+        try:
+            cache.get_or_fetch("뉴스", 3, failing)
+            print("  ❌ 첫 실패가 전달되지 않음")
+            return False
+        except ConnectionError:
+            pass
+        try:
+            cache.get_or_fetch("뉴스", 3, failing)
+            print("  ❌ 부정 캐시 적중 시 오류가 전달되지 않음")
+            return False
+        except CachedSearchError:
+            pass
+
+        clock.now += 301
+        results = cache.get_or_fetch("뉴스", 3, lambda: [{"title": "뉴스"}])
+        if len(calls) != 1 or results != [{"title": "뉴스"}] or cache.get_stats()["negative_hits"] != 1:
+            print(f"  ❌ 실패 요청 {len(calls)}회, 결과 {results}")
+            return False
+        print("  ✅ 실패는 300초 동안만 부정 캐시")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_http_error_not_cached():
+    """200이 아닌 응답이 빈 결과로 24시간 캐시되지 않고 부정 캐시로 가는지 확인"""
+    print("✓ 테스트 4: HTTP 오류 응답 처리")
+    temp_dir = tempfile.mkdtemp()
+    original_get = self_learning_engine.requests.get
+    calls = []
+
+    def unavailable(url, timeout=None):
+        calls.append(url)
+        response = requests.Response()
+        response.status_code = 503
+        response.reason = "Service Unavailable"
+        response.url = url
+        return response
+
+    try:
+        self_learning_engine.requests.get = unavailable
+        engine = SelfLearningEngine(os.path.join(temp_dir, "knowledge_base.json"))
+        first = engine.web_search("소리새")
+        second = engine.web_search("소리새")
+        entries = list(engine.search_cache.entries.values())
+        engine.close()
+
+        if len(calls) != 1 or first[0]["type"] != "error" or second[0]["type"] != "error":
+            print(f"  ❌ 요청 {len(calls)}회, 결과 {first} / {second}")
+            return False
+        if len(entries) != 1 or not entries[0].get("negative") or "503" not in entries[0]["error"]:
+            print(f"  ❌ 캐시 항목 {entries}")
+            return False
+        print("  ✅ 503 응답은 부정 캐시에만 기록")
+        return True
+    finally:
+        self_learning_engine.requests.get = original_get
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """테스트 실행"""
+    print("=" * 60)
+    print("🧪 웹 검색 캐시 테스트 시작")
+    print("=" * 60)
+
+    tests = [
+        test_coalescing,
+        test_ttl_expiry,
+        test_negative_cache,
+        test_http_error_not_cached,
+    ]
+
+    results = []
+    for test in tests:
+        print()
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ❌ 테스트 실행 중 예외 발생: {e}")
+            results.append(False)
+
+    print()
+    print("=" * 60)
+    passed = sum(results)
+    total = len(results)
+    print(f"📊 테스트 결과: {passed}/{total} 통과")
+
+    if passed == total:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    print(f"⚠️ {total - passed}개 테스트 실패")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
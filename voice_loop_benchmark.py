@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎙📊 음성 루프 처리량 벤치마크
+마이크/TTS/네트워크 없이 발화 코퍼스를 SorisayCore 루프에 반복 재생하여
+처리량(명령/초), 단계별 시간, 의도/플러그인 정확도, 메모리 증가량을 측정합니다.
+
+처리량이 기준값보다 --max-regression% 넘게 떨어지거나 의도 정확도가 낮아지면
+종료 코드 1로 끝나므로 CI에서 회귀 검사로 쓸 수 있습니다.
+
+기준값은 두 파일에 나누어 저장합니다.
+    tests/data/voice_loop_baseline.json  - 기계와 무관한 의도 정확도 (저장소에 포함)
+    data/voice_loop_throughput.json      - 이 기계에서 잰 처리량 (저장소에 올리지 않음)
+처리량 기준값은 기록한 기계와 같은 기계에서만 비교하므로, CI 기계에서는 먼저
+--update-baseline으로 처리량을 기록한 뒤 변경 전후를 비교하세요.
+
+사용법:
+    python voice_loop_benchmark.py                          # 코퍼스 100회 반복 후 기준값과 비교
+    python voice_loop_benchmark.py --repeat 300             # 더 많은 발화로 측정
+    python voice_loop_benchmark.py --max-regression 10      # 10% 넘게 느려지면 실패
+    python voice_loop_benchmark.py --update-baseline        # 이번 결과를 기준값으로 저장 (처리량은 이 기계용)
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+from modules.ai_code_manager.headless_replay import (
+    DEFAULT_CORPUS, check_regression, format_report, load_corpus, replay
+)
+
+DEFAULT_BASELINE = "tests/data/voice_loop_baseline.json"
+DEFAULT_THROUGHPUT_BASELINE = "data/voice_loop_throughput.json"
+
+
+def machine_id():
+    """처리량 기준값을 비교할 수 있는 실행 환경 식별자"""
+    return (f"{platform.node()}|{platform.machine()}|"
+            f"{platform.python_implementation()} {platform.python_version()}")
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_throughput(path):
+    """이 기계에서 기록한 처리량 기준값 (다른 기계에서 기록했으면 None)"""
+    throughput = load_baseline(path)
+    if throughput is None:
+        return None
+    if throughput.get("machine") != machine_id():
+        print(f"\n⚠ 처리량 기준값이 다른 환경에서 기록되었습니다: {throughput.get('machine')} "
+              f"(이 기계에서 --update-baseline으로 다시 기록)")
+        return None
+    return throughput
+
+
+def save_baseline(path, throughput_path, report, repeat):
+    recorded_at = datetime.now().isoformat(timespec="seconds")
+    baseline = {
+        "intent_accuracy": round(report["intent"]["accuracy"], 4),
+        "utterances": report["utterances"],
+        "repeat": repeat,
+        "recorded_at": recorded_at,
+    }
+    throughput = {
+        "commands_per_sec": round(report["commands_per_sec"], 1),
+        "utterances": report["utterances"],
+        "repeat": repeat,
+        "machine": machine_id(),
+        "recorded_at": recorded_at,
+    }
+    for target, data in ((path, baseline), (throughput_path, throughput)):
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return throughput
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 루프 처리량 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="발화 코퍼스 (JSONL)")
+    parser.add_argument("--repeat", type=int, default=100, help="코퍼스 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="의도 정확도 기준값 파일 (JSON)")
+    parser.add_argument("--throughput-baseline", default=DEFAULT_THROUGHPUT_BASELINE,
+                        help="이 기계의 처리량 기준값 파일 (JSON)")
+    parser.add_argument("--max-regression", type=float, default=20.0,
+                        help="허용하는 처리량 하락 비율 (%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--execute-plugins", action="store_true", help="플러그인 명령을 실제로 실행")
+    parser.add_argument("--output", help="전체 결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    utterances = load_corpus(args.corpus)
+    print(f"\n🚀 발화 {len(utterances)}개 × {args.repeat}회 재생 중...")
+    report = replay(utterances, repeat=args.repeat, seed=args.seed, execute_plugins=args.execute_plugins)
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if args.update_baseline:
+        throughput = save_baseline(args.baseline, args.throughput_baseline, report, args.repeat)
+        print(f"\n📌 기준값 저장: {args.baseline}, {args.throughput_baseline} "
+              f"({throughput['commands_per_sec']}명령/초)")
+        return 0
+
+    baseline = load_baseline(args.baseline) or {}
+    throughput = load_throughput(args.throughput_baseline)
+    if throughput is not None:
+        baseline["commands_per_sec"] = throughput["commands_per_sec"]
+    if not baseline:
+        print(f"\n⚠ 기준값 파일이 없습니다: {args.baseline} (--update-baseline으로 생성)")
+        return 0
+
+    failures = check_regression(report, baseline, args.max_regression)
+    rate = (f"{baseline['commands_per_sec']:.1f}명령/초 (허용 하락 {args.max_regression:.0f}%)"
+            if "commands_per_sec" in baseline else "처리량 비교 안 함 (이 기계의 기준값 없음)")
+    accuracy = baseline.get("intent_accuracy")
+    print(f"\n📏 기준값: {rate}, 의도 정확도 {'-' if accuracy is None else f'{accuracy:.1%}'}")
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())